@@ -0,0 +1,57 @@
+-- Denormalized current state of each dataset (latest version, metrics, versions count)
+-- Maintained by the repository on every version write, so list pages no longer scan dataset_versions
+-- Added on 2026-10-17
+
+CREATE TABLE IF NOT EXISTS dataset_current (
+    dataset_id uuid PRIMARY KEY REFERENCES datasets(id) ON DELETE CASCADE,
+    version_id uuid,
+    version_timestamp timestamptz,
+    blob_id uuid,
+    checksum varchar(64),
+    title text,
+    downloads_count int,
+    api_calls_count int,
+    views_count int,
+    reuses_count int,
+    followers_count int,
+    popularity_score float,
+    records_count int,
+    size_bytes bigint,
+    versions_count int NOT NULL DEFAULT 0
+);
+COMMENT ON TABLE dataset_current IS 'Projection de l''état courant de chaque jeu de données (dernière version, métriques)';
+COMMENT ON COLUMN dataset_current.version_id IS 'Dernière version (dataset_versions.id)';
+COMMENT ON COLUMN dataset_current.versions_count IS 'Nombre de versions du jeu de données';
+
+-- Health scores stay in dataset_quality (one row per dataset), indexed for health sorting and filters
+CREATE INDEX IF NOT EXISTS idx_dataset_quality_health_score ON dataset_quality (health_score);
+
+-- Backfill from history
+INSERT INTO dataset_current (
+    dataset_id, version_id, version_timestamp, blob_id, checksum, title,
+    downloads_count, api_calls_count, views_count, reuses_count, followers_count, popularity_score,
+    records_count, size_bytes, versions_count
+)
+SELECT d.id, dv.id, dv.timestamp, dv.blob_id, dv.checksum,
+       COALESCE(dv.title, db.data ->> 'title', db.data -> 'metas' -> 'default' ->> 'title'),
+       dv.downloads_count, dv.api_calls_count, dv.views_count, dv.reuses_count, dv.followers_count, dv.popularity_score,
+       COALESCE(
+           (dv.metadata_volatile ->> 'records_count')::int,
+           (db.data ->> 'records_count')::int,
+           (db.data -> 'metas' -> 'default' ->> 'records_count')::int
+       ),
+       COALESCE(
+           (dv.metadata_volatile ->> 'size_bytes')::bigint,
+           (db.data ->> 'records_size')::bigint,
+           (db.data -> 'metas' -> 'default' ->> 'records_size')::bigint
+       ),
+       COALESCE(vc.versions_count, 0)
+FROM datasets d
+LEFT JOIN LATERAL (
+    SELECT * FROM dataset_versions WHERE dataset_id = d.id ORDER BY timestamp DESC LIMIT 1
+) dv ON TRUE
+LEFT JOIN dataset_blobs db ON db.id = dv.blob_id
+LEFT JOIN (
+    SELECT dataset_id, COUNT(*) AS versions_count FROM dataset_versions GROUP BY dataset_id
+) vc ON vc.dataset_id = d.id
+ON CONFLICT (dataset_id) DO NOTHING;
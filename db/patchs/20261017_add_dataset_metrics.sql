@@ -0,0 +1,63 @@
+-- Usage counters as a narrow time series, apart from the versions and their heavy JSON
+-- dataset_metrics keeps every sample; dataset_metrics_rollups keeps the last sample of each UTC day, ISO week
+-- and month. Both are written by the repository in the statement that inserts a version, and survive the
+-- compaction of dataset_versions. Both go away with their dataset.
+-- Added on 2026-10-17
+
+CREATE TABLE IF NOT EXISTS dataset_metrics (
+    dataset_id uuid NOT NULL REFERENCES datasets(id) ON DELETE CASCADE,
+    ts timestamptz NOT NULL,
+    downloads_count int,
+    api_calls_count int,
+    views_count int,
+    reuses_count int,
+    followers_count int,
+    popularity_score float,
+    PRIMARY KEY (dataset_id, ts)
+);
+COMMENT ON TABLE dataset_metrics IS 'Compteurs d''usage de chaque version, sans les métadonnées';
+
+CREATE TABLE IF NOT EXISTS dataset_metrics_rollups (
+    dataset_id uuid NOT NULL REFERENCES datasets(id) ON DELETE CASCADE,
+    granularity text NOT NULL CHECK (granularity IN ('day', 'week', 'month')),
+    period timestamptz NOT NULL,
+    first_ts timestamptz NOT NULL,
+    last_ts timestamptz NOT NULL,
+    samples int NOT NULL DEFAULT 1,
+    downloads_count int,
+    api_calls_count int,
+    views_count int,
+    reuses_count int,
+    followers_count int,
+    popularity_score float,
+    PRIMARY KEY (dataset_id, granularity, period)
+);
+COMMENT ON TABLE dataset_metrics_rollups IS 'Dernière valeur des compteurs par jeu de données et par jour, semaine ou mois (UTC)';
+COMMENT ON COLUMN dataset_metrics_rollups.period IS 'Début de la période (date_trunc en UTC)';
+
+-- Cross-dataset reports read one period of one granularity
+CREATE INDEX IF NOT EXISTS idx_dataset_metrics_rollups_granularity_period
+    ON dataset_metrics_rollups (granularity, period);
+
+-- Backfill from the version history
+INSERT INTO dataset_metrics (
+    dataset_id, ts, downloads_count, api_calls_count, views_count, reuses_count, followers_count, popularity_score
+)
+SELECT dataset_id, timestamp, downloads_count, api_calls_count, views_count, reuses_count, followers_count,
+       popularity_score
+FROM dataset_versions
+ON CONFLICT (dataset_id, ts) DO NOTHING;
+
+INSERT INTO dataset_metrics_rollups (
+    dataset_id, granularity, period, first_ts, last_ts, samples,
+    downloads_count, api_calls_count, views_count, reuses_count, followers_count, popularity_score
+)
+SELECT DISTINCT ON (m.dataset_id, g.granularity, date_trunc(g.granularity, m.ts, 'UTC'))
+       m.dataset_id, g.granularity, date_trunc(g.granularity, m.ts, 'UTC'),
+       min(m.ts) OVER p, m.ts, count(*) OVER p,
+       m.downloads_count, m.api_calls_count, m.views_count, m.reuses_count, m.followers_count, m.popularity_score
+FROM dataset_metrics m
+CROSS JOIN (VALUES ('day'), ('week'), ('month')) AS g(granularity)
+WINDOW p AS (PARTITION BY m.dataset_id, g.granularity, date_trunc(g.granularity, m.ts, 'UTC'))
+ORDER BY m.dataset_id, g.granularity, date_trunc(g.granularity, m.ts, 'UTC'), m.ts DESC
+ON CONFLICT (dataset_id, granularity, period) DO NOTHING;
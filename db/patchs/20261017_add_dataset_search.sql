@@ -0,0 +1,33 @@
+-- Full-text search over dataset title, slug, publisher and description
+-- The vector lives in the dataset_current projection and is refreshed with it on every version write
+-- Added on 2026-10-17
+
+ALTER TABLE dataset_current ADD COLUMN IF NOT EXISTS search_vector tsvector;
+COMMENT ON COLUMN dataset_current.search_vector IS 'Vecteur de recherche plein texte (français) : titre et slug (A), producteur (B), description (C)';
+
+UPDATE dataset_current dc
+SET search_vector =
+    setweight(to_tsvector('french', COALESCE(dc.title, d.title, '')), 'A')
+    || setweight(to_tsvector('french', translate(d.slug, '-_', '  ')), 'A')
+    || setweight(to_tsvector('french', COALESCE(d.publisher, '')), 'B')
+    || setweight(to_tsvector('french', left(regexp_replace(
+        COALESCE(db.data ->> 'description', db.data -> 'metas' -> 'default' ->> 'description', ''),
+        '<[^>]+>', ' ', 'g'
+    ), 20000)), 'C')
+FROM datasets d, dataset_blobs db
+WHERE d.id = dc.dataset_id AND db.id = dc.blob_id;
+
+CREATE INDEX IF NOT EXISTS idx_dataset_current_search_vector ON dataset_current USING gin (search_vector);
+
+-- Trigram indexes back the substring (ILIKE) matching on slug and title; pg_trgm is a contrib
+-- extension, skipped where the server does not ship it
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS idx_datasets_slug_trgm ON datasets USING gin (slug gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_dataset_current_title_trgm ON dataset_current USING gin (title gin_trgm_ops);
+    ELSE
+        RAISE NOTICE 'pg_trgm not available: trigram indexes not created';
+    END IF;
+END $$;
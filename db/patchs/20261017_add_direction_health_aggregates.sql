@@ -0,0 +1,64 @@
+-- Incrementally maintained health aggregates per direction (publisher)
+-- Replaces the full REFRESH of direction_health_stats_view: the repository applies deltas for the datasets it writes
+-- Added on 2026-10-17
+
+-- Contribution of each eligible dataset, as last applied to the totals
+CREATE TABLE IF NOT EXISTS direction_health_members (
+    dataset_id uuid PRIMARY KEY,
+    direction text NOT NULL,
+    quality_score double precision,
+    freshness_score double precision,
+    engagement_score double precision,
+    global_score double precision NOT NULL
+);
+COMMENT ON TABLE direction_health_members IS 'Scores de santé de chaque jeu de données tels que comptés dans direction_health_totals';
+
+CREATE INDEX IF NOT EXISTS idx_direction_health_members_direction ON direction_health_members (direction);
+
+-- Running sums and counts, one row per direction
+CREATE TABLE IF NOT EXISTS direction_health_totals (
+    direction text PRIMARY KEY,
+    dataset_count int NOT NULL DEFAULT 0,
+    unhealthy_count int NOT NULL DEFAULT 0,
+    quality_sum numeric NOT NULL DEFAULT 0,
+    quality_count int NOT NULL DEFAULT 0,
+    freshness_sum numeric NOT NULL DEFAULT 0,
+    freshness_count int NOT NULL DEFAULT 0,
+    engagement_sum numeric NOT NULL DEFAULT 0,
+    engagement_count int NOT NULL DEFAULT 0,
+    global_sum numeric NOT NULL DEFAULT 0,
+    updated_at timestamptz NOT NULL DEFAULT now()
+);
+COMMENT ON TABLE direction_health_totals IS 'Sommes et effectifs des scores de santé par direction, mis à jour par deltas';
+COMMENT ON COLUMN direction_health_totals.unhealthy_count IS 'Nombre de jeux de données dont le score global est inférieur à 50';
+
+-- Backfill
+INSERT INTO direction_health_members
+SELECT d.id,
+       COALESCE(NULLIF(d.publisher, ''), 'Inconnu'),
+       dq.health_quality_score,
+       dq.health_freshness_score,
+       dq.health_engagement_score,
+       dq.health_score
+FROM datasets d
+JOIN dataset_quality dq ON dq.dataset_id = d.id
+WHERE d.deleted IS FALSE
+  AND d.published IS TRUE
+  AND d.restricted IS FALSE
+  AND dq.health_score IS NOT NULL
+ON CONFLICT (dataset_id) DO NOTHING;
+
+INSERT INTO direction_health_totals (
+    direction, dataset_count, unhealthy_count,
+    quality_sum, quality_count, freshness_sum, freshness_count, engagement_sum, engagement_count, global_sum
+)
+SELECT direction,
+       COUNT(*),
+       COUNT(*) FILTER (WHERE global_score < 50),
+       COALESCE(SUM(quality_score::numeric), 0), COUNT(quality_score),
+       COALESCE(SUM(freshness_score::numeric), 0), COUNT(freshness_score),
+       COALESCE(SUM(engagement_score::numeric), 0), COUNT(engagement_score),
+       SUM(global_score::numeric)
+FROM direction_health_members
+GROUP BY direction
+ON CONFLICT (direction) DO NOTHING;
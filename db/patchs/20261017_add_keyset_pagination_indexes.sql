@@ -0,0 +1,7 @@
+-- Indexes matching the keyset pagination order (sort column, id) of dataset listings and version history
+-- Added on 2026-10-17
+
+CREATE INDEX IF NOT EXISTS idx_datasets_modified_id ON datasets (modified, id);
+CREATE INDEX IF NOT EXISTS idx_datasets_created_id ON datasets (created, id);
+CREATE INDEX IF NOT EXISTS idx_dataset_versions_dataset_id_timestamp_id
+    ON dataset_versions (dataset_id, timestamp DESC, id DESC);
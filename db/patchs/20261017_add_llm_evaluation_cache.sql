@@ -0,0 +1,20 @@
+-- LLM evaluations addressed by their inputs rather than by dataset
+-- The key hashes the mapped metadata context and the reference documents, with the prompt type, output format,
+-- prompt template version and model: a dataset whose metadata did not change since its last evaluation, or
+-- shares its context with one already evaluated, is served from here without calling the LLM.
+-- Added on 2026-10-17
+
+CREATE TABLE IF NOT EXISTS llm_evaluation_cache (
+    context_hash text NOT NULL,
+    prompt_type text NOT NULL,
+    output text NOT NULL,
+    prompt_version text NOT NULL,
+    model text NOT NULL,
+    evaluation jsonb NOT NULL,
+    created_at timestamptz NOT NULL DEFAULT NOW(),
+    hits int NOT NULL DEFAULT 0,
+    last_hit_at timestamptz,
+    PRIMARY KEY (context_hash, prompt_type, output, prompt_version, model)
+);
+COMMENT ON TABLE llm_evaluation_cache IS 'Évaluations LLM déjà calculées, par empreinte du contexte envoyé, prompt et modèle';
+COMMENT ON COLUMN llm_evaluation_cache.hits IS 'Nombre de réutilisations de l''évaluation sans appel au LLM';
@@ -0,0 +1,35 @@
+-- Work queue of LLM evaluations, shared by any number of audit workers
+-- Workers claim pending jobs with FOR UPDATE SKIP LOCKED and hold them under a lease: a worker that dies leaves
+-- its jobs claimable again once the lease expires. Failed attempts are retried later, up to max_attempts.
+-- Replaces the JSON checkpoint file of utils/bulk_llm_audit.py.
+-- Added on 2026-10-17
+
+CREATE TABLE IF NOT EXISTS llm_evaluation_jobs (
+    id bigserial PRIMARY KEY,
+    dataset_id uuid NOT NULL REFERENCES datasets(id) ON DELETE CASCADE,
+    prompt_type text NOT NULL,
+    refresh boolean NOT NULL DEFAULT FALSE,
+    state text NOT NULL DEFAULT 'pending' CHECK (state IN ('pending', 'running', 'done', 'failed')),
+    priority int NOT NULL DEFAULT 0,
+    attempts int NOT NULL DEFAULT 0,
+    max_attempts int NOT NULL DEFAULT 3,
+    last_error text,
+    run_after timestamptz NOT NULL DEFAULT NOW(),
+    leased_by text,
+    leased_until timestamptz,
+    claimed_at timestamptz,
+    created_at timestamptz NOT NULL DEFAULT NOW(),
+    updated_at timestamptz NOT NULL DEFAULT NOW(),
+    UNIQUE (dataset_id, prompt_type)
+);
+
+-- Claimable jobs: pending ones by priority, running ones by lease expiry
+CREATE INDEX IF NOT EXISTS llm_evaluation_jobs_pending_idx
+    ON llm_evaluation_jobs (priority DESC, id) WHERE state = 'pending';
+CREATE INDEX IF NOT EXISTS llm_evaluation_jobs_leased_idx
+    ON llm_evaluation_jobs (leased_until) WHERE state = 'running';
+
+COMMENT ON TABLE llm_evaluation_jobs IS 'File d''attente des évaluations LLM, partagée par les workers d''audit';
+COMMENT ON COLUMN llm_evaluation_jobs.leased_until IS 'Fin du bail du worker : au-delà, le job peut être repris par un autre';
+COMMENT ON COLUMN llm_evaluation_jobs.claimed_at IS 'Dernière prise en charge par un worker : les jobs en attente et ceux pris depuis minuit entament le budget LLM du jour';
+COMMENT ON COLUMN llm_evaluation_jobs.run_after IS 'Pas de nouvelle tentative avant cette date (backoff après un échec)';
@@ -0,0 +1,11 @@
+-- Incremental (delta) sync: per-platform high-water mark
+-- Added on 2026-10-17
+
+ALTER TABLE platform_sync_histories ADD COLUMN IF NOT EXISTS mode varchar(16) NOT NULL DEFAULT 'full';
+ALTER TABLE platform_sync_histories ADD COLUMN IF NOT EXISTS high_water_mark timestamptz;
+COMMENT ON COLUMN platform_sync_histories.mode IS 'Type de synchronisation (full/incremental/metrics)';
+COMMENT ON COLUMN platform_sync_histories.high_water_mark IS 'Date de début de la synchronisation incrémentale : les datasets modifiés après cette date seront traités au prochain passage';
+
+CREATE INDEX IF NOT EXISTS idx_platform_sync_high_water_mark
+    ON platform_sync_histories (platform_id, high_water_mark DESC)
+    WHERE high_water_mark IS NOT NULL;
@@ -0,0 +1,8 @@
+-- Incremental sync: datasets to fetch again at the next run
+-- The high-water mark advances as soon as the change listing succeeded; the modified datasets that could not be
+-- fetched or synced are kept on the run row, with their failed attempts, and added to the next run's fetch instead
+-- of holding the mark back. Datasets gone from the source or failing too many times are dropped.
+-- Added on 2026-10-17
+
+ALTER TABLE platform_sync_histories ADD COLUMN IF NOT EXISTS retry_datasets jsonb NOT NULL DEFAULT '{}';
+COMMENT ON COLUMN platform_sync_histories.retry_datasets IS 'Datasets modifiés en échec (identifiant côté plateforme => nombre de tentatives), à reprendre à la prochaine synchronisation incrémentale';
@@ -0,0 +1,12 @@
+-- Where each version compaction pass stopped: the next run folds from there instead of a fixed window,
+-- so a skipped day (or month) of maintenance is caught up on the next run.
+-- Added on 2026-10-17
+
+CREATE TABLE IF NOT EXISTS dataset_version_compactions (
+    bucket text PRIMARY KEY CHECK (bucket IN ('day', 'week')),
+    compacted_until timestamptz NOT NULL,
+    updated_at timestamptz NOT NULL DEFAULT NOW()
+);
+
+COMMENT ON TABLE dataset_version_compactions IS 'Avancement de l''agrégation des versions « heartbeat » par granularité';
+COMMENT ON COLUMN dataset_version_compactions.compacted_until IS 'Les versions antérieures à cette date ont déjà été agrégées';
@@ -0,0 +1,81 @@
+-- Monthly range partitioning of dataset_versions on timestamp
+-- Queries filter on dataset_id and order by timestamp: recent reads only touch recent partitions,
+-- old months can be compacted (see CompactDatasetVersionsUseCase) or moved to cheaper storage.
+-- Large databases should run scripts/partition_versions.py first (batched, resumable copy):
+-- this patch then finds the table already partitioned and only creates the coming partitions.
+-- Added on 2026-10-17
+
+-- Creates the missing monthly partitions between two months (included) and returns how many were created.
+-- Rows of those months that landed in the default partition are moved to their new partition.
+CREATE OR REPLACE FUNCTION ensure_dataset_versions_partitions(from_month date, to_month date) RETURNS int AS $$
+DECLARE
+    month date := date_trunc('month', from_month);
+    lower_bound text;
+    upper_bound text;
+    partition_name text;
+    created int := 0;
+BEGIN
+    WHILE month <= to_month LOOP
+        partition_name := format('dataset_versions_%s', to_char(month, 'YYYY_MM'));
+        IF to_regclass(partition_name) IS NULL THEN
+            lower_bound := to_char(month, 'YYYY-MM-DD') || ' 00:00:00+00';
+            upper_bound := to_char(month + interval '1 month', 'YYYY-MM-DD') || ' 00:00:00+00';
+            CREATE TEMP TABLE IF NOT EXISTS dataset_versions_moved (LIKE dataset_versions) ON COMMIT DROP;
+            EXECUTE format(
+                'WITH moved AS (DELETE FROM dataset_versions_default WHERE timestamp >= %L AND timestamp < %L RETURNING *)
+                 INSERT INTO dataset_versions_moved SELECT * FROM moved',
+                lower_bound, upper_bound
+            );
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF dataset_versions FOR VALUES FROM (%L) TO (%L)',
+                partition_name, lower_bound, upper_bound
+            );
+            INSERT INTO dataset_versions SELECT * FROM dataset_versions_moved;
+            TRUNCATE dataset_versions_moved;
+            created := created + 1;
+        END IF;
+        month := month + interval '1 month';
+    END LOOP;
+    RETURN created;
+END
+$$ LANGUAGE plpgsql;
+
+DO $$
+BEGIN
+    -- The former materialized direction health view still reads dataset_versions; db/views.sql replaces it
+    IF EXISTS (SELECT 1 FROM pg_matviews WHERE matviewname = 'direction_health_stats_view') THEN
+        DROP MATERIALIZED VIEW direction_health_stats_view;
+    END IF;
+
+    IF (SELECT relkind FROM pg_class WHERE oid = 'dataset_versions'::regclass) = 'r' THEN
+        ALTER TABLE dataset_versions RENAME TO dataset_versions_unpartitioned;
+        ALTER TABLE dataset_versions_unpartitioned RENAME CONSTRAINT dataset_versions_pkey TO dataset_versions_unpartitioned_pkey;
+        DROP INDEX IF EXISTS idx_dataset_versions_blob_id;
+        DROP INDEX IF EXISTS idx_dataset_versions_dataset_id_timestamp;
+        DROP INDEX IF EXISTS idx_dataset_versions_dataset_id_timestamp_id;
+
+        CREATE TABLE dataset_versions (
+            LIKE dataset_versions_unpartitioned INCLUDING DEFAULTS INCLUDING COMMENTS,
+            PRIMARY KEY (id, timestamp),
+            FOREIGN KEY (blob_id) REFERENCES dataset_blobs(id)
+        ) PARTITION BY RANGE (timestamp);
+        CREATE TABLE dataset_versions_default PARTITION OF dataset_versions DEFAULT;
+
+        PERFORM ensure_dataset_versions_partitions(
+            COALESCE((SELECT min(timestamp) FROM dataset_versions_unpartitioned), now())::date,
+            (now() + interval '3 months')::date
+        );
+        INSERT INTO dataset_versions SELECT * FROM dataset_versions_unpartitioned;
+        DROP TABLE dataset_versions_unpartitioned;
+    END IF;
+END
+$$;
+
+SELECT ensure_dataset_versions_partitions(now()::date, (now() + interval '3 months')::date);
+
+-- Serves the latest-first listings and the (dataset_id, timestamp) lookups of the previous index
+CREATE INDEX IF NOT EXISTS idx_dataset_versions_dataset_id_timestamp_id
+    ON dataset_versions (dataset_id, timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_dataset_versions_blob_id ON dataset_versions (blob_id);
+
+COMMENT ON TABLE dataset_versions IS 'Historique des versions des métadonnées (partitionné par mois)';
@@ -23,41 +23,15 @@ BEGIN
     END IF;
 END $$;
 
-CREATE MATERIALIZED VIEW direction_health_stats_view AS
-WITH latest_quality AS (
-    SELECT DISTINCT ON (dataset_id)
-        dataset_id,
-        health_score,
-        health_quality_score,
-        health_freshness_score,
-        health_engagement_score,
-        evaluated_blob_id
-    FROM dataset_quality
-    ORDER BY dataset_id, timestamp DESC
-),
-dataset_scores AS (
-    SELECT
-        d.normalized_publisher as direction,
-        dq.health_quality_score as quality_score,
-        dq.health_freshness_score as freshness_score,
-        dq.health_engagement_score as engagement_score,
-        dq.health_score as global_score
-    FROM normalized_datasets d
-    JOIN latest_quality dq ON d.id = dq.dataset_id
-    WHERE d.deleted IS FALSE
-      AND d.published IS TRUE
-      AND d.restricted IS FALSE
-      AND dq.health_score IS NOT NULL  -- Exclure les datasets sans score calculé
-)
+-- Averages over the incrementally maintained totals (see db/patchs/20261017_add_direction_health_aggregates.sql)
+CREATE VIEW direction_health_stats_view AS
 SELECT
     direction,
-    ROUND(AVG(quality_score)::numeric, 2) as score_quality,
-    ROUND(AVG(freshness_score)::numeric, 2) as score_freshness,
-    ROUND(AVG(engagement_score)::numeric, 2) as score_engagement,
-    ROUND(AVG(global_score)::numeric, 2) as score_global,
-    COUNT(*) as dataset_count,
-    COUNT(*) FILTER (WHERE global_score < 50) as unhealthy_count
-FROM dataset_scores
-GROUP BY direction;
-
-CREATE UNIQUE INDEX IF NOT EXISTS idx_direction_health_stats_view_direction ON direction_health_stats_view (direction);
+    ROUND(quality_sum / NULLIF(quality_count, 0), 2) as score_quality,
+    ROUND(freshness_sum / NULLIF(freshness_count, 0), 2) as score_freshness,
+    ROUND(engagement_sum / NULLIF(engagement_count, 0), 2) as score_engagement,
+    ROUND(global_sum / dataset_count, 2) as score_global,
+    dataset_count,
+    unhealthy_count
+FROM direction_health_totals
+WHERE dataset_count > 0;
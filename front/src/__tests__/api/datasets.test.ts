@@ -7,7 +7,12 @@
 
 import { describe, it, expect } from "vitest";
 import { server, setupMSW, http, HttpResponse } from "./setup";
-import { getDatasets, getPlatforms, getPublishers } from "../../api/datasets";
+import {
+  getAllDatasets,
+  getDatasets,
+  getPlatforms,
+  getPublishers,
+} from "../../api/datasets";
 
 describe("API Client - Characterization Tests", () => {
   setupMSW();
@@ -143,6 +148,27 @@ describe("API Client - Characterization Tests", () => {
       expect(url.searchParams.get("sort_by")).toBe("title");
       expect(url.searchParams.get("page_size")).toBe("10");
     });
+
+    it("should follow next_cursor until the last page", async () => {
+      const cursors: (string | null)[] = [];
+
+      server.use(
+        http.get("/api/datasets", ({ request }) => {
+          const cursor = new URL(request.url).searchParams.get("cursor");
+          cursors.push(cursor);
+          return HttpResponse.json({
+            datasets: [{ id: cursor ?? "first", platform_id: "p", page: "https://test.com" }],
+            total_datasets: cursor ? null : 2,
+            next_cursor: cursor ? null : "abc",
+          });
+        })
+      );
+
+      const result = await getAllDatasets();
+
+      expect(cursors).toEqual([null, "abc"]);
+      expect(result.map((d) => d.id)).toEqual(["first", "abc"]);
+    });
   });
 
   describe("getPlatforms", () => {
@@ -5,7 +5,7 @@
  */
 
 import { describe, it, expect, vi } from "vitest";
-import { render, screen } from "@testing-library/react";
+import { fireEvent, render, screen, waitFor } from "@testing-library/react";
 import { DatasetTable } from "../../components/DatasetTable";
 import { mockDatasets } from "../mockData";
 
@@ -214,6 +214,25 @@ describe("DatasetTable - Basic Tests", () => {
     });
   });
 
+  describe("Export", () => {
+    it("should delegate the CSV export of all results to onExport", async () => {
+      const onExport = vi.fn().mockResolvedValue(undefined);
+      render(
+        <DatasetTable
+          items={mockDatasets}
+          total={mockDatasets.length}
+          page={1}
+          pageSize={10}
+          onExport={onExport}
+        />
+      );
+
+      fireEvent.click(screen.getByRole("button", { name: /Exporter \(CSV\)/ }));
+
+      await waitFor(() => expect(onExport).toHaveBeenCalledTimes(1));
+    });
+  });
+
   describe("Accessibility", () => {
     it("should have accessible table structure", () => {
       render(
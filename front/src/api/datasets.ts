@@ -22,6 +22,7 @@ export async function getDatasets(
   total: number;
   pageSize: number;
   page: number;
+  nextCursor: string | null;
   items: (DatasetSummary & { platformName?: string })[];
 }> {
   const {
@@ -39,6 +40,7 @@ export async function getDatasets(
     order = "desc",
     page = 1,
     pageSize = 25,
+    cursor,
     includeColdStorage = false,
   } = query;
 
@@ -58,12 +60,14 @@ export async function getDatasets(
     order,
     page,
     page_size: pageSize,
+    cursor,
     include_counts: true,
   };
 
   const data = await api.get<{
     datasets: any[];
-    total_datasets: number;
+    total_datasets: number | null;
+    next_cursor?: string | null;
     page: number;
     page_size: number;
   }>("/datasets", apiQuery);
@@ -110,9 +114,26 @@ export async function getDatasets(
     total: data.total_datasets ?? 0,
     page: data.page ?? page,
     pageSize: data.page_size ?? pageSize,
+    nextCursor: data.next_cursor ?? null,
   };
 }
 
+/**
+ * Parcourt tout le catalogue filtré en suivant les curseurs (exports CSV).
+ */
+export async function getAllDatasets(
+  query: Omit<DatasetListQuery, "page" | "cursor"> = {}
+): Promise<(DatasetSummary & { platformName?: string })[]> {
+  const all: (DatasetSummary & { platformName?: string })[] = [];
+  let cursor: string | undefined;
+  do {
+    const res = await getDatasets({ pageSize: 100, ...query, cursor });
+    all.push(...res.items);
+    cursor = res.nextCursor ?? undefined;
+  } while (cursor);
+  return all;
+}
+
 export async function getPlatforms(): Promise<PlatformRef[]> {
   const data = await api.get<{ platforms: any[]; total_platforms: number }>(
     "/platforms"
@@ -201,18 +222,25 @@ export async function getDatasetDetail(
 
 export async function getDatasetVersions(
   id: string,
-  params?: { page?: number; pageSize?: number; includeData?: boolean }
+  params?: {
+    page?: number;
+    pageSize?: number;
+    includeData?: boolean;
+    cursor?: string;
+  }
 ): Promise<PaginatedResponse<SnapshotVersion>> {
   const query = {
     page: params?.page ?? 1,
     page_size: params?.pageSize ?? 10,
     include_data: params?.includeData ?? false,
+    cursor: params?.cursor,
   };
   const data = await api.get<{
     versions: any[];
     total_versions: number;
     page: number;
     page_size: number;
+    next_cursor?: string | null;
   }>(`/datasets/${id}/versions`, query);
   const items: SnapshotVersion[] = (data.versions ?? []).map((s: any) => ({
     id: s.id,
@@ -235,6 +263,7 @@ export async function getDatasetVersions(
     total: data.total_versions ?? 0,
     page: data.page ?? query.page,
     pageSize: data.page_size ?? query.page_size,
+    nextCursor: data.next_cursor ?? null,
   };
 }
 export async function evaluateDataset(id: string): Promise<any> {
@@ -1,4 +1,4 @@
-import { useMemo } from "react";
+import { useMemo, useState } from "react";
 import { Table } from "@codegouvfr/react-dsfr/Table";
 import { Select } from "@codegouvfr/react-dsfr/Select";
 import { PaginationDsfr } from "./PaginationDsfr";
@@ -25,6 +25,8 @@ export type DatasetTableProps = Readonly<{
   ) => void;
   loading?: boolean;
   skeletonRowCount?: number;
+  // Exports all filtered results; without it, only the displayed page
+  onExport?: () => Promise<void>;
 }>;
 
 function formatDate(iso: string): string {
@@ -71,7 +73,22 @@ export function DatasetTable(props: DatasetTableProps): JSX.Element {
     onRowClick,
     loading,
     skeletonRowCount,
+    onExport,
   } = props;
+  const [exporting, setExporting] = useState<boolean>(false);
+
+  const handleExport = async (): Promise<void> => {
+    if (!onExport) {
+      exportDatasetsToCsv(items);
+      return;
+    }
+    setExporting(true);
+    try {
+      await onExport();
+    } finally {
+      setExporting(false);
+    }
+  };
   const totalPages = useMemo(
     () => Math.max(1, Math.ceil(total / Math.max(1, pageSize))),
     [total, pageSize]
@@ -675,11 +692,15 @@ export function DatasetTable(props: DatasetTableProps): JSX.Element {
               <Button
                 priority="secondary"
                 iconId="fr-icon-download-line"
-                onClick={() => exportDatasetsToCsv(items)}
-                title="Exporter les données de la page actuelle en CSV (données élargies)"
-                disabled={!!loading || items.length === 0}
+                onClick={handleExport}
+                title={
+                  onExport
+                    ? "Exporter tous les résultats filtrés en CSV (données élargies)"
+                    : "Exporter les données de la page actuelle en CSV (données élargies)"
+                }
+                disabled={!!loading || exporting || items.length === 0}
               >
-                Exporter (CSV)
+                {exporting ? "Export en cours…" : "Exporter (CSV)"}
               </Button>
             </div>
           </div>
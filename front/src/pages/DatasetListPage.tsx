@@ -17,11 +17,13 @@ import type {
 } from "../types/datasets";
 import { useNavigate, useParams, useSearchParams } from "react-router-dom";
 import {
+  getAllDatasets,
   getDatasets,
   getPlatforms,
   getPublishers,
   getDatasetDetail,
 } from "../api/datasets";
+import { exportDatasetsToCsv } from "../utils/export";
 
 export function DatasetListPage(): JSX.Element {
   const { id: routeId } = useParams<{ id: string }>();
@@ -109,6 +111,13 @@ export function DatasetListPage(): JSX.Element {
 
   const [selected, setSelected] = useState<DatasetDetail | null>(null);
 
+  // Keyset cursors of the next pages, valid for one set of filters and sort:
+  // page n + 1 resumes after the last row of page n instead of counting an OFFSET.
+  const cursors = useRef<{ key: string; byPage: Map<number, string> }>({
+    key: "",
+    byPage: new Map(),
+  });
+
   // handle deep link
   useEffect(() => {
     if (routeId) {
@@ -146,9 +155,22 @@ export function DatasetListPage(): JSX.Element {
     let aborted = false;
     setLoading(true);
     setError(null);
-    getDatasets(query)
+    const { page = 1, ...listQuery } = query;
+    const key = JSON.stringify(listQuery);
+    if (cursors.current.key !== key) {
+      cursors.current = { key, byPage: new Map() };
+    }
+    // Pages jumped to directly (no cursor yet) fall back on page-number pagination
+    const cursor = page > 1 ? cursors.current.byPage.get(page) : undefined;
+    getDatasets({ ...query, cursor })
       .then((res) => {
         if (aborted) return;
+        if (res.nextCursor) cursors.current.byPage.set(page + 1, res.nextCursor);
+        if (cursor) {
+          // Totals are only counted without a cursor: keep the first page's one
+          setData((prev) => ({ ...res, total: prev.total }));
+          return;
+        }
         setData(res);
         // Clamp page if out of range after filters/sort/pageSize changes
         const totalPages = Math.max(
@@ -234,16 +256,33 @@ export function DatasetListPage(): JSX.Element {
     return map;
   }, [platforms]);
 
-  const displayItems = useMemo(() => {
-    return data.items.map((it) => {
+  const withPlatformInfo = useCallback(
+    (it: DatasetSummary) => {
       const p = platformInfoById.get(it.platformId);
       return {
         ...it,
         platformName: p?.name ?? it.platformName,
         platformType: p?.type,
       };
-    });
-  }, [data.items, platformInfoById]);
+    },
+    [platformInfoById]
+  );
+
+  const displayItems = useMemo(
+    () => data.items.map(withPlatformInfo),
+    [data.items, withPlatformInfo]
+  );
+
+  // CSV export of all filtered results, following the cursors page after page
+  const handleExport = useCallback(async () => {
+    const { page: _page, cursor: _cursor, ...filters } = query;
+    try {
+      const all = await getAllDatasets({ ...filters, pageSize: 100 });
+      exportDatasetsToCsv(all.map(withPlatformInfo));
+    } catch (err: any) {
+      setError(`Impossible d'exporter les jeux de données: ${err.message}`);
+    }
+  }, [query, withPlatformInfo]);
 
   return (
     <div
@@ -321,6 +360,7 @@ export function DatasetListPage(): JSX.Element {
           setQuery((q) => ({ ...q, page: 1, pageSize: size }))
         }
         onRowClick={(id) => handleNavigateDetail(id)}
+        onExport={handleExport}
       />
 
       <DatasetDetailsModal
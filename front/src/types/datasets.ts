@@ -132,6 +132,7 @@ export type PaginatedResponse<T> = {
   total: number;
   page: number; // 1-indexed
   pageSize: number;
+  nextCursor?: string | null; // Opaque keyset cursor, null on the last page
 };
 
 export type DatasetListQuery = {
@@ -166,12 +167,14 @@ export type DatasetListQuery = {
     | "reuses_count"
     | "health_score"
     | "size_bytes"
-    | "records_count";
+    | "records_count"
+    | "relevance"; // Only meaningful with q
   order?: "asc" | "desc";
 
   // Pagination
   page?: number;
   pageSize?: number;
+  cursor?: string; // Takes precedence over page (constant cost per page)
 };
 
 // ----------------------------------------------------------------------------
@@ -45,11 +45,32 @@ export function computeDiff(base: unknown, other: unknown): DiffSummary {
   return { added, removed, changed };
 }
 
+function pointerToPath(pointer: string): string {
+  return pointer
+    .split("/")
+    .slice(1)
+    .map((part) => part.replace(/~1/g, "/").replace(/~0/g, "~"))
+    .join(".");
+}
+
 export function parseBackendDiff(richDiff: any): DiffSummary {
   const added: string[] = [];
   const removed: string[] = [];
   const changed: string[] = [];
 
+  // JSON-Patch-style operations
+  if (Array.isArray(richDiff)) {
+    for (const op of richDiff) {
+      const path = pointerToPath(op.path);
+      if (op.op === "add") added.push(path);
+      else if (op.op === "remove") removed.push(path);
+      else if (op.op === "replace" || op.op === "move") changed.push(path);
+    }
+    return { added, removed, changed };
+  }
+
+  // Legacy nested diff
+
   function traverse(obj: any, prefix = "") {
     if (!obj || typeof obj !== "object") return;
 
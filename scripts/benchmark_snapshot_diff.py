@@ -0,0 +1,73 @@
+import json
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+
+from common import calculate_snapshot_diff, calculate_snapshot_patch, deep_merge
+from infrastructure.database.postgres import PostgresClient
+
+
+def benchmark(sample_size=1000, repeat=5):
+    """
+    Compare the legacy nested diff with the JSON-Patch-style one on consecutive versions of real datasets,
+    largest blobs first: diff time and size of the stored JSON.
+    """
+    load_dotenv()
+
+    db_name = os.getenv("DB_NAME", "odm")
+    db_user = os.getenv("DB_USER", "postgres")
+    db_pass = os.getenv("DB_PASSWORD", "postgres")
+    db_host = os.getenv("DB_HOST", "localhost")
+    db_port = os.getenv("DB_PORT", "5432")
+
+    client = PostgresClient(db_name, db_user, db_pass, db_host, db_port)
+
+    print(f"Fetching up to {sample_size} pairs of consecutive versions with different blobs...")
+    pairs = client.fetchall(
+        """
+        SELECT prev_blob.data AS old_data, prev.metadata_volatile AS old_volatile,
+               curr_blob.data AS new_data, curr.metadata_volatile AS new_volatile
+        FROM (
+            SELECT dv.*, lag(dv.id) OVER (PARTITION BY dv.dataset_id ORDER BY dv.timestamp) AS prev_id
+            FROM dataset_versions dv
+        ) curr
+        JOIN dataset_versions prev ON prev.id = curr.prev_id
+        JOIN dataset_blobs prev_blob ON prev_blob.id = prev.blob_id
+        JOIN dataset_blobs curr_blob ON curr_blob.id = curr.blob_id
+        WHERE prev.blob_id <> curr.blob_id
+        ORDER BY pg_column_size(curr_blob.data) DESC
+        LIMIT %s
+        """,
+        (sample_size,),
+    )
+    client.close()
+    if not pairs:
+        print("No version pair found.")
+        return
+
+    snapshots = [
+        (
+            deep_merge(p["old_data"] or {}, p["old_volatile"] or {}),
+            deep_merge(p["new_data"] or {}, p["new_volatile"] or {}),
+        )
+        for p in pairs
+    ]
+
+    print(f"Diffing {len(snapshots)} pairs, best of {repeat} runs:")
+    for name, function in (("nested (legacy)", calculate_snapshot_diff), ("patch", calculate_snapshot_patch)):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            diffs = [function(old, new) for old, new in snapshots]
+            timings.append(time.perf_counter() - started)
+        sizes = [len(json.dumps(diff)) for diff in diffs if diff]
+        print(
+            f" - {name}: {min(timings) * 1000:.1f} ms, "
+            f"{sum(sizes) / 1024:.1f} KiB stored, largest diff {max(sizes, default=0) / 1024:.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    benchmark(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,159 @@
+import os
+import sys
+from datetime import date, datetime, timezone
+
+from dotenv import load_dotenv
+
+from infrastructure.database.postgres import PostgresClient
+
+SHADOW = "dataset_versions_partitioned"
+MONTHS_AHEAD = 3
+
+# Index name on the shadow table -> name once swapped in (the unpartitioned ones are renamed out of the way)
+INDEXES = {
+    f"{SHADOW}_dataset_id_timestamp_id": (
+        "idx_dataset_versions_dataset_id_timestamp_id",
+        "(dataset_id, timestamp DESC, id DESC)",
+    ),
+    f"{SHADOW}_blob_id": ("idx_dataset_versions_blob_id", "(blob_id)"),
+}
+
+
+def _add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _bounds(month):
+    return f"{month:%Y-%m-%d} 00:00:00+00", f"{_add_months(month, 1):%Y-%m-%d} 00:00:00+00"
+
+
+def _copy_month(client, month):
+    """Copies one month of versions into the shadow table, replacing whatever a previous run left there."""
+    lower, upper = _bounds(month)
+    client.execute(f"DELETE FROM {SHADOW} WHERE timestamp >= %s AND timestamp < %s", (lower, upper))
+    client.execute(
+        f"INSERT INTO {SHADOW} SELECT * FROM dataset_versions WHERE timestamp >= %s AND timestamp < %s",
+        (lower, upper),
+    )
+
+
+def _count_month(client, table, month):
+    return client.fetchone(
+        f"SELECT count(*) AS count FROM {table} WHERE timestamp >= %s AND timestamp < %s", _bounds(month)
+    )["count"]
+
+
+def _swap(client, current_month, drop_old):
+    """Recopies the current month under an exclusive lock and renames the shadow table into place."""
+    client.execute("LOCK TABLE dataset_versions IN ACCESS EXCLUSIVE MODE")
+    lower, _ = _bounds(current_month)
+    client.execute(f"DELETE FROM {SHADOW} WHERE timestamp >= %s", (lower,))
+    client.execute(f"INSERT INTO {SHADOW} SELECT * FROM dataset_versions WHERE timestamp >= %s", (lower,))
+    missing = client.fetchone(
+        f"SELECT (SELECT count(*) FROM dataset_versions) - (SELECT count(*) FROM {SHADOW}) AS missing"
+    )["missing"]
+    if missing:
+        client.rollback()
+        client.close()
+        raise RuntimeError(f"{missing} versions differ between the tables, past months changed: run the script again.")
+
+    client.execute("DROP MATERIALIZED VIEW IF EXISTS direction_health_stats_view")
+    client.execute("ALTER TABLE dataset_versions RENAME TO dataset_versions_unpartitioned")
+    client.execute(
+        "ALTER TABLE dataset_versions_unpartitioned RENAME CONSTRAINT dataset_versions_pkey "
+        "TO dataset_versions_unpartitioned_pkey"
+    )
+    for _, (final_name, _) in INDEXES.items():
+        client.execute(f"ALTER INDEX IF EXISTS {final_name} RENAME TO {final_name}_unpartitioned")
+    client.execute("DROP INDEX IF EXISTS idx_dataset_versions_dataset_id_timestamp")
+    client.execute(f"ALTER TABLE {SHADOW} RENAME TO dataset_versions")
+    client.execute(f"ALTER TABLE dataset_versions RENAME CONSTRAINT {SHADOW}_pkey TO dataset_versions_pkey")
+    client.execute(
+        f"ALTER TABLE dataset_versions RENAME CONSTRAINT {SHADOW}_blob_id_fkey TO dataset_versions_blob_id_fkey"
+    )
+    for name, (final_name, _) in INDEXES.items():
+        client.execute(f"ALTER INDEX {name} RENAME TO {final_name}")
+    if drop_old:
+        client.execute("DROP TABLE dataset_versions_unpartitioned")
+    client.commit()
+
+
+def migrate(drop_old=False, db_name=None, db_user=None, db_pass=None, db_host=None, db_port=None):
+    """
+    Converts dataset_versions into a table range-partitioned by month, without locking it for the whole copy:
+    a shadow table is filled month by month (one transaction per month, resumable), then swapped in under a
+    short exclusive lock that only recopies the current month. Run it before the
+    20261017_partition_dataset_versions.sql patch, which then only creates the coming partitions.
+    Do not run the version compaction meanwhile: past months are not recopied at the swap.
+    """
+    load_dotenv()
+
+    db_name = db_name or os.getenv("DB_NAME", "odm")
+    db_user = db_user or os.getenv("DB_USER", "postgres")
+    db_pass = db_pass or os.getenv("DB_PASSWORD", "postgres")
+    db_host = db_host or os.getenv("DB_HOST", "localhost")
+    db_port = db_port or os.getenv("DB_PORT", "5432")
+
+    client = PostgresClient(db_name, db_user, db_pass, db_host, db_port)
+
+    relkind = client.fetchone("SELECT relkind FROM pg_class WHERE oid = 'dataset_versions'::regclass")["relkind"]
+    if relkind == "p":
+        print("dataset_versions is already partitioned, nothing to do.")
+        client.close()
+        return
+
+    print(f"Partitioning dataset_versions on {db_name} by month...")
+
+    # 1. Shadow table, its partitions and indexes (kept from a previous run if any)
+    client.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {SHADOW} (
+            LIKE dataset_versions INCLUDING DEFAULTS INCLUDING COMMENTS,
+            PRIMARY KEY (id, timestamp),
+            FOREIGN KEY (blob_id) REFERENCES dataset_blobs(id)
+        ) PARTITION BY RANGE (timestamp)
+        """
+    )
+    client.execute(f"CREATE TABLE IF NOT EXISTS dataset_versions_default PARTITION OF {SHADOW} DEFAULT")
+    oldest = client.fetchone("SELECT min(timestamp) AS oldest FROM dataset_versions")["oldest"]
+    current_month = datetime.now(timezone.utc).date().replace(day=1)
+    month = (oldest.astimezone(timezone.utc).date() if oldest else current_month).replace(day=1)
+    months = []
+    while month <= _add_months(current_month, MONTHS_AHEAD):
+        months.append(month)
+        month = _add_months(month, 1)
+    for month in months:
+        lower, upper = _bounds(month)
+        client.execute(
+            f"CREATE TABLE IF NOT EXISTS dataset_versions_{month:%Y_%m} PARTITION OF {SHADOW} "
+            "FOR VALUES FROM (%s) TO (%s)",
+            (lower, upper),
+        )
+    for name, (_, columns) in INDEXES.items():
+        client.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {SHADOW} {columns}")
+    client.commit()
+    print(f"Shadow table ready with {len(months)} monthly partitions.")
+
+    # 2. Past months, one transaction each; months already copied with the same row count are skipped
+    past_months = [m for m in months if m < current_month]
+    for index, month in enumerate(past_months, start=1):
+        expected = _count_month(client, "dataset_versions", month)
+        if _count_month(client, SHADOW, month) == expected:
+            print(f"Progress: {index}/{len(past_months)} - {month:%Y-%m} already copied ({expected} versions).")
+            continue
+        _copy_month(client, month)
+        client.commit()
+        print(f"Progress: {index}/{len(past_months)} - {month:%Y-%m} copied ({expected} versions).")
+
+    # 3. Swap: syncs only write the current month, which is recopied under the lock
+    print("Swapping tables (exclusive lock)...")
+    _swap(client, current_month, drop_old)
+    client.close()
+
+    kept = "dropped" if drop_old else "kept as dataset_versions_unpartitioned"
+    print(f"Migration finished: dataset_versions is partitioned, the previous table is {kept}.")
+
+
+if __name__ == "__main__":
+    migrate(drop_old="--drop-old" in sys.argv[1:])
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import timedelta
+from functools import partial
+
+from application.services.quality_assessment import QualityAssessmentService
+from domain.quality.evaluation import MetadataEvaluation
+from domain.quality.jobs import DEFAULT_LEASE, EvaluationJob, retry_delay
+from logger import logger
+
+
+class LeaseLostError(Exception):
+    """Raised when a job is reclaimed by another worker while its evaluation runs."""
+
+    pass
+
+
+@dataclass
+class WorkerReport:
+    """What a worker did with the jobs it claimed."""
+
+    done: int = 0
+    retried: int = 0  # Failed, pending again after a backoff
+    failed: int = 0  # Failed on their last attempt
+    lost: int = 0  # Reclaimed by another worker mid-evaluation, left to it
+    errors: list[str] = field(default_factory=list)
+
+
+class EvaluationWorker:
+    """
+    Pulls LLM evaluation jobs from the queue and runs `concurrency` of them at a time through
+    `QualityAssessmentService.aevaluate_dataset`. Each job is claimed under a lease and marked done or failed
+    (retried later with a backoff) on its own: any number of workers, on any machine, can drain the same queue,
+    and a worker stopped midway leaves nothing to resume but the leases to expire.
+
+    The lease is renewed every third of its length while the evaluation runs, as one evaluation (retries and
+    backoff included) can outlast it. A job reclaimed by another worker meanwhile has its evaluation cancelled:
+    neither its result nor its state is written, the new lease holder owns both.
+    """
+
+    def __init__(
+        self, service: QualityAssessmentService, worker_id: str | None = None, lease: timedelta = DEFAULT_LEASE
+    ):
+        self.service = service
+        self.uow = service.uow
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease = lease
+        self.report = WorkerReport()
+
+    async def run(
+        self,
+        dcat_path: str,
+        charter_path: str,
+        concurrency: int = 16,
+        on_result: Callable[[EvaluationJob, MetadataEvaluation | None, Exception | None], None] | None = None,
+    ) -> WorkerReport:
+        """Work until no job can be claimed (jobs waiting for a retry are left to a later run)."""
+        await asyncio.gather(*(self._work(dcat_path, charter_path, on_result) for _ in range(concurrency)))
+        logger.info(
+            f"Worker {self.worker_id}: {self.report.done} done, {self.report.retried} to retry, "
+            f"{self.report.failed} failed, {self.report.lost} lost"
+        )
+        return self.report
+
+    async def _work(self, dcat_path: str, charter_path: str, on_result) -> None:
+        while job := await self._in_db_thread(self._claim):
+            evaluation, error = await self._process(job, dcat_path, charter_path)
+            if on_result:
+                on_result(job, evaluation, error)
+
+    async def _process(
+        self, job: EvaluationJob, dcat_path: str, charter_path: str
+    ) -> tuple[MetadataEvaluation | None, Exception | None]:
+        try:
+            evaluation = await self._evaluate(job, dcat_path, charter_path)
+        except LeaseLostError as e:
+            self.report.lost += 1
+            return None, e
+        except Exception as e:
+            logger.error(f"Evaluation job {job.id} failed (attempt {job.attempts}/{job.max_attempts}): {e}")
+            await self._in_db_thread(self._fail, job, str(e))
+            if job.attempts < job.max_attempts:
+                self.report.retried += 1
+            else:
+                self.report.failed += 1
+            self.report.errors.append(f"{job.dataset_id} — {e}")
+            return None, e
+        await self._in_db_thread(self._complete, job)
+        self.report.done += 1
+        return evaluation, None
+
+    async def _evaluate(self, job: EvaluationJob, dcat_path: str, charter_path: str) -> MetadataEvaluation:
+        evaluation = asyncio.create_task(
+            self.service.aevaluate_dataset(
+                dataset_id=job.dataset_id,
+                dcat_path=dcat_path,
+                charter_path=charter_path,
+                output="json",
+                prompt_type=job.prompt_type,
+                refresh=job.refresh,
+            )
+        )
+        heartbeat = asyncio.create_task(self._keep_leased(job, evaluation))
+        try:
+            return await evaluation
+        except asyncio.CancelledError:
+            if not heartbeat.done():
+                raise  # The worker itself is being stopped
+            raise LeaseLostError(f"lease lost by {self.worker_id}, the job was reclaimed") from None
+        finally:
+            heartbeat.cancel()
+
+    async def _keep_leased(self, job: EvaluationJob, evaluation: asyncio.Task) -> None:
+        """Renew the lease until cancelled; if it was lost, cancel the evaluation before its results are stored."""
+        while True:
+            await asyncio.sleep(self.lease.total_seconds() / 3)
+            try:
+                renewed = await self._in_db_thread(self._renew, job)
+            except Exception as e:
+                logger.warning(f"Evaluation job {job.id}: lease renewal failed, retrying: {e}")
+                continue
+            if not renewed:
+                logger.warning(
+                    f"Evaluation job {job.id}: lease lost by {self.worker_id}, the job was reclaimed, "
+                    "evaluation cancelled"
+                )
+                evaluation.cancel()
+                return
+
+    def _claim(self) -> EvaluationJob | None:
+        with self.uow:
+            jobs = self.uow.datasets.claim_evaluation_jobs(self.worker_id, limit=1, lease=self.lease)
+        return jobs[0] if jobs else None
+
+    def _renew(self, job: EvaluationJob) -> bool:
+        with self.uow:
+            return self.uow.datasets.renew_evaluation_job_lease(job.id, self.worker_id, self.lease)
+
+    def _complete(self, job: EvaluationJob) -> None:
+        with self.uow:
+            completed = self.uow.datasets.complete_evaluation_job(job.id, self.worker_id)
+        if not completed:
+            logger.warning(f"Evaluation job {job.id}: not leased by {self.worker_id} anymore, completion not recorded")
+
+    def _fail(self, job: EvaluationJob, error: str) -> None:
+        with self.uow:
+            failed = self.uow.datasets.fail_evaluation_job(job.id, self.worker_id, error, retry_delay(job.attempts))
+        if not failed:
+            logger.warning(f"Evaluation job {job.id}: not leased by {self.worker_id} anymore, failure not recorded")
+
+    async def _in_db_thread(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.service.db_executor, partial(fn, *args))
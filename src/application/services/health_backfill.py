@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from uuid import UUID
+
+from domain.datasets.ports import AbstractDatasetRepository
+from domain.datasets.services import health_scoring
+from domain.unit_of_work import UnitOfWork
+
+
+@dataclass
+class BackfillProgress:
+    processed: int = 0
+    last_id: UUID | str | None = None
+
+
+def score_health_inputs(rows: list[dict]) -> list[tuple]:
+    """Score one batch of `stream_health_inputs` rows; runs in the worker processes, hence a module-level function."""
+    if not rows:
+        return []
+    scores = health_scoring.health_scores(
+        has_description=[row["has_description"] for row in rows],
+        is_slug_valid=[row["is_slug_valid"] for row in rows],
+        llm_score=[row["llm_score"] for row in rows],
+        syntax_change_score=[row["syntax_change_score"] for row in rows],
+        modified=[row["modified"] for row in rows],
+        frequency=[row["frequency"] for row in rows],
+        views=[row["views_count"] for row in rows],
+        api_calls=[row["api_calls_count"] for row in rows],
+        reuses=[row["reuses_count"] for row in rows],
+        slugs=[row["slug"] for row in rows],
+        scored=[not row["restricted"] and row["published"] is not False for row in rows],
+    )
+    return [(row["id"], *values) for row, values in zip(rows, scores.rows(), strict=True)]
+
+
+class HealthBackfillService:
+    """
+    Recompute the health scores of the whole catalog, e.g. after a change of scoring weights.
+
+    Inputs are streamed by dataset id from `reader` (a repository on its own connection, so that the
+    server-side cursor survives the commits of `uow`), scored by batches in a process pool and written back
+    with one UPDATE per batch. Batches are committed in id order: `progress.last_id` is a safe resume point.
+    """
+
+    def __init__(
+        self, uow: UnitOfWork, reader: AbstractDatasetRepository, workers: int | None = None, batch_size: int = 1000
+    ):
+        self.uow = uow
+        self.reader = reader
+        self.workers = workers
+        self.batch_size = batch_size
+
+    def run(
+        self, after_id: UUID | str | None = None, on_batch: Callable[[BackfillProgress], None] | None = None
+    ) -> BackfillProgress:
+        progress = BackfillProgress(last_id=after_id)
+        batches = self._batches(self.reader.stream_health_inputs(after_id=after_id))
+
+        workers = self.workers or os.cpu_count() or 1
+        if workers == 1:
+            for batch in batches:
+                self._write(score_health_inputs(batch), progress, on_batch)
+            return progress
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Bounded read-ahead: keep every worker busy without loading the catalog in memory
+            pending: deque[Future] = deque()
+            for batch in batches:
+                pending.append(executor.submit(score_health_inputs, batch))
+                if len(pending) >= workers * 2:
+                    self._write(pending.popleft().result(), progress, on_batch)
+            while pending:
+                self._write(pending.popleft().result(), progress, on_batch)
+        return progress
+
+    def _batches(self, rows: Iterator[dict]) -> Iterator[list[dict]]:
+        while batch := list(islice(rows, self.batch_size)):
+            yield batch
+
+    def _write(
+        self, scores: list[tuple], progress: BackfillProgress, on_batch: Callable[[BackfillProgress], None] | None
+    ) -> None:
+        with self.uow:
+            self.uow.datasets.update_health_scores(scores)
+        progress.processed += len(scores)
+        progress.last_id = scores[-1][0]
+        if on_batch:
+            on_batch(progress)
@@ -1,18 +1,106 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import threading
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
 from uuid import UUID
 
-from domain.quality.evaluation import MetadataEvaluation
+from domain.common.ports import ANALYTICS
+from domain.datasets.aggregate import Dataset
+from domain.quality.context_budget import context_tokens, trim_context
+from domain.quality.evaluation import EvaluationCacheKey, LLMUsage, MetadataEvaluation
 from domain.quality.ports import LLMEvaluator, MetadataMapper
 from domain.unit_of_work import UnitOfWork
 from logger import logger
 
+# Tokens of mapped metadata sent per evaluation: with the system prompt (~3k tokens) and the completion (2k),
+# this fits the 8k context window of local models
+DEFAULT_CONTEXT_TOKEN_BUDGET = 3000
+
+
+@dataclass
+class EvaluationCacheStats:
+    """Evaluation cache hits and misses of a service, safe to update from the workers sharing it."""
+
+    hits: int = 0
+    misses: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class LLMUsageStats:
+    """Tokens and latency of the LLM calls made by a service, to measure what an audit costs."""
+
+    calls: int = 0
+    prompt_tokens: int = 0
+    cached_prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_ms: float = 0.0  # Sum over the calls whose latency is known
+    timed_calls: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, usage: LLMUsage) -> None:
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += usage.prompt_tokens
+            self.cached_prompt_tokens += usage.cached_prompt_tokens
+            self.completion_tokens += usage.completion_tokens
+            if usage.latency_ms is not None:
+                self.latency_ms += usage.latency_ms
+                self.timed_calls += 1
+
+    @property
+    def cached_prompt_rate(self) -> float:
+        return self.cached_prompt_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    @property
+    def mean_latency_ms(self) -> float:
+        return self.latency_ms / self.timed_calls if self.timed_calls else 0.0
+
+
+@dataclass
+class PreparedEvaluation:
+    """A dataset with everything its LLM evaluation needs, or the evaluation found in cache for it."""
+
+    dataset: Dataset
+    context: dict
+    dcat_reference: str
+    charter: str
+    output: str
+    prompt_type: str
+    cache_key: EvaluationCacheKey
+    cached: MetadataEvaluation | None = None
+
 
 class QualityAssessmentService:
     """Service for assessing metadata quality using LLM."""
 
-    def __init__(self, evaluator: LLMEvaluator, uow: UnitOfWork, mappers: dict[str, MetadataMapper] | None = None):
+    def __init__(
+        self,
+        evaluator: LLMEvaluator,
+        uow: UnitOfWork,
+        mappers: dict[str, MetadataMapper] | None = None,
+        db_executor: Executor | None = None,
+        context_token_budget: int | None = DEFAULT_CONTEXT_TOKEN_BUDGET,
+    ):
         """
         Initialize quality assessment service.
 
@@ -20,10 +108,16 @@ class QualityAssessmentService:
             evaluator: LLM evaluator implementation
             uow: Unit of work for data access
             mappers: Dictionary of platform_type -> MetadataMapper
+            db_executor: Threads running the database work of async evaluations (default: the loop's executor)
+            context_token_budget: Estimated tokens the mapped metadata is trimmed to (None: not trimmed)
         """
         self.evaluator = evaluator
         self.uow = uow
         self.mappers = mappers or {}
+        self.db_executor = db_executor
+        self.context_token_budget = context_token_budget
+        self.cache_stats = EvaluationCacheStats()
+        self.usage_stats = LLMUsageStats()
 
     def evaluate_dataset(
         self,
@@ -32,22 +126,112 @@ class QualityAssessmentService:
         charter_path: str,
         output: str,
         prompt_type: str = "standard",
+        refresh: bool = False,
     ) -> MetadataEvaluation:
         """
         Orchestrate the quality evaluation of a dataset.
+
+        The LLM is only called when no evaluation is cached for the same context, prompt and model,
+        or when `refresh` is set (the new evaluation then replaces the cached one).
         """
+        with self.uow:
+            prepared = self._prepare(dataset_id, dcat_path, charter_path, output, prompt_type, refresh)
+            if prepared.cached:
+                return self._persist_results(prepared.dataset, prepared.cached)
+
+            evaluation = self._run_llm_evaluation(
+                prepared.context, prepared.dcat_reference, prepared.charter, output, prompt_type
+            )
+            return self._persist_results(prepared.dataset, evaluation, prepared.cache_key)
+
+    async def aevaluate_dataset(
+        self,
+        dataset_id: str | UUID,
+        dcat_path: str,
+        charter_path: str,
+        output: str,
+        prompt_type: str = "standard",
+        refresh: bool = False,
+    ) -> MetadataEvaluation:
+        """
+        Same as `evaluate_dataset`, awaiting the LLM through `aevaluate_metadata`: no thread or connection
+        is held while the model answers, the database work runs on `db_executor`.
+        """
+        prepared = await self._in_db_thread(
+            self.prepare_evaluation, dataset_id, dcat_path, charter_path, output, prompt_type, refresh
+        )
+        if prepared.cached:
+            return await self._in_db_thread(self.complete_evaluation, prepared)
+
+        evaluation = await self.evaluator.aevaluate_metadata(
+            dataset=prepared.context,
+            dcat_reference=prepared.dcat_reference,
+            charter=prepared.charter,
+            output=output,
+            prompt_type=prompt_type,
+        )
+        return await self._in_db_thread(self.complete_evaluation, prepared, evaluation)
+
+    def prepare_evaluation(
+        self,
+        dataset_id: str | UUID,
+        dcat_path: str,
+        charter_path: str,
+        output: str,
+        prompt_type: str = "standard",
+        refresh: bool = False,
+    ) -> PreparedEvaluation:
+        """Load a dataset and its LLM context, and look its evaluation up in cache (unless `refresh`)."""
+        with self.uow:
+            return self._prepare(dataset_id, dcat_path, charter_path, output, prompt_type, refresh)
+
+    def complete_evaluation(
+        self, prepared: PreparedEvaluation, evaluation: MetadataEvaluation | None = None
+    ) -> MetadataEvaluation:
+        """Record the new evaluation of a prepared dataset (cached along the way), or the one found in cache."""
+        with self.uow:
+            if evaluation is None:
+                return self._persist_results(prepared.dataset, prepared.cached)
+            return self._persist_results(prepared.dataset, evaluation, prepared.cache_key)
+
+    def record_evaluation(
+        self, dataset_id: str | UUID, evaluation: MetadataEvaluation, cache_key: EvaluationCacheKey
+    ) -> MetadataEvaluation:
+        """Record an evaluation obtained out of band (e.g. from the Batch API) and cache it under `cache_key`."""
         with self.uow:
             dataset_uuid = self._resolve_dataset_uuid(dataset_id)
             dataset_obj = self.uow.datasets.get(dataset_uuid)
             if not dataset_obj:
                 raise ValueError(f"Dataset not found: {dataset_uuid}")
+            return self._persist_results(dataset_obj, evaluation, cache_key)
 
-            dcat_ref, charter = self._load_references(dcat_path, charter_path)
-            llm_context = self._get_llm_context(dataset_obj)
+    async def _in_db_thread(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.db_executor, partial(fn, *args))
 
-            evaluation = self._run_llm_evaluation(llm_context, dcat_ref, charter, output, prompt_type)
+    def _prepare(
+        self, dataset_id: str | UUID, dcat_path: str, charter_path: str, output: str, prompt_type: str, refresh: bool
+    ) -> PreparedEvaluation:
+        dataset_uuid = self._resolve_dataset_uuid(dataset_id)
+        dataset_obj = self.uow.datasets.get(dataset_uuid)
+        if not dataset_obj:
+            raise ValueError(f"Dataset not found: {dataset_uuid}")
 
-            return self._persist_results(dataset_obj, evaluation)
+        dcat_ref, charter = self._load_references(dcat_path, charter_path)
+        llm_context = self._get_llm_context(dataset_obj)
+
+        cache_key = self._cache_key(llm_context, dcat_ref, charter, output, prompt_type)
+        cached = None if refresh else self._cached_evaluation(cache_key)
+        self.cache_stats.record(hit=cached is not None)
+        return PreparedEvaluation(
+            dataset=dataset_obj,
+            context=llm_context,
+            dcat_reference=dcat_ref,
+            charter=charter,
+            output=output,
+            prompt_type=prompt_type,
+            cache_key=cache_key,
+            cached=cached,
+        )
 
     def _load_references(self, dcat_path: str, charter_path: str) -> tuple[str, str]:
         return self._load_markdown(dcat_path), self._load_markdown(charter_path)
@@ -69,7 +253,43 @@ class QualityAssessmentService:
             llm_context = self._prepare_llm_context(dataset_obj, raw_dataset)
 
         # Cleanup empty fields
-        return {k: v for k, v in llm_context.items() if v and (not isinstance(v, dict) or any(v.values()))}
+        llm_context = {k: v for k, v in llm_context.items() if v and (not isinstance(v, dict) or any(v.values()))}
+        return self._fit_context(llm_context, dataset_obj)
+
+    def _fit_context(self, llm_context: dict, dataset_obj: any) -> dict:
+        if self.context_token_budget is None:
+            return llm_context
+        trimmed = trim_context(llm_context, self.context_token_budget)
+        if trimmed is not llm_context:
+            logger.info(
+                f"LLM context of {dataset_obj.slug} trimmed from ~{context_tokens(llm_context)} "
+                f"to ~{context_tokens(trimmed)} tokens"
+            )
+        return trimmed
+
+    def _cache_key(self, context: dict, dcat: str, charter: str, out: str, p_type: str) -> EvaluationCacheKey:
+        """Key of the evaluation cache: everything sent to the LLM, hashed, with the prompt and model names."""
+        content = json.dumps(
+            {"context": context, "dcat_reference": dcat, "charter": charter}, sort_keys=True, default=str
+        )
+        return EvaluationCacheKey(
+            context_hash=hashlib.sha256(content.encode("utf-8")).hexdigest(),
+            prompt_type=p_type,
+            output=out,
+            prompt_version=str(self.evaluator.prompt_version),
+            model=str(self.evaluator.model_name),
+        )
+
+    def _cached_evaluation(self, cache_key: EvaluationCacheKey) -> MetadataEvaluation | None:
+        cached = self.uow.datasets.get_cached_evaluation(cache_key)
+        if cached is None:
+            return None
+        logger.info(f"Evaluation cache hit ({cache_key.context_hash[:12]}, model={cache_key.model})")
+        evaluation = MetadataEvaluation.from_dict(cached)
+        evaluation.cached = True
+        evaluation.cached_from = evaluation.evaluated_at
+        evaluation.evaluated_at = datetime.now()
+        return evaluation
 
     def _run_llm_evaluation(self, context, dcat, charter, out, p_type) -> MetadataEvaluation:
         return self.evaluator.evaluate_metadata(
@@ -86,7 +306,10 @@ class QualityAssessmentService:
             return [self._sanitize_evaluation_data(item) for item in obj]
         return obj
 
-    def _persist_results(self, dataset: any, evaluation: MetadataEvaluation) -> MetadataEvaluation:
+    def _persist_results(
+        self, dataset: any, evaluation: MetadataEvaluation, cache_key: EvaluationCacheKey | None = None
+    ) -> MetadataEvaluation:
+        """Record the evaluation on the dataset, and in the evaluation cache under `cache_key` if given."""
         evaluation.dataset_id = dataset.id
         evaluation.dataset_slug = str(dataset.slug)
 
@@ -95,6 +318,8 @@ class QualityAssessmentService:
         eval_data = self._sanitize_evaluation_data(asdict(evaluation))
         eval_data["dataset_id"] = str(eval_data["dataset_id"])
         eval_data["evaluated_at"] = eval_data["evaluated_at"].isoformat()
+        if eval_data.get("cached_from"):
+            eval_data["cached_from"] = eval_data["cached_from"].isoformat()
 
         previous_raw = dataset.versions[-1].snapshot if dataset.versions else None
         blob_id = dataset.versions[-1].blob_id if dataset.versions else None
@@ -110,10 +335,23 @@ class QualityAssessmentService:
         )
 
         self.uow.datasets.add(dataset)
+        if cache_key:
+            self.uow.datasets.cache_evaluation(cache_key, eval_data)
+        if evaluation.usage and not evaluation.cached:
+            self._record_usage(dataset, evaluation.usage)
         self.uow.commit()
+        self.uow.cache.invalidate(ANALYTICS)
         logger.info(f"Evaluation complete for {dataset.slug}: score={evaluation.overall_score:.1f}")
         return evaluation
 
+    def _record_usage(self, dataset: any, usage: LLMUsage) -> None:
+        self.usage_stats.record(usage)
+        latency = f" in {usage.latency_ms:.0f} ms" if usage.latency_ms is not None else ""
+        logger.info(
+            f"LLM call for {dataset.slug} ({usage.model}): {usage.prompt_tokens} prompt tokens "
+            f"({usage.cached_prompt_tokens} cached), {usage.completion_tokens} completion tokens{latency}"
+        )
+
     def _resolve_dataset_uuid(self, dataset_id: str | UUID) -> UUID:
         """Resolve dataset_id (might be a UUID or a slug) to a UUID."""
         if isinstance(dataset_id, UUID):
@@ -149,9 +387,16 @@ class QualityAssessmentService:
         return {k: v for k, v in llm_context.items() if v and (not isinstance(v, dict) or any(v.values()))}
 
     def _load_markdown(self, path: str) -> str:
-        """Load markdown file content."""
+        """Load markdown file content, read from disk only when it changed."""
         file_path = Path(path)
         if not file_path.exists():
             raise FileNotFoundError(f"Reference file not found: {path}")
 
-        return file_path.read_text(encoding="utf-8")
+        return _read_markdown(str(file_path.resolve()), file_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _read_markdown(path: str, mtime_ns: int) -> str:
+    # Keyed by modification time: an edited reference is read again. Returning the same string object for
+    # unchanged files also keeps the memoized system prompt (see `build_system_prompt`) a cheap lookup.
+    return Path(path).read_text(encoding="utf-8")
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from io import BytesIO
 from typing import Any
 
@@ -20,6 +20,8 @@ from reportlab.platypus import (
 )
 
 from domain.datasets.aggregate import Dataset
+from domain.datasets.entities import VersionHistory
+from domain.datasets.value_objects import DatasetMetricsDelta
 
 # --- DSFR & Design System Colors ---
 DSFR_BLUE_FRANCE = colors.Color(0, 0, 0.569)  # #000091
@@ -241,8 +243,11 @@ class ReportGenerator:
         buffer.seek(0)
         return buffer
 
-    def generate_impact_report(self, dataset: Dataset) -> BytesIO:
-        """Entry point for a business-oriented Dataset Impact Report."""
+    def generate_impact_report(self, dataset: Dataset, deltas: dict[int, DatasetMetricsDelta] | None = None) -> BytesIO:
+        """
+        Entry point for a business-oriented Dataset Impact Report.
+        `deltas` (7 and 30 days, see get_metrics_deltas) spare loading the versions to compute the trends.
+        """
         buffer = BytesIO()
         doc = AuditReportTemplate(buffer)  # Reuse template for consistent header/footer
         styles = self._get_styles()
@@ -260,7 +265,7 @@ class ReportGenerator:
         self._add_impact_vitals(story, dataset, styles)
 
         # 4. Temporal Trends (Evolution)
-        self._add_evolution_trends(story, dataset, styles)
+        self._add_evolution_trends(story, dataset, styles, deltas)
 
         # 5. Engagement & Reuses
         self._add_engagement_details(story, dataset, styles)
@@ -592,66 +597,40 @@ class ReportGenerator:
         story.append(v_table)
         story.append(Spacer(1, 0.8 * cm))
 
-    def _add_evolution_trends(self, story: list, dataset: Dataset, styles: Any):
-        """Shows evolution of metrics over historical versions."""
+    def _add_evolution_trends(
+        self, story: list, dataset: Dataset, styles: Any, deltas: dict[int, DatasetMetricsDelta] | None = None
+    ):
+        """Shows the growth of the metrics over the last 7 and 30 days."""
         story.append(Paragraph("Dynamique Temporelle (Deltas)", styles["SectionHeader"]))
 
-        # Filter versions with valid timestamps
-        valid_versions = [v for v in dataset.versions if v.timestamp is not None]
-
-        if len(valid_versions) < 2:
+        if deltas is None:
+            deltas = self._deltas_from_versions(dataset)
+        if not deltas or 7 not in deltas or 30 not in deltas:
             story.append(
                 Paragraph("Données historiques insuffisantes pour calculer les tendances.", styles["SmallText"])
             )
             story.append(Spacer(1, 0.5 * cm))
             return
 
-        # Sort versions by timestamp
-        versions = sorted(valid_versions, key=lambda v: v.timestamp)
-        latest = versions[-1]
-
-        # Calculate deltas for 7 days and 30 days if possible
-        from datetime import timezone
-
-        now = datetime.now(timezone.utc)
-
-        def get_version_at_days_ago(days):
-            target = now - timedelta(days=days)
-            # Find the closest version that is at least 'days' old
-            for v in reversed(versions):
-                v_ts = v.timestamp if v.timestamp.tzinfo else v.timestamp.replace(tzinfo=timezone.utc)
-                if v_ts <= target:
-                    return v
-            return versions[0]
-
-        v_7d = get_version_at_days_ago(7)
-        v_30d = get_version_at_days_ago(30)
-
-        def get_delta_text(current, previous):
-            if current is None or previous is None:
+        def get_delta_text(delta):
+            if delta is None:
                 return "N/A"
-            delta = current - previous
             color = "green" if delta > 0 else "grey"
             return f'<font color="{color}">+{delta:,}</font>' if delta > 0 else f"{delta:,}"
 
-        trends_data = [
-            ["Metric", "Derniers 7 jours", "Derniers 30 jours"],
-            [
-                "Consultations",
-                Paragraph(get_delta_text(latest.views_count, v_7d.views_count), styles["NormalText"]),
-                Paragraph(get_delta_text(latest.views_count, v_30d.views_count), styles["NormalText"]),
-            ],
-            [
-                "Téléchargements",
-                Paragraph(get_delta_text(latest.downloads_count, v_7d.downloads_count), styles["NormalText"]),
-                Paragraph(get_delta_text(latest.downloads_count, v_30d.downloads_count), styles["NormalText"]),
-            ],
-            [
-                "Appels API",
-                Paragraph(get_delta_text(latest.api_calls_count, v_7d.api_calls_count), styles["NormalText"]),
-                Paragraph(get_delta_text(latest.api_calls_count, v_30d.api_calls_count), styles["NormalText"]),
-            ],
-        ]
+        trends_data = [["Metric", "Derniers 7 jours", "Derniers 30 jours"]]
+        for label, name in (
+            ("Consultations", "views_count"),
+            ("Téléchargements", "downloads_count"),
+            ("Appels API", "api_calls_count"),
+        ):
+            trends_data.append(
+                [
+                    label,
+                    Paragraph(get_delta_text(getattr(deltas[7], name)), styles["NormalText"]),
+                    Paragraph(get_delta_text(getattr(deltas[30], name)), styles["NormalText"]),
+                ]
+            )
 
         t_table = Table(trends_data, colWidths=[6 * cm, 5 * cm, 5 * cm])
         t_table.setStyle(
@@ -668,6 +647,33 @@ class ReportGenerator:
         story.append(t_table)
         story.append(Spacer(1, 0.8 * cm))
 
+    @staticmethod
+    def _deltas_from_versions(dataset: Dataset) -> dict[int, DatasetMetricsDelta]:
+        """Fallback when no deltas are given: 7 and 30 day deltas from the loaded versions."""
+
+        def aware(timestamp):
+            return timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=timezone.utc)
+
+        history = dataset.versions.metrics_only() if isinstance(dataset.versions, VersionHistory) else dataset.versions
+        versions = sorted((v for v in history if v.timestamp is not None), key=lambda v: aware(v.timestamp))
+        if len(versions) < 2:
+            return {}
+        latest = versions[-1]
+        now = datetime.now(timezone.utc)
+        deltas = {}
+        for days in (7, 30):
+            # The closest version that is at least 'days' old, else the oldest one
+            target = now - timedelta(days=days)
+            reference = next((v for v in reversed(versions) if aware(v.timestamp) <= target), versions[0])
+            growth = {}
+            for name in ("views_count", "downloads_count", "api_calls_count"):
+                current, previous = getattr(latest, name), getattr(reference, name)
+                growth[name] = None if current is None or previous is None else current - previous
+            deltas[days] = DatasetMetricsDelta(
+                dataset_id=dataset.id, since=reference.timestamp, until=latest.timestamp, **growth
+            )
+        return deltas
+
     def _add_engagement_details(self, story: list, dataset: Dataset, styles: Any):
         """Focus on Reuses and Followers."""
         story.append(Paragraph("Notoriété & Appropriation", styles["SectionHeader"]))
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from domain.datasets.ports import AbstractDatasetRepository
+from logger import logger
+
+
+@dataclass(frozen=True)
+class CompactDatasetVersionsCommand:
+    daily_after_days: int = 30  # Heartbeat versions older than this are folded to one per day
+    weekly_after_days: int = 180  # ... and older than this to one per week
+    # Range folded by a pass that never ran: later passes resume where the last one stopped. None folds the whole
+    # history every time
+    window_days: int | None = 7
+    partitions_ahead: int = 3
+
+
+@dataclass(frozen=True)
+class CompactDatasetVersionsOutput:
+    status: str
+    daily_removed: int = 0
+    weekly_removed: int = 0
+    partitions_created: int = 0
+
+
+class CompactDatasetVersionsUseCase:
+    """
+    Daily maintenance of the version history: creates the coming monthly partitions, then folds the heartbeat
+    versions (counters only) that aged past each threshold into daily, then weekly, rollups.
+    Each pass resumes where the previous one stopped, so a daily run touches a few partitions and a missed run is
+    caught up by the next; every pass is committed on its own.
+    """
+
+    def __init__(self, uow):
+        self.uow = uow
+
+    @property
+    def repository(self) -> AbstractDatasetRepository:
+        return self.uow.datasets
+
+    def handle(self, command: CompactDatasetVersionsCommand) -> CompactDatasetVersionsOutput:
+        now = datetime.now(timezone.utc)
+        with self.uow:
+            created = self.repository.ensure_version_partitions(months_ahead=command.partitions_ahead)
+
+        daily = self._fold(now - timedelta(days=command.daily_after_days), "day", command.window_days)
+        weekly = self._fold(now - timedelta(days=command.weekly_after_days), "week", command.window_days)
+        logger.info(f"Version history compacted: {daily} daily and {weekly} weekly folds, {created} new partitions")
+        return CompactDatasetVersionsOutput(
+            status="success", daily_removed=daily, weekly_removed=weekly, partitions_created=created
+        )
+
+    def _fold(self, end: datetime, bucket: str, window_days: int | None) -> int:
+        # Whole buckets only (UTC days, weeks starting on Monday), so that no bucket is split between two runs
+        end = end.replace(hour=0, minute=0, second=0, microsecond=0)
+        if bucket == "week":
+            end -= timedelta(days=end.weekday())
+        with self.uow:
+            start = self._resume_from(end, bucket, window_days)
+            if start is not None and start >= end:
+                return 0
+            return self.repository.compact_versions(start=start, end=end, bucket=bucket)
+
+    def _resume_from(self, end: datetime, bucket: str, window_days: int | None) -> datetime | None:
+        if window_days is None:
+            return None
+        return self.repository.get_compacted_until(bucket) or end - timedelta(days=window_days)
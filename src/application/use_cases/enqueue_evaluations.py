@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+
+from application.use_cases.plan_reevaluation import PlanReevaluationCommand, PlanReevaluationUseCase
+from domain.datasets.ports import AbstractDatasetRepository
+from domain.quality.jobs import EvaluationJobSelection
+from logger import logger
+
+PLANNED_PRIORITY = 1  # Datasets queued from a re-evaluation plan go before the bulk ones
+
+
+@dataclass(frozen=True)
+class EnqueueEvaluationsCommand:
+    prompt_type: str = "standard"
+    platform_slug: str | None = None
+    publisher: str | None = None
+    skip_evaluated: bool = False
+    limit: int | None = None
+    refresh: bool = False
+    requeue: bool = False  # Queue again the datasets whose job is done or failed
+    max_attempts: int = 3
+    drift_threshold: float | None = None  # Only the datasets a re-evaluation plan queues (see PlanReevaluationUseCase)
+    daily_budget: int = 200
+
+
+@dataclass(frozen=True)
+class EnqueueEvaluationsOutput:
+    status: str
+    enqueued: int = 0
+    planned: int | None = None  # Datasets of the re-evaluation plan, with a drift threshold
+
+
+class EnqueueEvaluationsUseCase:
+    """
+    Fills the LLM evaluation queue that audit workers pull from: every selected dataset, or with a drift threshold
+    only those the re-evaluation plan queues within the day's budget (queued again even if evaluated before).
+    """
+
+    def __init__(self, uow):
+        self.uow = uow
+
+    @property
+    def repository(self) -> AbstractDatasetRepository:
+        return self.uow.datasets
+
+    def handle(self, command: EnqueueEvaluationsCommand) -> EnqueueEvaluationsOutput:
+        selection = EvaluationJobSelection(
+            prompt_type=command.prompt_type,
+            platform_slug=command.platform_slug,
+            publisher=command.publisher,
+            skip_evaluated=command.skip_evaluated,
+            limit=command.limit,
+            refresh=command.refresh,
+            requeue=command.requeue,
+            max_attempts=command.max_attempts,
+        )
+        planned = None
+        if command.drift_threshold is not None:
+            plan = self._plan(command)
+            planned = len(plan)
+            selection = replace(selection, dataset_ids=plan, requeue=True, priority=PLANNED_PRIORITY)
+
+        with self.uow:
+            enqueued = self.repository.enqueue_evaluation_jobs(selection) if planned != 0 else 0
+        logger.info(f"Queued {enqueued} LLM evaluation jobs (prompt: {command.prompt_type})")
+        return EnqueueEvaluationsOutput(status="success", enqueued=enqueued, planned=planned)
+
+    def _plan(self, command: EnqueueEvaluationsCommand) -> tuple:
+        output = PlanReevaluationUseCase(self.uow).handle(
+            PlanReevaluationCommand(
+                drift_threshold=command.drift_threshold,
+                daily_budget=command.daily_budget,
+                platform_slug=command.platform_slug,
+                publisher=command.publisher,
+            )
+        )
+        return tuple(candidate.dataset_id for candidate in output.plan.queued)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import Executor
 from dataclasses import asdict, dataclass
 from typing import Optional
 from uuid import UUID
@@ -14,6 +15,7 @@ class EvaluateDatasetCommand:
     dataset_id: UUID
     dcat_path: str = "docs/quality/dcat_reference.md"
     charter_path: str = "docs/quality/charter_opendata.md"
+    refresh: bool = False  # Call the LLM even if an evaluation of the same metadata is cached
 
 
 @dataclass(frozen=True)
@@ -24,10 +26,17 @@ class EvaluateDatasetOutput:
 
 
 class EvaluateDatasetUseCase:
-    def __init__(self, uow, evaluator: LLMEvaluator, mappers: dict[str, MetadataMapper] | None = None):
+    def __init__(
+        self,
+        uow,
+        evaluator: LLMEvaluator,
+        mappers: dict[str, MetadataMapper] | None = None,
+        db_executor: Executor | None = None,
+    ):
         self.uow = uow
         self.evaluator = evaluator
         self.mappers = mappers
+        self.db_executor = db_executor
 
     def handle(self, command: EvaluateDatasetCommand) -> EvaluateDatasetOutput:
         """
@@ -40,11 +49,35 @@ class EvaluateDatasetUseCase:
             logger.error(f"Evaluation failed for {command.dataset_id}: {e}")
             return EvaluateDatasetOutput(status="failed", error=str(e))
 
+    async def ahandle(self, command: EvaluateDatasetCommand) -> EvaluateDatasetOutput:
+        """
+        Same as `handle`, awaiting the LLM: database work runs on `db_executor` only while it lasts.
+        """
+        try:
+            service = self._service()
+            results = await service.aevaluate_dataset(
+                dataset_id=str(command.dataset_id),
+                dcat_path=command.dcat_path,
+                charter_path=command.charter_path,
+                output="json",
+                refresh=command.refresh,
+            )
+            return EvaluateDatasetOutput(status="success", evaluation=asdict(results))
+        except Exception as e:
+            logger.error(f"Evaluation failed for {command.dataset_id}: {e}")
+            return EvaluateDatasetOutput(status="failed", error=str(e))
+
+    def _service(self) -> QualityAssessmentService:
+        return QualityAssessmentService(
+            evaluator=self.evaluator, uow=self.uow, mappers=self.mappers, db_executor=self.db_executor
+        )
+
     def _perform_evaluation(self, command: EvaluateDatasetCommand):
-        service = QualityAssessmentService(evaluator=self.evaluator, uow=self.uow, mappers=self.mappers)
+        service = self._service()
         return service.evaluate_dataset(
             dataset_id=str(command.dataset_id),
             dcat_path=command.dcat_path,
             charter_path=command.charter_path,
             output="json",
+            refresh=command.refresh,
         )
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from domain.datasets.ports import AbstractDatasetRepository
+from domain.quality.reevaluation import ReevaluationPlan, plan_reevaluations
+from logger import logger
+
+
+@dataclass(frozen=True)
+class PlanReevaluationCommand:
+    drift_threshold: float = 10.0  # Minimal drift (0-100) since the last evaluation to evaluate again
+    daily_budget: int = 200  # LLM evaluations per UTC day, those queued or run today included
+    platform_slug: str | None = None
+    publisher: str | None = None
+
+
+@dataclass(frozen=True)
+class PlanReevaluationOutput:
+    status: str
+    plan: ReevaluationPlan
+    budget_used: int = 0  # Evaluation jobs queued, or claimed today
+
+
+class PlanReevaluationUseCase:
+    """
+    Decides which datasets deserve a new LLM evaluation: the metadata of each published dataset is compared with
+    the blob it was last evaluated on (see `SyntaxAnalyzer`), and the datasets that drifted past the threshold are
+    queued by priority within what is left of the day's LLM budget.
+    """
+
+    def __init__(self, uow):
+        self.uow = uow
+
+    @property
+    def repository(self) -> AbstractDatasetRepository:
+        return self.uow.datasets
+
+    def handle(self, command: PlanReevaluationCommand) -> PlanReevaluationOutput:
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        with self.uow:
+            used = self.repository.count_llm_evaluations(since=today)
+            rows = self.repository.stream_reevaluation_inputs(
+                platform_slug=command.platform_slug, publisher=command.publisher
+            )
+            plan = plan_reevaluations(rows, threshold=command.drift_threshold, budget=command.daily_budget - used)
+        logger.info(
+            f"Re-evaluation plan: {len(plan.queued)} queued, {len(plan.over_budget)} over budget, "
+            f"{plan.below_threshold} below threshold, {plan.unchanged} unchanged ({used} evaluations queued or run today)"
+        )
+        return PlanReevaluationOutput(status="success", plan=plan, budget_used=used)
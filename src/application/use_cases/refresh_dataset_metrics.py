@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from uuid import UUID
+
+from common import calculate_snapshot_patch
+from domain.datasets.aggregate import Dataset
+from domain.datasets.value_objects import DatasetMetricsParams
+from domain.platform.ports import DatasetAdapter, PlatformRepository
+from infrastructure.factories.dataset import DatasetAdapterFactory
+from infrastructure.factories.platform import PlatformAdapterFactory
+
+METRIC_FIELDS = (
+    "downloads_count",
+    "api_calls_count",
+    "views_count",
+    "reuses_count",
+    "followers_count",
+    "popularity_score",
+)
+
+
+@dataclass(frozen=True)
+class RefreshDatasetMetricsCommand:
+    platform_id: UUID
+
+
+@dataclass(frozen=True)
+class RefreshDatasetMetricsOutput:
+    status: str
+    updated_count: int = 0
+    message: str = ""
+
+
+class RefreshDatasetMetricsUseCase:
+    """
+    Cheap counters-only pass: reads one paginated metrics stream per platform and records a version
+    (reusing the latest blob) for datasets whose counters moved. Metadata is neither fetched nor hashed.
+    """
+
+    def __init__(self, uow):
+        self.uow = uow
+        self.platform_factory = PlatformAdapterFactory()
+        self.dataset_factory = DatasetAdapterFactory()
+
+    @property
+    def repository(self) -> PlatformRepository:
+        return self.uow.platforms
+
+    def handle(self, command: RefreshDatasetMetricsCommand) -> RefreshDatasetMetricsOutput:
+        """
+        Main orchestration for the metrics-only pass.
+        """
+        with self.uow:
+            platform = self.repository.get(platform_id=command.platform_id)
+            if not platform:
+                return RefreshDatasetMetricsOutput(status="failed", message="Not found")
+            states = self.uow.datasets.get_sync_states(platform_id=platform.id)
+
+        started_at = datetime.now(timezone.utc)
+        by_slug = {str(dataset.slug): dataset for dataset in states.values()}
+        adapter = self.platform_factory.create(
+            platform_type=platform.type,
+            url=platform.url,
+            key=platform.key,
+            slug=platform.slug,
+        )
+        mapper = self.dataset_factory.create(platform_type=platform.type)
+
+        # A dataset listed twice keeps its last record: one statement cannot upsert the same row twice
+        params_by_dataset: dict[UUID, DatasetMetricsParams] = {}
+        for record in adapter.fetch_metrics():
+            params = self._build_params(mapper, record, by_slug)
+            if params:
+                params_by_dataset[params.dataset_id] = params
+        params_list = list(params_by_dataset.values())
+
+        with self.uow:
+            self.uow.datasets.add_metrics_versions(params_list)
+            self.repository.save_incremental_sync(
+                platform_id=platform.id,
+                payload={
+                    "timestamp": started_at,
+                    "status": "success",
+                    "datasets_count": len(params_list),
+                    "mode": "metrics",
+                },
+            )
+        return RefreshDatasetMetricsOutput(status="success", updated_count=len(params_list))
+
+    @staticmethod
+    def _build_params(mapper: DatasetAdapter, record: dict, by_slug: dict[str, Dataset]) -> DatasetMetricsParams | None:
+        try:
+            dto = mapper.map(**record)
+        except Exception:
+            return None
+
+        existing = by_slug.get(str(dto.slug))
+        if not existing or existing.is_deleted or not existing.last_version_timestamp:
+            return None
+
+        current = {field: getattr(existing, field) for field in METRIC_FIELDS}
+        # Sources may only expose some counters: missing ones keep their last known value
+        incoming = {**current, **{f: getattr(dto, f) for f in METRIC_FIELDS if getattr(dto, f) is not None}}
+        if incoming == current or existing.is_cooldown_active():
+            return None
+
+        return DatasetMetricsParams(
+            dataset_id=existing.id, diff=calculate_snapshot_patch(current, incoming), **incoming
+        )
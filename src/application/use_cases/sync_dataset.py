@@ -4,15 +4,28 @@ from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID
 
+from domain.common.ports import ANALYTICS, PUBLISHERS
 from domain.datasets.aggregate import Dataset
 from domain.datasets.exceptions import DatasetUnreachableError
 from domain.datasets.ports import AbstractDatasetRepository
-from domain.datasets.value_objects import DatasetVersionParams
+from domain.datasets.value_objects import DatasetVersionParams, DatasetVersionState
 from domain.platform.aggregate import Platform
 from infrastructure.factories.dataset import DatasetAdapterFactory
 from logger import logger
 
 
+def is_ods_datagouv_pair(page: str, other_page: str) -> bool:
+    """True when one page is on data.economie.gouv.fr (ODS) and the other on data.gouv.fr."""
+
+    def is_ods(p: str) -> bool:
+        return str(p).startswith("https://data.economie.gouv.fr")
+
+    def is_dg(p: str) -> bool:
+        return "data.gouv.fr" in str(p)
+
+    return (is_ods(page) and is_dg(other_page)) or (is_dg(page) and is_ods(other_page))
+
+
 @dataclass(frozen=True)
 class SyncDatasetCommand:
     platform: Platform
@@ -85,14 +98,15 @@ class SyncDatasetUseCase:
             self.repository.add(dataset=instance)
 
             if not existing or existing.should_version(instance):
-                self._add_version(instance)
+                self._add_version(instance, previous=existing.current_version if existing else None)
 
             self.repository.update_dataset_sync_status(platform.id, instance.id, "success")
             self._link_datasets(instance)
 
-            return SyncDatasetOutput(dataset_id=instance.id, status="success")
+        self.uow.cache.invalidate(ANALYTICS, PUBLISHERS)
+        return SyncDatasetOutput(dataset_id=instance.id, status="success")
 
-    def _add_version(self, instance: Dataset) -> None:
+    def _add_version(self, instance: Dataset, previous: DatasetVersionState | None = None) -> None:
         params = DatasetVersionParams(
             dataset_id=instance.id,
             snapshot=instance.raw,
@@ -106,6 +120,7 @@ class SyncDatasetUseCase:
             popularity_score=instance.popularity_score,
             records_count=instance.records_count,
             size_bytes=instance.size_bytes,
+            previous=previous,
         )
         self.repository.add_version(params)
 
@@ -123,14 +138,8 @@ class SyncDatasetUseCase:
         if not linked_dataset:
             return
 
-        def is_ods(d: Dataset) -> bool:
-            return str(d.page).startswith("https://data.economie.gouv.fr")
-
-        def is_dg(d: Dataset) -> bool:
-            return "data.gouv.fr" in str(d.page)
-
         # Establish link if it's an ODS <-> DG pair
-        if (is_ods(dataset) and is_dg(linked_dataset)) or (is_dg(dataset) and is_ods(linked_dataset)):
+        if is_ods_datagouv_pair(dataset.page, linked_dataset.page):
             self._establish_bidirectional_link(dataset, linked_dataset)
 
     def _establish_bidirectional_link(self, d1: Dataset, d2: Dataset) -> None:
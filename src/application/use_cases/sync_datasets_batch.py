@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from uuid import UUID
+
+from application.use_cases.sync_dataset import is_ods_datagouv_pair
+from domain.common.ports import ANALYTICS, PUBLISHERS
+from domain.datasets.aggregate import Dataset
+from domain.datasets.factory import DatasetFactory
+from domain.datasets.ports import AbstractDatasetRepository
+from domain.datasets.value_objects import DatasetVersionParams
+from domain.platform.aggregate import Platform
+from infrastructure.factories.dataset import DatasetAdapterFactory
+from logger import logger
+
+DEFAULT_SYNC_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class SyncDatasetsBatchCommand:
+    platform: Platform
+    datasets: Iterable[dict]
+    batch_size: int = DEFAULT_SYNC_BATCH_SIZE
+
+
+@dataclass(frozen=True)
+class SyncDatasetsBatchOutput:
+    status: str
+    success_count: int = 0
+    failed_count: int = 0
+    skipped_count: int = 0
+    failed_datasets: tuple[dict, ...] = ()  # Raw payloads that were not synced
+
+
+class SyncDatasetsBatchUseCase:
+    """
+    Bulk counterpart of SyncDatasetUseCase for full platform runs.
+
+    Existing datasets and their last checksum/metrics, and the hashes of the stored blobs, are preloaded
+    once for the whole platform, then datasets are persisted by chunks of `batch_size` with multi-row
+    statements, each chunk being committed on its own. Unchanged blobs are not sent again.
+    """
+
+    def __init__(self, uow):
+        self.uow = uow
+        self.adapter_factory = DatasetAdapterFactory()
+
+    @property
+    def repository(self) -> AbstractDatasetRepository:
+        return self.uow.datasets
+
+    def handle(self, command: SyncDatasetsBatchCommand) -> SyncDatasetsBatchOutput:
+        """
+        Main orchestration for batched dataset synchronization.
+        """
+        with self.uow:
+            states = self.repository.get_sync_states(platform_id=command.platform.id)
+            known_blobs = self.repository.get_blob_ids(platform_id=command.platform.id)
+
+        stats = {"success": 0, "failed": [], "skipped": 0}
+        chunk = []
+        for raw_data in command.datasets:
+            chunk.append(raw_data)
+            if len(chunk) >= command.batch_size:
+                self._sync_chunk(command.platform, chunk, states, known_blobs, stats)
+                chunk = []
+        if chunk:
+            self._sync_chunk(command.platform, chunk, states, known_blobs, stats)
+
+        return SyncDatasetsBatchOutput(
+            status="success" if not stats["failed"] else "partial",
+            success_count=stats["success"],
+            failed_count=len(stats["failed"]),
+            skipped_count=stats["skipped"],
+            failed_datasets=tuple(stats["failed"]),
+        )
+
+    def _sync_chunk(
+        self, platform: Platform, chunk: list[dict], states: dict[str, Dataset], known_blobs: dict, stats: dict
+    ) -> None:
+        instances, failed_ids = self._build_instances(platform, chunk, states, stats)
+        if not instances and not failed_ids:
+            return
+
+        try:
+            with self.uow:
+                versions = self._persist(platform, instances, states, known_blobs, failed_ids)
+                self._link_datasets(instances)
+        except Exception as e:
+            # Blobs of the rolled back chunk may be listed: fall back to the conflict-checked inserts
+            known_blobs.clear()
+            already_failed = {id(raw_data) for raw_data in stats["failed"]}
+            stats["failed"].extend(raw_data for raw_data in chunk if raw_data and id(raw_data) not in already_failed)
+            logger.error(f"{platform.type.upper()} - Batch of {len(instances)} datasets failed: {e}")
+            return
+        self.uow.cache.invalidate(ANALYTICS, PUBLISHERS)
+
+        now = datetime.now(timezone.utc)
+        for instance in instances.values():
+            if instance.id in versions:
+                instance.last_version_timestamp = now
+            else:
+                instance.last_version_timestamp = states[instance.buid].last_version_timestamp
+            states[instance.buid] = instance
+        stats["success"] += len(instances)
+
+    def _build_instances(
+        self, platform: Platform, chunk: list[dict], states: dict[str, Dataset], stats: dict
+    ) -> tuple[dict[str, Dataset], list[UUID]]:
+        """Map raw payloads to aggregates, keeping the last occurrence of each buid."""
+        adapter = self.adapter_factory.create(platform_type=platform.type)
+        instances: dict[str, Dataset] = {}
+        failed_ids = []
+        states_by_slug = None
+        for raw_data in chunk:
+            if not raw_data:
+                stats["skipped"] += 1
+                continue
+            if raw_data.get("sync_status") == "failed":
+                stats["failed"].append(raw_data)
+                if states_by_slug is None:
+                    states_by_slug = self._index_states_by_slug(states)
+                existing = states_by_slug.get(raw_data.get("slug") or raw_data.get("dataset_id"))
+                if existing:
+                    failed_ids.append(existing.id)
+                continue
+            try:
+                instance = DatasetFactory.create_from_adapter(adapter=adapter, platform=platform, raw_data=raw_data)
+                instance.prepare_for_persistence()
+            except Exception as e:
+                stats["failed"].append(raw_data)
+                logger.error(f"{platform.type.upper()} - {raw_data.get('id') or raw_data.get('dataset_id')} - {e}")
+                continue
+            instances[instance.buid] = instance
+        return instances, failed_ids
+
+    @staticmethod
+    def _index_states_by_slug(states: dict[str, Dataset]) -> dict[str, Dataset]:
+        """Index the known states by slug, keeping the first state of each slug."""
+        states_by_slug: dict[str, Dataset] = {}
+        for state in states.values():
+            if state.slug:
+                states_by_slug.setdefault(str(state.slug), state)
+        return states_by_slug
+
+    def _persist(
+        self,
+        platform: Platform,
+        instances: dict[str, Dataset],
+        states: dict[str, Dataset],
+        known_blobs: dict,
+        failed_ids: list[UUID],
+    ) -> set[UUID]:
+        versions = []
+        for buid, instance in instances.items():
+            existing = states.get(buid)
+            if existing:
+                instance.merge_with_existing(existing)
+            if not existing or existing.should_version(instance):
+                versions.append(self._version_params(instance))
+
+        self.repository.add_many(list(instances.values()))
+        self.repository.add_versions(versions, known_blobs=known_blobs)
+        self.repository.update_datasets_sync_status(platform.id, [i.id for i in instances.values()], "success")
+        self.repository.update_datasets_sync_status(platform.id, failed_ids, "failed")
+        return {params.dataset_id for params in versions}
+
+    @staticmethod
+    def _version_params(instance: Dataset) -> DatasetVersionParams:
+        return DatasetVersionParams(
+            dataset_id=instance.id,
+            snapshot=instance.raw,
+            checksum=instance.checksum,
+            title=instance.title,
+            downloads_count=instance.downloads_count,
+            api_calls_count=instance.api_calls_count,
+            views_count=instance.views_count,
+            reuses_count=instance.reuses_count,
+            followers_count=instance.followers_count,
+            popularity_score=instance.popularity_score,
+            records_count=instance.records_count,
+            size_bytes=instance.size_bytes,
+        )
+
+    def _link_datasets(self, instances: dict[str, Dataset]) -> None:
+        """
+        Reconcile ODS (economie.gouv.fr) and DataGouv datasets of the chunk with a single slug lookup.
+        """
+        wanted = {}
+        for instance in instances.values():
+            linked_slug = instance.extract_external_link_slug() or str(instance.slug)
+            wanted[instance.id] = _slug_candidates(linked_slug)
+
+        candidates = {}
+        for row in self.repository.find_by_slugs([slug for slugs in wanted.values() for slug in slugs]):
+            candidates.setdefault(row["slug"], []).append(row)
+
+        links = {}
+        for instance in instances.values():
+            target = self._find_link_target(instance, wanted[instance.id], candidates)
+            if target and is_ods_datagouv_pair(instance.page, target["page"]):
+                instance.linked_dataset_id = target["id"]
+                links[instance.id] = target["id"]
+                links[target["id"]] = instance.id
+                logger.info(f"Link established (Bidirectional): {instance.slug} <-> {target['slug']}")
+
+        self.repository.update_linkings(list(links.items()))
+
+    @staticmethod
+    def _find_link_target(instance: Dataset, slugs: list[str], candidates: dict[str, list[dict]]) -> dict | None:
+        for slug in slugs:
+            match = next((row for row in candidates.get(slug, []) if row["id"] != instance.id), None)
+            if match:
+                return match
+        return None
+
+
+def _slug_candidates(slug: str) -> list[str]:
+    """Slug to look up, plus its variant without a DataGouv-style numeric suffix ('-12345')."""
+    if "-" in slug:
+        base, suffix = slug.rsplit("-", 1)
+        if suffix.isdigit():
+            return [slug, base]
+    return [slug]
@@ -7,7 +7,7 @@ from application.use_cases.check_deleted_datasets import (
     CheckDeletedDatasetsCommand,
     CheckDeletedDatasetsUseCase,
 )
-from domain.datasets.ports import AbstractDatasetRepository
+from domain.common.ports import ANALYTICS, PUBLISHERS
 from domain.platform.aggregate import Platform
 from domain.platform.ports import PlatformRepository
 from infrastructure.factories.platform import PlatformAdapterFactory
@@ -34,10 +34,6 @@ class SyncPlatformUseCase:
     def repository(self) -> PlatformRepository:
         return self.uow.platforms
 
-    @property
-    def dataset_repository(self) -> AbstractDatasetRepository:
-        return self.uow.datasets
-
     def handle(self, command: SyncPlatformCommand) -> SyncPlatformOutput:
         """
         Main orchestration for platform metadata sync.
@@ -48,7 +44,9 @@ class SyncPlatformUseCase:
                 return SyncPlatformOutput(status="failed", message="Not found")
 
             output = self._execute_sync(platform)
-            return output
+        if output.status == "success":
+            self.uow.cache.invalidate(ANALYTICS, PUBLISHERS)
+        return output
 
     def _execute_sync(self, platform: Platform) -> SyncPlatformOutput:
         adapter = self.factory.create(
@@ -67,9 +65,6 @@ class SyncPlatformUseCase:
                 deletion_command = CheckDeletedDatasetsCommand(platform=platform, datasets=payload["datasets"])
                 self.check_deleted_use_case.handle(deletion_command)
 
-            # Refresh analytics views after meta sync
-            self.dataset_repository.refresh_materialized_views()
-
             return SyncPlatformOutput(status="success", message="Completed")
         except Exception as e:
             return SyncPlatformOutput(status="failed", message=str(e))
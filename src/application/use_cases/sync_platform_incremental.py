@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from uuid import UUID
+
+from application.use_cases.sync_datasets_batch import (
+    DEFAULT_SYNC_BATCH_SIZE,
+    SyncDatasetsBatchCommand,
+    SyncDatasetsBatchUseCase,
+)
+from domain.common.constants import INCREMENTAL_SYNC_MAX_ATTEMPTS, INCREMENTAL_SYNC_OVERLAP_MINUTES
+from domain.datasets.exceptions import DatasetGoneError
+from domain.platform.aggregate import Platform
+from domain.platform.ports import PlatformRepository
+from infrastructure.factories.dataset import DatasetAdapterFactory
+from infrastructure.factories.platform import PlatformAdapterFactory
+from logger import logger
+
+
+@dataclass(frozen=True)
+class IncrementalSyncPlatformCommand:
+    platform_id: UUID
+    since: Optional[datetime] = None
+    batch_size: int = DEFAULT_SYNC_BATCH_SIZE
+
+
+@dataclass(frozen=True)
+class IncrementalSyncPlatformOutput:
+    status: str
+    datasets_count: int = 0
+    message: str = ""
+
+
+class IncrementalSyncPlatformUseCase:
+    """
+    Delta sync: only datasets modified at the source since the platform high-water mark get the full
+    fetch/merge/hash treatment. The start time of each run whose change listing succeeded becomes the next
+    high-water mark; the modified datasets that could not be fetched or synced are recorded on the run and
+    fetched again by the next one, so a failing dataset never holds the mark back. Datasets gone from the
+    source are dropped at once, the others after INCREMENTAL_SYNC_MAX_ATTEMPTS failed runs.
+    """
+
+    def __init__(self, uow):
+        self.uow = uow
+        self.platform_factory = PlatformAdapterFactory()
+        self.dataset_factory = DatasetAdapterFactory()
+        self.batch_use_case = SyncDatasetsBatchUseCase(uow)
+
+    @property
+    def repository(self) -> PlatformRepository:
+        return self.uow.platforms
+
+    def handle(self, command: IncrementalSyncPlatformCommand) -> IncrementalSyncPlatformOutput:
+        """
+        Main orchestration for incremental platform sync.
+        """
+        with self.uow:
+            platform = self.repository.get(platform_id=command.platform_id)
+            if not platform:
+                return IncrementalSyncPlatformOutput(status="failed", message="Not found")
+            since = command.since or self._resolve_since(platform)
+            attempts = self.repository.get_retry_datasets(platform_id=platform.id)
+
+        if since is None:
+            return IncrementalSyncPlatformOutput(status="failed", message="No previous sync, run a full sync first")
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
+        started_at = datetime.now(timezone.utc)
+        # A listing error propagates: no row is saved and the next run starts from the same mark
+        modified_ids, raw_datasets, gone_ids = self._fetch_changes(platform, since, list(attempts))
+        output = self.batch_use_case.handle(
+            SyncDatasetsBatchCommand(platform=platform, datasets=raw_datasets.values(), batch_size=command.batch_size)
+        )
+
+        failed = {id(raw_data) for raw_data in output.failed_datasets}
+        failed_ids = [
+            dataset_id
+            for dataset_id in modified_ids
+            if dataset_id not in gone_ids and (dataset_id not in raw_datasets or id(raw_datasets[dataset_id]) in failed)
+        ]
+        retry_datasets = self._next_attempts(platform, failed_ids, attempts)
+        status = "success" if not failed_ids else "partial_success"
+        with self.uow:
+            self.repository.save_incremental_sync(
+                platform_id=platform.id,
+                payload={
+                    "timestamp": started_at,
+                    "status": status,
+                    "datasets_count": output.success_count,
+                    "mode": "incremental",
+                    "high_water_mark": started_at,
+                    "retry_datasets": retry_datasets,
+                },
+            )
+        message = f"{len(modified_ids)} modified since {since.isoformat()}"
+        if gone_ids:
+            message += f", {len(gone_ids)} gone"
+        if failed_ids:
+            message += f", {len(retry_datasets)} to retry, {len(failed_ids) - len(retry_datasets)} given up"
+        return IncrementalSyncPlatformOutput(status=status, datasets_count=output.success_count, message=message)
+
+    def _resolve_since(self, platform: Platform) -> datetime | None:
+        """Last incremental run, falling back on the last full platform sync."""
+        since = self.repository.get_high_water_mark(platform_id=platform.id) or platform.last_sync
+        if since is None:
+            return None
+        return since - timedelta(minutes=INCREMENTAL_SYNC_OVERLAP_MINUTES)
+
+    @staticmethod
+    def _next_attempts(platform: Platform, failed_ids: list[str], attempts: dict[str, int]) -> dict[str, int]:
+        """Count one more failed attempt per dataset, giving up on those reaching the limit."""
+        retry_datasets = {}
+        for dataset_id in failed_ids:
+            count = attempts.get(dataset_id, 0) + 1
+            if count >= INCREMENTAL_SYNC_MAX_ATTEMPTS:
+                logger.error(f"{str(platform.type).upper()} - {dataset_id} - given up after {count} failed syncs")
+            else:
+                retry_datasets[dataset_id] = count
+        return retry_datasets
+
+    def _fetch_changes(
+        self, platform: Platform, since: datetime, retry_ids: list[str]
+    ) -> tuple[list[str], dict[str, dict], set[str]]:
+        """
+        Datasets modified since `since` plus those left to retry, the payloads that could be fetched, and the
+        datasets the source no longer has.
+        """
+        adapter = self.platform_factory.create(
+            platform_type=platform.type,
+            url=platform.url,
+            key=platform.key,
+            slug=platform.slug,
+        )
+        dataset_ids = list(dict.fromkeys([*adapter.fetch_modified_since(since), *retry_ids]))
+        if not dataset_ids:
+            return [], {}, set()
+
+        dataset_adapter = self.dataset_factory.create(platform_type=platform.type)
+        results = asyncio.run(dataset_adapter.afetch_many(platform.url, platform.key, dataset_ids))
+        raw_datasets = {}
+        gone_ids = set()
+        for dataset_id, result in results.items():
+            if isinstance(result, DatasetGoneError):
+                gone_ids.add(dataset_id)
+                logger.info(f"{str(platform.type).upper()} - {dataset_id} - gone from the source, not retried")
+            elif isinstance(result, Exception):
+                logger.warning(f"{str(platform.type).upper()} - {dataset_id} - {result!r}")
+            else:
+                raw_datasets[dataset_id] = result
+        return dataset_ids, raw_datasets, gone_ids
@@ -1,4 +1,5 @@
 import json
+from bisect import bisect_left
 from datetime import datetime
 from urllib.parse import urlparse
 from uuid import UUID
@@ -55,15 +56,155 @@ def calculate_snapshot_diff(old: dict, new: dict) -> dict:
     return diff
 
 
+# Keys identifying the items of a list of objects (resources, ODS fields...), by priority
+LIST_IDENTITY_KEYS = ("id", "url", "name")
+
+
+def calculate_snapshot_patch(old: dict, new: dict) -> list[dict]:
+    """
+    Calculates the differences between two snapshots as a compact list of JSON-Patch-style operations:
+    `{"op": "add", "path", "value"}`, `{"op": "remove", "path"}`, `{"op": "replace", "path", "old", "value"}`
+    and `{"op": "move", "from", "path"}`, paths being JSON Pointers.
+
+    Equal subtrees are skipped without being walked. Lists of objects are matched by identity (see
+    LIST_IDENTITY_KEYS), so inserting one resource yields one "add" instead of shifting every index:
+    removed items are addressed by their old index, the other ones by their new index, and "move" is only
+    emitted for items whose order relative to the others changed. Other lists of scalars are replaced as a whole.
+    """
+    ops = []
+    _patch_value(old, new, "", ops)
+    return ops
+
+
+def _pointer(path: str, key) -> str:
+    return f"{path}/{str(key).replace('~', '~0').replace('/', '~1')}"
+
+
+def _patch_value(old, new, path: str, ops: list[dict]) -> None:
+    if old is new or old == new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        _patch_dict(old, new, path, ops)
+    elif isinstance(old, list) and isinstance(new, list):
+        _patch_list(old, new, path, ops)
+    else:
+        ops.append({"op": "replace", "path": path, "old": old, "value": new})
+
+
+def _patch_dict(old: dict, new: dict, path: str, ops: list[dict]) -> None:
+    for key, value in old.items():
+        if key not in new:
+            ops.append({"op": "remove", "path": _pointer(path, key)})
+        else:
+            _patch_value(value, new[key], _pointer(path, key), ops)
+    for key, value in new.items():
+        if key not in old:
+            ops.append({"op": "add", "path": _pointer(path, key), "value": value})
+
+
+def _identities(items: list) -> list | None:
+    """Identity of each item, or None when the list items cannot all be told apart by one identity key."""
+    if not items or not all(isinstance(item, dict) for item in items):
+        return None
+    for key in LIST_IDENTITY_KEYS:
+        values = [item.get(key) for item in items]
+        if all(isinstance(v, str | int) for v in values) and len(set(values)) == len(values):
+            return values
+    return None
+
+
+def _patch_list(old: list, new: list, path: str, ops: list[dict]) -> None:
+    old_ids = _identities(old)
+    new_ids = _identities(new)
+    if old_ids is not None and (new_ids is not None or not new):
+        _patch_list_by_identity(old, new, old_ids, new_ids or [], path, ops)
+    elif any(isinstance(item, dict | list) for item in old) or any(isinstance(item, dict | list) for item in new):
+        _patch_list_by_position(old, new, path, ops)
+    else:
+        ops.append({"op": "replace", "path": path, "old": old, "value": new})
+
+
+def _patch_list_by_position(old: list, new: list, path: str, ops: list[dict]) -> None:
+    for index, (old_item, new_item) in enumerate(zip(old, new, strict=False)):
+        _patch_value(old_item, new_item, _pointer(path, index), ops)
+    for index in range(len(old) - 1, len(new) - 1, -1):
+        ops.append({"op": "remove", "path": _pointer(path, index)})
+    for index in range(len(old), len(new)):
+        ops.append({"op": "add", "path": _pointer(path, index), "value": new[index]})
+
+
+def _patch_list_by_identity(old: list, new: list, old_ids: list, new_ids: list, path: str, ops: list[dict]) -> None:
+    old_index = {identity: index for index, identity in enumerate(old_ids)}
+    new_index = {identity: index for index, identity in enumerate(new_ids)}
+
+    for index in range(len(old_ids) - 1, -1, -1):
+        if old_ids[index] not in new_index:
+            ops.append({"op": "remove", "path": _pointer(path, index)})
+
+    kept = [identity for identity in new_ids if identity in old_index]
+    in_order = _longest_increasing_run([old_index[identity] for identity in kept])
+    for position, identity in enumerate(kept):
+        if position not in in_order:
+            ops.append(
+                {"op": "move", "from": _pointer(path, old_index[identity]), "path": _pointer(path, new_index[identity])}
+            )
+
+    for index, identity in enumerate(new_ids):
+        if identity in old_index:
+            _patch_value(old[old_index[identity]], new[index], _pointer(path, index), ops)
+        else:
+            ops.append({"op": "add", "path": _pointer(path, index), "value": new[index]})
+
+
+def _longest_increasing_run(values: list[int]) -> set[int]:
+    """Positions of one longest increasing subsequence of `values` (the items that kept their relative order)."""
+    tails: list[int] = []  # tails[k]: position of the smallest tail of an increasing subsequence of length k + 1
+    tail_values: list[int] = []
+    previous: list[int | None] = []
+    for position, value in enumerate(values):
+        k = bisect_left(tail_values, value)
+        previous.append(tails[k - 1] if k else None)
+        if k == len(tails):
+            tails.append(position)
+            tail_values.append(value)
+        else:
+            tails[k] = position
+            tail_values[k] = value
+    positions = set()
+    position = tails[-1] if tails else None
+    while position is not None:
+        positions.add(position)
+        position = previous[position]
+    return positions
+
+
+def _is_parallel_list(base, volatile) -> bool:
+    return (
+        isinstance(base, list)
+        and isinstance(volatile, list)
+        and len(base) == len(volatile)
+        and all(isinstance(extra, dict) for extra in volatile)
+    )
+
+
 def deep_merge(base: dict, volatile: dict) -> dict:
-    """Deep merges volatile data back into base snapshot."""
+    """
+    Deep merges volatile data back into base snapshot.
+    A list of volatile objects is merged item by item into a base list of the same length (e.g. resources).
+    """
     if not volatile:
         return base
 
     result = base.copy()
     for key, value in volatile.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
+        current = result.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            result[key] = deep_merge(current, value)
+        elif _is_parallel_list(current, value):
+            result[key] = [
+                deep_merge(item, extra) if isinstance(item, dict) else item
+                for item, extra in zip(current, value, strict=True)
+            ]
         else:
             result[key] = value
     return result
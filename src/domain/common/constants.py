@@ -2,3 +2,10 @@
 
 # Standardized time constants
 DEFAULT_VERSIONING_COOLDOWN_HOURS = 0
+
+# Incremental sync: re-scan this many minutes before the last high-water mark to absorb clock skew
+# and source-side indexing delays (already-synced datasets are discarded by Dataset.should_version)
+INCREMENTAL_SYNC_OVERLAP_MINUTES = 15
+
+# Incremental sync: a modified dataset that keeps failing is given up after this many runs
+INCREMENTAL_SYNC_MAX_ATTEMPTS = 5
@@ -0,0 +1,46 @@
+"""Port (interface) for caching read models derived from the database."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+# Namespaces of cached read models, invalidated by the use cases that change them
+ANALYTICS = "analytics"
+PUBLISHERS = "publishers"
+
+
+class ReadModelCache(ABC):
+    """Cache of query results (dashboards, lists) that only change when a sync or an evaluation runs."""
+
+    @abstractmethod
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self, *namespaces: str) -> None:
+        """Drop every entry of the given namespaces."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Hit / miss counters of this process."""
+        raise NotImplementedError
+
+
+class NullReadModelCache(ReadModelCache):
+    """Cache that never stores anything, used when none is configured."""
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        return default
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        pass
+
+    def invalidate(self, *namespaces: str) -> None:
+        pass
+
+    def stats(self) -> dict:
+        return {}
@@ -10,14 +10,15 @@ from common import JsonSerializer
 from domain.common.constants import DEFAULT_VERSIONING_COOLDOWN_HOURS
 from domain.common.enums import SyncStatus
 from domain.common.value_objects import Slug, Url
-from domain.datasets.entities import DatasetVersion
+from domain.datasets.entities import DatasetVersion, VersionHistory
 from domain.datasets.exceptions import (
     DatasetAlreadyDeletedError,
     DatasetNotDeletedError,
     InvalidMetricValueError,
 )
+from domain.datasets.services import health_scoring
 from domain.datasets.services.syntax_analyzer import SyntaxAnalyzer
-from domain.datasets.value_objects import DatasetQuality, DiscoverabilityKPI, ImpactKPI
+from domain.datasets.value_objects import DatasetQuality, DatasetVersionState, DiscoverabilityKPI, ImpactKPI
 
 
 class Dataset:
@@ -72,7 +73,9 @@ class Dataset:
         self.size_bytes = size_bytes
         self.raw = raw
         self.checksum = checksum
-        self.versions: list[DatasetVersion] | None = []
+        self.versions: list[DatasetVersion] | VersionHistory | None = []
+        # Stored state of the latest version, when loaded by the repository
+        self.current_version: DatasetVersionState | None = None
         self.last_sync_status = (
             last_sync_status
             if last_sync_status is None or isinstance(last_sync_status, SyncStatus)
@@ -130,7 +133,7 @@ class Dataset:
         reuses_count: int | None = None,
         followers_count: int | None = None,
         popularity_score: float | None = None,
-        diff: dict | None = None,
+        diff: list | dict | None = None,
         metadata_volatile: dict | None = None,
         **kwargs,
     ):
@@ -222,43 +225,7 @@ class Dataset:
             dcat_score = (present / len(mandatory_fields)) * 100.0
 
         # 3. Freshness (Relative to expected frequency)
-        # Ensure modified is a datetime object (can be str if from some DTOs)
-        modified_dt = self.modified
-        if isinstance(modified_dt, str):
-            modified_dt = datetime.fromisoformat(modified_dt.replace("Z", "+00:00"))
-
-        if modified_dt.tzinfo is None:
-            modified_dt = modified_dt.replace(tzinfo=timezone.utc)
-
-        frequency = self.raw.get("frequency")
-        if not frequency:
-            # Safe traversal addressing ODS null metas anomaly
-            metas = self.raw.get("metas") or {}
-            default_meta = metas.get("default") or {} if metas else {}
-            frequency = default_meta.get("accrual_periodicity")
-
-        # Mapping to days (including grace period)
-        frequency_thresholds = {
-            "daily": 2,
-            "continuous": 2,
-            "weekly": 9,
-            "monthly": 37,
-            "quarterly": 105,
-            "semiannual": 210,
-            "annual": 395,
-            "punctual": 3650,  # 10 years for punctual
-        }
-
-        default_threshold = 90  # Penalty for unknown frequency
-        threshold_days = frequency_thresholds.get(str(frequency).lower(), default_threshold)
-
-        delta_days = (datetime.now(timezone.utc) - modified_dt).days
-        if delta_days <= threshold_days:
-            freshness_score = 100.0
-        elif delta_days <= threshold_days * 2:
-            freshness_score = 50.0
-        else:
-            freshness_score = 0.0
+        freshness_score = self._calculate_freshness_score()
 
         # 4. Semantic Quality (from IA if available)
         semantic_score = None
@@ -303,100 +270,45 @@ class Dataset:
 
         # 4. Global Health Score
         self.quality.health_score = (
-            (self.quality.health_quality_score * 0.5)
-            + (self.quality.health_freshness_score * 0.3)
-            + (self.quality.health_engagement_score * 0.2)
+            (self.quality.health_quality_score * health_scoring.QUALITY_WEIGHT)
+            + (self.quality.health_freshness_score * health_scoring.FRESHNESS_WEIGHT)
+            + (self.quality.health_engagement_score * health_scoring.ENGAGEMENT_WEIGHT)
         )
 
-    def _calculate_quality_score(self) -> float:  # noqa: C901
-        """Calculates the quality sub-score (0-100).
-
-        With LLM audit:
-          20 pts — has_description
-          10 pts — is_slug_valid
-          70 pts — LLM overall_score (stored as 0.0-1.0, × 100)
-
-        Without LLM audit (fallback):
-          40 pts — has_description
-          20 pts — is_slug_valid
-          40 pts — syntax_change_score × 0.4
-        """
+    def _calculate_quality_score(self) -> float:
+        """Calculates the quality sub-score (0-100), see `health_scoring.quality_scores`."""
         if not self.quality:
             return 0.0
+        llm_score = (self.quality.evaluation_results or {}).get("overall_score")
+        return float(
+            health_scoring.quality_scores(
+                [self.quality.has_description],
+                [self.quality.is_slug_valid],
+                [llm_score],
+                [self.quality.syntax_change_score],
+            )[0]
+        )
 
-        # Check if an LLM evaluation is available
-        llm_score = None
-        if self.quality.evaluation_results:
-            raw = self.quality.evaluation_results.get("overall_score")
-            if raw is not None:
-                llm_score = float(raw)
-
-        if llm_score is not None:
-            quality_pts = 0.0
-            if self.quality.has_description:
-                quality_pts += 20
-            if self.quality.is_slug_valid:
-                quality_pts += 10
-            quality_pts += llm_score * 0.70
-            return min(100.0, quality_pts)
-
-        # Fallback: no LLM audit yet
-        quality_pts = 0.0
-        if self.quality.has_description:
-            quality_pts += 40
-        if self.quality.is_slug_valid:
-            quality_pts += 20
-        syntax_score = self.quality.syntax_change_score or 0.0
-        quality_pts += syntax_score * 0.4
-        return quality_pts
-
-    def _calculate_freshness_score(self) -> float:
-        """Calculates the freshness sub-score."""
+    def _frequency(self) -> str | None:
         frequency = self.raw.get("frequency")
         if not frequency:
+            # Safe traversal addressing ODS null metas anomaly
             metas = self.raw.get("metas") or {}
             default_meta = metas.get("default") or {}
             frequency = default_meta.get("accrual_periodicity")
+        return frequency
 
-        # Mapping to days (including grace period)
-        frequency_thresholds = {
-            "daily": 2,
-            "continuous": 2,
-            "weekly": 9,
-            "monthly": 37,
-            "quarterly": 105,
-            "semiannual": 210,
-            "annual": 395,
-            "punctual": 3650,
-        }
-        days_limit = frequency_thresholds.get(str(frequency).lower(), 90)
-
-        modified_dt = self.modified
-        if isinstance(modified_dt, str):
-            modified_dt = datetime.fromisoformat(modified_dt)
-
-        if modified_dt.tzinfo is None:
-            modified_dt = modified_dt.replace(tzinfo=timezone.utc)
-
-        delta_days = (datetime.now(timezone.utc) - modified_dt).days
-        if delta_days <= days_limit:
-            return 100.0
-        if delta_days <= days_limit * 2:
-            return 50.0
-        return 0.0
+    def _calculate_freshness_score(self) -> float:
+        """Calculates the freshness sub-score, relative to the expected frequency."""
+        return float(health_scoring.freshness_scores([self.modified], [self._frequency()])[0])
 
     def _calculate_engagement_score(self) -> float:
         """Calculates the engagement sub-score."""
-        if "admin" in str(self.slug).lower():
-            return 100.0
-
-        import math
-
-        views = self.views_count or 0
-        api_calls = self.api_calls_count or 0
-        reuses = self.reuses_count or 0
-        engagement_pts = math.log1p(views) * 5 + math.log1p(api_calls) * 3 + math.log1p(reuses) * 20
-        return max(0.0, min(100.0, round(engagement_pts, 2)))
+        return float(
+            health_scoring.engagement_scores(
+                [self.views_count], [self.api_calls_count], [self.reuses_count], [str(self.slug)]
+            )[0]
+        )
 
     def calculate_impact_kpi(self) -> ImpactKPI:
         """
@@ -655,7 +567,11 @@ class Dataset:
         data["page"] = str(self.page)
         data["last_sync_status"] = self.last_sync_status.value if self.last_sync_status else None
         data["quality"] = asdict(self.quality) if self.quality else None
-        data["versions"] = [asdict(v) for v in self.versions] if self.versions else []
+        if isinstance(self.versions, VersionHistory):
+            # The stored history is not read: only the versions added since it was loaded are serialized
+            data["versions"] = [asdict(v) for v in self.versions.appended]
+        else:
+            data["versions"] = [asdict(v) for v in self.versions] if self.versions else []
         data["linked_dataset_id"] = str(self.linked_dataset_id) if self.linked_dataset_id else None
         return data
 
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
+if TYPE_CHECKING:  # pragma: no cover
+    from domain.datasets.ports import AbstractDatasetRepository
+
 
 @dataclass
 class DatasetVersion:
@@ -13,7 +17,7 @@ class DatasetVersion:
     """
 
     dataset_id: UUID
-    snapshot: dict
+    snapshot: Optional[dict]  # None when loaded without snapshots (see VersionHistory.metrics_only)
     blob_id: Optional[UUID] = None
     checksum: Optional[str] = None
     downloads_count: Optional[int] = None
@@ -22,9 +26,121 @@ class DatasetVersion:
     reuses_count: Optional[int] = None
     followers_count: Optional[int] = None
     popularity_score: Optional[float] = None
-    diff: Optional[dict] = None
+    diff: Optional[list | dict] = None
     metadata_volatile: Optional[dict] = None
     timestamp: Optional[datetime] = None
 
     def __repr__(self):
         return f"<DatasetVersion: {self.dataset_id} :: {self.checksum}>"
+
+
+class VersionHistory(Sequence):
+    """
+    Versions of a dataset, oldest first, read from the repository on demand rather than all at once.
+
+    `len()` is a count, `history[-1]` reads the latest version only and iteration reads `chunk_size` versions
+    per query without keeping them. `last(n)`, `between(start, end)` and `metrics_only()` narrow what is read.
+    Versions added with `append()` are kept in memory after the stored ones until the history is loaded again.
+    """
+
+    def __init__(
+        self,
+        repository: AbstractDatasetRepository,
+        dataset_id: UUID,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        with_snapshots: bool = True,
+        chunk_size: int = 100,
+    ):
+        self._repository = repository
+        self.dataset_id = dataset_id
+        self.start = start
+        self.end = end
+        self.with_snapshots = with_snapshots
+        self.chunk_size = chunk_size
+        self._count = None
+        self._by_index = {}
+        self.appended: list[DatasetVersion] = []
+
+    def _load(self, offset: int, limit: int, newest_first: bool = False) -> list[DatasetVersion]:
+        return self._repository.load_versions(
+            self.dataset_id,
+            offset=offset,
+            limit=limit,
+            start=self.start,
+            end=self.end,
+            newest_first=newest_first,
+            with_snapshots=self.with_snapshots,
+        )
+
+    def _stored_count(self) -> int:
+        if self._count is None:
+            self._count = self._repository.count_versions(self.dataset_id, start=self.start, end=self.end)
+        return self._count
+
+    def __len__(self) -> int:
+        return self._stored_count() + len(self.appended)
+
+    def append(self, version: DatasetVersion) -> None:
+        """Add a version after the stored ones, without reading them."""
+        self.appended.append(version)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return list(self)[index]
+            stored = self._stored_count()
+            loaded = self._load(start, max(min(stop, stored) - start, 0)) if start < stored else []
+            return loaded + self.appended[max(start - stored, 0) : max(stop - stored, 0)]
+        if index < 0 and -index <= len(self.appended):
+            return self.appended[index]
+        if index < 0:
+            index += len(self.appended)
+        elif self.appended and index >= self._stored_count():
+            return self.appended[index - self._stored_count()]
+        if index not in self._by_index:
+            # Negative indexes are read from the newest end, without counting
+            versions = self._load(-index - 1, 1, newest_first=True) if index < 0 else self._load(index, 1)
+            if not versions:
+                raise IndexError("version index out of range")
+            self._by_index[index] = versions[0]
+        return self._by_index[index]
+
+    def __iter__(self) -> Iterator[DatasetVersion]:
+        yield from self._chunks(newest_first=False)
+        yield from self.appended
+
+    def __reversed__(self) -> Iterator[DatasetVersion]:
+        yield from reversed(self.appended)
+        yield from self._chunks(newest_first=True)
+
+    def _chunks(self, newest_first: bool) -> Iterator[DatasetVersion]:
+        offset = 0
+        while True:
+            chunk = self._load(offset, self.chunk_size, newest_first)
+            yield from chunk
+            if len(chunk) < self.chunk_size:
+                return
+            offset += self.chunk_size
+
+    def last(self, count: int) -> list[DatasetVersion]:
+        """The `count` latest versions, oldest first."""
+        appended = self.appended[-count:] if count > 0 else []
+        stored = self._load(0, count - len(appended), newest_first=True)[::-1] if count > len(appended) else []
+        return stored + appended
+
+    def between(self, start: datetime | None = None, end: datetime | None = None) -> VersionHistory:
+        """The versions recorded in [start, end), within the current bounds (appended versions are not recorded)."""
+        if self.start and (start is None or start < self.start):
+            start = self.start
+        if self.end and (end is None or end > self.end):
+            end = self.end
+        return VersionHistory(self._repository, self.dataset_id, start, end, self.with_snapshots, self.chunk_size)
+
+    def metrics_only(self) -> VersionHistory:
+        """The same versions with their counters only: blobs are not read and `snapshot` is None."""
+        return VersionHistory(self._repository, self.dataset_id, self.start, self.end, False, self.chunk_size)
+
+    def __repr__(self):
+        return f"<VersionHistory: {self.dataset_id} [{self.start} - {self.end})>"
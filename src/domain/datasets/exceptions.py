@@ -15,6 +15,12 @@ class DatasetUnreachableError(Exception):
     pass
 
 
+class DatasetGoneError(DatasetUnreachableError):
+    """Raised when the source answers that a dataset does not exist (anymore)."""
+
+    pass
+
+
 class DatasetAlreadyDeletedError(Exception):
     """Raised when attempting to delete an already deleted dataset."""
 
@@ -34,3 +40,9 @@ class InvalidMetricValueError(Exception):
         self.metric_name = metric_name
         self.value = value
         super().__init__(f"Invalid value for metric '{metric_name}': {value}")
+
+
+class InvalidCursorError(Exception):
+    """Raised when a pagination cursor is malformed or does not match the requested sort."""
+
+    pass
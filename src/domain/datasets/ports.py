@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import abc
+from collections.abc import Iterator
+from datetime import datetime, timedelta
 from uuid import UUID
 
 from domain.datasets.aggregate import Dataset
-from domain.datasets.value_objects import DatasetVersionParams
+from domain.datasets.entities import DatasetVersion
+from domain.datasets.value_objects import DatasetMetricsDelta, DatasetMetricsParams, DatasetVersionParams
+from domain.quality.evaluation import EvaluationCacheKey
+from domain.quality.jobs import DEFAULT_LEASE, EvaluationJob, EvaluationJobProgress, EvaluationJobSelection
 
 
 class AbstractDatasetRepository(abc.ABC):  # pragma: no cover
@@ -16,8 +21,37 @@ class AbstractDatasetRepository(abc.ABC):  # pragma: no cover
     def add_version(self, params: DatasetVersionParams) -> None:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def add_many(self, datasets: list[Dataset]) -> None:
+        """Upsert several datasets (and their quality) in one round-trip."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def add_versions(self, params_list: list[DatasetVersionParams], known_blobs: dict | None = None) -> None:
+        """
+        Add one new version for each of several datasets in one round-trip.
+        Blobs listed in `known_blobs` (from get_blob_ids) are reused without being sent; new ones are added to it.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_blob_ids(self, platform_id: UUID) -> dict:
+        """Ids of the stored blobs of a platform's datasets, keyed by (dataset id, content hash)."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def add_metrics_versions(self, params_list: list[DatasetMetricsParams]) -> None:
+        """Add versions that only change counters, reusing the latest blob of each dataset."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_sync_states(self, platform_id: UUID) -> dict[str, Dataset]:
+        """Datasets of a platform with their latest checksum and metrics, keyed by buid."""
+        raise NotImplementedError
+
     @abc.abstractmethod
     def get(self, dataset_id: UUID, include_versions: bool = True) -> Dataset:
+        """The dataset with its current snapshot; `versions` is then read on demand (see VersionHistory)."""
         raise NotImplementedError
 
     @abc.abstractmethod
@@ -48,10 +82,30 @@ class AbstractDatasetRepository(abc.ABC):  # pragma: no cover
     def update_dataset_sync_status(self, platform_id, dataset_id, status):
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def update_datasets_sync_status(self, platform_id: UUID, dataset_ids: list[UUID], status: str) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def find_by_slugs(self, slugs: list[str]) -> list[dict]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def update_linkings(self, links: list[tuple[UUID, UUID | None]]) -> None:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def update_dataset_state(self, dataset: Dataset) -> None:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def mark_missing_as_deleted(self, platform_id: UUID, present_buids: list[str]) -> list[dict]:
+        """Mark the active datasets of a platform whose buid is not in `present_buids` as deleted.
+
+        Returns the `id`, `buid` and `slug` of each dataset marked by this call.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def search(
         self,
@@ -70,6 +124,30 @@ class AbstractDatasetRepository(abc.ABC):  # pragma: no cover
     ) -> tuple[list[dict], int]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def search_page(
+        self,
+        platform_id: str | None = None,
+        publisher: str | None = None,
+        q: str | None = None,
+        created_from: str | None = None,
+        created_to: str | None = None,
+        modified_from: str | None = None,
+        modified_to: str | None = None,
+        is_deleted: bool | None = None,
+        sort_by: str = "modified",
+        order: str = "desc",
+        page: int = 1,
+        page_size: int = 25,
+        cursor: str | None = None,
+        with_total: bool = True,
+    ) -> tuple[list[dict], int | None, str | None]:
+        """Like `search`, but resumable from an opaque `cursor` (keyset) and returning the next one.
+
+        The total is only counted when `with_total` is set, and `next_cursor` is None on the last page.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def get_detail(self, dataset_id: UUID, include_snapshots: bool = False) -> dict | None:
         """Get full dataset details including current snapshot and optionally history."""
@@ -82,12 +160,165 @@ class AbstractDatasetRepository(abc.ABC):  # pragma: no cover
         """Get paginated version history for a dataset."""
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def get_versions_page(
+        self,
+        dataset_id: UUID,
+        page: int = 1,
+        page_size: int = 50,
+        include_data: bool = False,
+        cursor: str | None = None,
+    ) -> tuple[list[dict], int, str | None]:
+        """Like `get_versions`, but resumable from an opaque `cursor` and returning the next one."""
+        raise NotImplementedError
+
     @abc.abstractmethod
     def list_publishers(self, platform_id: UUID | None = None, q: str | None = None, limit: int = 50) -> list[str]:
         """Get a list of distinct publishers, optionally filtered by platform or name."""
         raise NotImplementedError
 
     @abc.abstractmethod
-    def refresh_materialized_views(self) -> None:
-        """Refresh all materialized views used for analytics."""
+    def stream_health_inputs(self, after_id: UUID | None = None) -> Iterator[dict]:
+        """Stream, by ascending id, the inputs of the health scores of every dataset with a quality record."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def update_health_scores(self, scores: list[tuple]) -> None:
+        """Persist `(dataset_id, health, quality, freshness, engagement)` tuples, leaving other columns untouched."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def refresh_direction_health(self, dataset_ids: list[UUID]) -> None:
+        """Apply the health score changes of these datasets to the direction aggregates."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def rebuild_direction_health(self) -> None:
+        """Recompute the direction aggregates from every dataset (repair)."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def count_versions(self, dataset_id: UUID, start: datetime | None = None, end: datetime | None = None) -> int:
+        """Number of versions of a dataset, optionally recorded in [start, end)."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def load_versions(
+        self,
+        dataset_id: UUID,
+        offset: int = 0,
+        limit: int | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        newest_first: bool = False,
+        with_snapshots: bool = True,
+    ) -> list[DatasetVersion]:
+        """A window of the versions of a dataset, by timestamp; backs the lazy `Dataset.versions`."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_metrics_deltas(self, since: datetime, dataset_ids: list[UUID] | None = None) -> list[DatasetMetricsDelta]:
+        """
+        Growth of the counters of each dataset (all of them by default) since its last metrics sample at or before
+        `since`, or since its first sample for datasets followed after that.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_metrics_series(
+        self, dataset_id: UUID, granularity: str = "day", since: datetime | None = None
+    ) -> list[dict]:
+        """
+        Counters of a dataset at the end of each UTC 'day', 'week' or 'month' (oldest first), with their growth
+        over the previous period.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def ensure_version_partitions(self, months_ahead: int = 3) -> int:
+        """Create the version history partitions of the coming months; returns how many were created."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def compact_versions(self, start: datetime | None, end: datetime, bucket: str) -> int:
+        """
+        Fold the metrics-only versions recorded in [start, end) into one per dataset and `bucket` ('day' or 'week'),
+        keeping content-changing and latest versions, and record `end` as compacted for `bucket`.
+        Returns the number of versions removed.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_compacted_until(self, bucket: str) -> datetime | None:
+        """End of the last compaction pass for `bucket`, None if it never ran."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_cached_evaluation(self, key: EvaluationCacheKey) -> dict | None:
+        """The evaluation stored under `key` (as a dict), counting the hit; None when there is none."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def cache_evaluation(self, key: EvaluationCacheKey, evaluation: dict) -> None:
+        """Store an evaluation under `key`, replacing the previous one."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def count_llm_evaluations(self, since: datetime) -> int:
+        """
+        LLM evaluations charged to the budget since `since`: queued jobs not claimed yet, plus the jobs claimed since
+        then (cache hits included, as they are only known once run).
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def stream_reevaluation_inputs(
+        self, platform_slug: str | None = None, publisher: str | None = None
+    ) -> Iterator[dict]:
+        """
+        Published, non-restricted datasets with what the re-evaluation planner needs: `evaluated` (has LLM results),
+        `current_blob_id`, `evaluated_blob_id`, the data of both blobs when they differ (`current_data`,
+        `evaluated_data`), `health_score` and `health_engagement_score`.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def enqueue_evaluation_jobs(self, selection: EvaluationJobSelection) -> int:
+        """
+        Queue an evaluation job for each selected dataset that has none for the prompt type (or whose job is done
+        or failed, with `requeue`). Returns the number of jobs queued.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def claim_evaluation_jobs(
+        self, worker: str, limit: int = 1, lease: timedelta = DEFAULT_LEASE
+    ) -> list[EvaluationJob]:
+        """
+        Lease up to `limit` claimable jobs to `worker`, highest priority first: pending ones due to run, and running
+        ones whose lease expired. Jobs locked by another worker's claim are skipped, not waited for.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def renew_evaluation_job_lease(self, job_id: int, worker: str, lease: timedelta = DEFAULT_LEASE) -> bool:
+        """Extend the lease of a running job to `lease` from now. False if `worker` no longer holds the job."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def complete_evaluation_job(self, job_id: int, worker: str) -> bool:
+        """Mark a job leased by `worker` as done. False if `worker` no longer holds the job."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def fail_evaluation_job(self, job_id: int, worker: str, error: str, retry_after: timedelta) -> bool:
+        """
+        Record the failure of a job leased by `worker`: pending again after `retry_after`, or failed if out of
+        attempts. False if `worker` no longer holds the job.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_evaluation_job_progress(self, prompt_type: str | None = None, failures: int = 10) -> EvaluationJobProgress:
+        """Jobs by state, with the `failures` last failed jobs (slug, attempts, last error)."""
         raise NotImplementedError
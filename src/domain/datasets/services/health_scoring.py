@@ -0,0 +1,139 @@
+"""
+Columnar health scoring: the single implementation of the health score formulas.
+
+Every function takes one array (or sequence) per input, one element per dataset, and scores the whole batch with
+array operations. `Dataset.calculate_health_scores` calls it with batches of one, the backfill with the catalog.
+Missing values may be given as None: missing counts count as 0, a missing LLM score falls back to the syntax score.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import numpy as np
+
+# Expected update period per frequency code, in days, grace period included
+FREQUENCY_THRESHOLD_DAYS = {
+    "daily": 2,
+    "continuous": 2,
+    "weekly": 9,
+    "monthly": 37,
+    "quarterly": 105,
+    "semiannual": 210,
+    "annual": 395,
+    "punctual": 3650,
+}
+DEFAULT_THRESHOLD_DAYS = 90  # Penalty for unknown frequency
+
+QUALITY_WEIGHT = 0.5
+FRESHNESS_WEIGHT = 0.3
+ENGAGEMENT_WEIGHT = 0.2
+
+
+@dataclass(frozen=True)
+class HealthScores:
+    """Scores (0-100) of a batch of datasets, NaN where a dataset is not scored."""
+
+    quality: np.ndarray
+    freshness: np.ndarray
+    engagement: np.ndarray
+    health: np.ndarray
+
+    def rows(self) -> list[tuple[float | None, float | None, float | None, float | None]]:
+        """(health, quality, freshness, engagement) per dataset, None instead of NaN, for persistence."""
+        columns = np.stack([self.health, self.quality, self.freshness, self.engagement], axis=1)
+        return [tuple(None if np.isnan(value) else float(value) for value in row) for row in columns]
+
+
+def _floats(values: Sequence | np.ndarray, missing: float) -> np.ndarray:
+    array = np.asarray(values, dtype=object)
+    return np.where(array == None, missing, array).astype(float)  # noqa: E711 - element-wise None test
+
+
+def _bools(values: Sequence | np.ndarray) -> np.ndarray:
+    return np.asarray(values, dtype=object).astype(bool)
+
+
+def _utc_datetime64(values: Sequence | np.ndarray) -> np.ndarray:
+    """Timestamps as naive UTC datetime64; naive datetimes are taken as UTC."""
+    if isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.datetime64):
+        return values.astype("datetime64[us]")
+    converted = []
+    for value in values:
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        converted.append(value)
+    return np.array(converted, dtype="datetime64[us]")
+
+
+def threshold_days(frequencies: Sequence | np.ndarray) -> np.ndarray:
+    """Expected update period of each frequency code (case-insensitive), the default one when unknown."""
+    codes, inverse = np.unique(np.char.lower(np.asarray(frequencies, dtype=object).astype(str)), return_inverse=True)
+    per_code = np.array([FREQUENCY_THRESHOLD_DAYS.get(code, DEFAULT_THRESHOLD_DAYS) for code in codes], dtype=float)
+    return per_code[inverse.reshape(-1)]
+
+
+def quality_scores(has_description, is_slug_valid, llm_score, syntax_change_score) -> np.ndarray:
+    """
+    With LLM audit: 20 pts description, 10 pts valid slug, 70% of the LLM overall score, capped at 100.
+    Without: 40 pts description, 20 pts valid slug, 40% of the syntax change score.
+    """
+    description = _bools(has_description)
+    slug = _bools(is_slug_valid)
+    llm = _floats(llm_score, np.nan)
+    with_llm = np.minimum(100.0, description * 20.0 + slug * 10.0 + llm * 0.70)
+    without_llm = description * 40.0 + slug * 20.0 + _floats(syntax_change_score, 0.0) * 0.4
+    return np.where(np.isnan(llm), without_llm, with_llm)
+
+
+def freshness_scores(modified, frequency, now: datetime | None = None) -> np.ndarray:
+    """100 when modified within the expected period of the frequency, 50 within twice that period, 0 beyond."""
+    now = now or datetime.now(timezone.utc)
+    age = _utc_datetime64([now])[0] - _utc_datetime64(modified)
+    age_days = age // np.timedelta64(1, "D")
+    limit = threshold_days(frequency)
+    return np.select([age_days <= limit, age_days <= limit * 2], [100.0, 50.0], default=0.0)
+
+
+def engagement_scores(views, api_calls, reuses, slugs=None) -> np.ndarray:
+    """Log-weighted usage (5 ln(1+views) + 3 ln(1+api calls) + 20 ln(1+reuses)), 0-100; admin datasets score 100."""
+    points = (
+        np.log1p(_floats(views, 0.0)) * 5 + np.log1p(_floats(api_calls, 0.0)) * 3 + np.log1p(_floats(reuses, 0.0)) * 20
+    )
+    scores = np.round(np.clip(points, 0.0, 100.0), 2)
+    if slugs is not None:
+        is_admin = np.char.find(np.char.lower(np.asarray(slugs, dtype=object).astype(str)), "admin") >= 0
+        scores = np.where(is_admin, 100.0, scores)
+    return scores
+
+
+def health_scores(
+    has_description,
+    is_slug_valid,
+    llm_score,
+    syntax_change_score,
+    modified,
+    frequency,
+    views,
+    api_calls,
+    reuses,
+    slugs=None,
+    scored=None,
+    now: datetime | None = None,
+) -> HealthScores:
+    """
+    All the health scores of a batch of datasets in one call. Datasets where `scored` is False
+    (restricted or unpublished) get NaN everywhere.
+    """
+    quality = quality_scores(has_description, is_slug_valid, llm_score, syntax_change_score)
+    freshness = freshness_scores(modified, frequency, now=now)
+    engagement = engagement_scores(views, api_calls, reuses, slugs)
+    health = quality * QUALITY_WEIGHT + freshness * FRESHNESS_WEIGHT + engagement * ENGAGEMENT_WEIGHT
+    if scored is not None:
+        mask = _bools(scored)
+        quality, freshness, engagement, health = (
+            np.where(mask, s, np.nan) for s in (quality, freshness, engagement, health)
+        )
+    return HealthScores(quality=quality, freshness=freshness, engagement=engagement, health=health)
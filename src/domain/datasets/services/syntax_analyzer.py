@@ -46,6 +46,23 @@ class SyntaxAnalyzer:
         serialized_keys = json.dumps(keys_list)
         return hashlib.sha256(serialized_keys.encode("utf-8")).hexdigest()
 
+    @staticmethod
+    def get_text_field(raw: dict[str, Any], name: str) -> str:
+        """
+        Text of a main field wherever the platform puts it: at the top level (data.gouv.fr) or in the
+        default metas/metadata (Opendatasoft), whose values may be wrapped as {"value": ...}.
+        """
+        candidates = [raw.get(name)]
+        for section in ("metas", "metadata"):
+            default = (raw.get(section) or {}).get("default") or {}
+            candidates.append(default.get(name))
+        for value in candidates:
+            if isinstance(value, dict):
+                value = value.get("value")
+            if value and isinstance(value, str):
+                return value
+        return ""
+
     @classmethod
     def analyze_change(cls, old_raw: dict, new_raw: dict) -> dict[str, float | str]:
         """
@@ -55,12 +72,12 @@ class SyntaxAnalyzer:
         new_hash = cls.get_structure_hash(new_raw)
 
         # Textual similarity on main fields
-        old_title = old_raw.get("title", "") or ""
-        new_title = new_raw.get("title", "") or ""
+        old_title = cls.get_text_field(old_raw, "title")
+        new_title = cls.get_text_field(new_raw, "title")
         title_similarity = cls.calculate_text_similarity(old_title, new_title)
 
-        old_desc = old_raw.get("description", "") or ""
-        new_desc = new_raw.get("description", "") or ""
+        old_desc = cls.get_text_field(old_raw, "description")
+        new_desc = cls.get_text_field(new_raw, "description")
         desc_similarity = cls.calculate_text_similarity(old_desc, new_desc)
 
         # Global Syntax Score (weighted average)
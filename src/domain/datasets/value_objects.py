@@ -1,7 +1,12 @@
+import base64
+import binascii
+import json
 from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime
+from typing import Any, Optional
 from uuid import UUID
 
+from domain.datasets.exceptions import InvalidCursorError
 from domain.datasets.kpis import DiscoverabilityKPI, ImpactKPI
 
 
@@ -22,6 +27,25 @@ class DatasetQuality:
     health_engagement_score: Optional[float] = None
 
 
+@dataclass(frozen=True)
+class DatasetVersionState:
+    """Stored state of the latest version of a dataset: its stable blob, volatile metadata and counters.
+
+    Loaded along with the dataset, so that the next version can be diffed without reading it back.
+    """
+
+    blob_id: Optional[UUID]
+    blob_hash: Optional[str]
+    blob_data: dict
+    metadata_volatile: Optional[dict] = None
+    downloads_count: Optional[int] = None
+    api_calls_count: Optional[int] = None
+    views_count: Optional[int] = None
+    reuses_count: Optional[int] = None
+    followers_count: Optional[int] = None
+    popularity_score: Optional[float] = None
+
+
 @dataclass(frozen=True)
 class DatasetVersionParams:
     """Parameter object for dataset version creation.
@@ -42,4 +66,68 @@ class DatasetVersionParams:
     popularity_score: Optional[float] = None
     records_count: Optional[int] = None
     size_bytes: Optional[int] = None
-    diff: Optional[dict] = None
+    diff: Optional[list | dict] = None
+    # Latest stored version when already loaded: the repository diffs against it instead of reading it back
+    previous: Optional[DatasetVersionState] = None
+
+
+@dataclass(frozen=True)
+class DatasetMetricsParams:
+    """Parameter object for a metrics-only version.
+
+    The new version reuses the blob, checksum and volatile metadata of the latest one,
+    only counters (and their diff) change.
+    """
+
+    dataset_id: UUID
+    downloads_count: Optional[int] = None
+    api_calls_count: Optional[int] = None
+    views_count: Optional[int] = None
+    reuses_count: Optional[int] = None
+    followers_count: Optional[int] = None
+    popularity_score: Optional[float] = None
+    diff: Optional[list | dict] = None
+
+
+@dataclass(frozen=True)
+class DatasetMetricsDelta:
+    """Growth of the usage counters of a dataset, from its metrics sample at `since` to its latest one."""
+
+    dataset_id: UUID
+    since: datetime
+    until: datetime
+    downloads_count: Optional[int] = None
+    api_calls_count: Optional[int] = None
+    views_count: Optional[int] = None
+    reuses_count: Optional[int] = None
+    followers_count: Optional[int] = None
+    popularity_score: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Keyset position in a sorted listing: the sort key and id of the last row already served.
+
+    Encoded as an opaque url-safe token; the sort it was issued for is embedded so that a
+    cursor cannot be replayed against another ordering.
+    """
+
+    sort_by: str
+    order: str
+    value: Any
+    id: str
+
+    def encode(self) -> str:
+        payload = json.dumps([self.sort_by, self.order, self.value, self.id], default=str)
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str, sort_by: str, order: str) -> "PageCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            cursor_sort, cursor_order, value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+            raise InvalidCursorError(f"Malformed cursor: {token}") from e
+        if (cursor_sort, cursor_order) != (sort_by, order.lower()):
+            raise InvalidCursorError(f"Cursor was issued for sort {cursor_sort} {cursor_order}, not {sort_by} {order}")
+        return cls(sort_by=cursor_sort, order=cursor_order, value=value, id=row_id)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+from collections.abc import Iterator
+from datetime import datetime
 from typing import Protocol
 from uuid import UUID
 
@@ -28,12 +31,32 @@ class PlatformRepository(Protocol):  # pragma: no cover
         """Find a platform by its domain name."""
         ...
 
+    def save_incremental_sync(self, platform_id: UUID, payload: dict) -> None:
+        """Record an incremental or metrics-only sync (history only, platform totals untouched)."""
+        ...
+
+    def get_high_water_mark(self, platform_id: UUID) -> datetime | None:
+        """Start time of the last incremental sync whose change listing succeeded."""
+        ...
+
+    def get_retry_datasets(self, platform_id: UUID) -> dict[str, int]:
+        """Modified datasets the last incremental sync failed on, with their failed attempts, to fetch again."""
+        ...
+
 
 class PlatformAdapter(Protocol):
     def fetch(self) -> dict:  # pragma: no cover
         """Fetch platform metadata and dataset IDs from the source."""
         ...
 
+    def fetch_modified_since(self, since: datetime) -> Iterator[str]:  # pragma: no cover
+        """Yield the IDs (as expected by DatasetAdapter.fetch) of datasets modified after `since`."""
+        ...
+
+    def fetch_metrics(self) -> Iterator[dict]:  # pragma: no cover
+        """Yield lightweight records carrying dataset counters, in a shape DatasetAdapter.map accepts."""
+        ...
+
 
 class DatasetAdapter(abc.ABC):  # pragma: no cover
     @staticmethod
@@ -47,6 +70,15 @@ class DatasetAdapter(abc.ABC):  # pragma: no cover
         """Fetch raw dataset metadata."""
         ...
 
+    async def afetch(self, url: str, key: str, dataset_id: str) -> dict:
+        """Async variant of fetch. Defaults to running the blocking fetch in a worker thread."""
+        return await asyncio.to_thread(self.fetch, url, key, dataset_id)
+
+    async def afetch_many(self, url: str, key: str, dataset_ids: list[str]) -> dict[str, dict | Exception]:
+        """Fetch several datasets concurrently. Failures are returned in place of the payload, not raised."""
+        results = await asyncio.gather(*(self.afetch(url, key, i) for i in dataset_ids), return_exceptions=True)
+        return dict(zip(dataset_ids, results, strict=True))
+
     @abc.abstractmethod
     def map(self, *args, **kwargs) -> dict:  # pragma: no cover
         """Map raw data to internal representation."""
@@ -0,0 +1,56 @@
+"""Token budget of the metadata context sent to the LLM with each evaluation."""
+
+from __future__ import annotations
+
+import json
+
+CHARS_PER_TOKEN = 4
+
+# Identity of the dataset, never dropped from a context
+KEPT_FIELDS = ("id", "slug", "title")
+
+# Successive (characters per string, items per list) caps tried until a context fits its budget
+TRIM_STEPS = ((4000, 50), (2000, 20), (1000, 10), (500, 5))
+
+
+def estimate_tokens(*texts: str, completion_tokens: int = 0) -> int:
+    """Tokens a request may count against the TPM limit: prompt characters / 4, plus the completion allowed."""
+    return sum(len(text) for text in texts) // CHARS_PER_TOKEN + completion_tokens
+
+
+def context_tokens(context: object) -> int:
+    """Estimated tokens of a context as serialized in the user prompt."""
+    return estimate_tokens(json.dumps(context, indent=2, default=str))
+
+
+def trim_context(context: dict, max_tokens: int) -> dict:
+    """
+    Fit a mapped metadata context in `max_tokens`. Long strings and lists are cut a little more at each step, with
+    a marker telling the model how long they were (description lengths are graded); if that is not enough the
+    largest fields are dropped, the identity of the dataset aside. A context within budget is returned as is.
+    """
+    if context_tokens(context) <= max_tokens:
+        return context
+
+    for max_chars, max_items in TRIM_STEPS:
+        trimmed = _truncate(context, max_chars, max_items)
+        if context_tokens(trimmed) <= max_tokens:
+            return trimmed
+
+    droppable = sorted((k for k in trimmed if k not in KEPT_FIELDS), key=lambda k: context_tokens(trimmed[k]))
+    while droppable and context_tokens(trimmed) > max_tokens:
+        del trimmed[droppable.pop()]
+    return trimmed
+
+
+def _truncate(value: object, max_chars: int, max_items: int) -> object:
+    if isinstance(value, str) and len(value) > max_chars:
+        return f"{value[:max_chars]}… [tronqué, {len(value)} caractères]"
+    if isinstance(value, list):
+        items = [_truncate(item, max_chars, max_items) for item in value[:max_items]]
+        if len(value) > max_items:
+            items.append(f"… [{len(value) - max_items} éléments de plus]")
+        return items
+    if isinstance(value, dict):
+        return {key: _truncate(item, max_chars, max_items) for key, item in value.items()}
+    return value
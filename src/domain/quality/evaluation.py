@@ -29,6 +29,17 @@ class Suggestion:
     priority: str  # "high", "medium", "low"
 
 
+@dataclass
+class LLMUsage:
+    """Tokens and latency of the LLM call behind an evaluation, as reported by the provider."""
+
+    model: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_prompt_tokens: int = 0  # Part of the prompt served from the provider's prompt cache
+    latency_ms: float | None = None  # None when unknown (e.g. Batch API)
+
+
 @dataclass
 class MetadataEvaluation:
     """Complete evaluation of dataset metadata quality."""
@@ -40,6 +51,9 @@ class MetadataEvaluation:
     criteria_scores: dict[str, CriterionScore]
     suggestions: list[Suggestion]
     raw_text: str | None = None  # For text-format evaluations
+    cached: bool = False  # Served from the evaluation cache instead of a new LLM call
+    usage: LLMUsage | None = None  # Of the LLM call that produced the evaluation
+    cached_from: datetime | None = None  # When a cached evaluation was produced by the LLM (`evaluated_at`: reused)
 
     def get_scores_by_category(self, category: str) -> list[CriterionScore]:
         """Get all criterion scores for a specific category."""
@@ -48,3 +62,38 @@ class MetadataEvaluation:
     def get_high_priority_suggestions(self) -> list[Suggestion]:
         """Get only high priority suggestions."""
         return [s for s in self.suggestions if s.priority == "high"]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MetadataEvaluation":
+        """Rebuild an evaluation from its `asdict` form, as stored in JSON."""
+        dataset_id = data.get("dataset_id")
+        evaluated_at = data.get("evaluated_at")
+        cached_from = data.get("cached_from")
+        return cls(
+            dataset_id=UUID(str(dataset_id)) if dataset_id else None,
+            dataset_slug=data.get("dataset_slug"),
+            evaluated_at=datetime.fromisoformat(evaluated_at) if isinstance(evaluated_at, str) else evaluated_at,
+            overall_score=data.get("overall_score", 0.0),
+            criteria_scores={
+                name: CriterionScore(**score) for name, score in (data.get("criteria_scores") or {}).items()
+            },
+            suggestions=[Suggestion(**suggestion) for suggestion in data.get("suggestions") or []],
+            raw_text=data.get("raw_text"),
+            cached=data.get("cached", False),
+            usage=LLMUsage(**data["usage"]) if data.get("usage") else None,
+            cached_from=datetime.fromisoformat(cached_from) if isinstance(cached_from, str) else cached_from,
+        )
+
+
+@dataclass(frozen=True)
+class EvaluationCacheKey:
+    """
+    Identifies an LLM evaluation by what the model was given: a hash of the mapped metadata context and of the
+    reference documents, the prompt used and the model. Same key, same prompt: the stored evaluation is reused.
+    """
+
+    context_hash: str
+    prompt_type: str
+    output: str
+    prompt_version: str
+    model: str
@@ -0,0 +1,61 @@
+"""LLM evaluation jobs: a durable work queue that any number of audit workers pull from."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from uuid import UUID
+
+PENDING = "pending"  # Waiting for a worker, not before its `run_after`
+RUNNING = "running"  # Leased by a worker until `leased_until`; an expired lease makes the job claimable again
+DONE = "done"
+FAILED = "failed"  # Out of attempts
+JOB_STATES = (PENDING, RUNNING, DONE, FAILED)
+
+DEFAULT_LEASE = timedelta(minutes=10)
+MAX_RETRY_DELAY = timedelta(hours=6)
+
+
+@dataclass(frozen=True)
+class EvaluationJob:
+    """A dataset to evaluate, as claimed by a worker: `attempts` counts the current one."""
+
+    id: int
+    dataset_id: UUID
+    prompt_type: str
+    refresh: bool
+    attempts: int
+    max_attempts: int
+
+
+@dataclass(frozen=True)
+class EvaluationJobSelection:
+    """Which published, non-restricted datasets to enqueue."""
+
+    prompt_type: str = "standard"
+    platform_slug: str | None = None
+    publisher: str | None = None
+    dataset_ids: tuple[UUID, ...] | None = None  # Only these datasets (e.g. a re-evaluation plan)
+    skip_evaluated: bool = False  # Leave out datasets that already have LLM results
+    limit: int | None = None  # Most recently modified first
+    refresh: bool = False  # Call the LLM even if the same metadata was evaluated (see the evaluation cache)
+    requeue: bool = False  # Queue again datasets whose job is done or failed
+    priority: int = 0  # Higher is claimed first
+    max_attempts: int = 3
+
+
+@dataclass
+class EvaluationJobProgress:
+    """Jobs by state, and the last failures."""
+
+    counts: dict[str, int]
+    failures: list[dict]
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Wait before the next attempt of a job that failed `attempts` times: 1, 4, 16... minutes, at most 6 hours."""
+    return min(timedelta(minutes=4 ** max(attempts - 1, 0)), MAX_RETRY_DELAY)
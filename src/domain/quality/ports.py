@@ -1,5 +1,6 @@
 """Port (interface) for LLM-based metadata evaluation."""
 
+import asyncio
 from abc import ABC, abstractmethod
 
 from domain.datasets.aggregate import Dataset
@@ -9,6 +10,10 @@ from domain.quality.evaluation import MetadataEvaluation
 class LLMEvaluator(ABC):
     """Abstract interface for LLM-based metadata quality evaluation."""
 
+    # Part of the evaluation cache key: change either and previous evaluations are not reused
+    model_name: str = ""
+    prompt_version: str = ""
+
     @abstractmethod
     def evaluate_metadata(
         self, dataset: Dataset, dcat_reference: str, charter: str, output: str, prompt_type: str = "standard"
@@ -27,6 +32,15 @@ class LLMEvaluator(ABC):
         """
         raise NotImplementedError
 
+    async def aevaluate_metadata(
+        self, dataset: Dataset, dcat_reference: str, charter: str, output: str, prompt_type: str = "standard"
+    ) -> MetadataEvaluation:
+        """
+        Awaitable `evaluate_metadata`. Implementations call their provider's async client, with their own
+        rate limiting and retries; by default the blocking call runs in a thread.
+        """
+        return await asyncio.to_thread(self.evaluate_metadata, dataset, dcat_reference, charter, output, prompt_type)
+
 
 class MetadataMapper(ABC):
     """Abstract interface for mapping platform-specific raw metadata to a standard LLM context."""
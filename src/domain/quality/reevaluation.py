@@ -0,0 +1,95 @@
+"""Planning of LLM re-evaluations from the metadata drift since each dataset's last evaluation."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from domain.datasets.services.syntax_analyzer import SyntaxAnalyzer
+
+NEVER_EVALUATED = "never_evaluated"
+UNKNOWN_BASELINE = "unknown_baseline"  # Evaluated before the evaluated blob was recorded, or that blob is gone
+CHANGED = "changed"
+UNCHANGED = "unchanged"  # Same blob as evaluated
+
+# Drift of a blob that changed in fields the text comparison leaves out: never mistaken for an unchanged one
+MIN_CHANGED_DRIFT = 0.01
+
+
+@dataclass(frozen=True)
+class ReevaluationCandidate:
+    """A dataset whose metadata drifted enough since its last evaluation to be evaluated again."""
+
+    dataset_id: UUID
+    slug: str
+    drift: float  # 0 (same blob as evaluated) to 100 (nothing in common, or never evaluated)
+    priority: float
+    reason: str
+    platform_slug: str | None = None
+    health_score: float | None = None
+
+
+@dataclass
+class ReevaluationPlan:
+    """Datasets to evaluate, by decreasing priority, within the LLM budget left for the day."""
+
+    queued: list[ReevaluationCandidate] = field(default_factory=list)
+    over_budget: list[ReevaluationCandidate] = field(default_factory=list)
+    unchanged: int = 0  # Same blob as evaluated
+    below_threshold: int = 0  # Changed, but less than the drift threshold
+
+
+def metadata_drift(evaluated_raw: dict, current_raw: dict) -> float:
+    """How far the metadata moved between two snapshots (0-100): the complement of the syntax change score."""
+    return round(100.0 - SyntaxAnalyzer.analyze_change(evaluated_raw, current_raw)["syntax_score"], 2)
+
+
+def reevaluation_priority(drift: float, engagement_score: float | None) -> float:
+    """
+    Drift weighted by the health impact of a new evaluation: the LLM score moves the quality part of the health
+    score, which matters up to twice as much on the most used datasets (engagement sub-score, 0-100).
+    """
+    return round(drift * (1.0 + (engagement_score or 0.0) / 100.0), 2)
+
+
+def _candidate(row: dict) -> tuple[float, str]:
+    if not row["evaluated"]:
+        return 100.0, NEVER_EVALUATED
+    if row["evaluated_blob_id"] is not None and row["evaluated_blob_id"] == row["current_blob_id"]:
+        return 0.0, UNCHANGED
+    if row["evaluated_data"] is None or row["current_data"] is None:
+        return 100.0, UNKNOWN_BASELINE
+    return max(metadata_drift(row["evaluated_data"], row["current_data"]), MIN_CHANGED_DRIFT), CHANGED
+
+
+def plan_reevaluations(rows: Iterable[dict], threshold: float, budget: int) -> ReevaluationPlan:
+    """
+    Score the drift of each `stream_reevaluation_inputs` row and keep the datasets at or above `threshold`,
+    the `budget` first (by priority, then drift) being queued.
+    """
+    plan = ReevaluationPlan()
+    candidates = []
+    for row in rows:
+        drift, reason = _candidate(row)
+        if reason == UNCHANGED:
+            plan.unchanged += 1
+            continue
+        if drift < threshold:
+            plan.below_threshold += 1
+            continue
+        candidates.append(
+            ReevaluationCandidate(
+                dataset_id=UUID(str(row["id"])),
+                slug=row["slug"],
+                drift=drift,
+                priority=reevaluation_priority(drift, row["health_engagement_score"]),
+                reason=reason,
+                platform_slug=row.get("platform_slug"),
+                health_score=row["health_score"],
+            )
+        )
+    candidates.sort(key=lambda c: (c.priority, c.drift), reverse=True)
+    budget = max(budget, 0)
+    plan.queued, plan.over_budget = candidates[:budget], candidates[budget:]
+    return plan
@@ -1,11 +1,15 @@
 from abc import ABC, abstractmethod
 
 from domain.auth.ports import UserRepository
+from domain.common.ports import NullReadModelCache, ReadModelCache
 from domain.datasets.ports import AbstractDatasetRepository
 from domain.platform.ports import PlatformRepository
 
 
 class UnitOfWork(ABC):  # pragma: no cover
+    # Read models derived from the repositories, to invalidate once changes are committed
+    cache: ReadModelCache = NullReadModelCache()
+
     def __enter__(self):
         return self
 
@@ -34,3 +38,44 @@ class UnitOfWork(ABC):  # pragma: no cover
     @abstractmethod
     def users(self) -> UserRepository:
         raise NotImplementedError
+
+
+class AsyncUnitOfWork(ABC):  # pragma: no cover
+    """
+    Awaitable counterpart of UnitOfWork: repositories expose the same methods as their blocking ports,
+    as coroutines. Everything awaited within one `async with` block runs in the same transaction.
+    """
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.rollback()
+
+    @abstractmethod
+    async def run(self, fn, *args, **kwargs):
+        """Run a blocking callable (use case, service...) inside the unit of work."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def commit(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rollback(self):
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def platforms(self):
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def datasets(self):
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def users(self):
+        raise NotImplementedError
@@ -1,15 +1,40 @@
-import requests
+import httpx
 
 from application.dtos.dataset import DatasetDTO
-from domain.datasets.exceptions import DatasetUnreachableError
+from domain.datasets.exceptions import DatasetGoneError, DatasetUnreachableError
 from domain.datasets.value_objects import DatasetQuality
 from domain.platform.ports import DatasetAdapter
+from infrastructure.adapters.http import HttpFetcher, get_http_fetcher
 
 
 class DatagouvDatasetAdapter(DatasetAdapter):
+    def __init__(self, http: HttpFetcher | None = None):
+        self.http = http or get_http_fetcher()
+
     def fetch(self, url, key, dataset_id):
         query = f"{url}/api/1/datasets/{dataset_id}/"
-        response = requests.get(query)
+        try:
+            response = self.http.get(query)
+        except httpx.HTTPError as e:
+            raise DatasetUnreachableError(f"DATAGOUVFR :: {e} for '{query}'")
+        return self._parse(query, response)
+
+    async def afetch(self, url, key, dataset_id):
+        query = f"{url}/api/1/datasets/{dataset_id}/"
+        try:
+            response = await self.http.aget(query)
+        except httpx.HTTPError as e:
+            raise DatasetUnreachableError(f"DATAGOUVFR :: {e} for '{query}'")
+        return self._parse(query, response)
+
+    async def afetch_many(self, url: str, key: str, dataset_ids: list[str]) -> dict[str, dict | Exception]:
+        async with self.http.async_session():
+            return await super().afetch_many(url, key, dataset_ids)
+
+    @staticmethod
+    def _parse(query: str, response: httpx.Response) -> dict:
+        if response.status_code == 404:
+            raise DatasetGoneError(f"DATAGOUVFR :: 404 for '{query}'")
         if response.status_code != 200:
             raise DatasetUnreachableError(f"DATAGOUVFR :: {response.status_code} for '{query}'")
         return response.json()
@@ -1,12 +1,13 @@
 import os
 from datetime import datetime
 
-import requests
+import httpx
 
 from application.dtos.dataset import DatasetDTO
-from domain.datasets.exceptions import DatasetUnreachableError
+from domain.datasets.exceptions import DatasetGoneError, DatasetUnreachableError
 from domain.datasets.value_objects import DatasetQuality
 from domain.platform.ports import DatasetAdapter
+from infrastructure.adapters.http import HttpFetcher, HttpRequest, get_http_fetcher
 
 
 class OpendatasoftDatasetAdapter(DatasetAdapter):
@@ -26,21 +27,46 @@ class OpendatasoftDatasetAdapter(DatasetAdapter):
             return url.split("/")[-2]
         return url.split("/")[-1]
 
+    def __init__(self, http: HttpFetcher | None = None):
+        self.http = http or get_http_fetcher()
+
     def fetch(self, url: str, key: str, dataset_id: str):
-        key = os.environ[key]
-        automation = requests.get(
-            f"{url}/api/automation/v1.0/datasets/",
-            headers={"Authorization": f"Apikey {key}"},
-            params={"dataset_id": dataset_id},
-        )
-        catalog = requests.get(
-            f"{url}/api/explore/v2.1/catalog/datasets/{dataset_id}/",
-            headers={"Authorization": f"Apikey {key}"},
-        )
-        monitoring = requests.get(
-            f"{url}/api/explore/v2.1/monitoring/datasets/ods-datasets-monitoring/exports/json/?where=dataset_id: '{dataset_id}'",
-            headers={"Authorization": f"Apikey {key}"},
-        )
+        try:
+            responses = self.http.get_many(self._requests(url, key, dataset_id))
+        except httpx.HTTPError as e:
+            raise DatasetUnreachableError(f"OPENDATASOFT :: {e} for '{dataset_id}'")
+        return self._merge(responses)
+
+    async def afetch(self, url: str, key: str, dataset_id: str):
+        try:
+            responses = await self.http.aget_many(self._requests(url, key, dataset_id))
+        except httpx.HTTPError as e:
+            raise DatasetUnreachableError(f"OPENDATASOFT :: {e} for '{dataset_id}'")
+        return self._merge(responses)
+
+    async def afetch_many(self, url: str, key: str, dataset_ids: list[str]) -> dict[str, dict | Exception]:
+        async with self.http.async_session():
+            return await super().afetch_many(url, key, dataset_ids)
+
+    @staticmethod
+    def _requests(url: str, key: str, dataset_id: str) -> list[HttpRequest]:
+        """Automation, catalog and monitoring calls, issued in parallel and merged in that order."""
+        headers = {"Authorization": f"Apikey {os.environ[key]}"}
+        return [
+            HttpRequest(f"{url}/api/automation/v1.0/datasets/", params={"dataset_id": dataset_id}, headers=headers),
+            HttpRequest(f"{url}/api/explore/v2.1/catalog/datasets/{dataset_id}/", headers=headers),
+            HttpRequest(
+                f"{url}/api/explore/v2.1/monitoring/datasets/ods-datasets-monitoring/exports/json/",
+                params={"where": f"dataset_id: '{dataset_id}'"},
+                headers=headers,
+            ),
+        ]
+
+    @staticmethod
+    def _merge(responses: list[httpx.Response]) -> dict:
+        automation, catalog, monitoring = responses
+        if catalog.status_code == 404:
+            raise DatasetGoneError(f"OPENDATASOFT :: 404 for '{catalog.url}'")
         try:
             automation_data = automation.json()
             catalog_data = catalog.json()
@@ -51,7 +77,7 @@ class OpendatasoftDatasetAdapter(DatasetAdapter):
                 **monitoring_data[0],
             }
             return data
-        except IndexError:
+        except (IndexError, KeyError, ValueError):
             raise DatasetUnreachableError()
 
     @staticmethod
@@ -0,0 +1,101 @@
+"""
+Streaming catalog harvesting.
+
+Pages are requested lazily and records are yielded one by one, so a full catalog never has to be
+held in memory. `merge_by_key` joins several such streams on the fly.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from itertools import zip_longest
+
+from infrastructure.adapters.http import HttpFetcher, get_http_fetcher
+from logger import logger
+
+ODS_MAX_PAGE_SIZE = 100
+
+
+def iter_offset_pages(
+    url: str,
+    params: dict | None = None,
+    headers: dict | None = None,
+    results_key: str = "results",
+    page_size: int = ODS_MAX_PAGE_SIZE,
+    http: HttpFetcher | None = None,
+) -> Iterator[dict]:
+    """Follow limit/offset pagination (Opendatasoft APIs) until a short page or `total_count` is reached."""
+    http = http or get_http_fetcher()
+    offset = 0
+    while True:
+        response = http.get(url, params={**(params or {}), "limit": page_size, "offset": offset}, headers=headers)
+        response.raise_for_status()
+        data = response.json()
+        records = data if isinstance(data, list) else data.get(results_key, [])
+        yield from records
+
+        offset += len(records)
+        total_count = data.get("total_count") if isinstance(data, dict) else None
+        if len(records) < page_size or (total_count is not None and offset >= total_count):
+            return
+
+
+def iter_next_pages(
+    url: str,
+    params: dict | None = None,
+    headers: dict | None = None,
+    results_key: str = "data",
+    http: HttpFetcher | None = None,
+) -> Iterator[dict]:
+    """Follow `next_page` links (data.gouv.fr API) until the last page."""
+    http = http or get_http_fetcher()
+    while url:
+        response = http.get(url, params=params, headers=headers)
+        response.raise_for_status()
+        data = response.json()
+        yield from data.get(results_key, [])
+
+        url = data.get("next_page")
+        params = None  # next_page already carries the query string
+
+
+def merge_by_key(*streams: Iterable[dict], key: str = "dataset_id") -> Iterator[dict]:
+    """
+    Merge records sharing the same `key` across streams, later streams taking precedence.
+
+    Streams are consumed in lockstep and a record is emitted as soon as every stream has provided
+    its part, so memory only holds the records on which streams are out of step (little when they are
+    sorted by `key`). Records missing from some streams are emitted at the end.
+
+    The sort order of each stream is checked as records arrive: an unsorted stream still merges
+    correctly, but falls back to buffering its records until the others catch up, which is logged.
+    """
+    pending: dict[str, list[dict | None]] = {}
+    last_keys: list[str | None] = [None] * len(streams)
+    unsorted: set[int] = set()
+    for records in zip_longest(*streams):
+        for index, record in enumerate(records):
+            if record is None or record.get(key) is None:
+                continue
+            if index not in unsorted and last_keys[index] is not None and str(record[key]) < last_keys[index]:
+                unsorted.add(index)
+                logger.warning(
+                    f"Stream #{index} is not sorted by {key} ({record[key]!r} after {last_keys[index]!r}): "
+                    f"merge falls back to buffering, memory is no longer bounded"
+                )
+            last_keys[index] = str(record[key])
+            parts = pending.setdefault(record[key], [None] * len(streams))
+            parts[index] = record
+            if all(part is not None for part in parts):
+                yield _merge_parts(pending.pop(record[key]))
+
+    for parts in pending.values():
+        yield _merge_parts(parts)
+
+
+def _merge_parts(parts: list[dict | None]) -> dict:
+    merged = {}
+    for part in parts:
+        if part:
+            merged.update(part)
+    return merged
@@ -0,0 +1,179 @@
+"""
+Shared HTTP layer for source adapters.
+
+One pooled client per process (keep-alive + TLS session reuse), a concurrency cap per host so that
+fan-outs do not hammer a single platform, and retry with jittered exponential backoff on 429/5xx.
+Both a blocking API (used by the sync use cases) and an async API (used for fan-outs) are exposed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import random
+import threading
+import time
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import httpx
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 4
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+
+    def should_retry(self, attempt: int, response: httpx.Response | None = None) -> bool:
+        """`response` is None when the attempt failed at the transport level (timeout, reset...)."""
+        if attempt + 1 >= self.max_attempts:
+            return False
+        return response is None or response.status_code in RETRYABLE_STATUS_CODES
+
+    def delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Seconds to wait before the next attempt: Retry-After when given, jittered exponential backoff otherwise."""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.max_backoff)
+        return min(self.backoff_factor * (2**attempt), self.max_backoff) * random.uniform(0.5, 1.0)
+
+
+@dataclass(frozen=True)
+class HttpRequest:
+    url: str
+    params: dict | None = None
+    headers: dict | None = None
+
+
+class HttpFetcher:
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_connections: int = 100,
+        per_host_limit: int = 8,
+        max_workers: int = 16,
+        retry: RetryPolicy | None = None,
+    ):
+        self.timeout = timeout
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self.per_host_limit = per_host_limit
+        self.retry = retry or RetryPolicy()
+        self._client = httpx.Client(timeout=timeout, limits=self.limits, follow_redirects=True)
+        # Threads are started on demand and shared by every get_many call
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="http-fetcher")
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        # httpx.AsyncClient and asyncio primitives are bound to the loop they were created in
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_host_slots: dict[str, asyncio.Semaphore] = {}
+        self._async_sessions = 0
+
+    # Blocking API
+
+    def get(self, url: str, params: dict | None = None, headers: dict | None = None) -> httpx.Response:
+        """GET with per-host concurrency cap and retry. Transport errors are raised once retries are exhausted."""
+        with self._host_slot(url):
+            attempt = 0
+            while True:
+                response = None
+                try:
+                    response = self._client.get(url, params=params, headers=headers)
+                except httpx.TransportError:
+                    if not self.retry.should_retry(attempt):
+                        raise
+                if response is not None and not self.retry.should_retry(attempt, response):
+                    return response
+                time.sleep(self.retry.delay(attempt, response))
+                attempt += 1
+
+    def get_many(self, requests: list[HttpRequest]) -> list[httpx.Response]:
+        """Issue several GETs in parallel; responses are returned in request order."""
+        if len(requests) <= 1:
+            return [self.get(r.url, r.params, r.headers) for r in requests]
+        return list(self._executor.map(lambda r: self.get(r.url, r.params, r.headers), requests))
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        self._client.close()
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_slots[host]
+
+    # Async API
+
+    async def aget(self, url: str, params: dict | None = None, headers: dict | None = None) -> httpx.Response:
+        """Async counterpart of `get`, sharing one pooled AsyncClient per event loop."""
+        client = self._get_async_client()
+        async with self._async_host_slot(url):
+            attempt = 0
+            while True:
+                response = None
+                try:
+                    response = await client.get(url, params=params, headers=headers)
+                except httpx.TransportError:
+                    if not self.retry.should_retry(attempt):
+                        raise
+                if response is not None and not self.retry.should_retry(attempt, response):
+                    return response
+                await asyncio.sleep(self.retry.delay(attempt, response))
+                attempt += 1
+
+    async def aget_many(self, requests: list[HttpRequest]) -> list[httpx.Response]:
+        return list(await asyncio.gather(*(self.aget(r.url, r.params, r.headers) for r in requests)))
+
+    @contextlib.asynccontextmanager
+    async def async_session(self) -> AsyncIterator[HttpFetcher]:
+        """Scope the AsyncClient to a fan-out: it is closed when the outermost session ends.
+
+        The client cannot outlive its event loop, so each `asyncio.run` fan-out should run in a session.
+        """
+        self._async_sessions += 1
+        try:
+            yield self
+        finally:
+            self._async_sessions -= 1
+            if not self._async_sessions:
+                await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_loop = None
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits, follow_redirects=True)
+            self._async_host_slots = {}
+            self._async_loop = loop
+        return self._async_client
+
+    def _async_host_slot(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self._async_host_slots:
+            self._async_host_slots[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._async_host_slots[host]
+
+
+_default_fetcher: HttpFetcher | None = None
+_default_fetcher_lock = threading.Lock()
+
+
+def get_http_fetcher() -> HttpFetcher:
+    """Process-wide fetcher shared by all adapters so connections are pooled across calls."""
+    global _default_fetcher
+    with _default_fetcher_lock:
+        if _default_fetcher is None:
+            _default_fetcher = HttpFetcher()
+        return _default_fetcher
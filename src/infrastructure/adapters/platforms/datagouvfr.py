@@ -1,8 +1,10 @@
 import datetime
+from collections.abc import Iterator
 
 import requests
 
 from domain.platform.ports import PlatformAdapter
+from infrastructure.adapters.harvest import iter_next_pages
 
 
 class DataGouvPlatformAdapter(PlatformAdapter):
@@ -35,3 +37,26 @@ class DataGouvPlatformAdapter(PlatformAdapter):
             "datasets": datasets,
         }
         return sync_data
+
+    def fetch_modified_since(self, since: datetime.datetime) -> Iterator[str]:
+        """Walk the organization datasets sorted by last_update (newest first) and stop at `since`."""
+        for dataset in self._iter_datasets(sort="-last_update"):
+            last_update = dataset.get("last_update")
+            if last_update and self._parse_datetime(last_update) <= since:
+                return
+            yield dataset["id"]
+
+    def fetch_metrics(self) -> Iterator[dict]:
+        """Listed datasets embed their metrics, so one paginated walk covers the whole organization."""
+        return self._iter_datasets()
+
+    def _iter_datasets(self, sort: str | None = None) -> Iterator[dict]:
+        params = {"page_size": 100}
+        if sort:
+            params["sort"] = sort
+        return iter_next_pages(f"{self.url}/api/1/organizations/{self.slug}/datasets/", params=params)
+
+    @staticmethod
+    def _parse_datetime(value: str) -> datetime.datetime:
+        parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=datetime.timezone.utc)
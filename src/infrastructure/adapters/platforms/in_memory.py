@@ -15,3 +15,9 @@ class InMemoryAdapter(PlatformAdapter):
             "status": "success",
             "datasets_count": 10,
         }
+
+    def fetch_modified_since(self, since):
+        return iter([])
+
+    def fetch_metrics(self):
+        return iter([])
@@ -1,9 +1,12 @@
 import datetime
 import os
+from collections.abc import Iterator
 
 import requests
 
 from domain.platform.ports import PlatformAdapter
+from infrastructure.adapters.harvest import iter_offset_pages
+from infrastructure.adapters.http import get_http_fetcher
 
 
 class OpendatasoftPlatformAdapter(PlatformAdapter):
@@ -49,3 +52,28 @@ class OpendatasoftPlatformAdapter(PlatformAdapter):
             "datasets": datasets,
         }
         return sync_data
+
+    def fetch_modified_since(self, since: datetime.datetime) -> Iterator[str]:
+        """
+        Catalog records whose metadata was modified after `since`.
+
+        Read from the export endpoint: the paginated one stops at offset 10000, which would silently drop changes
+        after a long gap while the high-water mark still advances. Only dataset_id is selected, so the export is small.
+        """
+        since_utc = since.astimezone(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        response = get_http_fetcher().get(
+            f"{self.url}/api/explore/v2.1/catalog/exports/json",
+            params={"where": f"modified > date'{since_utc}'", "select": "dataset_id"},
+            headers={"Authorization": f"Apikey {self.key}"},
+        )
+        response.raise_for_status()
+        for record in response.json():
+            yield record["dataset_id"]
+
+    def fetch_metrics(self) -> Iterator[dict]:
+        """Counters from the monitoring dataset: one paginated stream instead of three calls per dataset."""
+        return iter_offset_pages(
+            f"{self.url}/api/explore/v2.1/monitoring/datasets/ods-datasets-monitoring/records",
+            params={"order_by": "dataset_id"},
+            headers={"Authorization": f"Apikey {self.key}"},
+        )
@@ -0,0 +1,116 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from domain.common.ports import ReadModelCache
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class InMemoryReadModelCache(ReadModelCache):
+    """
+    Process-local LRU cache with a time-to-live, safe to share between the API threads.
+
+    Explicit invalidation only reaches this process: when syncs run elsewhere (CLI, cron), the TTL bounds staleness.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop((namespace, key), None)
+                self._stats.misses += 1
+                return default
+            self._entries.move_to_end((namespace, key))
+            self._stats.hits += 1
+            return entry[1]
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[(namespace, key)] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end((namespace, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def invalidate(self, *namespaces: str) -> None:
+        with self._lock:
+            for entry_key in [k for k in self._entries if k[0] in namespaces]:
+                del self._entries[entry_key]
+            self._stats.invalidations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                **asdict(self._stats),
+                "hit_ratio": self._stats.hit_ratio,
+            }
+
+
+class RedisReadModelCache(ReadModelCache):
+    """
+    Cache shared by every process through a Redis-compatible server (`client` is a `redis.Redis`).
+
+    Invalidating a namespace bumps its generation counter instead of scanning keys: entries of older
+    generations are no longer reachable and expire with their TTL. Values are stored as JSON.
+    """
+
+    def __init__(self, client, ttl: float = 300.0, prefix: str = "odm:cache"):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        raw = self.client.get(self._key(namespace, key))
+        with self._lock:
+            if raw is None:
+                self._stats.misses += 1
+                return default
+            self._stats.hits += 1
+        return json.loads(raw)
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        self.client.set(self._key(namespace, key), json.dumps(value, default=str), ex=max(1, int(self.ttl)))
+
+    def invalidate(self, *namespaces: str) -> None:
+        for namespace in namespaces:
+            self.client.incr(self._generation_key(namespace))
+        with self._lock:
+            self._stats.invalidations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"backend": "redis", **asdict(self._stats), "hit_ratio": self._stats.hit_ratio}
+
+    def _generation_key(self, namespace: str) -> str:
+        return f"{self.prefix}:{namespace}:generation"
+
+    def _key(self, namespace: str, key: str) -> str:
+        generation = int(self.client.get(self._generation_key(namespace)) or 0)
+        return f"{self.prefix}:{namespace}:{generation}:{key}"
@@ -1,5 +1,14 @@
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+
 import psycopg2
 import psycopg2.extras
+import psycopg2.pool
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_UNKNOWN
+
+from logger import logger
 
 
 class PostgresClient:
@@ -32,6 +41,19 @@ class PostgresClient:
             rows = cur.fetchall()
             return [dict(row) for row in rows]
 
+    def execute_values(self, query, rows, template=None, page_size=1000, fetch=False):
+        """Execute a multi-row statement (``VALUES %s``) in pages, optionally returning rows as dicts"""
+        with self.connection.cursor(cursor_factory=psycopg2.extras.DictCursor) as cur:
+            try:
+                result = psycopg2.extras.execute_values(
+                    cur, query, rows, template=template, page_size=page_size, fetch=fetch
+                )
+            except Exception as e:
+                logger.error(f"Multi-row statement failed: {e}")
+                self.rollback()
+                raise
+            return [dict(row) for row in result] if fetch else None
+
     def stream_fetchall(self, query, params=None, name="streaming_cursor"):
         """Execute a query using a server-side cursor to stream results (memory-efficient)"""
         # A named cursor in psycopg2 triggers a server-side cursor
@@ -42,6 +64,12 @@ class PostgresClient:
             yield dict(row)
         cur.close()
 
+    def begin(self):
+        """Start of a unit of work; the single connection is always held, so there is nothing to check out"""
+
+    def end(self):
+        """End of a unit of work"""
+
     def commit(self):
         self.connection.commit()
 
@@ -50,3 +78,210 @@ class PostgresClient:
 
     def close(self):
         self.connection.close()
+
+
+class PoolTimeoutError(Exception):
+    """No connection could be checked out of the pool within its timeout."""
+
+
+@dataclass
+class PoolStats:
+    checkouts: int = 0
+    timeouts: int = 0
+    discarded: int = 0
+    in_use: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+
+
+class PostgresConnectionPool:
+    """
+    Bounded pool of psycopg2 connections shared by all threads of the process.
+
+    Checkouts block up to `timeout` seconds when every connection is in use, connections that sat idle for
+    more than `health_check_interval` seconds are pinged before being handed out, and broken ones are replaced.
+    """
+
+    def __init__(
+        self,
+        dbname,
+        user,
+        password,
+        host="localhost",
+        port=5432,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        health_check_interval: float = 30.0,
+    ):
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self._pool = psycopg2.pool.ThreadedConnectionPool(
+            min_size, max_size, dbname=dbname, user=user, password=password, host=host, port=port
+        )
+        # ThreadedConnectionPool raises when exhausted instead of waiting: the semaphore makes callers queue
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle_since: dict[int, float] = {}
+        self._stats = PoolStats()
+
+    def acquire(self):
+        started = time.monotonic()
+        if not self._slots.acquire(timeout=self.timeout):
+            with self._lock:
+                self._stats.timeouts += 1
+            raise PoolTimeoutError(f"No connection available after {self.timeout}s ({self.max_size} in use)")
+        waited = time.monotonic() - started
+
+        try:
+            connection = self._checkout_healthy()
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._stats.checkouts += 1
+            self._stats.in_use += 1
+            self._stats.total_wait_seconds += waited
+            self._stats.max_wait_seconds = max(self._stats.max_wait_seconds, waited)
+        return connection
+
+    def release(self, connection) -> None:
+        broken = connection.closed or connection.info.transaction_status == TRANSACTION_STATUS_UNKNOWN
+        if not broken and connection.info.transaction_status != TRANSACTION_STATUS_IDLE:
+            # Never hand over a connection with a pending transaction
+            try:
+                connection.rollback()
+            except psycopg2.Error:
+                broken = True
+        try:
+            self._discard(connection) if broken else self._put(connection)
+        finally:
+            with self._lock:
+                self._stats.in_use -= 1
+            self._slots.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                **asdict(self._stats),
+                "avg_wait_seconds": self._stats.avg_wait_seconds,
+            }
+
+    def close(self) -> None:
+        self._pool.closeall()
+
+    def _checkout_healthy(self):
+        connection = self._pool.getconn()
+        idle_since = self._idle_since.pop(id(connection), None)
+        stale = idle_since is not None and time.monotonic() - idle_since > self.health_check_interval
+        if connection.closed or (stale and not self._ping(connection)):
+            self._discard(connection)
+            connection = self._pool.getconn()
+        connection.autocommit = False
+        return connection
+
+    @staticmethod
+    def _ping(connection) -> bool:
+        try:
+            with connection.cursor() as cur:
+                cur.execute("SELECT 1")
+            connection.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _put(self, connection) -> None:
+        self._idle_since[id(connection)] = time.monotonic()
+        self._pool.putconn(connection)
+
+    def _discard(self, connection) -> None:
+        with self._lock:
+            self._stats.discarded += 1
+        self._idle_since.pop(id(connection), None)
+        self._pool.putconn(connection, close=True)
+
+
+class PooledPostgresClient(PostgresClient):
+    """
+    Thread-safe PostgresClient: each thread works on its own connection checked out of a PostgresConnectionPool.
+
+    A connection is held from `begin()` (unit of work entry) to the matching `end()`, or from the first write
+    to the commit/rollback ending that implicit transaction. Reads outside a transaction only borrow one
+    for the duration of the query.
+    """
+
+    def __init__(self, pool: PostgresConnectionPool):
+        self.pool = pool
+        self._local = threading.local()
+
+    @property
+    def connection(self):
+        if getattr(self._local, "connection", None) is None:
+            self._local.connection = self.pool.acquire()
+        return self._local.connection
+
+    @property
+    def _depth(self) -> int:
+        return getattr(self._local, "depth", 0)
+
+    def begin(self):
+        self._local.depth = self._depth + 1
+        self.connection  # noqa: B018 - check out upfront so the wait happens before any work
+
+    def end(self):
+        self._local.depth = max(self._depth - 1, 0)
+        if not self._depth:
+            self._release()
+
+    def fetchone(self, query, params=None):
+        with self._borrowed():
+            return super().fetchone(query, params)
+
+    def fetchall(self, query, params=None):
+        with self._borrowed():
+            return super().fetchall(query, params)
+
+    def stream_fetchall(self, query, params=None, name="streaming_cursor"):
+        with self._borrowed():
+            yield from super().stream_fetchall(query, params, name)
+
+    def commit(self):
+        if getattr(self._local, "connection", None) is not None:
+            self._local.connection.commit()
+            if not self._depth:
+                self._release()
+
+    def rollback(self):
+        if getattr(self._local, "connection", None) is not None:
+            self._local.connection.rollback()
+            if not self._depth:
+                self._release()
+
+    def close(self):
+        """Give back the connection of the calling thread; the pool itself is closed with `pool.close()`."""
+        self._local.depth = 0
+        self._release()
+
+    @contextmanager
+    def _borrowed(self):
+        borrowed = getattr(self._local, "connection", None) is None
+        try:
+            yield
+        finally:
+            if borrowed and not self._depth:
+                self._release()
+
+    def _release(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            self._local.connection = None
+            self.pool.release(connection)
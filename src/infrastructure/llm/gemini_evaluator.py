@@ -2,29 +2,45 @@
 
 import json
 import os
+import time
 from datetime import datetime
 
 from google import genai
+from google.genai import errors as genai_errors
 from pydantic import ValidationError
 
 from domain.datasets.aggregate import Dataset
-from domain.quality.evaluation import CriterionScore, MetadataEvaluation, Suggestion
+from domain.quality.context_budget import estimate_tokens
+from domain.quality.evaluation import CriterionScore, LLMUsage, MetadataEvaluation, Suggestion
 from domain.quality.ports import LLMEvaluator
 from infrastructure.llm.models import EvaluationResponse
-from infrastructure.llm.prompts import build_system_prompt, build_user_prompt
+from infrastructure.llm.prompts import PROMPT_TEMPLATE_VERSION, build_system_prompt, build_user_prompt
+from infrastructure.llm.throttling import RateLimiter, retry_with_backoff
 from logger import logger
 
 
 class GeminiEvaluator(LLMEvaluator):
     """Gemini-based metadata quality evaluator."""
 
-    def __init__(self, api_key: str | None = None, model_name: str = "gemini-1.5-pro"):
+    prompt_version = PROMPT_TEMPLATE_VERSION
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model_name: str = "gemini-1.5-pro",
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        max_attempts: int = 5,
+    ):
         """
         Initialize Gemini evaluator.
 
         Args:
             api_key: Gemini API key (defaults to GEMINI_API_KEY env var)
             model_name: Gemini model to use
+            requests_per_minute: RPM limit of the key, enforced on async calls (None: not enforced)
+            tokens_per_minute: TPM limit of the key, enforced on async calls (None: not enforced)
+            max_attempts: Attempts of an async call on rate limits and server errors
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
@@ -32,6 +48,8 @@ class GeminiEvaluator(LLMEvaluator):
 
         self.client = genai.Client(api_key=self.api_key)
         self.model_name = model_name
+        self.limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self.max_attempts = max_attempts
 
     def evaluate_metadata(
         self, dataset: Dataset, dcat_reference: str, charter: str, output: str, prompt_type: str = "standard"
@@ -49,6 +67,68 @@ class GeminiEvaluator(LLMEvaluator):
         Returns:
             MetadataEvaluation with scores and suggestions
         """
+        request = self._build_request(dataset, dcat_reference, charter, output, prompt_type)
+
+        # Call Gemini
+        try:
+            started = time.perf_counter()
+            response = self.client.models.generate_content(**request)
+            latency_ms = (time.perf_counter() - started) * 1000
+            evaluation = self._parse_response(dataset, response.text, output, prompt_type)
+            evaluation.usage = self._usage(response, latency_ms)
+            return evaluation
+        except ValidationError as e:
+            logger.error(f"Failed to validate Gemini response: {e}")
+            raise ValueError(f"Invalid LLM response format: {e}")
+        except Exception as e:
+            logger.error(f"Gemini API error: {e}")
+            raise RuntimeError(f"LLM evaluation failed: {e}")
+
+    async def aevaluate_metadata(
+        self, dataset: Dataset, dcat_reference: str, charter: str, output: str, prompt_type: str = "standard"
+    ) -> MetadataEvaluation:
+        """Same as `evaluate_metadata` on the SDK's async client, paced by the RPM/TPM limiter and retried."""
+        request = self._build_request(dataset, dcat_reference, charter, output, prompt_type)
+        tokens = estimate_tokens(*request["contents"])
+
+        async def call():
+            await self.limiter.acquire(tokens)
+            started = time.perf_counter()
+            response = await self.client.aio.models.generate_content(**request)
+            return response, (time.perf_counter() - started) * 1000
+
+        try:
+            response, latency_ms = await retry_with_backoff(call, self._is_retryable, attempts=self.max_attempts)
+            evaluation = self._parse_response(dataset, response.text, output, prompt_type)
+            evaluation.usage = self._usage(response, latency_ms)
+            return evaluation
+        except ValidationError as e:
+            logger.error(f"Failed to validate Gemini response: {e}")
+            raise ValueError(f"Invalid LLM response format: {e}")
+        except Exception as e:
+            logger.error(f"Gemini API error: {e}")
+            raise RuntimeError(f"LLM evaluation failed: {e}")
+
+    def _usage(self, response, latency_ms: float) -> LLMUsage:
+        # Gemini caches repeated prompt prefixes implicitly and reports the tokens read from that cache
+        metadata = response.usage_metadata
+        if metadata is None:
+            return LLMUsage(model=self.model_name, latency_ms=latency_ms)
+        return LLMUsage(
+            model=self.model_name,
+            prompt_tokens=metadata.prompt_token_count or 0,
+            completion_tokens=metadata.candidates_token_count or 0,
+            cached_prompt_tokens=metadata.cached_content_token_count or 0,
+            latency_ms=latency_ms,
+        )
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        return isinstance(error, genai_errors.APIError) and (error.code == 429 or error.code >= 500)
+
+    def _build_request(
+        self, dataset: Dataset, dcat_reference: str, charter: str, output: str, prompt_type: str
+    ) -> dict:
         dataset_name = dataset.slug if hasattr(dataset, "slug") else dataset.get("title", "unknown")
         logger.info(
             f"Evaluating metadata for dataset {dataset_name} with Gemini (output: {output}, prompt: {prompt_type})"
@@ -58,63 +138,54 @@ class GeminiEvaluator(LLMEvaluator):
         system_prompt = build_system_prompt(dcat_reference, charter, output, prompt_type=prompt_type)
         user_prompt = build_user_prompt(dataset, output, prompt_type=prompt_type)
 
-        # Call Gemini
-        try:
-            generation_config = {"temperature": 0.1}
-            if output == "json":
-                generation_config["response_mime_type"] = "application/json"
-
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=[system_prompt, user_prompt],
-                config=genai.GenerationConfig(**generation_config),
+        generation_config = {"temperature": 0.1}
+        if output == "json":
+            generation_config["response_mime_type"] = "application/json"
+        return {
+            "model": self.model_name,
+            "contents": [system_prompt, user_prompt],
+            "config": genai.GenerationConfig(**generation_config),
+        }
+
+    def _parse_response(
+        self, dataset: Dataset, response_text: str, output: str, prompt_type: str
+    ) -> MetadataEvaluation:
+        logger.debug(f"Gemini response: {response_text}")
+
+        # For text output, return raw text wrapped in a simple evaluation object
+        if output == "text":
+            return MetadataEvaluation(
+                dataset_id=None,  # Will be set by service
+                dataset_slug=None,  # Will be set by service
+                evaluated_at=datetime.now(),
+                overall_score=0.0,
+                criteria_scores={},
+                suggestions=[],
+                raw_text=response_text,
             )
 
-            # Parse response
-            response_text = response.text
-            logger.debug(f"Gemini response: {response_text}")
-
-            # For text output, return raw text wrapped in a simple evaluation object
-            if output == "text":
-                return MetadataEvaluation(
-                    dataset_id=None,  # Will be set by service
-                    dataset_slug=None,  # Will be set by service
-                    evaluated_at=datetime.now(),
-                    overall_score=0.0,
-                    criteria_scores={},
-                    suggestions=[],
-                    raw_text=response_text,
-                )
-
-            # JSON Parsing
-            try:
-                # Basic cleaning
-                json_content = response_text.replace("```json", "").replace("```", "").strip()
-
-                if prompt_type == "light":
-                    from infrastructure.llm.models import LightEvaluationResponse
-
-                    parsed_light = LightEvaluationResponse.model_validate_json(json_content)
-                    return self._map_light_to_domain(dataset, parsed_light)
-
-                # Standard format
-                evaluation_data = json.loads(json_content)
-                validated = EvaluationResponse(**evaluation_data)
-
-                # Convert to domain model
-                return self._to_domain_model(dataset, validated)
-
-            except Exception as e:
-                logger.error(f"Failed to parse Gemini JSON response: {e}")
-                logger.error(f"Response was: {response_text}")
-                raise ValueError(f"Invalid JSON from Gemini: {e}")
+        # JSON Parsing
+        try:
+            # Basic cleaning
+            json_content = response_text.replace("```json", "").replace("```", "").strip()
+
+            if prompt_type == "light":
+                from infrastructure.llm.models import LightEvaluationResponse
+
+                parsed_light = LightEvaluationResponse.model_validate_json(json_content)
+                return self._map_light_to_domain(dataset, parsed_light)
+
+            # Standard format
+            evaluation_data = json.loads(json_content)
+            validated = EvaluationResponse(**evaluation_data)
+
+            # Convert to domain model
+            return self._to_domain_model(dataset, validated)
 
-        except ValidationError as e:
-            logger.error(f"Failed to validate Gemini response: {e}")
-            raise ValueError(f"Invalid LLM response format: {e}")
         except Exception as e:
-            logger.error(f"Gemini API error: {e}")
-            raise RuntimeError(f"LLM evaluation failed: {e}")
+            logger.error(f"Failed to parse Gemini JSON response: {e}")
+            logger.error(f"Response was: {response_text}")
+            raise ValueError(f"Invalid JSON from Gemini: {e}")
 
     def _map_light_to_domain(self, dataset: Dataset, light: any) -> MetadataEvaluation:
         """Map the light prompt response format to domain MetadataEvaluation."""
@@ -1,30 +1,45 @@
 import json
+import time
 from datetime import datetime
 
+import httpx
 import requests
 
 from domain.datasets.aggregate import Dataset
-from domain.quality.evaluation import CriterionScore, MetadataEvaluation, Suggestion
+from domain.quality.evaluation import CriterionScore, LLMUsage, MetadataEvaluation, Suggestion
 from domain.quality.ports import LLMEvaluator
 from infrastructure.llm.models import EvaluationResponse
-from infrastructure.llm.prompts import build_system_prompt, build_user_prompt
+from infrastructure.llm.prompts import PROMPT_TEMPLATE_VERSION, build_system_prompt, build_user_prompt
+from infrastructure.llm.throttling import RateLimiter, retry_with_backoff
 from logger import logger
 
 
 class OllamaEvaluator(LLMEvaluator):
     """Ollama-based metadata quality evaluator (local LLM)."""
 
-    def __init__(self, model_name: str = "llama3.1", base_url: str = "http://localhost:11434"):
+    prompt_version = PROMPT_TEMPLATE_VERSION
+
+    def __init__(
+        self,
+        model_name: str = "llama3.1",
+        base_url: str = "http://localhost:11434",
+        requests_per_minute: int | None = None,
+        max_attempts: int = 3,
+    ):
         """
         Initialize Ollama evaluator.
 
         Args:
             model_name: Ollama model to use (default: llama3.1)
             base_url: Ollama API base URL
+            requests_per_minute: Limit of async calls per minute (None: not enforced, Ollama queues requests)
+            max_attempts: Attempts of an async call on connection and server errors
         """
         self.model_name = model_name
         self.base_url = base_url
         self.api_url = f"{base_url}/api/generate"
+        self.limiter = RateLimiter(requests_per_minute)
+        self.max_attempts = max_attempts
 
         # Check if Ollama is running
         try:
@@ -51,90 +66,143 @@ class OllamaEvaluator(LLMEvaluator):
         Returns:
             MetadataEvaluation with scores and suggestions
         """
-        dataset_name = dataset.slug if hasattr(dataset, "slug") else dataset.get("title", "unknown")
-        logger.info(
-            f"Evaluating metadata for dataset {dataset_name} with Ollama (output: {output}, prompt: {prompt_type})"
-        )
-
-        # Build prompts
-        system_prompt = build_system_prompt(dcat_reference, charter, output, prompt_type=prompt_type)
-        user_prompt = build_user_prompt(dataset, output, prompt_type=prompt_type)
-
-        # Combine prompts for Ollama
-        full_prompt = f"{system_prompt}\n\n{user_prompt}"
+        payload = self._build_payload(dataset, dcat_reference, charter, output, prompt_type)
 
         # Call Ollama
         try:
-            payload = {
-                "model": self.model_name,
-                "prompt": full_prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.1,  # Low temperature for consistency
-                    "num_predict": 2048,  # Max tokens for response
-                    "num_ctx": 8192,  # Increase context window
-                },
-            }
-
-            if output == "json":
-                payload["format"] = "json"
-
+            started = time.perf_counter()
             response = requests.post(
                 self.api_url,
                 json=payload,
                 timeout=300,  # 5 minutes timeout for local inference
             )
             response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Ollama API error: {e}")
+            raise RuntimeError(self._failure_message(e))
+
+        latency_ms = (time.perf_counter() - started) * 1000
+        ollama_response = response.json()
+        evaluation = self._parse_response(dataset, ollama_response.get("response", ""), output, prompt_type)
+        evaluation.usage = self._usage(ollama_response, latency_ms)
+        return evaluation
 
-            # Parse response
-            ollama_response = response.json()
-            response_text = ollama_response.get("response", "")
+    async def aevaluate_metadata(
+        self, dataset: Dataset, dcat_reference: str, charter: str, output: str, prompt_type: str = "standard"
+    ) -> MetadataEvaluation:
+        """Same as `evaluate_metadata` with an async HTTP client, retried with backoff on transient errors."""
+        payload = self._build_payload(dataset, dcat_reference, charter, output, prompt_type)
 
-            logger.debug(f"Ollama response: {response_text[:500]}...")
+        async def call():
+            await self.limiter.acquire(0)
+            started = time.perf_counter()
+            async with httpx.AsyncClient(timeout=300) as client:
+                response = await client.post(self.api_url, json=payload)
+                response.raise_for_status()
+                return response.json(), (time.perf_counter() - started) * 1000
 
-            # For text output, return raw text wrapped in a simple evaluation object
-            if output == "text":
-                return MetadataEvaluation(
-                    dataset_id=None,  # Will be set by service
-                    dataset_slug=None,  # Will be set by service
-                    evaluated_at=datetime.now(),
-                    overall_score=0.0,
-                    criteria_scores=[],
-                    suggestions=[],
-                    raw_text=response_text,
-                )
+        try:
+            ollama_response, latency_ms = await retry_with_backoff(call, self._is_retryable, attempts=self.max_attempts)
+        except httpx.HTTPError as e:
+            logger.error(f"Ollama API error: {e}")
+            raise RuntimeError(self._failure_message(e))
+
+        evaluation = self._parse_response(dataset, ollama_response.get("response", ""), output, prompt_type)
+        evaluation.usage = self._usage(ollama_response, latency_ms)
+        return evaluation
+
+    def _usage(self, ollama_response: dict, latency_ms: float) -> LLMUsage:
+        # Ollama reuses the KV cache of a repeated prompt prefix without reporting it: no cached token count
+        return LLMUsage(
+            model=self.model_name,
+            prompt_tokens=ollama_response.get("prompt_eval_count") or 0,
+            completion_tokens=ollama_response.get("eval_count") or 0,
+            latency_ms=latency_ms,
+        )
 
-            # JSON Parsing
-            try:
-                # Basic cleaning for some LLMs that might wrap JSON in markdown blocks
-                json_content = response_text.replace("```json", "").replace("```", "").strip()
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code >= 500
+        return isinstance(error, httpx.TransportError)
+
+    def _failure_message(self, error: Exception) -> str:
+        return (
+            f"Ollama evaluation failed: {error}. "
+            "Make sure Ollama is running ('ollama serve') "
+            f"and model '{self.model_name}' is installed ('ollama pull {self.model_name}')"
+        )
 
-                if prompt_type == "light":
-                    from infrastructure.llm.models import LightEvaluationResponse
+    def _build_payload(
+        self, dataset: Dataset, dcat_reference: str, charter: str, output: str, prompt_type: str
+    ) -> dict:
+        dataset_name = dataset.slug if hasattr(dataset, "slug") else dataset.get("title", "unknown")
+        logger.info(
+            f"Evaluating metadata for dataset {dataset_name} with Ollama (output: {output}, prompt: {prompt_type})"
+        )
 
-                    parsed_light = LightEvaluationResponse.model_validate_json(json_content)
-                    return self._map_light_to_domain(dataset, parsed_light)
+        # Build prompts
+        system_prompt = build_system_prompt(dcat_reference, charter, output, prompt_type=prompt_type)
+        user_prompt = build_user_prompt(dataset, output, prompt_type=prompt_type)
 
-                # Standard format
-                evaluation_data = json.loads(json_content)
-                validated = EvaluationResponse(**evaluation_data)
+        # Combine prompts for Ollama
+        full_prompt = f"{system_prompt}\n\n{user_prompt}"
 
-                # Convert to domain model
-                return self._to_domain_model(dataset, validated)
+        payload = {
+            "model": self.model_name,
+            "prompt": full_prompt,
+            "stream": False,
+            "options": {
+                "temperature": 0.1,  # Low temperature for consistency
+                "num_predict": 2048,  # Max tokens for response
+                "num_ctx": 8192,  # Increase context window
+            },
+        }
 
-            except Exception as e:
-                logger.error(f"Failed to parse Ollama JSON response: {e}")
-                logger.error(f"Response was: {response_text}")
-                raise ValueError(f"Invalid JSON from Ollama: {e}")
+        if output == "json":
+            payload["format"] = "json"
+        return payload
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Ollama API error: {e}")
-            raise RuntimeError(
-                f"Ollama evaluation failed: {e}. "
-                "Make sure Ollama is running ('ollama serve') "
-                f"and model '{self.model_name}' is installed ('ollama pull {self.model_name}')"
+    def _parse_response(
+        self, dataset: Dataset, response_text: str, output: str, prompt_type: str
+    ) -> MetadataEvaluation:
+        logger.debug(f"Ollama response: {response_text[:500]}...")
+
+        # For text output, return raw text wrapped in a simple evaluation object
+        if output == "text":
+            return MetadataEvaluation(
+                dataset_id=None,  # Will be set by service
+                dataset_slug=None,  # Will be set by service
+                evaluated_at=datetime.now(),
+                overall_score=0.0,
+                criteria_scores=[],
+                suggestions=[],
+                raw_text=response_text,
             )
 
+        # JSON Parsing
+        try:
+            # Basic cleaning for some LLMs that might wrap JSON in markdown blocks
+            json_content = response_text.replace("```json", "").replace("```", "").strip()
+
+            if prompt_type == "light":
+                from infrastructure.llm.models import LightEvaluationResponse
+
+                parsed_light = LightEvaluationResponse.model_validate_json(json_content)
+                return self._map_light_to_domain(dataset, parsed_light)
+
+            # Standard format
+            evaluation_data = json.loads(json_content)
+            validated = EvaluationResponse(**evaluation_data)
+
+            # Convert to domain model
+            return self._to_domain_model(dataset, validated)
+
+        except Exception as e:
+            logger.error(f"Failed to parse Ollama JSON response: {e}")
+            logger.error(f"Response was: {response_text}")
+            raise ValueError(f"Invalid JSON from Ollama: {e}")
+
     def _map_light_to_domain(self, dataset: Dataset, light: any) -> MetadataEvaluation:
         """Map the light prompt response format to domain MetadataEvaluation."""
         # Map light keys to standard keys
@@ -2,36 +2,56 @@
 
 import json
 import os
+import time
 from datetime import datetime
 
-from openai import OpenAI
+from openai import APIConnectionError, APITimeoutError, AsyncOpenAI, InternalServerError, OpenAI, RateLimitError
+from openai.types import CompletionUsage
 from pydantic import ValidationError
 
 from domain.datasets.aggregate import Dataset
-from domain.quality.evaluation import CriterionScore, MetadataEvaluation, Suggestion
+from domain.quality.context_budget import estimate_tokens
+from domain.quality.evaluation import CriterionScore, LLMUsage, MetadataEvaluation, Suggestion
 from domain.quality.ports import LLMEvaluator
 from infrastructure.llm.models import EvaluationResponse
-from infrastructure.llm.prompts import build_system_prompt, build_user_prompt
+from infrastructure.llm.prompts import PROMPT_TEMPLATE_VERSION, build_system_prompt, build_user_prompt
+from infrastructure.llm.throttling import RateLimiter, retry_with_backoff
 from logger import logger
 
 
 class OpenAIEvaluator(LLMEvaluator):
     """OpenAI-based metadata quality evaluator."""
 
-    def __init__(self, api_key: str | None = None, model_name: str = "gpt-4o-mini"):
+    prompt_version = PROMPT_TEMPLATE_VERSION
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model_name: str = "gpt-4o-mini",
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        max_attempts: int = 5,
+    ):
         """
         Initialize OpenAI evaluator.
 
         Args:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
             model_name: OpenAI model to use (default: gpt-4o-mini)
+            requests_per_minute: RPM allowed to this process, enforced on async calls (None: not enforced)
+            tokens_per_minute: TPM allowed to this process, enforced on async calls (None: not enforced)
+            max_attempts: Attempts of an async call on rate limits, timeouts and server errors
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY must be set. Get your key at https://platform.openai.com/api-keys")
 
         self.client = OpenAI(api_key=self.api_key)
+        # Retries are ours (jittered, limiter-aware) rather than the SDK's
+        self.aclient = AsyncOpenAI(api_key=self.api_key, max_retries=0)
         self.model_name = model_name
+        self.limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self.max_attempts = max_attempts
 
     def evaluate_metadata(
         self, dataset: Dataset, dcat_reference: str, charter: str, output: str, prompt_type: str = "standard"
@@ -49,80 +69,136 @@ class OpenAIEvaluator(LLMEvaluator):
         Returns:
             MetadataEvaluation with scores and suggestions
         """
+        api_params = self._prepare_request(dataset, dcat_reference, charter, output, prompt_type)
+        try:
+            started = time.perf_counter()
+            response = self.client.chat.completions.create(**api_params)
+            latency_ms = (time.perf_counter() - started) * 1000
+            evaluation = self.parse_response(dataset, response.choices[0].message.content, output, prompt_type)
+            evaluation.usage = self.usage(response.usage, latency_ms)
+            return evaluation
+        except ValidationError as e:
+            logger.error(f"Failed to validate OpenAI response: {e}")
+            raise ValueError(f"Invalid LLM response format: {e}")
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            raise RuntimeError(f"LLM evaluation failed: {e}")
+
+    async def aevaluate_metadata(
+        self, dataset: Dataset, dcat_reference: str, charter: str, output: str, prompt_type: str = "standard"
+    ) -> MetadataEvaluation:
+        """Same as `evaluate_metadata` on the async client, paced by the RPM/TPM limiter and retried with backoff."""
+        api_params = self._prepare_request(dataset, dcat_reference, charter, output, prompt_type)
+        tokens = estimate_tokens(
+            *(message["content"] for message in api_params["messages"]), completion_tokens=api_params["max_tokens"]
+        )
+
+        async def call():
+            await self.limiter.acquire(tokens)
+            started = time.perf_counter()  # Time spent waiting for the limiter is not latency
+            response = await self.aclient.chat.completions.create(**api_params)
+            return response, (time.perf_counter() - started) * 1000
+
+        try:
+            response, latency_ms = await retry_with_backoff(call, self._is_retryable, attempts=self.max_attempts)
+            evaluation = self.parse_response(dataset, response.choices[0].message.content, output, prompt_type)
+            evaluation.usage = self.usage(response.usage, latency_ms)
+            return evaluation
+        except ValidationError as e:
+            logger.error(f"Failed to validate OpenAI response: {e}")
+            raise ValueError(f"Invalid LLM response format: {e}")
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            raise RuntimeError(f"LLM evaluation failed: {e}")
+
+    def usage(self, usage: CompletionUsage | None, latency_ms: float | None = None) -> LLMUsage:
+        """Token counts of a completion, prompt tokens read from OpenAI's prompt cache included."""
+        if usage is None:
+            return LLMUsage(model=self.model_name, latency_ms=latency_ms)
+        details = usage.prompt_tokens_details
+        return LLMUsage(
+            model=self.model_name,
+            prompt_tokens=usage.prompt_tokens,
+            completion_tokens=usage.completion_tokens,
+            cached_prompt_tokens=(details.cached_tokens or 0) if details else 0,
+            latency_ms=latency_ms,
+        )
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        return isinstance(error, (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError))
+
+    def _prepare_request(
+        self, dataset: Dataset, dcat_reference: str, charter: str, output: str, prompt_type: str
+    ) -> dict:
         dataset_name = dataset.slug if hasattr(dataset, "slug") else dataset.get("title", "unknown")
         logger.info(
             f"Evaluating metadata for dataset {dataset_name} with OpenAI (model: {self.model_name}, prompt: {prompt_type})"
         )
-
-        # Build prompts
         try:
-            system_prompt = build_system_prompt(dcat_reference, charter, output, prompt_type=prompt_type)
-            user_prompt = build_user_prompt(dataset, output, prompt_type=prompt_type)
+            return self.build_request(dataset, dcat_reference, charter, output, prompt_type)
         except Exception as e:
             logger.error(f"Failed to build prompts for dataset evaluation: {e}")
             raise RuntimeError(f"Prompt builders failed: {e}")
 
-        # Call OpenAI
+    def build_request(
+        self, dataset: Dataset, dcat_reference: str, charter: str, output: str, prompt_type: str = "standard"
+    ) -> dict:
+        """Chat completion parameters of an evaluation, as sent live or in a Batch API file."""
+        system_prompt = build_system_prompt(dcat_reference, charter, output, prompt_type=prompt_type)
+        user_prompt = build_user_prompt(dataset, output, prompt_type=prompt_type)
+        api_params = {
+            "model": self.model_name,
+            "messages": [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
+            "temperature": 0.1,
+            "max_tokens": 2048,
+            # Requests sharing the system prompt are routed to the same prompt cache
+            "prompt_cache_key": f"evaluation-{prompt_type}-{output}-{self.prompt_version}",
+        }
+
+        # Only enable JSON mode for json output
+        if output == "json":
+            api_params["response_format"] = {"type": "json_object"}
+        return api_params
+
+    def parse_response(self, dataset: Dataset, response_text: str, output: str, prompt_type: str) -> MetadataEvaluation:
+        """Convert the completion text of an evaluation to the domain model."""
+        logger.debug(f"OpenAI response: {response_text[:500]}...")
+
+        # For text output, return raw text wrapped in a simple evaluation object
+        if output == "text":
+            return MetadataEvaluation(
+                dataset_id=None,  # Will be set by service
+                dataset_slug=None,  # Will be set by service
+                evaluated_at=datetime.now(),
+                overall_score=0.0,  # Not applicable for text format
+                criteria_scores={},  # Not applicable for text format
+                suggestions=[],  # Not applicable for text format
+                raw_text=response_text,  # Store raw text evaluation
+            )
+
+        # JSON Parsing
         try:
-            # Configure response format based on output type
-            api_params = {
-                "model": self.model_name,
-                "messages": [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
-                "temperature": 0.1,
-                "max_tokens": 2048,
-            }
-
-            # Only enable JSON mode for json output
-            if output == "json":
-                api_params["response_format"] = {"type": "json_object"}
+            # Basic cleaning
+            json_content = response_text.replace("```json", "").replace("```", "").strip()
 
-            response = self.client.chat.completions.create(**api_params)
+            if prompt_type == "light":
+                from infrastructure.llm.models import LightEvaluationResponse
 
-            # Parse response
-            response_text = response.choices[0].message.content
-            logger.debug(f"OpenAI response: {response_text[:500]}...")
-
-            # For text output, return raw text wrapped in a simple evaluation object
-            if output == "text":
-                return MetadataEvaluation(
-                    dataset_id=None,  # Will be set by service
-                    dataset_slug=None,  # Will be set by service
-                    evaluated_at=datetime.now(),
-                    overall_score=0.0,  # Not applicable for text format
-                    criteria_scores={},  # Not applicable for text format
-                    suggestions=[],  # Not applicable for text format
-                    raw_text=response_text,  # Store raw text evaluation
-                )
-
-            # JSON Parsing
-            try:
-                # Basic cleaning
-                json_content = response_text.replace("```json", "").replace("```", "").strip()
-
-                if prompt_type == "light":
-                    from infrastructure.llm.models import LightEvaluationResponse
-
-                    parsed_light = LightEvaluationResponse.model_validate_json(json_content)
-                    return self._map_light_to_domain(dataset, parsed_light)
-
-                # Standard format
-                evaluation_data = json.loads(json_content)
-                validated = EvaluationResponse(**evaluation_data)
-
-                # Convert to domain model
-                return self._to_domain_model(dataset, validated)
-
-            except Exception as e:
-                logger.error(f"Failed to parse OpenAI JSON response: {e}")
-                logger.error(f"Response was: {response_text}")
-                raise ValueError(f"Invalid JSON from OpenAI: {e}")
+                parsed_light = LightEvaluationResponse.model_validate_json(json_content)
+                return self._map_light_to_domain(dataset, parsed_light)
+
+            # Standard format
+            evaluation_data = json.loads(json_content)
+            validated = EvaluationResponse(**evaluation_data)
+
+            # Convert to domain model
+            return self._to_domain_model(dataset, validated)
 
-        except ValidationError as e:
-            logger.error(f"Failed to validate OpenAI response: {e}")
-            raise ValueError(f"Invalid LLM response format: {e}")
         except Exception as e:
-            logger.error(f"OpenAI API error: {e}")
-            raise RuntimeError(f"LLM evaluation failed: {e}")
+            logger.error(f"Failed to parse OpenAI JSON response: {e}")
+            logger.error(f"Response was: {response_text}")
+            raise ValueError(f"Invalid JSON from OpenAI: {e}")
 
     def _map_light_to_domain(self, dataset: Dataset, light: any) -> MetadataEvaluation:
         """Map the light prompt response format to domain MetadataEvaluation."""
@@ -1,4 +1,8 @@
 import json
+from functools import lru_cache
+
+# Bump whenever a template below changes: cached evaluations made with another version are not reused
+PROMPT_TEMPLATE_VERSION = "2026-10-17"
 
 SYSTEM_PROMPT_TEMPLATE_TEXT = """
 Rôle : Tu es un expert en gouvernance des données pour l'administration française, spécialisé dans l'application de la charte Open Data du Ministère de l'Économie et des Finances (MEF) et des principes FAIR.
@@ -159,8 +163,15 @@ USER_PROMPT_TEMPLATE_LIGHT = """
 Réponds avec l'évaluation au format JSON."""
 
 
+@lru_cache(maxsize=16)
 def build_system_prompt(dcat_reference: str, charter: str, output: str, prompt_type: str = "standard") -> str:
-    """Build the system prompt (ignoring references to fit context)."""
+    """
+    Build the system prompt (ignoring references to fit context).
+
+    Built once per references, output and prompt type, then reused verbatim: it is the leading, byte-identical
+    part of every request, so that providers' prompt caching applies to it. Everything specific to a dataset
+    goes in the user prompt, after it.
+    """
     if prompt_type == "light":
         return SYSTEM_PROMPT_TEMPLATE_LIGHT
 
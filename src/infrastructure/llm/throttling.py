@@ -0,0 +1,82 @@
+"""Client-side pacing of LLM API calls: token buckets for the provider's RPM/TPM limits and jittered retries."""
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from logger import logger
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """
+    Async token bucket refilled continuously at `per_minute`, holding at most one minute of capacity.
+    Waiters are served in arrival order.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.available = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        amount = min(amount, self.capacity)  # A request larger than the bucket waits for a full bucket
+        async with self._lock:
+            self._refill()
+            while self.available < amount:
+                await asyncio.sleep((amount - self.available) / self.rate)
+                self._refill()
+            self.available -= amount
+
+
+class RateLimiter:
+    """
+    Requests per minute and tokens per minute of one API key; a None limit is not enforced.
+
+    Buckets are in memory: each process only paces its own calls, so processes sharing a key must each be given
+    their share of its limits.
+    """
+
+    def __init__(self, requests_per_minute: int | None = None, tokens_per_minute: int | None = None):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    async def acquire(self, tokens: int) -> None:
+        if self.requests:
+            await self.requests.acquire(1)
+        if self.tokens:
+            await self.tokens.acquire(tokens)
+
+
+async def retry_with_backoff(
+    call: Callable[[], Awaitable[T]],
+    is_retryable: Callable[[Exception], bool],
+    attempts: int = 5,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+) -> T:
+    """
+    Await `call()` until it succeeds, at most `attempts` times. Retryable failures (rate limits, timeouts,
+    server errors) wait a random delay up to base_delay * 2^attempt ("full jitter"), so that workers throttled
+    together do not retry together.
+    """
+    for attempt in range(attempts):
+        try:
+            return await call()
+        except Exception as e:
+            if attempt == attempts - 1 or not is_retryable(e):
+                raise
+            delay = random.uniform(0, min(max_delay, base_delay * 2**attempt))
+            logger.warning(f"LLM call failed ({type(e).__name__}), retry {attempt + 1}/{attempts - 1} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    raise ValueError("attempts must be at least 1")
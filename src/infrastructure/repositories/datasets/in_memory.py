@@ -1,18 +1,52 @@
 import uuid
 from collections import Counter
-from datetime import datetime, timezone
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
-from common import calculate_snapshot_diff
+from common import calculate_snapshot_patch
 from domain.datasets.aggregate import Dataset
+from domain.datasets.entities import DatasetVersion
 from domain.datasets.ports import AbstractDatasetRepository
-from domain.datasets.value_objects import DatasetVersionParams
+from domain.datasets.value_objects import DatasetMetricsDelta, DatasetMetricsParams, DatasetVersionParams, PageCursor
+from domain.quality.evaluation import EvaluationCacheKey
+from domain.quality.jobs import (
+    DEFAULT_LEASE,
+    DONE,
+    FAILED,
+    JOB_STATES,
+    PENDING,
+    RUNNING,
+    EvaluationJob,
+    EvaluationJobProgress,
+    EvaluationJobSelection,
+)
+
+_METRICS = ("downloads_count", "api_calls_count", "views_count", "reuses_count", "followers_count", "popularity_score")
+
+
+def _growth(latest: dict, reference: dict | None, name: str):
+    if reference is None or latest[name] is None or reference[name] is None:
+        return None
+    return latest[name] - reference[name]
+
+
+def _period_start(timestamp: datetime, granularity: str) -> datetime:
+    day = timestamp.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
 
 
 class InMemoryDatasetRepository(AbstractDatasetRepository):
     def __init__(self, db):
         self.db = db
         self.versions = []
+        self.evaluations = {}
+        self.jobs = {}  # (dataset_id, prompt_type) -> job
+        self.compactions = {}  # bucket -> compacted until
 
     def add(self, dataset: Dataset):
         for i, existing in enumerate(self.db):
@@ -28,31 +62,25 @@ class InMemoryDatasetRepository(AbstractDatasetRepository):
         if not diff:
             prev_version_dict = next((v for v in reversed(self.versions) if v["dataset_id"] == params.dataset_id), None)
             if prev_version_dict:
-                # Construct comparable objects including metrics
-                prev_comparable = prev_version_dict["snapshot"].copy() if prev_version_dict["snapshot"] else {}
-                prev_comparable.update(
-                    {
-                        "downloads_count": prev_version_dict.get("downloads_count"),
-                        "api_calls_count": prev_version_dict.get("api_calls_count"),
-                        "views_count": prev_version_dict.get("views_count"),
-                        "reuses_count": prev_version_dict.get("reuses_count") or 0,
-                        "followers_count": prev_version_dict.get("followers_count"),
-                        "popularity_score": prev_version_dict.get("popularity_score"),
-                    }
-                )
-
-                curr_comparable = params.snapshot.copy()
-                curr_comparable.update(
-                    {
-                        "downloads_count": params.downloads_count,
-                        "api_calls_count": params.api_calls_count,
-                        "views_count": params.views_count,
-                        "reuses_count": params.reuses_count or 0,
-                        "followers_count": params.followers_count,
-                        "popularity_score": params.popularity_score,
-                    }
-                )
-                diff = calculate_snapshot_diff(prev_comparable, curr_comparable)
+                prev_comparable = {
+                    **(prev_version_dict["snapshot"] or {}),
+                    "downloads_count": prev_version_dict.get("downloads_count"),
+                    "api_calls_count": prev_version_dict.get("api_calls_count"),
+                    "views_count": prev_version_dict.get("views_count"),
+                    "reuses_count": prev_version_dict.get("reuses_count") or 0,
+                    "followers_count": prev_version_dict.get("followers_count"),
+                    "popularity_score": prev_version_dict.get("popularity_score"),
+                }
+                curr_comparable = {
+                    **params.snapshot,
+                    "downloads_count": params.downloads_count,
+                    "api_calls_count": params.api_calls_count,
+                    "views_count": params.views_count,
+                    "reuses_count": params.reuses_count or 0,
+                    "followers_count": params.followers_count,
+                    "popularity_score": params.popularity_score,
+                }
+                diff = calculate_snapshot_patch(prev_comparable, curr_comparable)
 
         self.versions.append(
             {
@@ -72,6 +100,41 @@ class InMemoryDatasetRepository(AbstractDatasetRepository):
             }
         )
 
+    def add_many(self, datasets: list[Dataset]) -> None:
+        for dataset in datasets:
+            self.add(dataset)
+
+    def add_versions(self, params_list: list[DatasetVersionParams], known_blobs: dict | None = None) -> None:
+        for params in params_list:
+            self.add_version(params)
+
+    def get_blob_ids(self, platform_id: UUID) -> dict:
+        return {}
+
+    def add_metrics_versions(self, params_list: list[DatasetMetricsParams]) -> None:
+        for params in params_list:
+            latest = next((v for v in reversed(self.versions) if v["dataset_id"] == params.dataset_id), None)
+            if latest is None:
+                continue
+            self.versions.append(
+                {
+                    **latest,
+                    "timestamp": datetime.now(timezone.utc),
+                    "downloads_count": params.downloads_count,
+                    "api_calls_count": params.api_calls_count,
+                    "views_count": params.views_count,
+                    "reuses_count": params.reuses_count,
+                    "followers_count": params.followers_count,
+                    "popularity_score": params.popularity_score,
+                    "diff": params.diff,
+                }
+            )
+
+    def get_sync_states(self, platform_id: UUID) -> dict[str, Dataset]:
+        return {
+            dataset.buid: self.get_by_buid(dataset.buid) for dataset in self.db if dataset.platform_id == platform_id
+        }
+
     def get(self, dataset_id: UUID, include_versions: bool = True) -> Dataset:
         dataset = next((item for item in self.db if item.id == dataset_id), None)
         if dataset is not None:
@@ -145,6 +208,24 @@ class InMemoryDatasetRepository(AbstractDatasetRepository):
         self.add(instance)
         return
 
+    def update_datasets_sync_status(self, platform_id: UUID, dataset_ids: list[UUID], status: str) -> None:
+        for dataset_id in dataset_ids:
+            self.update_dataset_sync_status(platform_id, dataset_id, status)
+
+    def find_by_slugs(self, slugs: list[str]) -> list[dict]:
+        wanted = {str(slug) for slug in slugs}
+        return [
+            {"id": dataset.id, "slug": str(dataset.slug), "page": str(dataset.page)}
+            for dataset in self.db
+            if str(dataset.slug) in wanted
+        ]
+
+    def update_linkings(self, links: list[tuple[UUID, UUID | None]]) -> None:
+        for dataset_id, linked_id in links:
+            instance = next((item for item in self.db if item.id == dataset_id), None)
+            if instance is not None:
+                instance.linked_dataset_id = linked_id
+
     def get_buids(self, platform_id):
         return [dataset.buid for dataset in self.db if dataset.platform_id == platform_id]
 
@@ -153,6 +234,15 @@ class InMemoryDatasetRepository(AbstractDatasetRepository):
         instance.is_deleted = dataset.is_deleted
         self.add(instance)
 
+    def mark_missing_as_deleted(self, platform_id: UUID, present_buids: list[str]) -> list[dict]:
+        present = set(present_buids)
+        deleted = []
+        for dataset in self.db:
+            if dataset.platform_id == platform_id and not dataset.is_deleted and dataset.buid not in present:
+                dataset.mark_as_deleted()
+                deleted.append({"id": dataset.id, "buid": dataset.buid, "slug": dataset.slug})
+        return deleted
+
     def search(
         self,
         platform_id: str | None = None,
@@ -169,6 +259,40 @@ class InMemoryDatasetRepository(AbstractDatasetRepository):
         page_size: int = 25,
     ) -> tuple[list[dict], int]:
         """Basic in-memory search implementation for tests."""
+        items, total, _ = self.search_page(
+            platform_id,
+            publisher,
+            q,
+            created_from,
+            created_to,
+            modified_from,
+            modified_to,
+            is_deleted,
+            sort_by=sort_by,
+            order=order,
+            page=page,
+            page_size=page_size,
+        )
+        return items, total
+
+    def search_page(
+        self,
+        platform_id: str | None = None,
+        publisher: str | None = None,
+        q: str | None = None,
+        created_from: str | None = None,
+        created_to: str | None = None,
+        modified_from: str | None = None,
+        modified_to: str | None = None,
+        is_deleted: bool | None = None,
+        sort_by: str = "modified",
+        order: str = "desc",
+        page: int = 1,
+        page_size: int = 25,
+        cursor: str | None = None,
+        with_total: bool = True,
+    ) -> tuple[list[dict], int | None, str | None]:
+        """In-memory search; the cursor resumes right after the dataset it points to."""
         results = [d for d in self.db]
 
         # Simple filtering
@@ -177,7 +301,7 @@ class InMemoryDatasetRepository(AbstractDatasetRepository):
         if publisher:
             results = [d for d in results if d.publisher == publisher]
         if q:
-            results = [d for d in results if q.lower() in str(d.slug).lower()]
+            results = [d for d in results if q.lower() in f"{d.slug} {d.title or ''} {d.publisher or ''}".lower()]
         if is_deleted is not None:
             results = [d for d in results if d.is_deleted == is_deleted]
 
@@ -190,7 +314,14 @@ class InMemoryDatasetRepository(AbstractDatasetRepository):
 
         total = len(results)
         offset = (page - 1) * page_size
+        if cursor:
+            position = PageCursor.decode(cursor, sort_by, order)
+            offset = next((i + 1 for i, d in enumerate(results) if str(d.id) == position.id), total)
         paginated = results[offset : offset + page_size]
+        next_cursor = None
+        if offset + page_size < total:
+            last = paginated[-1]
+            next_cursor = PageCursor(sort_by, order.lower(), getattr(last, sort_by, None), str(last.id)).encode()
 
         # Map to dict (simplified version of Postgres search output)
         items = []
@@ -230,7 +361,7 @@ class InMemoryDatasetRepository(AbstractDatasetRepository):
                 }
             )
 
-        return items, total
+        return items, total if with_total else None, next_cursor
 
     def get_detail(self, dataset_id: uuid.UUID, include_snapshots: bool = False) -> dict | None:
         """Get full dataset details (In-memory implementation)."""
@@ -308,12 +439,30 @@ class InMemoryDatasetRepository(AbstractDatasetRepository):
         self, dataset_id: uuid.UUID, page: int = 1, page_size: int = 50, include_data: bool = False
     ) -> tuple[list[dict], int]:
         """Get paginated version history for a dataset (In-memory implementation)."""
+        items, total, _ = self.get_versions_page(dataset_id, page, page_size, include_data)
+        return items, total
+
+    def get_versions_page(
+        self,
+        dataset_id: uuid.UUID,
+        page: int = 1,
+        page_size: int = 50,
+        include_data: bool = False,
+        cursor: str | None = None,
+    ) -> tuple[list[dict], int, str | None]:
+        """In-memory versions have no stable id, so the cursor carries the position in the sorted list."""
         dataset_versions = [v for v in self.versions if v["dataset_id"] == dataset_id]
         dataset_versions.sort(key=lambda v: v["timestamp"], reverse=True)
 
         total = len(dataset_versions)
         offset = (max(1, page) - 1) * page_size
+        if cursor:
+            offset = int(PageCursor.decode(cursor, "timestamp", "desc").id)
         paginated = dataset_versions[offset : offset + page_size]
+        next_cursor = None
+        if offset + page_size < total:
+            end = offset + page_size
+            next_cursor = PageCursor("timestamp", "desc", paginated[-1]["timestamp"], str(end)).encode()
 
         items = [
             {
@@ -332,7 +481,7 @@ class InMemoryDatasetRepository(AbstractDatasetRepository):
             for v in paginated
         ]
 
-        return items, total
+        return items, total, next_cursor
 
     def list_publishers(self, platform_id: UUID | None = None, q: str | None = None, limit: int = 50) -> list[str]:
         """Get a list of distinct publishers, optionally filtered by platform or name."""
@@ -352,6 +501,281 @@ class InMemoryDatasetRepository(AbstractDatasetRepository):
         sorted_publishers = [p for p, count in counts.most_common(limit)]
         return sorted_publishers
 
-    def refresh_materialized_views(self) -> None:
+    def stream_health_inputs(self, after_id: UUID | None = None) -> Iterator[dict]:
+        for dataset in sorted(self.db, key=lambda d: str(d.id)):
+            if not dataset.quality or (after_id is not None and str(dataset.id) <= str(after_id)):
+                continue
+            metas = dataset.raw.get("metas") or {}
+            yield {
+                "id": dataset.id,
+                "slug": str(dataset.slug),
+                "modified": dataset.modified,
+                "published": dataset.published,
+                "restricted": dataset.restricted,
+                "frequency": dataset.raw.get("frequency") or (metas.get("default") or {}).get("accrual_periodicity"),
+                "views_count": dataset.views_count,
+                "api_calls_count": dataset.api_calls_count,
+                "reuses_count": dataset.reuses_count,
+                "has_description": dataset.quality.has_description,
+                "is_slug_valid": dataset.quality.is_slug_valid,
+                "syntax_change_score": dataset.quality.syntax_change_score,
+                "llm_score": (dataset.quality.evaluation_results or {}).get("overall_score"),
+            }
+
+    def update_health_scores(self, scores: list[tuple]) -> None:
+        by_id = {str(dataset_id): values for dataset_id, *values in scores}
+        for dataset in self.db:
+            if dataset.quality and str(dataset.id) in by_id:
+                (
+                    dataset.quality.health_score,
+                    dataset.quality.health_quality_score,
+                    dataset.quality.health_freshness_score,
+                    dataset.quality.health_engagement_score,
+                ) = by_id[str(dataset.id)]
+
+    def refresh_direction_health(self, dataset_ids: list[UUID]) -> None:
         """In-memory implementation does nothing."""
         pass
+
+    def rebuild_direction_health(self) -> None:
+        """In-memory implementation does nothing."""
+        pass
+
+    def count_versions(self, dataset_id: UUID, start: datetime | None = None, end: datetime | None = None) -> int:
+        return len(self._versions_in_range(dataset_id, start, end))
+
+    def load_versions(
+        self,
+        dataset_id: UUID,
+        offset: int = 0,
+        limit: int | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        newest_first: bool = False,
+        with_snapshots: bool = True,
+    ) -> list[DatasetVersion]:
+        versions = self._versions_in_range(dataset_id, start, end)
+        if newest_first:
+            versions.reverse()
+        window = versions[offset : None if limit is None else offset + limit]
+        fields = ("blob_id", "checksum", *_METRICS, "diff", "metadata_volatile", "timestamp")
+        return [
+            DatasetVersion(
+                dataset_id=dataset_id,
+                snapshot=v["snapshot"] if with_snapshots else None,
+                **{name: v.get(name) for name in fields},
+            )
+            for v in window
+        ]
+
+    def _versions_in_range(self, dataset_id: UUID, start: datetime | None, end: datetime | None) -> list[dict]:
+        return [
+            v
+            for v in self.versions
+            if v["dataset_id"] == dataset_id
+            and (start is None or v["timestamp"] >= start)
+            and (end is None or v["timestamp"] < end)
+        ]
+
+    def get_metrics_deltas(self, since: datetime, dataset_ids: list[UUID] | None = None) -> list[DatasetMetricsDelta]:
+        by_dataset = {}
+        for version in self.versions:
+            if dataset_ids is None or version["dataset_id"] in dataset_ids:
+                by_dataset.setdefault(version["dataset_id"], []).append(version)
+        deltas = []
+        for dataset_id, versions in by_dataset.items():
+            latest = versions[-1]
+            reference = next((v for v in reversed(versions) if v["timestamp"] <= since), versions[0])
+            deltas.append(
+                DatasetMetricsDelta(
+                    dataset_id=dataset_id,
+                    since=reference["timestamp"],
+                    until=latest["timestamp"],
+                    **{name: _growth(latest, reference, name) for name in _METRICS},
+                )
+            )
+        return deltas
+
+    def get_metrics_series(
+        self, dataset_id: UUID, granularity: str = "day", since: datetime | None = None
+    ) -> list[dict]:
+        closes = {}
+        for version in self.versions:
+            if version["dataset_id"] == dataset_id:
+                closes[_period_start(version["timestamp"], granularity)] = version
+        series, previous = [], None
+        for period, version in sorted(closes.items()):
+            if since is None or period >= since:
+                point = {"period": period, "last_ts": version["timestamp"]}
+                point.update({name: version[name] for name in _METRICS})
+                point.update(
+                    {f"{name.removesuffix('_count')}_delta": _growth(version, previous, name) for name in _METRICS[:-1]}
+                )
+                series.append(point)
+            previous = version
+        return series
+
+    def ensure_version_partitions(self, months_ahead: int = 3) -> int:
+        """In-memory implementation does nothing."""
+        return 0
+
+    def compact_versions(self, start: datetime | None, end: datetime, bucket: str) -> int:
+        """In-memory implementation only records the pass."""
+        self.compactions[bucket] = max(end, self.compactions.get(bucket, end))
+        return 0
+
+    def get_compacted_until(self, bucket: str) -> datetime | None:
+        return self.compactions.get(bucket)
+
+    def get_cached_evaluation(self, key: EvaluationCacheKey) -> dict | None:
+        entry = self.evaluations.get(key)
+        if entry is None:
+            return None
+        entry["hits"] += 1
+        return entry["evaluation"]
+
+    def cache_evaluation(self, key: EvaluationCacheKey, evaluation: dict) -> None:
+        self.evaluations[key] = {"evaluation": evaluation, "hits": 0, "created_at": datetime.now(timezone.utc)}
+
+    def count_llm_evaluations(self, since: datetime) -> int:
+        return sum(
+            1
+            for job in self.jobs.values()
+            if job["state"] == PENDING or (job["claimed_at"] is not None and job["claimed_at"] >= since)
+        )
+
+    def stream_reevaluation_inputs(
+        self, platform_slug: str | None = None, publisher: str | None = None
+    ) -> Iterator[dict]:
+        """In-memory versions have no blobs: evaluated datasets have no known baseline to compare with."""
+        for dataset in self.db:
+            if not dataset.published or dataset.restricted or dataset.is_deleted:
+                continue
+            if publisher and dataset.publisher != publisher:
+                continue
+            quality = dataset.quality
+            evaluated = bool(quality and quality.evaluation_results)
+            yield {
+                "id": dataset.id,
+                "slug": str(dataset.slug),
+                "platform_slug": None,
+                "health_score": quality.health_score if quality else None,
+                "health_engagement_score": quality.health_engagement_score if quality else None,
+                "evaluated": evaluated,
+                "current_blob_id": None,
+                "evaluated_blob_id": quality.evaluated_blob_id if quality else None,
+                "current_data": None,
+                "evaluated_data": None,
+            }
+
+    def enqueue_evaluation_jobs(self, selection: EvaluationJobSelection) -> int:
+        """In-memory datasets have no platform slug: that filter is not applied."""
+        queued = 0
+        for dataset in self.db:
+            if selection.limit and queued >= selection.limit:
+                break
+            if not self._is_job_candidate(dataset, selection):
+                continue
+            key = (dataset.id, selection.prompt_type)
+            job = self.jobs.get(key)
+            if job and not (selection.requeue and job["state"] in (DONE, FAILED)):
+                continue
+            self.jobs[key] = {
+                "id": job["id"] if job else len(self.jobs) + 1,
+                "dataset_id": dataset.id,
+                "prompt_type": selection.prompt_type,
+                "refresh": selection.refresh,
+                "priority": selection.priority,
+                "attempts": 0,
+                "max_attempts": selection.max_attempts,
+                "state": PENDING,
+                "last_error": None,
+                "run_after": datetime.now(timezone.utc),
+                "leased_by": None,
+                "leased_until": None,
+                "claimed_at": job["claimed_at"] if job else None,
+                "updated_at": datetime.now(timezone.utc),
+            }
+            queued += 1
+        return queued
+
+    @staticmethod
+    def _is_job_candidate(dataset: Dataset, selection: EvaluationJobSelection) -> bool:
+        if not dataset.published or dataset.restricted or dataset.is_deleted:
+            return False
+        if selection.publisher and dataset.publisher != selection.publisher:
+            return False
+        if selection.dataset_ids is not None and dataset.id not in selection.dataset_ids:
+            return False
+        return not (selection.skip_evaluated and dataset.quality and dataset.quality.evaluation_results)
+
+    def claim_evaluation_jobs(
+        self, worker: str, limit: int = 1, lease: timedelta = DEFAULT_LEASE
+    ) -> list[EvaluationJob]:
+        now = datetime.now(timezone.utc)
+        claimable = []
+        for job in self.jobs.values():
+            expired = job["state"] == RUNNING and job["leased_until"] < now
+            if expired and job["attempts"] >= job["max_attempts"]:
+                job.update(state=FAILED, last_error=job["last_error"] or "Worker lease expired", leased_by=None)
+            elif expired or (job["state"] == PENDING and job["run_after"] <= now):
+                claimable.append(job)
+        claimable.sort(key=lambda job: (-job["priority"], job["id"]))
+        for job in claimable[:limit]:
+            job.update(
+                state=RUNNING,
+                attempts=job["attempts"] + 1,
+                leased_by=worker,
+                leased_until=now + lease,
+                claimed_at=now,
+                updated_at=now,
+            )
+        return [
+            EvaluationJob(**{field: job[field] for field in EvaluationJob.__dataclass_fields__})
+            for job in claimable[:limit]
+        ]
+
+    def _leased_job(self, job_id: int, worker: str) -> dict | None:
+        return next((j for j in self.jobs.values() if j["id"] == job_id and j["leased_by"] == worker), None)
+
+    def renew_evaluation_job_lease(self, job_id: int, worker: str, lease: timedelta = DEFAULT_LEASE) -> bool:
+        job = self._leased_job(job_id, worker)
+        if not job or job["state"] != RUNNING:
+            return False
+        now = datetime.now(timezone.utc)
+        job.update(leased_until=now + lease, updated_at=now)
+        return True
+
+    def complete_evaluation_job(self, job_id: int, worker: str) -> bool:
+        job = self._leased_job(job_id, worker)
+        if job:
+            job.update(state=DONE, last_error=None, leased_by=None, leased_until=None)
+        return job is not None
+
+    def fail_evaluation_job(self, job_id: int, worker: str, error: str, retry_after: timedelta) -> bool:
+        job = self._leased_job(job_id, worker)
+        if job:
+            now = datetime.now(timezone.utc)
+            job.update(
+                state=PENDING if job["attempts"] < job["max_attempts"] else FAILED,
+                run_after=now + retry_after,
+                last_error=error,
+                leased_by=None,
+                leased_until=None,
+                updated_at=now,
+            )
+        return job is not None
+
+    def get_evaluation_job_progress(self, prompt_type: str | None = None, failures: int = 10) -> EvaluationJobProgress:
+        jobs = [job for job in self.jobs.values() if not prompt_type or job["prompt_type"] == prompt_type]
+        counts = Counter(job["state"] for job in jobs)
+        slugs = {dataset.id: str(dataset.slug) for dataset in self.db}
+        failed = sorted((job for job in jobs if job["last_error"]), key=lambda job: job["updated_at"], reverse=True)
+        columns = ("prompt_type", "state", "attempts", "max_attempts", "last_error", "run_after", "updated_at")
+        return EvaluationJobProgress(
+            counts={state: counts.get(state, 0) for state in JOB_STATES},
+            failures=[
+                {"slug": slugs.get(job["dataset_id"]), **{column: job[column] for column in columns}}
+                for job in failed[:failures]
+            ],
+        )
@@ -3,14 +3,32 @@ from __future__ import annotations
 import hashlib
 import json
 import uuid
+from collections.abc import Iterator
+from dataclasses import astuple, fields
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 from psycopg2.extras import Json
 
-from common import calculate_snapshot_diff, deep_merge
+from common import calculate_snapshot_patch, deep_merge
 from domain.datasets.aggregate import Dataset
+from domain.datasets.entities import DatasetVersion, VersionHistory
 from domain.datasets.ports import AbstractDatasetRepository
-from domain.datasets.value_objects import DatasetVersionParams
+from domain.datasets.value_objects import (
+    DatasetMetricsDelta,
+    DatasetMetricsParams,
+    DatasetVersionParams,
+    DatasetVersionState,
+    PageCursor,
+)
+from domain.quality.evaluation import EvaluationCacheKey
+from domain.quality.jobs import (
+    DEFAULT_LEASE,
+    JOB_STATES,
+    EvaluationJob,
+    EvaluationJobProgress,
+    EvaluationJobSelection,
+)
 from infrastructure.database.postgres import PostgresClient
 
 
@@ -174,19 +192,606 @@ def strip_volatile_fields(data: dict) -> tuple[dict, dict]:
     return stripped, volatile
 
 
-def _get_frequency_thresholds(frequency: str | None) -> int:
-    """Mapping to days (including grace period) based on ODS frequency labels."""
-    thresholds = {
-        "daily": 2,
-        "continuous": 2,
-        "weekly": 9,
-        "monthly": 37,
-        "quarterly": 105,
-        "semiannual": 210,
-        "annual": 395,
-        "punctual": 3650,
-    }
-    return thresholds.get(str(frequency).lower(), 90)
+_DATASET_UPSERT_SQL = """
+    INSERT INTO datasets (
+        id, platform_id, buid, slug, title, page, publisher, created, modified, published, restricted, deleted, deleted_at, linked_dataset_id
+    ) VALUES {values}
+    ON CONFLICT (id) DO UPDATE SET
+        platform_id = EXCLUDED.platform_id,
+        buid = EXCLUDED.buid,
+        slug = EXCLUDED.slug,
+        title = EXCLUDED.title,
+        page = EXCLUDED.page,
+        publisher = EXCLUDED.publisher,
+        created = EXCLUDED.created,
+        modified = EXCLUDED.modified,
+        published = EXCLUDED.published,
+        restricted = EXCLUDED.restricted,
+        deleted = EXCLUDED.deleted,
+        deleted_at = EXCLUDED.deleted_at,
+        linked_dataset_id = EXCLUDED.linked_dataset_id
+"""
+
+_QUALITY_UPSERT_SQL = (
+    "INSERT INTO dataset_quality (dataset_id, downloads_count, api_calls_count, has_description, is_slug_valid, evaluation_results, syntax_change_score, evaluated_blob_id, health_score, health_quality_score, health_freshness_score, health_engagement_score) "
+    "VALUES {values} "
+    "ON CONFLICT (dataset_id) DO UPDATE SET "
+    "downloads_count = EXCLUDED.downloads_count, "
+    "api_calls_count = EXCLUDED.api_calls_count, "
+    "has_description = EXCLUDED.has_description, "
+    "evaluation_results = COALESCE(EXCLUDED.evaluation_results, dataset_quality.evaluation_results), "
+    "is_slug_valid = EXCLUDED.is_slug_valid, "
+    "syntax_change_score = COALESCE(EXCLUDED.syntax_change_score, dataset_quality.syntax_change_score), "
+    "evaluated_blob_id = COALESCE(EXCLUDED.evaluated_blob_id, dataset_quality.evaluated_blob_id), "
+    "health_score = EXCLUDED.health_score, "
+    "health_quality_score = EXCLUDED.health_quality_score, "
+    "health_freshness_score = EXCLUDED.health_freshness_score, "
+    "health_engagement_score = EXCLUDED.health_engagement_score"
+)
+
+_PREVIOUS_VERSION_COLUMNS = """
+    dv.downloads_count, dv.api_calls_count, dv.views_count,
+    dv.reuses_count, dv.followers_count, dv.popularity_score,
+    dv.metadata_volatile, db.id as blob_id, db.data as blob_data, db.hash as blob_hash
+"""
+
+# Latest version of each dataset, reached through the dataset_current projection instead of a DISTINCT ON scan
+_CURRENT_VERSION_JOIN = """
+    FROM dataset_current dc
+    JOIN dataset_versions dv ON dv.id = dc.version_id AND dv.timestamp = dc.version_timestamp
+    LEFT JOIN dataset_blobs db ON dv.blob_id = db.id
+"""
+
+_DERIVED_TITLE_SQL = "COALESCE(dv.title, db.data ->> 'title', db.data -> 'metas' -> 'default' ->> 'title')"
+_RECORDS_COUNT_SQL = """COALESCE(
+    (dv.metadata_volatile ->> 'records_count')::int,
+    (db.data ->> 'records_count')::int,
+    (db.data -> 'metas' -> 'default' ->> 'records_count')::int
+)"""
+_SIZE_BYTES_SQL = """COALESCE(
+    (dv.metadata_volatile ->> 'size_bytes')::bigint,
+    (db.data ->> 'records_size')::bigint,
+    (db.data -> 'metas' -> 'default' ->> 'records_size')::bigint
+)"""
+
+_DESCRIPTION_SQL = "COALESCE(db.data ->> 'description', db.data -> 'metas' -> 'default' ->> 'description', '')"
+
+# Full-text vector (French) of a dataset; expects `dv`, `db` and `d` (datasets) in scope
+_SEARCH_VECTOR_SQL = f"""(
+    setweight(to_tsvector('french', COALESCE({_DERIVED_TITLE_SQL}, d.title, '')), 'A')
+    || setweight(to_tsvector('french', translate(d.slug, '-_', '  ')), 'A')
+    || setweight(to_tsvector('french', COALESCE(d.publisher, '')), 'B')
+    || setweight(to_tsvector('french', left(regexp_replace({_DESCRIPTION_SQL}, '<[^>]+>', ' ', 'g'), 20000)), 'C')
+)"""
+
+_VERSION_COLUMNS = """
+    dataset_id, blob_id, checksum, title, downloads_count, api_calls_count,
+    views_count, reuses_count, followers_count, popularity_score, diff,
+    metadata_volatile
+"""
+
+_CURRENT_STATE_COLUMNS = """
+    dataset_id, version_id, version_timestamp, blob_id, checksum, title,
+    downloads_count, api_calls_count, views_count, reuses_count, followers_count, popularity_score,
+    records_count, size_bytes, search_vector, versions_count
+"""
+
+_CURRENT_STATE_UPDATES = """
+    version_id = EXCLUDED.version_id,
+    version_timestamp = EXCLUDED.version_timestamp,
+    blob_id = EXCLUDED.blob_id,
+    checksum = EXCLUDED.checksum,
+    title = EXCLUDED.title,
+    downloads_count = EXCLUDED.downloads_count,
+    api_calls_count = EXCLUDED.api_calls_count,
+    views_count = EXCLUDED.views_count,
+    reuses_count = EXCLUDED.reuses_count,
+    followers_count = EXCLUDED.followers_count,
+    popularity_score = EXCLUDED.popularity_score,
+    records_count = EXCLUDED.records_count,
+    size_bytes = EXCLUDED.size_bytes,
+    search_vector = EXCLUDED.search_vector
+"""
+
+_VERSION_METRICS = (
+    "downloads_count",
+    "api_calls_count",
+    "views_count",
+    "reuses_count",
+    "followers_count",
+    "popularity_score",
+)
+
+
+_METRICS_COLUMNS = ", ".join(_VERSION_METRICS)
+
+# A late sample (backfill) only widens the period; the counters are those of the latest sample. A sample written
+# again (same dataset and ts) brings 0 in EXCLUDED.samples, so that it is only counted once
+_METRICS_ROLLUP_UPDATES = ",\n".join(
+    [
+        "first_ts = LEAST(dataset_metrics_rollups.first_ts, EXCLUDED.first_ts)",
+        "last_ts = GREATEST(dataset_metrics_rollups.last_ts, EXCLUDED.last_ts)",
+        "samples = dataset_metrics_rollups.samples + EXCLUDED.samples",
+    ]
+    + [
+        f"{name} = CASE WHEN EXCLUDED.last_ts >= dataset_metrics_rollups.last_ts "
+        f"THEN EXCLUDED.{name} ELSE dataset_metrics_rollups.{name} END"
+        for name in _VERSION_METRICS
+    ]
+)
+
+# Wraps an INSERT INTO dataset_versions so that dataset_current and the metrics series follow in the same statement
+_VERSION_INSERT_WITH_CURRENT_SQL = f"""
+    WITH dv AS (
+        {{insert}}
+        RETURNING id, {_VERSION_COLUMNS}, timestamp
+    ),
+    metrics AS (
+        INSERT INTO dataset_metrics (dataset_id, ts, {_METRICS_COLUMNS})
+        SELECT dataset_id, timestamp, {_METRICS_COLUMNS} FROM dv
+        ON CONFLICT (dataset_id, ts) DO UPDATE SET
+            ({_METRICS_COLUMNS}) = ROW({", ".join(f"EXCLUDED.{name}" for name in _VERSION_METRICS)})
+        RETURNING dataset_id, ts, xmax = 0 AS inserted
+    ),
+    rollups AS (
+        INSERT INTO dataset_metrics_rollups (
+            dataset_id, granularity, period, first_ts, last_ts, samples, {_METRICS_COLUMNS}
+        )
+        SELECT dv.dataset_id, g.granularity, date_trunc(g.granularity, dv.timestamp, 'UTC'), dv.timestamp,
+               dv.timestamp, m.inserted::int, {", ".join(f"dv.{name}" for name in _VERSION_METRICS)}
+        FROM dv
+        JOIN metrics m ON m.dataset_id = dv.dataset_id AND m.ts = dv.timestamp
+        CROSS JOIN (VALUES ('day'), ('week'), ('month')) AS g(granularity)
+        ON CONFLICT (dataset_id, granularity, period) DO UPDATE SET
+            {_METRICS_ROLLUP_UPDATES}
+    )
+    INSERT INTO dataset_current ({_CURRENT_STATE_COLUMNS})
+    SELECT dv.dataset_id, dv.id, dv.timestamp, dv.blob_id, dv.checksum, {_DERIVED_TITLE_SQL},
+           dv.downloads_count, dv.api_calls_count, dv.views_count, dv.reuses_count, dv.followers_count,
+           dv.popularity_score, {_RECORDS_COUNT_SQL}, {_SIZE_BYTES_SQL}, {_SEARCH_VECTOR_SQL}, 1
+    FROM dv
+    JOIN datasets d ON d.id = dv.dataset_id
+    LEFT JOIN dataset_blobs db ON dv.blob_id = db.id
+    ON CONFLICT (dataset_id) DO UPDATE SET
+        {_CURRENT_STATE_UPDATES},
+        versions_count = dataset_current.versions_count + 1
+"""
+
+# Recomputes dataset_current from history, for repairs after manual deletions
+_CURRENT_STATE_REBUILD_SQL = f"""
+    INSERT INTO dataset_current ({_CURRENT_STATE_COLUMNS})
+    SELECT d.id, dv.id, dv.timestamp, dv.blob_id, dv.checksum, {_DERIVED_TITLE_SQL},
+           dv.downloads_count, dv.api_calls_count, dv.views_count, dv.reuses_count, dv.followers_count,
+           dv.popularity_score, {_RECORDS_COUNT_SQL}, {_SIZE_BYTES_SQL}, {_SEARCH_VECTOR_SQL},
+           (SELECT COUNT(*) FROM dataset_versions WHERE dataset_id = d.id)
+    FROM datasets d
+    LEFT JOIN LATERAL (
+        SELECT * FROM dataset_versions WHERE dataset_id = d.id ORDER BY timestamp DESC LIMIT 1
+    ) dv ON TRUE
+    LEFT JOIN dataset_blobs db ON dv.blob_id = db.id
+    {{where}}
+    ON CONFLICT (dataset_id) DO UPDATE SET
+        {_CURRENT_STATE_UPDATES},
+        versions_count = EXCLUDED.versions_count
+"""
+
+# Health contribution of each dataset counted in direction_health_stats_view
+_DIRECTION_HEALTH_MEMBERS_SQL = """
+    SELECT d.id AS dataset_id,
+           COALESCE(NULLIF(d.publisher, ''), 'Inconnu') AS direction,
+           dq.health_quality_score AS quality_score,
+           dq.health_freshness_score AS freshness_score,
+           dq.health_engagement_score AS engagement_score,
+           dq.health_score AS global_score
+    FROM datasets d
+    JOIN dataset_quality dq ON dq.dataset_id = d.id
+    WHERE d.deleted IS FALSE
+      AND d.published IS TRUE
+      AND d.restricted IS FALSE
+      AND dq.health_score IS NOT NULL
+"""
+
+_DIRECTION_HEALTH_TOTALS_COLUMNS = """
+    direction, dataset_count, unhealthy_count,
+    quality_sum, quality_count, freshness_sum, freshness_count, engagement_sum, engagement_count, global_sum
+"""
+
+# Applies the difference between the stored and the current contributions of some datasets to the totals,
+# so the cost follows the number of written datasets. Unchanged contributions cancel out of the delta.
+_DIRECTION_HEALTH_DELTA_SQL = f"""
+    WITH cur AS (
+        {_DIRECTION_HEALTH_MEMBERS_SQL}
+          AND d.id = ANY(%(ids)s::uuid[])
+    ),
+    old AS (
+        SELECT dataset_id, direction, quality_score, freshness_score, engagement_score, global_score
+        FROM direction_health_members
+        WHERE dataset_id = ANY(%(ids)s::uuid[])
+    ),
+    added AS (SELECT * FROM cur EXCEPT SELECT * FROM old),
+    removed AS (SELECT * FROM old EXCEPT SELECT * FROM cur),
+    dropped AS (
+        DELETE FROM direction_health_members
+        WHERE dataset_id IN (SELECT dataset_id FROM removed) AND dataset_id NOT IN (SELECT dataset_id FROM added)
+    ),
+    stored AS (
+        INSERT INTO direction_health_members SELECT * FROM added
+        ON CONFLICT (dataset_id) DO UPDATE SET
+            direction = EXCLUDED.direction,
+            quality_score = EXCLUDED.quality_score,
+            freshness_score = EXCLUDED.freshness_score,
+            engagement_score = EXCLUDED.engagement_score,
+            global_score = EXCLUDED.global_score
+    ),
+    changes AS (
+        SELECT 1 AS sign, * FROM added
+        UNION ALL
+        SELECT -1 AS sign, * FROM removed
+    )
+    INSERT INTO direction_health_totals ({_DIRECTION_HEALTH_TOTALS_COLUMNS})
+    SELECT direction,
+           SUM(sign),
+           COALESCE(SUM(sign) FILTER (WHERE global_score < 50), 0),
+           COALESCE(SUM(sign * quality_score::numeric), 0), COALESCE(SUM(sign) FILTER (WHERE quality_score IS NOT NULL), 0),
+           COALESCE(SUM(sign * freshness_score::numeric), 0),
+           COALESCE(SUM(sign) FILTER (WHERE freshness_score IS NOT NULL), 0),
+           COALESCE(SUM(sign * engagement_score::numeric), 0),
+           COALESCE(SUM(sign) FILTER (WHERE engagement_score IS NOT NULL), 0),
+           SUM(sign * global_score::numeric)
+    FROM changes
+    GROUP BY direction
+    ON CONFLICT (direction) DO UPDATE SET
+        dataset_count = direction_health_totals.dataset_count + EXCLUDED.dataset_count,
+        unhealthy_count = direction_health_totals.unhealthy_count + EXCLUDED.unhealthy_count,
+        quality_sum = direction_health_totals.quality_sum + EXCLUDED.quality_sum,
+        quality_count = direction_health_totals.quality_count + EXCLUDED.quality_count,
+        freshness_sum = direction_health_totals.freshness_sum + EXCLUDED.freshness_sum,
+        freshness_count = direction_health_totals.freshness_count + EXCLUDED.freshness_count,
+        engagement_sum = direction_health_totals.engagement_sum + EXCLUDED.engagement_sum,
+        engagement_count = direction_health_totals.engagement_count + EXCLUDED.engagement_count,
+        global_sum = direction_health_totals.global_sum + EXCLUDED.global_sum,
+        updated_at = now()
+"""
+
+# Recomputes the members and totals from scratch, kept as a repair after writes that bypass the repository
+_DIRECTION_HEALTH_REBUILD_SQL = f"""
+    DELETE FROM direction_health_members;
+    DELETE FROM direction_health_totals;
+    INSERT INTO direction_health_members {_DIRECTION_HEALTH_MEMBERS_SQL};
+    INSERT INTO direction_health_totals ({_DIRECTION_HEALTH_TOTALS_COLUMNS})
+    SELECT direction,
+           COUNT(*),
+           COUNT(*) FILTER (WHERE global_score < 50),
+           COALESCE(SUM(quality_score::numeric), 0), COUNT(quality_score),
+           COALESCE(SUM(freshness_score::numeric), 0), COUNT(freshness_score),
+           COALESCE(SUM(engagement_score::numeric), 0), COUNT(engagement_score),
+           SUM(global_score::numeric)
+    FROM direction_health_members
+    GROUP BY direction;
+"""
+
+# Everything health_scoring.health_scores reads, one row per scored dataset, in id order for resumable backfills
+_HEALTH_INPUTS_SQL = """
+    SELECT d.id, d.slug, d.modified, d.published, d.restricted,
+           COALESCE(NULLIF(db.data ->> 'frequency', ''), db.data -> 'metas' -> 'default' ->> 'accrual_periodicity')
+               AS frequency,
+           dc.views_count, dc.api_calls_count, dc.reuses_count,
+           dq.has_description, dq.is_slug_valid, dq.syntax_change_score,
+           dq.evaluation_results -> 'overall_score' AS llm_score
+    FROM datasets d
+    JOIN dataset_quality dq ON dq.dataset_id = d.id
+    LEFT JOIN dataset_current dc ON dc.dataset_id = d.id
+    LEFT JOIN dataset_blobs db ON db.id = dc.blob_id
+    WHERE d.modified IS NOT NULL {after}
+    ORDER BY d.id
+"""
+
+_HEALTH_SCORES_UPDATE_SQL = """
+    UPDATE dataset_quality dq SET
+        health_score = v.health_score,
+        health_quality_score = v.health_quality_score,
+        health_freshness_score = v.health_freshness_score,
+        health_engagement_score = v.health_engagement_score
+    FROM (VALUES %s) AS v(dataset_id, health_score, health_quality_score, health_freshness_score, health_engagement_score)
+    WHERE dq.dataset_id = v.dataset_id
+"""
+
+# Blobs are only read when the current one is not the evaluated one
+_REEVALUATION_INPUTS_SQL = """
+    SELECT d.id, d.slug, p.slug AS platform_slug, dq.health_score, dq.health_engagement_score,
+           dq.evaluation_results IS NOT NULL AS evaluated,
+           dc.blob_id AS current_blob_id, dq.evaluated_blob_id,
+           cb.data AS current_data, eb.data AS evaluated_data
+    FROM datasets d
+    JOIN platforms p ON p.id = d.platform_id
+    JOIN dataset_current dc ON dc.dataset_id = d.id
+    LEFT JOIN dataset_quality dq ON dq.dataset_id = d.id
+    LEFT JOIN dataset_blobs cb ON cb.id = dc.blob_id AND dq.evaluated_blob_id IS DISTINCT FROM dc.blob_id
+    LEFT JOIN dataset_blobs eb ON eb.id = dq.evaluated_blob_id AND dq.evaluated_blob_id <> dc.blob_id
+    WHERE d.published IS TRUE AND d.restricted IS NOT TRUE AND d.deleted IS NOT TRUE {filters}
+    ORDER BY d.id
+"""
+
+# Jobs already queued for a dataset and prompt type are left alone, or queued again once done or failed (requeue)
+_ENQUEUE_EVALUATION_JOBS_SQL = """
+    INSERT INTO llm_evaluation_jobs (dataset_id, prompt_type, refresh, priority, max_attempts)
+    SELECT d.id, %(prompt_type)s, %(refresh)s, %(priority)s, %(max_attempts)s
+    FROM datasets d
+    JOIN platforms p ON p.id = d.platform_id
+    LEFT JOIN dataset_quality dq ON dq.dataset_id = d.id
+    WHERE d.published IS TRUE AND d.restricted IS NOT TRUE AND d.deleted IS NOT TRUE {filters}
+    ORDER BY d.modified DESC NULLS LAST
+    {limit}
+    ON CONFLICT (dataset_id, prompt_type) DO {on_conflict}
+    RETURNING id
+"""
+_REQUEUE_EVALUATION_JOB = """UPDATE SET
+        state = 'pending', refresh = EXCLUDED.refresh, priority = EXCLUDED.priority, attempts = 0,
+        max_attempts = EXCLUDED.max_attempts, last_error = NULL, run_after = NOW(), leased_by = NULL,
+        leased_until = NULL, updated_at = NOW()
+    WHERE llm_evaluation_jobs.state IN ('done', 'failed')"""
+
+# SKIP LOCKED: concurrent claims pass over each other's rows instead of waiting, so no job is leased twice
+_CLAIM_EVALUATION_JOBS_SQL = """
+    UPDATE llm_evaluation_jobs j
+    SET state = 'running', attempts = j.attempts + 1, leased_by = %(worker)s,
+        leased_until = NOW() + %(lease)s, claimed_at = NOW(), updated_at = NOW()
+    FROM (
+        SELECT id FROM llm_evaluation_jobs
+        WHERE (state = 'pending' AND run_after <= NOW())
+           OR (state = 'running' AND leased_until < NOW() AND attempts < max_attempts)
+        ORDER BY priority DESC, id
+        LIMIT %(limit)s
+        FOR UPDATE SKIP LOCKED
+    ) claimed
+    WHERE j.id = claimed.id
+    RETURNING j.id, j.dataset_id, j.prompt_type, j.refresh, j.attempts, j.max_attempts
+"""
+
+# Jobs whose worker died on their last attempt
+_EXPIRE_EVALUATION_JOBS_SQL = """
+    UPDATE llm_evaluation_jobs
+    SET state = 'failed', last_error = COALESCE(last_error, 'Worker lease expired'), leased_by = NULL,
+        leased_until = NULL, updated_at = NOW()
+    WHERE state = 'running' AND leased_until < NOW() AND attempts >= max_attempts
+"""
+
+# Folds the heartbeat versions (same blob and checksum as the previous version: only counters moved) of a time range
+# into one version per dataset and `bucket` ('day' or 'week'): the latest of each bucket is kept. Content-changing
+# versions, and the latest version of each dataset, always stay. The first version kept after each folded run, be it
+# a heartbeat or a content change, has its counters diffed again against the previous kept version; its other ops
+# stay (the folded versions shared the blob of the version before them). Legacy object diffs keep their format.
+# Versions of the week before `start` are only read, to tell heartbeats from content changes.
+_HISTORY_START = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_VERSION_COMPACTION_SQL = f"""
+    WITH ordered AS (
+        SELECT id, dataset_id, timestamp, lag(id) OVER w AS previous_id,
+               lag(id) OVER w IS NOT NULL
+                   AND blob_id IS NOT DISTINCT FROM lag(blob_id) OVER w
+                   AND checksum IS NOT DISTINCT FROM lag(checksum) OVER w AS heartbeat
+        FROM dataset_versions
+        WHERE timestamp >= %(lookback)s AND timestamp < %(end)s
+        WINDOW w AS (PARTITION BY dataset_id ORDER BY timestamp)
+    ),
+    buckets AS (
+        SELECT id, dataset_id, timestamp, row_number() OVER b AS rank
+        FROM ordered
+        WHERE heartbeat AND timestamp >= %(start)s
+        WINDOW b AS (PARTITION BY dataset_id, date_trunc(%(bucket)s, timestamp, 'UTC') ORDER BY timestamp DESC)
+    ),
+    folded AS (
+        SELECT id, dataset_id, timestamp FROM buckets WHERE rank > 1
+    ),
+    deleted AS (
+        DELETE FROM dataset_versions dv
+        USING folded f
+        WHERE dv.id = f.id AND dv.timestamp = f.timestamp
+          AND dv.timestamp >= %(start)s AND dv.timestamp < %(end)s
+        RETURNING dv.dataset_id
+    ),
+    rediffed AS (
+        UPDATE dataset_versions dv SET diff = CASE
+            WHEN jsonb_typeof(dv.diff) = 'object' THEN NULLIF(
+                (dv.diff - ARRAY[{", ".join(f"'{name}'" for name in _VERSION_METRICS)}]) || COALESCE(
+                    (SELECT jsonb_object_agg(c ->> 'key', jsonb_build_object('_t', 'changed', 'old', c -> 'old', 'new', c -> 'new'))
+                     FROM jsonb_array_elements(changes.ops) c),
+                    '{{}}'
+                ),
+                '{{}}'
+            )
+            ELSE (
+                SELECT jsonb_agg(o.op ORDER BY o.part, o.position)
+                FROM (
+                    SELECT e.op, 0 AS part, e.position
+                    FROM jsonb_array_elements(CASE WHEN jsonb_typeof(dv.diff) = 'array' THEN dv.diff ELSE '[]' END)
+                        WITH ORDINALITY AS e(op, position)
+                    WHERE e.op ->> 'path' <> ALL (ARRAY[{", ".join(f"'/{name}'" for name in _VERSION_METRICS)}])
+                    UNION ALL
+                    SELECT jsonb_build_object('op', 'replace', 'path', '/' || (c.op ->> 'key'), 'old', c.op -> 'old', 'value', c.op -> 'new'),
+                           1, c.position
+                    FROM jsonb_array_elements(changes.ops) WITH ORDINALITY AS c(op, position)
+                ) o
+            )
+        END
+        FROM ordered o
+        JOIN folded f ON f.id = o.previous_id
+        JOIN dataset_versions cur ON cur.id = o.id AND cur.timestamp = o.timestamp
+        CROSS JOIN LATERAL (
+            -- Previous kept version, wherever it is: the versions folded by this statement are skipped
+            SELECT jsonb_build_object(
+                       'downloads_count', p.downloads_count, 'api_calls_count', p.api_calls_count,
+                       'views_count', p.views_count, 'reuses_count', p.reuses_count,
+                       'followers_count', p.followers_count, 'popularity_score', p.popularity_score
+                   ) AS counters
+            FROM dataset_versions p
+            WHERE p.dataset_id = o.dataset_id AND p.timestamp < o.timestamp
+              AND NOT EXISTS (SELECT 1 FROM folded pf WHERE pf.id = p.id)
+            ORDER BY p.timestamp DESC
+            LIMIT 1
+        ) prev
+        CROSS JOIN LATERAL (
+            SELECT jsonb_agg(jsonb_build_object('key', c.key, 'old', c.old, 'new', c.new)) AS ops
+            FROM (
+                VALUES ('downloads_count', to_jsonb(cur.downloads_count)), ('api_calls_count', to_jsonb(cur.api_calls_count)),
+                       ('views_count', to_jsonb(cur.views_count)), ('reuses_count', to_jsonb(cur.reuses_count)),
+                       ('followers_count', to_jsonb(cur.followers_count)),
+                       ('popularity_score', to_jsonb(cur.popularity_score))
+            ) AS v(key, new)
+            CROSS JOIN LATERAL (SELECT v.key, COALESCE(prev.counters -> v.key, 'null') AS old, COALESCE(v.new, 'null') AS new) c
+            WHERE c.old IS DISTINCT FROM c.new
+        ) changes
+        WHERE dv.id = o.id AND dv.timestamp = o.timestamp
+          AND NOT EXISTS (SELECT 1 FROM folded kf WHERE kf.id = o.id)
+          AND dv.timestamp >= %(start)s AND dv.timestamp < %(end)s
+        RETURNING dv.id
+    ),
+    recounted AS (
+        UPDATE dataset_current dc SET versions_count = dc.versions_count - r.removed
+        FROM (SELECT dataset_id, COUNT(*) AS removed FROM deleted GROUP BY dataset_id) r
+        WHERE dc.dataset_id = r.dataset_id
+        RETURNING dc.dataset_id
+    )
+    SELECT COUNT(*) AS removed, (SELECT COUNT(*) FROM rediffed) AS rediffed, (SELECT COUNT(*) FROM recounted) AS datasets
+    FROM deleted
+"""
+
+# Latest counters minus those of the last sample at or before %(since)s (the first one for newer datasets):
+# at most two index lookups per dataset, the priority column settling which candidate is the reference
+_METRICS_DELTAS_SQL = f"""
+    SELECT dc.dataset_id, ref.ts AS since, dc.version_timestamp AS until,
+           {", ".join(f"dc.{name} - ref.{name} AS {name}" for name in _VERSION_METRICS)}
+    FROM dataset_current dc
+    CROSS JOIN LATERAL (
+        SELECT * FROM (
+            (SELECT m.*, 0 AS priority FROM dataset_metrics m WHERE m.dataset_id = dc.dataset_id AND m.ts <= %(since)s
+             ORDER BY m.ts DESC LIMIT 1)
+            UNION ALL
+            (SELECT m.*, 1 AS priority FROM dataset_metrics m WHERE m.dataset_id = dc.dataset_id ORDER BY m.ts LIMIT 1)
+        ) candidates
+        ORDER BY priority
+        LIMIT 1
+    ) ref
+    {{where}}
+"""
+
+_METRICS_GRANULARITIES = ("day", "week", "month")
+
+_METRICS_SERIES_SQL = f"""
+    SELECT * FROM (
+        SELECT period, last_ts, samples, {_METRICS_COLUMNS},
+               {", ".join(f"{name} - lag({name}) OVER w AS {name.removesuffix('_count')}_delta" for name in _VERSION_METRICS[:-1])}
+        FROM dataset_metrics_rollups
+        WHERE dataset_id = %(dataset_id)s AND granularity = %(granularity)s
+        WINDOW w AS (ORDER BY period)
+    ) series
+    WHERE period >= %(since)s
+    ORDER BY period
+"""
+
+# Sort columns that may be NULL; they sort last and need a NULL-aware keyset predicate
+_NULLS_LAST_SORT_COLUMNS = ("health_score", "size_bytes", "records_count")
+
+
+def _dataset_row(dataset: Dataset) -> tuple:
+    return (
+        str(dataset.id),
+        str(dataset.platform_id),
+        dataset.buid,
+        str(dataset.slug),
+        dataset.title,
+        str(dataset.page),
+        dataset.publisher,
+        dataset.created,
+        dataset.modified,
+        dataset.published,
+        dataset.restricted,
+        dataset.is_deleted,
+        dataset.deleted_at,
+        str(dataset.linked_dataset_id) if dataset.linked_dataset_id else None,
+    )
+
+
+def _quality_row(dataset: Dataset) -> tuple:
+    # Calculate health scores for persistence using Domain logic
+    if dataset.modified and not dataset.restricted and dataset.published is not False:
+        dataset.calculate_health_scores()
+
+    return (
+        str(dataset.id),
+        dataset.quality.downloads_count,
+        dataset.quality.api_calls_count,
+        dataset.quality.has_description,
+        dataset.quality.is_slug_valid,
+        Json(dataset.quality.evaluation_results) if dataset.quality.evaluation_results else None,
+        dataset.quality.syntax_change_score,
+        str(dataset.quality.evaluated_blob_id) if dataset.quality.evaluated_blob_id else None,
+        dataset.quality.health_score,
+        dataset.quality.health_quality_score,
+        dataset.quality.health_freshness_score,
+        dataset.quality.health_engagement_score,
+    )
+
+
+def _prepare_version_payload(params: DatasetVersionParams) -> tuple[dict, dict, str]:
+    """Split a snapshot into its stable blob and volatile part, and hash the blob."""
+    stripped, volatile = strip_volatile_fields(params.snapshot)
+    if volatile is None:
+        volatile = {}
+
+    # Add metrics to volatile data for searchability without migration
+    volatile["records_count"] = params.records_count
+    volatile["size_bytes"] = params.size_bytes
+
+    data_str = json.dumps(stripped, sort_keys=True)
+    stable_hash = hashlib.sha256(data_str.encode()).hexdigest()
+    return stripped, volatile, stable_hash
+
+
+def _version_range(dataset_id: UUID, start: datetime | None, end: datetime | None) -> tuple[str, dict]:
+    """WHERE clause on `dv` for the versions of a dataset in [start, end); bounds prune the monthly partitions."""
+    clauses = ["dv.dataset_id = %(dataset_id)s"]
+    if start is not None:
+        clauses.append("dv.timestamp >= %(start)s")
+    if end is not None:
+        clauses.append("dv.timestamp < %(end)s")
+    return " AND ".join(clauses), {"dataset_id": str(dataset_id), "start": start, "end": end}
+
+
+def _version_state(row: dict) -> DatasetVersionState:
+    return DatasetVersionState(**{field.name: row[field.name] for field in fields(DatasetVersionState)})
+
+
+def _compute_version_diff(
+    previous: DatasetVersionState, stripped: dict, volatile: dict, stable_hash: str, params: DatasetVersionParams
+) -> list[dict]:
+    """Diff the previous version (blob + volatile + metrics) against the incoming snapshot."""
+    prev_volatile = previous.metadata_volatile or {}
+    if previous.blob_hash == stable_hash:
+        # Same stable blob: only the volatile part can differ, the blobs are not walked
+        diff = calculate_snapshot_patch(prev_volatile, volatile)
+    else:
+        diff = calculate_snapshot_patch(deep_merge(previous.blob_data, prev_volatile), deep_merge(stripped, volatile))
+
+    prev_metrics = {name: getattr(previous, name) for name in _VERSION_METRICS}
+    curr_metrics = {name: getattr(params, name) for name in _VERSION_METRICS}
+    return diff + calculate_snapshot_patch(prev_metrics, curr_metrics)
+
+
+def _version_row(params: DatasetVersionParams, blob_id, diff: list | dict | None, volatile: dict) -> tuple:
+    return (
+        str(params.dataset_id),
+        str(blob_id),
+        params.checksum,
+        params.title,
+        params.downloads_count,
+        params.api_calls_count,
+        params.views_count,
+        params.reuses_count,
+        params.followers_count,
+        params.popularity_score,
+        Json(diff) if diff else None,
+        Json(volatile) if volatile else None,
+    )
 
 
 class PostgresDatasetRepository(AbstractDatasetRepository):
@@ -195,204 +800,238 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
 
     def add(self, dataset: Dataset) -> None:
         self.client.execute(
-            """
-            INSERT INTO datasets (
-                id, platform_id, buid, slug, title, page, publisher, created, modified, published, restricted, deleted, deleted_at, linked_dataset_id
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (id) DO UPDATE SET
-                platform_id = EXCLUDED.platform_id,
-                buid = EXCLUDED.buid,
-                slug = EXCLUDED.slug,
-                title = EXCLUDED.title,
-                page = EXCLUDED.page,
-                publisher = EXCLUDED.publisher,
-                created = EXCLUDED.created,
-                modified = EXCLUDED.modified,
-                published = EXCLUDED.published,
-                restricted = EXCLUDED.restricted,
-                deleted = EXCLUDED.deleted,
-                deleted_at = EXCLUDED.deleted_at,
-                linked_dataset_id = EXCLUDED.linked_dataset_id
-            """,
-            (
-                str(dataset.id),
-                str(dataset.platform_id),
-                dataset.buid,
-                str(dataset.slug),
-                dataset.title,
-                str(dataset.page),
-                dataset.publisher,
-                dataset.created,
-                dataset.modified,
-                dataset.published,
-                dataset.restricted,
-                dataset.is_deleted,
-                dataset.deleted_at,
-                str(dataset.linked_dataset_id) if dataset.linked_dataset_id else None,
-            ),
+            _DATASET_UPSERT_SQL.format(values="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"),
+            _dataset_row(dataset),
         )
-        # Calculate health scores for persistence using Domain logic
-        if dataset.quality and dataset.modified and not dataset.restricted and dataset.published is not False:
-            dataset.calculate_health_scores()
-
         if dataset.quality:
             self.client.execute(
-                "INSERT INTO dataset_quality (dataset_id, downloads_count, api_calls_count, has_description, is_slug_valid, evaluation_results, syntax_change_score, evaluated_blob_id, health_score, health_quality_score, health_freshness_score, health_engagement_score) "
-                "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
-                "ON CONFLICT (dataset_id) DO UPDATE SET "
-                "downloads_count = EXCLUDED.downloads_count, "
-                "api_calls_count = EXCLUDED.api_calls_count, "
-                "has_description = EXCLUDED.has_description, "
-                "evaluation_results = COALESCE(EXCLUDED.evaluation_results, dataset_quality.evaluation_results), "
-                "is_slug_valid = EXCLUDED.is_slug_valid, "
-                "syntax_change_score = COALESCE(EXCLUDED.syntax_change_score, dataset_quality.syntax_change_score), "
-                "evaluated_blob_id = COALESCE(EXCLUDED.evaluated_blob_id, dataset_quality.evaluated_blob_id), "
-                "health_score = EXCLUDED.health_score, "
-                "health_quality_score = EXCLUDED.health_quality_score, "
-                "health_freshness_score = EXCLUDED.health_freshness_score, "
-                "health_engagement_score = EXCLUDED.health_engagement_score",
-                (
-                    str(dataset.id),
-                    dataset.quality.downloads_count,
-                    dataset.quality.api_calls_count,
-                    dataset.quality.has_description,
-                    dataset.quality.is_slug_valid,
-                    Json(dataset.quality.evaluation_results) if dataset.quality.evaluation_results else None,
-                    dataset.quality.syntax_change_score,
-                    str(dataset.quality.evaluated_blob_id) if dataset.quality.evaluated_blob_id else None,
-                    dataset.quality.health_score,
-                    dataset.quality.health_quality_score,
-                    dataset.quality.health_freshness_score,
-                    dataset.quality.health_engagement_score,
-                ),
+                _QUALITY_UPSERT_SQL.format(values="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"),
+                _quality_row(dataset),
             )
+        self.refresh_direction_health([dataset.id])
+
+    def add_many(self, datasets: list[Dataset]) -> None:
+        """Upsert datasets and their quality rows with one multi-row statement per table."""
+        if not datasets:
+            return
+        self.client.execute_values(_DATASET_UPSERT_SQL.format(values="%s"), [_dataset_row(d) for d in datasets])
+
+        quality_rows = [_quality_row(d) for d in datasets if d.quality]
+        if quality_rows:
+            self.client.execute_values(_QUALITY_UPSERT_SQL.format(values="%s"), quality_rows)
+        self.refresh_direction_health([d.id for d in datasets])
 
     def add_version(self, params: DatasetVersionParams) -> None:
         """Add a new version of a dataset using Parameter Object pattern."""
-        stripped, volatile = strip_volatile_fields(params.snapshot)
-        if volatile is None:
-            volatile = {}
-
-        # Add metrics to volatile data for searchability without migration
-        volatile["records_count"] = params.records_count
-        volatile["size_bytes"] = params.size_bytes
+        stripped, volatile, stable_hash = _prepare_version_payload(params)
 
         diff = params.diff  # Start with provided diff
 
         if not diff:
-            prev_row = self.client.fetchone(
+            previous = params.previous
+            if previous is None:
+                prev_row = self.client.fetchone(
+                    f"SELECT {_PREVIOUS_VERSION_COLUMNS} {_CURRENT_VERSION_JOIN} WHERE dc.dataset_id = %s",
+                    (str(params.dataset_id),),
+                )
+                previous = _version_state(prev_row) if prev_row else None
+            if previous:
+                diff = _compute_version_diff(previous, stripped, volatile, stable_hash, params)
+
+        known_blobs = {}
+        if params.previous and params.previous.blob_hash == stable_hash:
+            known_blobs[(str(params.dataset_id), stable_hash)] = params.previous.blob_id
+        blob_ids = self._store_blobs([(str(params.dataset_id), stable_hash, stripped)], known_blobs)
+
+        self.client.execute(
+            _VERSION_INSERT_WITH_CURRENT_SQL.format(
+                insert=f"""
+                INSERT INTO dataset_versions ({_VERSION_COLUMNS})
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 """
-                SELECT dv.downloads_count, dv.api_calls_count, dv.views_count,
-                       dv.reuses_count, dv.followers_count, dv.popularity_score,
-                       dv.metadata_volatile, db.data as blob_data
-                FROM dataset_versions dv
-                JOIN dataset_blobs db ON dv.blob_id = db.id
-                WHERE dv.dataset_id = %s
-                ORDER BY dv.timestamp DESC LIMIT 1
+            ),
+            _version_row(params, blob_ids[(str(params.dataset_id), stable_hash)], diff, volatile),
+        )
+
+    def add_versions(self, params_list: list[DatasetVersionParams], known_blobs: dict | None = None) -> None:
+        """
+        Batched counterpart of add_version: previous versions are preloaded in one query,
+        blobs and versions are written with multi-row statements.
+        Blobs found in `known_blobs` (see get_blob_ids) are not sent again; new ones are added to it.
+        Expects at most one entry per dataset.
+        """
+        if not params_list:
+            return
+
+        missing_diff = [str(p.dataset_id) for p in params_list if not p.diff and p.previous is None]
+        previous = {}
+        if missing_diff:
+            rows = self.client.fetchall(
+                f"""
+                SELECT dc.dataset_id, {_PREVIOUS_VERSION_COLUMNS}
+                {_CURRENT_VERSION_JOIN}
+                WHERE dc.dataset_id = ANY(%s::uuid[])
                 """,
-                (str(params.dataset_id),),
+                (missing_diff,),
             )
-            if prev_row:
-                # 1. Reconstruct full snapshots including metrics
-                prev_snapshot = deep_merge(prev_row["blob_data"], prev_row["metadata_volatile"] or {})
-                prev_comparable = prev_snapshot.copy()
-                prev_comparable.update(
-                    {
-                        "downloads_count": prev_row["downloads_count"],
-                        "api_calls_count": prev_row["api_calls_count"],
-                        "views_count": prev_row["views_count"],
-                        "reuses_count": prev_row["reuses_count"],
-                        "followers_count": prev_row["followers_count"],
-                        "popularity_score": prev_row["popularity_score"],
-                    }
-                )
-
-                curr_snapshot = deep_merge(stripped, volatile)
-                curr_comparable = curr_snapshot.copy()
-                curr_comparable.update(
-                    {
-                        "downloads_count": params.downloads_count,
-                        "api_calls_count": params.api_calls_count,
-                        "views_count": params.views_count,
-                        "reuses_count": params.reuses_count,
-                        "followers_count": params.followers_count,
-                        "popularity_score": params.popularity_score,
-                        "records_count": params.records_count,
-                        "size_bytes": params.size_bytes,
-                    }
-                )
+            previous = {str(row["dataset_id"]): _version_state(row) for row in rows}
+
+        payloads = []
+        for params in params_list:
+            stripped, volatile, stable_hash = _prepare_version_payload(params)
+            diff = params.diff
+            prev_state = params.previous or previous.get(str(params.dataset_id))
+            if not diff and prev_state:
+                diff = _compute_version_diff(prev_state, stripped, volatile, stable_hash, params)
+            payloads.append((params, stripped, volatile, stable_hash, diff))
+
+        if known_blobs is None:
+            known_blobs = {}
+        for params, _, _, stable_hash, _ in payloads:
+            prev_state = params.previous or previous.get(str(params.dataset_id))
+            if prev_state and prev_state.blob_hash == stable_hash:
+                known_blobs[(str(params.dataset_id), stable_hash)] = prev_state.blob_id
+        blob_ids = self._store_blobs(
+            [(str(p.dataset_id), stable_hash, stripped) for p, stripped, _, stable_hash, _ in payloads], known_blobs
+        )
 
-                # 2. Compute diff on harmonized structures
-                diff = calculate_snapshot_diff(prev_comparable, curr_comparable)
+        self.client.execute_values(
+            _VERSION_INSERT_WITH_CURRENT_SQL.format(
+                insert=f"INSERT INTO dataset_versions ({_VERSION_COLUMNS}) VALUES %s"
+            ),
+            [
+                _version_row(p, blob_ids[(str(p.dataset_id), stable_hash)], diff, volatile)
+                for p, _, volatile, stable_hash, diff in payloads
+            ],
+        )
 
-        data_str = json.dumps(stripped, sort_keys=True)
-        stable_hash = hashlib.sha256(data_str.encode()).hexdigest()
+    def _store_blobs(self, blobs: list[tuple[str, str, dict]], known_blobs: dict) -> dict:
+        """
+        Blob id of each (dataset id, hash, data), keyed by (dataset id, hash). Hash first: only the blobs
+        missing from `known_blobs` are sent, without touching the rows that already exist; `known_blobs` is updated.
+        """
+        new_blobs = {(dataset_id, blob_hash): data for dataset_id, blob_hash, data in blobs}
+        new_blobs = {key: data for key, data in new_blobs.items() if key not in known_blobs}
+        if new_blobs:
+            rows = self.client.execute_values(
+                """
+                INSERT INTO dataset_blobs (dataset_id, hash, data)
+                VALUES %s
+                ON CONFLICT (dataset_id, hash) DO NOTHING
+                RETURNING id, dataset_id, hash
+                """,
+                [(dataset_id, blob_hash, Json(data)) for (dataset_id, blob_hash), data in new_blobs.items()],
+                fetch=True,
+            )
+            known_blobs.update({(str(row["dataset_id"]), row["hash"]): row["id"] for row in rows})
+
+            # Blobs already stored but unknown to the caller: conflicting rows are not returned
+            conflicts = [key for key in new_blobs if key not in known_blobs]
+            if conflicts:
+                rows = self.client.execute_values(
+                    """
+                    SELECT b.id, b.dataset_id, b.hash
+                    FROM dataset_blobs b
+                    JOIN (VALUES %s) AS k(dataset_id, hash) ON b.dataset_id = k.dataset_id::uuid AND b.hash = k.hash
+                    """,
+                    conflicts,
+                    fetch=True,
+                )
+                known_blobs.update({(str(row["dataset_id"]), row["hash"]): row["id"] for row in rows})
+        return known_blobs
 
-        blob_row = self.client.fetchone(
+    def get_blob_ids(self, platform_id: UUID) -> dict[tuple[str, str], str]:
+        """Ids of the blobs of every dataset of a platform, keyed by (dataset id, content hash)."""
+        rows = self.client.fetchall(
             """
-            INSERT INTO dataset_blobs (dataset_id, hash, data)
-            VALUES (%s, %s, %s)
-            ON CONFLICT (dataset_id, hash)
-            DO UPDATE SET id = dataset_blobs.id
-            RETURNING id
+            SELECT b.id, b.dataset_id, b.hash
+            FROM dataset_blobs b
+            JOIN datasets d ON d.id = b.dataset_id
+            WHERE d.platform_id = %s
             """,
-            (str(params.dataset_id), stable_hash, Json(stripped)),
+            (str(platform_id),),
+        )
+        return {(str(row["dataset_id"]), row["hash"]): row["id"] for row in rows}
+
+    def add_metrics_versions(self, params_list: list[DatasetMetricsParams]) -> None:
+        """Insert metrics-only versions: blob, checksum, title and volatile metadata are copied from the latest version."""
+        if not params_list:
+            return
+        self.client.execute_values(
+            _VERSION_INSERT_WITH_CURRENT_SQL.format(
+                insert=f"""
+                INSERT INTO dataset_versions ({_VERSION_COLUMNS})
+                SELECT lv.dataset_id, lv.blob_id, lv.checksum, lv.title, v.downloads_count, v.api_calls_count,
+                       v.views_count, v.reuses_count, v.followers_count, v.popularity_score, v.diff,
+                       lv.metadata_volatile
+                FROM (VALUES %s) AS v(
+                    dataset_id, downloads_count, api_calls_count, views_count,
+                    reuses_count, followers_count, popularity_score, diff
+                )
+                JOIN dataset_current dc ON dc.dataset_id = v.dataset_id
+                JOIN dataset_versions lv ON lv.id = dc.version_id AND lv.timestamp = dc.version_timestamp
+                """
+            ),
+            [
+                (
+                    str(p.dataset_id),
+                    p.downloads_count,
+                    p.api_calls_count,
+                    p.views_count,
+                    p.reuses_count,
+                    p.followers_count,
+                    p.popularity_score,
+                    Json(p.diff) if p.diff else None,
+                )
+                for p in params_list
+            ],
+            template="(%s::uuid, %s::int, %s::int, %s::int, %s::int, %s::int, %s::float, %s::jsonb)",
         )
-        blob_id = blob_row["id"]
 
-        self.client.execute(
+    def get_sync_states(self, platform_id: UUID) -> dict[str, Dataset]:
+        """
+        Load every dataset of a platform with the checksum and metrics of its latest version,
+        keyed by buid. Snapshots are not loaded: this is what sync needs to decide on versioning.
+        """
+        rows = self.client.fetchall(
             """
-            INSERT INTO dataset_versions (
-                dataset_id, blob_id, checksum, title, downloads_count, api_calls_count,
-                views_count, reuses_count, followers_count, popularity_score, diff,
-                metadata_volatile
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            SELECT d.*, dc.downloads_count, dc.api_calls_count, dc.views_count,
+                   dc.reuses_count, dc.followers_count, dc.popularity_score,
+                   dc.version_timestamp as last_version_timestamp, dc.checksum
+            FROM datasets d
+            LEFT JOIN dataset_current dc ON dc.dataset_id = d.id
+            WHERE d.platform_id = %s
             """,
-            (
-                str(params.dataset_id),
-                str(blob_id),
-                params.checksum,
-                params.title,
-                params.downloads_count,
-                params.api_calls_count,
-                params.views_count,
-                params.reuses_count,
-                params.followers_count,
-                params.popularity_score,
-                Json(diff) if diff else None,
-                Json(volatile) if volatile else None,
-            ),
+            (str(platform_id),),
         )
+        return {row["buid"]: Dataset.from_dict(row) for row in rows}
 
     def get_by_buid(self, dataset_buid: str) -> Dataset | None:
         row = self.client.fetchone(
             """
-            SELECT d.*, dv.downloads_count, dv.api_calls_count, dv.views_count,
-                   dv.reuses_count, dv.followers_count, dv.popularity_score,
-                   dv.timestamp as last_version_timestamp, dv.checksum,
-                   db.data as blob_data, dv.metadata_volatile, d.deleted_at
+            SELECT d.*, dc.downloads_count, dc.api_calls_count, dc.views_count,
+                   dc.reuses_count, dc.followers_count, dc.popularity_score,
+                   dc.version_timestamp as last_version_timestamp, dc.checksum,
+                   db.id as blob_id, db.data as blob_data, db.hash as blob_hash, dv.metadata_volatile, d.deleted_at
             FROM datasets d
-            LEFT JOIN LATERAL (
-                SELECT downloads_count, api_calls_count, views_count,
-                       reuses_count, followers_count, popularity_score, timestamp, checksum,
-                       blob_id, metadata_volatile
-                FROM dataset_versions
-                WHERE dataset_id = d.id
-                ORDER BY timestamp DESC
-                LIMIT 1
-            ) dv ON TRUE
-            LEFT JOIN dataset_blobs db ON dv.blob_id = db.id
+            LEFT JOIN dataset_current dc ON dc.dataset_id = d.id
+            LEFT JOIN dataset_versions dv ON dv.id = dc.version_id AND dv.timestamp = dc.version_timestamp
+            LEFT JOIN dataset_blobs db ON dc.blob_id = db.id
             WHERE d.buid = %s
             """,
             (dataset_buid,),
         )
         if row:
             row["id"] = uuid.UUID(row["id"])
+            current_version = _version_state(row) if row["blob_data"] is not None else None
             # Reconstruct full raw metadata
             blob_data = row.pop("blob_data") or {}
             volatile = row.pop("metadata_volatile") or {}
             row["raw"] = deep_merge(blob_data, volatile)
-            return Dataset.from_dict(row)
+            dataset = Dataset.from_dict(row)
+            # Kept for the next add_version, which then diffs against it instead of reading it back
+            dataset.current_version = current_version
+            return dataset
         return None
 
     def get(self, dataset_id: UUID, include_versions: bool = True) -> Dataset:
@@ -403,12 +1042,7 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
                    dq.downloads_count as q_downloads_count, dq.api_calls_count as q_api_calls_count,
                    dq.health_score, dq.health_quality_score, dq.health_freshness_score, dq.health_engagement_score, dq.syntax_change_score
              FROM datasets d
-             LEFT JOIN (
-                SELECT DISTINCT ON (dataset_id) dataset_id, has_description, is_slug_valid, evaluation_results, evaluated_blob_id, downloads_count, api_calls_count,
-                       health_score, health_quality_score, health_freshness_score, health_engagement_score, syntax_change_score
-                FROM dataset_quality
-                ORDER BY dataset_id, timestamp DESC
-             ) dq ON d.id = dq.dataset_id
+             LEFT JOIN dataset_quality dq ON d.id = dq.dataset_id
              WHERE d.id = %s
              LIMIT 1;
             """,
@@ -420,15 +1054,13 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
 
         # Current snapshot reconstruction for the main aggregate
         cur_row = self.client.fetchone(
-            """
+            f"""
             SELECT dv.metadata_volatile, db.data as blob_data,
-                   dv.downloads_count, dv.api_calls_count, dv.views_count,
-                   dv.reuses_count, dv.followers_count, dv.popularity_score,
-                   dv.timestamp, dv.checksum
-            FROM dataset_versions dv
-            LEFT JOIN dataset_blobs db ON dv.blob_id = db.id
-            WHERE dv.dataset_id = %s
-            ORDER BY dv.timestamp DESC LIMIT 1
+                   dc.downloads_count, dc.api_calls_count, dc.views_count,
+                   dc.reuses_count, dc.followers_count, dc.popularity_score,
+                   dc.records_count, dc.size_bytes, dc.version_timestamp as timestamp, dc.checksum
+            {_CURRENT_VERSION_JOIN}
+            WHERE dc.dataset_id = %s
             """,
             (str(dataset_id),),
         )
@@ -476,45 +1108,59 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
         if not include_versions:
             # Still populate identifying metadata for the aggregate from latest version if exists
             if cur_row:
-                # We need checksum and last_version_timestamp for the aggregate
-                latest_info = self.client.fetchone(
-                    "SELECT timestamp, checksum FROM dataset_versions WHERE dataset_id = %s ORDER BY timestamp DESC LIMIT 1",
-                    (str(dataset_id),),
-                )
-                if latest_info:
-                    dataset.last_version_timestamp = latest_info["timestamp"]
-                    dataset.checksum = latest_info["checksum"]
+                dataset.last_version_timestamp = cur_row["timestamp"]
+                dataset.checksum = cur_row["checksum"]
             return dataset
 
-        versions = self.client.fetchall(
-            """
-            SELECT dv.dataset_id, dv.blob_id, db.data as blob_data, dv.metadata_volatile,
-                   dv.checksum, dv.downloads_count, dv.api_calls_count, dv.views_count,
+        dataset.versions = VersionHistory(self, dataset.id)
+        return dataset
+
+    def count_versions(self, dataset_id: UUID, start: datetime | None = None, end: datetime | None = None) -> int:
+        if start is None and end is None:
+            row = self.client.fetchone(
+                "SELECT versions_count FROM dataset_current WHERE dataset_id = %s", (str(dataset_id),)
+            )
+            return row["versions_count"] if row else 0
+        where, params = _version_range(dataset_id, start, end)
+        return self.client.fetchone(f"SELECT COUNT(*) AS count FROM dataset_versions dv WHERE {where}", params)["count"]
+
+    def load_versions(
+        self,
+        dataset_id: UUID,
+        offset: int = 0,
+        limit: int | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        newest_first: bool = False,
+        with_snapshots: bool = True,
+    ) -> list[DatasetVersion]:
+        """One window of versions; blobs are only joined when snapshots are wanted."""
+        where, params = _version_range(dataset_id, start, end)
+        direction = "DESC" if newest_first else "ASC"
+        rows = self.client.fetchall(
+            f"""
+            SELECT dv.dataset_id, dv.blob_id, dv.checksum, dv.downloads_count, dv.api_calls_count, dv.views_count,
                    dv.reuses_count, dv.followers_count, dv.popularity_score, dv.diff, dv.timestamp
+                   {", dv.metadata_volatile, db.data AS blob_data" if with_snapshots else ""}
             FROM dataset_versions dv
-            LEFT JOIN dataset_blobs db ON dv.blob_id = db.id
-            WHERE dv.dataset_id = %s
-            ORDER BY dv.timestamp ASC;
+            {"LEFT JOIN dataset_blobs db ON db.id = dv.blob_id" if with_snapshots else ""}
+            WHERE {where}
+            ORDER BY dv.timestamp {direction}, dv.id {direction}
+            LIMIT %(limit)s OFFSET %(offset)s
             """,
-            (str(dataset_id),),
+            {**params, "limit": limit, "offset": offset},
         )
-
-        for version_row in versions:
-            # Reconstruct the full snapshot
-            blob_data = version_row.pop("blob_data")
-            volatile = version_row.pop("metadata_volatile")
-
-            snapshot = deep_merge(blob_data or {}, volatile or {})
-
-            version_row["snapshot"] = snapshot
-            version_row["metadata_volatile"] = volatile
-            dataset.add_version(**version_row)
-
-        return dataset
+        versions = []
+        for row in rows:
+            snapshot = None
+            if with_snapshots:
+                snapshot = deep_merge(row.pop("blob_data") or {}, row["metadata_volatile"] or {})
+            versions.append(DatasetVersion(snapshot=snapshot, **row))
+        return versions
 
     def get_checksum_by_buid(self, dataset_buid) -> str or None:
         data = self.client.fetchone(
-            """SELECT dv.checksum FROM dataset_versions dv JOIN datasets d ON d.id = dv.dataset_id WHERE d.buid = %s ORDER BY dv.timestamp DESC LIMIT 1""",
+            """SELECT dc.checksum FROM dataset_current dc JOIN datasets d ON d.id = dc.dataset_id WHERE d.buid = %s""",
             (str(dataset_buid),),
         )
         if data is not None:
@@ -612,6 +1258,51 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
             """UPDATE datasets SET deleted = %s, deleted_at = %s WHERE id = %s;""",
             (dataset.is_deleted, dataset.deleted_at, str(dataset.id)),
         )
+        self.refresh_direction_health([dataset.id])
+
+    def mark_missing_as_deleted(self, platform_id: UUID, present_buids: list[str]) -> list[dict]:
+        """Soft-delete, in one statement, the active datasets of a platform missing from the crawler's list."""
+        rows = self.client.fetchall(
+            """
+            UPDATE datasets SET deleted = TRUE, deleted_at = now()
+            WHERE platform_id = %s AND deleted IS NOT TRUE AND buid <> ALL(%s::text[])
+            RETURNING id, buid, slug;
+            """,
+            (str(platform_id), [buid for buid in present_buids if buid is not None]),
+        )
+        self.refresh_direction_health([row["id"] for row in rows])
+        return rows
+
+    def update_datasets_sync_status(self, platform_id: UUID, dataset_ids: list[UUID], status: str) -> None:
+        if not dataset_ids:
+            return
+        self.client.execute(
+            """UPDATE datasets SET last_sync = now(), last_sync_status = %s WHERE platform_id = %s AND id = ANY(%s::uuid[]);""",
+            (status, str(platform_id), [str(dataset_id) for dataset_id in dataset_ids]),
+        )
+
+    def find_by_slugs(self, slugs: list[str]) -> list[dict]:
+        """Return id, slug and page of every dataset (any platform) whose slug is in the list."""
+        if not slugs:
+            return []
+        rows = self.client.fetchall(
+            """SELECT id, slug, page FROM datasets WHERE slug = ANY(%s);""",
+            (list({str(slug) for slug in slugs}),),
+        )
+        return [{"id": UUID(row["id"]), "slug": row["slug"], "page": row["page"]} for row in rows]
+
+    def update_linkings(self, links: list[tuple[UUID, UUID | None]]) -> None:
+        """Set linked_dataset_id for several datasets at once, as (dataset_id, linked_dataset_id) pairs."""
+        if not links:
+            return
+        self.client.execute_values(
+            """
+            UPDATE datasets SET linked_dataset_id = v.linked_id::uuid
+            FROM (VALUES %s) AS v(id, linked_id)
+            WHERE datasets.id = v.id::uuid
+            """,
+            [(str(dataset_id), str(linked_id) if linked_id else None) for dataset_id, linked_id in links],
+        )
 
     def search(
         self,
@@ -632,6 +1323,53 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
         include_cold_storage: bool = False,
     ) -> tuple[list[dict], int]:
         """Search datasets with filters, sorting and pagination."""
+        items, total, _ = self.search_page(
+            platform_id,
+            publisher,
+            q,
+            created_from,
+            created_to,
+            modified_from,
+            modified_to,
+            is_deleted,
+            sort_by=sort_by,
+            order=order,
+            page=page,
+            page_size=page_size,
+            min_health=min_health,
+            max_health=max_health,
+            include_cold_storage=include_cold_storage,
+        )
+        return items, total
+
+    def search_page(
+        self,
+        platform_id: str | None = None,
+        publisher: str | None = None,
+        q: str | None = None,
+        created_from: str | None = None,
+        created_to: str | None = None,
+        modified_from: str | None = None,
+        modified_to: str | None = None,
+        is_deleted: bool | None = None,
+        sort_by: str = "modified",
+        order: str = "desc",
+        page: int = 1,
+        page_size: int = 25,
+        cursor: str | None = None,
+        with_total: bool = True,
+        min_health: float | None = None,
+        max_health: float | None = None,
+        include_cold_storage: bool = False,
+    ) -> tuple[list[dict], int | None, str | None]:
+        """Search datasets, paginated by keyset when a `cursor` is given (by offset otherwise).
+
+        `q` matches the full-text vector (title, slug, publisher, description) or a slug/title substring;
+        `sort_by="relevance"` ranks the matches.
+        """
+        if sort_by == "relevance" and not q:
+            sort_by = "modified"
+        search_join_sql, search_join_params = self._build_search_join(q)
         where_sql, params = self._build_where_clause(
             platform_id,
             publisher,
@@ -646,37 +1384,38 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
             include_cold_storage=include_cold_storage,
         )
 
-        # Count total
-        count_query = f"SELECT COUNT(*) AS cnt FROM datasets d WHERE {where_sql}"
-        total_rows = self.client.fetchall(count_query, tuple(params))
-        total = int(total_rows[0]["cnt"]) if total_rows else 0
+        # Count total (optional: deep keyset pages should not pay for it)
+        total = None
+        if with_total:
+            count_query = f"""
+                SELECT COUNT(*) AS cnt
+                FROM datasets d
+                LEFT JOIN dataset_current dc ON dc.dataset_id = d.id
+                LEFT JOIN dataset_quality dq ON dq.dataset_id = d.id
+                {search_join_sql}
+                WHERE {where_sql}
+            """
+            total_rows = self.client.fetchall(count_query, tuple(search_join_params + params))
+            total = int(total_rows[0]["cnt"]) if total_rows else 0
 
         # Build sorting
+        sort_column = self._get_sort_column(sort_by)
         order_sql, sort_dir = self._build_order_clause(sort_by, order)
+        id_dir = sort_dir.split()[0]
 
-        # Pagination
-        page = max(1, page)
+        # Pagination: keyset after the cursor row, offset otherwise
         page_size = max(1, min(100, page_size))
-        offset = (page - 1) * page_size
+        offset = 0
+        if cursor:
+            position = PageCursor.decode(cursor, sort_column, id_dir)
+            keyset_sql, keyset_params = self._build_keyset_clause(order_sql, sort_column, id_dir, position)
+            where_sql = f"{where_sql} AND {keyset_sql}"
+            params = params + keyset_params
+        else:
+            offset = (max(1, page) - 1) * page_size
 
         # Main query
         list_query = f"""
-            WITH latest_versions AS (
-                SELECT DISTINCT ON (dataset_id) dataset_id, title, blob_id, downloads_count, api_calls_count, views_count, reuses_count, followers_count, popularity_score, metadata_volatile, timestamp
-                FROM dataset_versions
-                ORDER BY dataset_id, timestamp DESC
-            ),
-            version_counts AS (
-                SELECT dataset_id, COUNT(*) AS versions_count
-                FROM dataset_versions
-                GROUP BY dataset_id
-            ),
-            latest_quality AS (
-                SELECT DISTINCT ON (dataset_id) dataset_id, has_description, is_slug_valid, evaluation_results, syntax_change_score, evaluated_blob_id,
-                       health_score, health_quality_score, health_freshness_score, health_engagement_score
-                FROM dataset_quality
-                ORDER BY dataset_id, timestamp DESC
-            )
             SELECT d.id,
                    d.platform_id,
                    d.buid,
@@ -687,29 +1426,17 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
                    d.modified,
                    d.restricted,
                    d.published,
-                   COALESCE(
-                       lv.title,
-                       (db.data ->> 'title'),
-                       (db.data -> 'metas' -> 'default' ->> 'title'),
-                       d.slug
-                   ) AS title,
-                   lv.timestamp AS timestamp,
-                   lv.api_calls_count AS api_calls_count,
-                   lv.downloads_count AS downloads_count,
-                   lv.views_count AS views_count,
-                   lv.reuses_count AS reuses_count,
-                   lv.followers_count AS followers_count,
-                   COALESCE(
-                       (lv.metadata_volatile ->> 'records_count')::int,
-                       (db.data ->> 'records_count')::int,
-                       (db.data -> 'metas' -> 'default' ->> 'records_count')::int
-                   ) AS records_count,
-                   COALESCE(
-                       (lv.metadata_volatile ->> 'size_bytes')::bigint,
-                       (db.data ->> 'records_size')::bigint,
-                       (db.data -> 'metas' -> 'default' ->> 'records_size')::bigint
-                   ) AS size_bytes,
-                   COALESCE(vc.versions_count, 0) AS versions_count,
+                   COALESCE(dc.title, d.slug) AS title,
+                   dc.version_timestamp AS timestamp,
+                   dc.api_calls_count AS api_calls_count,
+                   dc.downloads_count AS downloads_count,
+                   dc.views_count AS views_count,
+                   dc.reuses_count AS reuses_count,
+                   dc.followers_count AS followers_count,
+                   dc.popularity_score AS popularity_score,
+                   dc.records_count AS records_count,
+                   dc.size_bytes AS size_bytes,
+                   COALESCE(dc.versions_count, 0) AS versions_count,
                    d.last_sync,
                    d.last_sync_status,
                    d.deleted,
@@ -725,23 +1452,28 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
                    dq.health_quality_score as stored_quality_score,
                    dq.health_freshness_score as stored_freshness_score,
                    dq.health_engagement_score as stored_engagement_score,
-                   lv.blob_id as current_blob_id,
-                   db.data as data
+                   dc.blob_id as current_blob_id,
+                   {order_sql} AS sort_key
 
             FROM datasets d
-            LEFT JOIN latest_versions lv ON lv.dataset_id = d.id
-            LEFT JOIN dataset_blobs db ON lv.blob_id = db.id
-            LEFT JOIN version_counts vc ON vc.dataset_id = d.id
-            LEFT JOIN latest_quality dq ON d.id = dq.dataset_id
+            LEFT JOIN dataset_current dc ON dc.dataset_id = d.id
+            LEFT JOIN dataset_quality dq ON d.id = dq.dataset_id
             LEFT JOIN datasets ld ON d.linked_dataset_id = ld.id
             LEFT JOIN platforms lp ON ld.platform_id = lp.id
+            {search_join_sql}
 
             WHERE {where_sql}
-            ORDER BY {order_sql} {sort_dir}
+            ORDER BY {order_sql} {sort_dir}, d.id {id_dir}
             LIMIT %s OFFSET %s
         """
-        list_params = params + [page_size, offset]
+        # One extra row tells whether there is a next page
+        list_params = search_join_params + params + [page_size + 1, offset]
         rows = self.client.fetchall(list_query, tuple(list_params))
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last = rows[-1]
+            next_cursor = PageCursor(sort_column, id_dir.lower(), last["sort_key"], str(last["id"])).encode()
 
         items = []
         for r in rows:
@@ -800,7 +1532,7 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
                 }
             )
 
-        return items, total
+        return items, total, next_cursor
 
     def _build_where_clause(
         self,
@@ -830,8 +1562,9 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
                 where_clauses.append("d.publisher = %s")
                 params.append(publisher)
         if q:
-            where_clauses.append("d.slug ILIKE %s")
-            params.append(f"%{q}%")
+            # `tsq` comes from _build_search_join; ILIKE keeps partial words matching (trigram indexed)
+            where_clauses.append("(dc.search_vector @@ tsq OR d.slug ILIKE %s OR dc.title ILIKE %s)")
+            params.extend([f"%{q}%", f"%{q}%"])
 
         self._add_date_filters(where_clauses, params, created_from, created_to, modified_from, modified_to)
 
@@ -865,6 +1598,24 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
             where_clauses.append("d.modified <= %s")
             params.append(m_to)
 
+    def _build_search_join(self, q: str | None) -> tuple[str, list]:
+        """Parse the search text once per query into a `tsq` relation usable by filters and ranking."""
+        if not q:
+            return "", []
+        return "CROSS JOIN websearch_to_tsquery('french', %s) AS tsq", [q]
+
+    def _build_keyset_clause(
+        self, order_sql: str, sort_column: str, direction: str, position: PageCursor
+    ) -> tuple[str, list]:
+        """Rows strictly after `position` in `ORDER BY order_sql direction [NULLS LAST], d.id direction`."""
+        op = "<" if direction == "DESC" else ">"
+        if sort_column not in _NULLS_LAST_SORT_COLUMNS:
+            return f"({order_sql}, d.id) {op} (%s, %s)", [position.value, position.id]
+        if position.value is None:
+            # Already in the NULL tail: only the id keeps moving
+            return f"({order_sql} IS NULL AND d.id {op} %s)", [position.id]
+        return f"({order_sql} IS NULL OR ({order_sql}, d.id) {op} (%s, %s))", [position.value, position.id]
+
     def _build_order_clause(self, sort_by: str, order: str) -> tuple[str, str]:
         """Build ORDER BY clause with NULL-safe sorting."""
         sort_column = self._get_sort_column(sort_by)
@@ -872,7 +1623,7 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
         sort_dir = "DESC" if order.lower() != "asc" else "ASC"
 
         # Add NULLS LAST for specific columns like health_score and size metrics
-        if sort_column in ("health_score", "size_bytes", "records_count"):
+        if sort_column in _NULLS_LAST_SORT_COLUMNS:
             sort_dir += " NULLS LAST"
 
         return order_sql, sort_dir
@@ -893,23 +1644,27 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
             "health_score",
             "size_bytes",
             "records_count",
+            "relevance",
         )
         return sort_by if sort_by in valid else "modified"
 
     def _get_order_sql(self, sort_column: str) -> str:
         mapping = {
-            "title": "COALESCE(title, '')",
-            "api_calls_count": "COALESCE(lv.api_calls_count, 0)",
-            "downloads_count": "COALESCE(lv.downloads_count, 0)",
-            "versions_count": "COALESCE(vc.versions_count, 0)",
-            "popularity_score": "COALESCE(lv.popularity_score, 0)",
-            "views_count": "COALESCE(lv.views_count, 0)",
-            "reuses_count": "COALESCE(lv.reuses_count, 0)",
-            "followers_count": "COALESCE(lv.followers_count, 0)",
-            "publisher": "COALESCE(publisher, '')",
+            "created": "d.created",
+            "modified": "d.modified",
+            "title": "COALESCE(dc.title, d.slug, '')",
+            "api_calls_count": "COALESCE(dc.api_calls_count, 0)",
+            "downloads_count": "COALESCE(dc.downloads_count, 0)",
+            "versions_count": "COALESCE(dc.versions_count, 0)",
+            "popularity_score": "COALESCE(dc.popularity_score, 0)",
+            "views_count": "COALESCE(dc.views_count, 0)",
+            "reuses_count": "COALESCE(dc.reuses_count, 0)",
+            "followers_count": "COALESCE(dc.followers_count, 0)",
+            "publisher": "COALESCE(d.publisher, '')",
             "health_score": "dq.health_score",
-            "size_bytes": "size_bytes",
-            "records_count": "records_count",
+            "size_bytes": "dc.size_bytes",
+            "records_count": "dc.records_count",
+            "relevance": "COALESCE(ts_rank(dc.search_vector, tsq), 0)::numeric",
         }
         return mapping.get(sort_column, sort_column)
 
@@ -951,12 +1706,7 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
                    ld.slug AS linked_dataset_slug,
                    lp.name AS linked_platform_name
             FROM datasets d
-            LEFT JOIN (
-                SELECT DISTINCT ON (dataset_id) dataset_id, has_description, is_slug_valid, evaluation_results, syntax_change_score, evaluated_blob_id,
-                       health_score, health_quality_score, health_freshness_score, health_engagement_score
-                FROM dataset_quality
-                ORDER BY dataset_id, timestamp DESC
-            ) dq ON d.id = dq.dataset_id
+            LEFT JOIN dataset_quality dq ON d.id = dq.dataset_id
             LEFT JOIN datasets ld ON d.linked_dataset_id = ld.id
             LEFT JOIN platforms lp ON ld.platform_id = lp.id
             WHERE d.id = %s
@@ -967,22 +1717,11 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
         d = rows[0]
 
         # Current snapshot
-        cur_query = """
+        cur_query = f"""
             SELECT dv.id, dv.blob_id, dv.timestamp, dv.downloads_count, dv.api_calls_count, dv.views_count, dv.reuses_count, dv.followers_count, dv.popularity_score, dv.metadata_volatile, db.data as blob_data, dv.title,
-                   COALESCE(dv.title, db.data ->> 'title', db.data -> 'metas' -> 'default' ->> 'title') AS derived_title,
-                   COALESCE(
-                       (dv.metadata_volatile ->> 'records_count')::int,
-                       (db.data ->> 'records_count')::int,
-                       (db.data -> 'metas' -> 'default' ->> 'records_count')::int
-                   ) AS records_count,
-                   COALESCE(
-                       (dv.metadata_volatile ->> 'size_bytes')::bigint,
-                       (db.data ->> 'records_size')::bigint,
-                       (db.data -> 'metas' -> 'default' ->> 'records_size')::bigint
-                   ) AS size_bytes
-            FROM dataset_versions dv
-            LEFT JOIN dataset_blobs db ON dv.blob_id = db.id
-            WHERE dv.dataset_id = %s ORDER BY dv.timestamp DESC LIMIT 1
+                   dc.title AS derived_title, dc.records_count, dc.size_bytes
+            {_CURRENT_VERSION_JOIN}
+            WHERE dc.dataset_id = %s
         """
         cur_rows = self.client.fetchall(cur_query, (str(dataset_id),))
         current_snapshot = None
@@ -1082,35 +1821,59 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
         self, dataset_id: uuid.UUID, page: int = 1, page_size: int = 50, include_data: bool = False
     ) -> tuple[list[dict], int]:
         """Get paginated version history for a dataset."""
-        offset = (max(1, page) - 1) * page_size
+        items, total, _ = self.get_versions_page(dataset_id, page, page_size, include_data)
+        return items, total
+
+    def get_versions_page(
+        self,
+        dataset_id: uuid.UUID,
+        page: int = 1,
+        page_size: int = 50,
+        include_data: bool = False,
+        cursor: str | None = None,
+    ) -> tuple[list[dict], int, str | None]:
+        """Version history, newest first, paginated by keyset on (timestamp, id) when a `cursor` is given."""
+        where_sql = "dv.dataset_id = %s"
+        params: list = [str(dataset_id)]
+        offset = 0
+        if cursor:
+            position = PageCursor.decode(cursor, "timestamp", "desc")
+            where_sql += " AND (dv.timestamp, dv.id) < (%s, %s)"
+            params += [position.value, position.id]
+        else:
+            offset = (max(1, page) - 1) * page_size
 
-        cnt_rows = self.client.fetchall(
-            "SELECT COUNT(*) AS cnt FROM dataset_versions WHERE dataset_id = %s",
+        cnt_row = self.client.fetchone(
+            "SELECT versions_count FROM dataset_current WHERE dataset_id = %s",
             (str(dataset_id),),
         )
-        total = int(cnt_rows[0]["cnt"]) if cnt_rows else 0
+        total = cnt_row["versions_count"] if cnt_row else 0
 
         if include_data:
             rows = self.client.fetchall(
-                """
+                f"""
                 SELECT dv.id, dv.blob_id, dv.timestamp, dv.downloads_count, dv.api_calls_count, dv.views_count, dv.reuses_count, dv.followers_count, dv.popularity_score, dv.diff, dv.metadata_volatile, db.data as blob_data,
                        COALESCE(dv.title, db.data ->> 'title', db.data -> 'metas' -> 'default' ->> 'title') AS derived_title
                 FROM dataset_versions dv
                 LEFT JOIN dataset_blobs db ON dv.blob_id = db.id
-                WHERE dv.dataset_id = %s ORDER BY dv.timestamp DESC LIMIT %s OFFSET %s
+                WHERE {where_sql} ORDER BY dv.timestamp DESC, dv.id DESC LIMIT %s OFFSET %s
                 """,
-                (str(dataset_id), page_size, offset),
+                (*params, page_size + 1, offset),
             )
         else:
             rows = self.client.fetchall(
-                """
+                f"""
                 SELECT dv.id, dv.blob_id, dv.timestamp, dv.downloads_count, dv.api_calls_count, dv.views_count, dv.reuses_count, dv.followers_count, dv.popularity_score, dv.diff, dv.metadata_volatile, NULL as blob_data,
                        dv.title AS derived_title
                 FROM dataset_versions dv
-                WHERE dv.dataset_id = %s ORDER BY dv.timestamp DESC LIMIT %s OFFSET %s
+                WHERE {where_sql} ORDER BY dv.timestamp DESC, dv.id DESC LIMIT %s OFFSET %s
                 """,
-                (str(dataset_id), page_size, offset),
+                (*params, page_size + 1, offset),
             )
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = PageCursor("timestamp", "desc", rows[-1]["timestamp"], str(rows[-1]["id"])).encode()
 
         items = [
             {
@@ -1132,8 +1895,239 @@ class PostgresDatasetRepository(AbstractDatasetRepository):
             for r in rows
         ]
 
-        return items, total
+        return items, total, next_cursor
+
+    def get_metrics_deltas(self, since: datetime, dataset_ids: list[UUID] | None = None) -> list[DatasetMetricsDelta]:
+        """Growth of the counters since `since`, read from the metrics series instead of the versions."""
+        where = "WHERE dc.dataset_id = ANY(%(ids)s::uuid[])" if dataset_ids is not None else ""
+        rows = self.client.fetchall(
+            _METRICS_DELTAS_SQL.format(where=where),
+            {"since": since, "ids": [str(dataset_id) for dataset_id in dataset_ids or []]},
+        )
+        return [DatasetMetricsDelta(**{**row, "dataset_id": UUID(str(row["dataset_id"]))}) for row in rows]
+
+    def get_metrics_series(
+        self, dataset_id: UUID, granularity: str = "day", since: datetime | None = None
+    ) -> list[dict]:
+        """Counters at the end of each period, read from the rollups maintained along with the versions."""
+        if granularity not in _METRICS_GRANULARITIES:
+            raise ValueError(f"Unknown granularity {granularity!r}, expected one of {_METRICS_GRANULARITIES}")
+        rows = self.client.fetchall(
+            _METRICS_SERIES_SQL,
+            {"dataset_id": str(dataset_id), "granularity": granularity, "since": since or _HISTORY_START},
+        )
+        return [dict(row) for row in rows]
+
+    def ensure_version_partitions(self, months_ahead: int = 3) -> int:
+        """Create the monthly partitions of dataset_versions up to `months_ahead` months from now."""
+        row = self.client.fetchone(
+            """
+            SELECT ensure_dataset_versions_partitions(now()::date, (now() + make_interval(months => %s))::date)
+                AS created
+            """,
+            (months_ahead,),
+        )
+        return row["created"]
 
-    def refresh_materialized_views(self) -> None:
-        """Refresh all materialized views used for analytics."""
-        self.client.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY direction_health_stats_view")
+    def compact_versions(self, start: datetime | None, end: datetime, bucket: str) -> int:
+        """Fold the heartbeat versions recorded between `start` (None: the beginning) and `end` into one per `bucket`."""
+        row = self.client.fetchone(
+            _VERSION_COMPACTION_SQL,
+            {
+                "start": start or _HISTORY_START,
+                "lookback": start - timedelta(days=7) if start else _HISTORY_START,
+                "end": end,
+                "bucket": bucket,
+            },
+        )
+        self.client.execute(
+            """
+            INSERT INTO dataset_version_compactions (bucket, compacted_until) VALUES (%s, %s)
+            ON CONFLICT (bucket) DO UPDATE
+            SET compacted_until = GREATEST(dataset_version_compactions.compacted_until, EXCLUDED.compacted_until),
+                updated_at = NOW()
+            """,
+            (bucket, end),
+        )
+        return row["removed"]
+
+    def get_compacted_until(self, bucket: str) -> datetime | None:
+        row = self.client.fetchone(
+            "SELECT compacted_until FROM dataset_version_compactions WHERE bucket = %s", (bucket,)
+        )
+        return row["compacted_until"] if row else None
+
+    def rebuild_current_state(self, dataset_ids: list[UUID] | None = None) -> None:
+        """Recompute the dataset_current projection from history (all datasets by default), e.g. after manual deletions."""
+        if dataset_ids is None:
+            self.client.execute(_CURRENT_STATE_REBUILD_SQL.format(where=""))
+        elif dataset_ids:
+            self.client.execute(
+                _CURRENT_STATE_REBUILD_SQL.format(where="WHERE d.id = ANY(%s::uuid[])"),
+                ([str(dataset_id) for dataset_id in dataset_ids],),
+            )
+
+    def stream_health_inputs(self, after_id: UUID | None = None) -> Iterator[dict]:
+        """Stream the scoring inputs of every dataset with a quality row, by id, starting after `after_id`."""
+        if after_id is None:
+            return self.client.stream_fetchall(_HEALTH_INPUTS_SQL.format(after=""), name="health_inputs_cursor")
+        return self.client.stream_fetchall(
+            _HEALTH_INPUTS_SQL.format(after="AND d.id > %s"), (str(after_id),), name="health_inputs_cursor"
+        )
+
+    def update_health_scores(self, scores: list[tuple]) -> None:
+        """Write `(dataset_id, health, quality, freshness, engagement)` tuples to dataset_quality only."""
+        if not scores:
+            return
+        self.client.execute_values(
+            _HEALTH_SCORES_UPDATE_SQL,
+            [(str(dataset_id), *values) for dataset_id, *values in scores],
+            template="(%s::uuid, %s::float, %s::float, %s::float, %s::float)",
+        )
+        self.refresh_direction_health([dataset_id for dataset_id, *_ in scores])
+
+    def refresh_direction_health(self, dataset_ids: list[UUID]) -> None:
+        """Apply the health score changes of these datasets to the direction aggregates."""
+        if dataset_ids:
+            self.client.execute(_DIRECTION_HEALTH_DELTA_SQL, {"ids": [str(dataset_id) for dataset_id in dataset_ids]})
+
+    def rebuild_direction_health(self) -> None:
+        """Recompute the direction aggregates from every dataset, e.g. after bulk SQL updates."""
+        self.client.execute(_DIRECTION_HEALTH_REBUILD_SQL)
+
+    def get_cached_evaluation(self, key: EvaluationCacheKey) -> dict | None:
+        """Read the stored evaluation and count the hit in the same statement."""
+        row = self.client.fetchone(
+            """
+            UPDATE llm_evaluation_cache SET hits = hits + 1, last_hit_at = NOW()
+            WHERE context_hash = %s AND prompt_type = %s AND output = %s AND prompt_version = %s AND model = %s
+            RETURNING evaluation
+            """,
+            astuple(key),
+        )
+        return row["evaluation"] if row else None
+
+    def cache_evaluation(self, key: EvaluationCacheKey, evaluation: dict) -> None:
+        self.client.execute(
+            """
+            INSERT INTO llm_evaluation_cache (context_hash, prompt_type, output, prompt_version, model, evaluation)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            ON CONFLICT (context_hash, prompt_type, output, prompt_version, model) DO UPDATE SET
+                evaluation = EXCLUDED.evaluation, created_at = NOW(), hits = 0, last_hit_at = NULL
+            """,
+            (*astuple(key), Json(evaluation)),
+        )
+
+    def count_llm_evaluations(self, since: datetime) -> int:
+        row = self.client.fetchone(
+            "SELECT count(*) AS count FROM llm_evaluation_jobs WHERE state = 'pending' OR claimed_at >= %s", (since,)
+        )
+        return row["count"]
+
+    def stream_reevaluation_inputs(
+        self, platform_slug: str | None = None, publisher: str | None = None
+    ) -> Iterator[dict]:
+        filters = ("AND p.slug = %(platform)s " if platform_slug else "") + (
+            "AND d.publisher = %(publisher)s" if publisher else ""
+        )
+        return self.client.stream_fetchall(
+            _REEVALUATION_INPUTS_SQL.format(filters=filters),
+            {"platform": platform_slug, "publisher": publisher},
+            name="reevaluation_inputs_cursor",
+        )
+
+    def enqueue_evaluation_jobs(self, selection: EvaluationJobSelection) -> int:
+        filters = "".join(
+            clause
+            for clause, enabled in (
+                ("AND p.slug = %(platform)s ", selection.platform_slug),
+                ("AND d.publisher = %(publisher)s ", selection.publisher),
+                ("AND d.id = ANY(%(dataset_ids)s::uuid[]) ", selection.dataset_ids is not None),
+                ("AND dq.evaluation_results IS NULL ", selection.skip_evaluated),
+            )
+            if enabled
+        )
+        query = _ENQUEUE_EVALUATION_JOBS_SQL.format(
+            filters=filters,
+            limit="LIMIT %(limit)s" if selection.limit else "",
+            on_conflict=_REQUEUE_EVALUATION_JOB if selection.requeue else "NOTHING",
+        )
+        rows = self.client.fetchall(
+            query,
+            {
+                "prompt_type": selection.prompt_type,
+                "refresh": selection.refresh,
+                "priority": selection.priority,
+                "max_attempts": selection.max_attempts,
+                "platform": selection.platform_slug,
+                "publisher": selection.publisher,
+                "dataset_ids": [str(dataset_id) for dataset_id in selection.dataset_ids or ()],
+                "limit": selection.limit,
+            },
+        )
+        return len(rows)
+
+    def claim_evaluation_jobs(
+        self, worker: str, limit: int = 1, lease: timedelta = DEFAULT_LEASE
+    ) -> list[EvaluationJob]:
+        self.client.execute(_EXPIRE_EVALUATION_JOBS_SQL)
+        rows = self.client.fetchall(_CLAIM_EVALUATION_JOBS_SQL, {"worker": worker, "lease": lease, "limit": limit})
+        return [EvaluationJob(**{**row, "dataset_id": UUID(str(row["dataset_id"]))}) for row in rows]
+
+    def renew_evaluation_job_lease(self, job_id: int, worker: str, lease: timedelta = DEFAULT_LEASE) -> bool:
+        row = self.client.fetchone(
+            """
+            UPDATE llm_evaluation_jobs SET leased_until = NOW() + %s, updated_at = NOW()
+            WHERE id = %s AND leased_by = %s AND state = 'running'
+            RETURNING id
+            """,
+            (lease, job_id, worker),
+        )
+        return row is not None
+
+    def complete_evaluation_job(self, job_id: int, worker: str) -> bool:
+        row = self.client.fetchone(
+            """
+            UPDATE llm_evaluation_jobs
+            SET state = 'done', last_error = NULL, leased_by = NULL, leased_until = NULL, updated_at = NOW()
+            WHERE id = %s AND leased_by = %s
+            RETURNING id
+            """,
+            (job_id, worker),
+        )
+        return row is not None
+
+    def fail_evaluation_job(self, job_id: int, worker: str, error: str, retry_after: timedelta) -> bool:
+        row = self.client.fetchone(
+            """
+            UPDATE llm_evaluation_jobs
+            SET state = CASE WHEN attempts < max_attempts THEN 'pending' ELSE 'failed' END,
+                run_after = NOW() + %s, last_error = %s, leased_by = NULL, leased_until = NULL, updated_at = NOW()
+            WHERE id = %s AND leased_by = %s
+            RETURNING id
+            """,
+            (retry_after, error, job_id, worker),
+        )
+        return row is not None
+
+    def get_evaluation_job_progress(self, prompt_type: str | None = None, failures: int = 10) -> EvaluationJobProgress:
+        where = "WHERE j.prompt_type = %(prompt_type)s" if prompt_type else ""
+        params = {"prompt_type": prompt_type, "failures": failures}
+        counts = {
+            row["state"]: row["count"]
+            for row in self.client.fetchall(
+                f"SELECT j.state, count(*) AS count FROM llm_evaluation_jobs j {where} GROUP BY j.state", params
+            )
+        }
+        failed = self.client.fetchall(
+            f"""
+            SELECT d.slug, j.prompt_type, j.state, j.attempts, j.max_attempts, j.last_error, j.run_after, j.updated_at
+            FROM llm_evaluation_jobs j
+            JOIN datasets d ON d.id = j.dataset_id
+            {where or "WHERE TRUE"} AND j.last_error IS NOT NULL
+            ORDER BY j.updated_at DESC
+            LIMIT %(failures)s
+            """,
+            params,
+        )
+        return EvaluationJobProgress(counts={state: counts.get(state, 0) for state in JOB_STATES}, failures=failed)
@@ -1,3 +1,4 @@
+from datetime import datetime
 from uuid import UUID
 
 from domain.platform.aggregate import Platform
@@ -32,3 +33,20 @@ class InMemoryPlatformRepository(PlatformRepository):
 
     def save_sync(self, platform_id, payload):
         self.syncs.append({"platform_id": platform_id, **payload})
+
+    def save_incremental_sync(self, platform_id, payload):
+        self.syncs.append({"platform_id": platform_id, **payload})
+
+    def get_high_water_mark(self, platform_id: UUID) -> datetime | None:
+        marks = [
+            item["high_water_mark"]
+            for item in self.syncs
+            if item["platform_id"] == platform_id and item.get("high_water_mark")
+        ]
+        return max(marks, default=None)
+
+    def get_retry_datasets(self, platform_id: UUID) -> dict[str, int]:
+        runs = [item for item in self.syncs if item["platform_id"] == platform_id and item.get("high_water_mark")]
+        if not runs:
+            return {}
+        return dict(max(runs, key=lambda item: item["high_water_mark"]).get("retry_datasets", {}))
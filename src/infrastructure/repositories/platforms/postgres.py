@@ -1,4 +1,7 @@
 import uuid
+from datetime import datetime
+
+from psycopg2.extras import Json
 
 from domain.platform.aggregate import Platform
 from domain.platform.ports import PlatformRepository
@@ -66,6 +69,39 @@ class PostgresPlatformRepository(PlatformRepository):
             (str(platform_id), payload["timestamp"], payload["status"], payload["datasets_count"]),
         )
 
+    def save_incremental_sync(self, platform_id: uuid.UUID, payload: dict) -> None:
+        """Record an incremental or metrics-only sync without touching the platform totals."""
+        self.client.execute(
+            "INSERT INTO platform_sync_histories "
+            "(platform_id, timestamp, status, datasets_count, mode, high_water_mark, retry_datasets) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s)",
+            (
+                str(platform_id),
+                payload["timestamp"],
+                payload["status"],
+                payload["datasets_count"],
+                payload["mode"],
+                payload.get("high_water_mark"),
+                Json(payload.get("retry_datasets", {})),
+            ),
+        )
+
+    def get_high_water_mark(self, platform_id: uuid.UUID) -> datetime | None:
+        row = self.client.fetchone(
+            "SELECT max(high_water_mark) AS high_water_mark FROM platform_sync_histories WHERE platform_id = %s;",
+            (str(platform_id),),
+        )
+        return row["high_water_mark"] if row else None
+
+    def get_retry_datasets(self, platform_id: uuid.UUID) -> dict[str, int]:
+        row = self.client.fetchone(
+            "SELECT retry_datasets FROM platform_sync_histories "
+            "WHERE platform_id = %s AND high_water_mark IS NOT NULL "
+            "ORDER BY high_water_mark DESC LIMIT 1;",
+            (str(platform_id),),
+        )
+        return dict(row["retry_datasets"]) if row else {}
+
     def all(self) -> list[Platform]:
         """Retrieve all registered platforms as aggregates."""
         rows = self.client.fetchall("""
@@ -1,6 +1,13 @@
+import asyncio
+import queue
+import threading
+from concurrent.futures import Executor, Future
+from functools import partial
+
+from domain.common.ports import NullReadModelCache, ReadModelCache
 from domain.datasets.ports import AbstractDatasetRepository
 from domain.platform.ports import PlatformRepository
-from domain.unit_of_work import UnitOfWork
+from domain.unit_of_work import AsyncUnitOfWork, UnitOfWork
 from infrastructure.database.postgres import PostgresClient
 from infrastructure.repositories.auth.in_memory import InMemoryUserRepository
 from infrastructure.repositories.auth.postgres import PostgresUserRepository
@@ -11,15 +18,22 @@ from infrastructure.repositories.platforms.postgres import PostgresPlatformRepos
 
 
 class PostgresUnitOfWork(UnitOfWork):
-    def __init__(self, client: PostgresClient):
+    def __init__(self, client: PostgresClient, cache: ReadModelCache | None = None):
         self.client = client
+        self.cache = cache or NullReadModelCache()
         self._platforms = None
         self._datasets = None
         self._users = None
-        self._in_transaction = False
+        # The app shares one unit of work across threads: transaction state is tracked per thread
+        self._local = threading.local()
+
+    @property
+    def _in_transaction(self) -> bool:
+        return getattr(self._local, "depth", 0) > 0
 
     def __enter__(self):
-        self._in_transaction = True
+        self.client.begin()
+        self._local.depth = getattr(self._local, "depth", 0) + 1
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -29,7 +43,8 @@ class PostgresUnitOfWork(UnitOfWork):
             else:
                 self.commit()
         finally:
-            self._in_transaction = False
+            self._local.depth -= 1
+            self.client.end()
 
     def commit(self):
         if self._in_transaction:
@@ -63,7 +78,8 @@ class PostgresUnitOfWork(UnitOfWork):
 
 
 class InMemoryUnitOfWork(UnitOfWork):
-    def __init__(self):
+    def __init__(self, cache: ReadModelCache | None = None):
+        self.cache = cache or NullReadModelCache()
         self._platforms = InMemoryPlatformRepository([])
         self._datasets = InMemoryDatasetRepository([])
         self._users = InMemoryUserRepository([])
@@ -100,3 +116,103 @@ class InMemoryUnitOfWork(UnitOfWork):
     @property
     def users(self) -> InMemoryUserRepository:
         return self._users
+
+
+_COMMIT = object()
+_ROLLBACK = object()
+
+
+class _RollbackRequestedError(Exception):
+    pass
+
+
+class AsyncRepository:
+    """Awaitable view of a blocking repository: each method call is run by `runner` and returns a coroutine."""
+
+    def __init__(self, repository, runner):
+        self._repository = repository
+        self._runner = runner
+
+    def __getattr__(self, name):
+        attribute = getattr(self._repository, name)
+        if not callable(attribute):
+            return attribute
+
+        async def call(*args, **kwargs):
+            return await self._runner(attribute, *args, **kwargs)
+
+        return call
+
+
+class ThreadedAsyncUnitOfWork(AsyncUnitOfWork):
+    """
+    Async unit of work for the API, on top of a blocking UnitOfWork.
+
+    Each `async with` block is served by one worker thread of `executor` which holds the blocking unit of work,
+    hence a single pooled connection, for the whole block while the event loop keeps serving other requests.
+    The executor is sized like the connection pool, so concurrency scales with connections.
+    Instances hold the state of one block: create one per request.
+    """
+
+    def __init__(self, uow: UnitOfWork, executor: Executor):
+        self.uow = uow
+        self.executor = executor
+        self._calls: queue.SimpleQueue | None = None
+        self._session: asyncio.Future | None = None
+
+    async def __aenter__(self):
+        self._calls = queue.SimpleQueue()
+        self._session = asyncio.wrap_future(self.executor.submit(self._serve, self._calls))
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._calls.put(_ROLLBACK if exc_type is not None else _COMMIT)
+        try:
+            await self._session
+        finally:
+            self._calls = None
+            self._session = None
+
+    async def run(self, fn, *args, **kwargs):
+        if self._calls is None:
+            async with self:
+                return await self.run(fn, *args, **kwargs)
+        call = Future()
+        self._calls.put((partial(fn, *args, **kwargs), call))
+        return await asyncio.wrap_future(call)
+
+    async def commit(self):
+        await self.run(self.uow.commit)
+
+    async def rollback(self):
+        await self.run(self.uow.rollback)
+
+    @property
+    def platforms(self) -> AsyncRepository:
+        return AsyncRepository(self.uow.platforms, self.run)
+
+    @property
+    def datasets(self) -> AsyncRepository:
+        return AsyncRepository(self.uow.datasets, self.run)
+
+    @property
+    def users(self) -> AsyncRepository:
+        return AsyncRepository(self.uow.users, self.run)
+
+    def _serve(self, calls: queue.SimpleQueue) -> None:
+        try:
+            with self.uow:
+                while True:
+                    item = calls.get()
+                    if item is _COMMIT:
+                        return
+                    if item is _ROLLBACK:
+                        raise _RollbackRequestedError
+                    fn, call = item
+                    if call.set_running_or_notify_cancel():
+                        try:
+                            call.set_result(fn())
+                        except Exception as e:
+                            call.set_exception(e)
+        except _RollbackRequestedError:
+            pass
@@ -1,15 +1,28 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 
 from domain.auth.aggregate import User
 from domain.auth.exceptions import UnauthorizedError, UserNotFoundError
+from domain.common.ports import ReadModelCache
 from settings import ALGORITHM, SECRET_KEY
 from settings import app as domain_app
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 
+async def read_through(cache: ReadModelCache, namespace: str, key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+    """Serve a read model from the cache, loading and storing it on a miss."""
+    value = cache.get(namespace, key)
+    if value is None:
+        value = await load()
+        cache.set(namespace, key, value)
+    return value
+
+
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     """Dependency to retrieve the current authenticated user from a JWT."""
     try:
@@ -20,8 +33,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     except JWTError:
         raise UnauthorizedError("Invalid token: failed to decode")
 
-    with domain_app.uow as uow:
-        user = uow.users.get_by_email(email)
-        if user is None:
-            raise UserNotFoundError(f"User not found for email: {email}")
-        return user
+    user = await domain_app.async_uow().users.get_by_email(email)
+    if user is None:
+        raise UserNotFoundError(f"User not found for email: {email}")
+    return user
@@ -12,6 +12,7 @@ from domain.datasets.exceptions import (
     DatasetNotDeletedError,
     DatasetNotFoundError,
     DatasetUnreachableError,
+    InvalidCursorError,
     InvalidMetricValueError,
 )
 from domain.platform.exceptions import InvalidPlatformTypeError, PlatformNotFoundError
@@ -65,6 +66,7 @@ def register_error_handlers(app: FastAPI):
     @app.exception_handler(DatasetAlreadyDeletedError)
     @app.exception_handler(DatasetNotDeletedError)
     @app.exception_handler(InvalidPlatformTypeError)
+    @app.exception_handler(InvalidCursorError)
     async def bad_request_handler(request: Request, exc: Exception):
         return create_problem_response(
             status_code=400, title="Bad Request", detail=str(exc), type_str="bad-request", instance=str(request.url)
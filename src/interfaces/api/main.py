@@ -11,6 +11,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from interfaces.api.errors import register_error_handlers
 from interfaces.api.routers import analytics, auth, common, datasets, platforms, publishers
 from settings import ENV
+from settings import app as domain_app
 
 # Configuration de l'application FastAPI
 api_app = FastAPI(
@@ -50,4 +51,9 @@ api_app.include_router(analytics.router, prefix="/api/v1")
 @api_app.get("/health")
 async def health_check():
     """Point de contrôle de santé de l'API"""
-    return {"status": "healthy", "environment": ENV, "version": "1.0.0"}
+    health = {"status": "healthy", "environment": ENV, "version": "1.0.0"}
+    pool = getattr(getattr(domain_app.uow, "client", None), "pool", None)
+    if pool is not None:
+        health["database_pool"] = pool.stats()
+    health["read_model_cache"] = domain_app.uow.cache.stats()
+    return health
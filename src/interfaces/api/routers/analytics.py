@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
 
-from interfaces.api.dependencies import get_current_user
+from domain.common.ports import ANALYTICS
+from interfaces.api.dependencies import get_current_user, read_through
 from settings import app as domain_app
 
 router = APIRouter(prefix="/analytics", tags=["analytics"], dependencies=[Depends(get_current_user)])
@@ -21,11 +22,13 @@ async def get_direction_health():
     FROM direction_health_stats_view
     ORDER BY score_global DESC
     """
-    # Use the database client from the repository
-    results = domain_app.dataset.repository.client.fetchall(query)
-
-    # Return raw results; FastAPI handles JSON conversion
-    return results
+    # Use the database client from the repository, off the event loop; cached until the next sync
+    return await read_through(
+        domain_app.uow.cache,
+        ANALYTICS,
+        "direction-health",
+        lambda: domain_app.async_uow().run(domain_app.uow.datasets.client.fetchall, query),
+    )
 
 
 @router.get("/summary")
@@ -43,5 +46,9 @@ async def get_summary_stats():
          JOIN datasets d ON d.id = dq.dataset_id WHERE NOT d.deleted AND dq.health_score < 50) as crises_count,
         (SELECT COUNT(*) FROM platforms) as total_platforms
     """
-    result = domain_app.dataset.repository.client.fetchone(query)
-    return result
+    return await read_through(
+        domain_app.uow.cache,
+        ANALYTICS,
+        "summary",
+        lambda: domain_app.async_uow().run(domain_app.uow.datasets.client.fetchone, query),
+    )
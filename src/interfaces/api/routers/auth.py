@@ -25,7 +25,7 @@ async def login(form_data: Annotated[OAuth2PasswordRequestForm, Depends()]):
     """
     Classic username/password login for local users.
     """
-    user = domain_app.uow.users.get_by_email(form_data.username)
+    user = await domain_app.async_uow().users.get_by_email(form_data.username)
     if not user or not verify_password(form_data.password, user.hashed_password):
         raise UnauthorizedError("Incorrect email or password")
 
@@ -72,7 +72,7 @@ async def auth_callback(code: str, state: str, x_beta_feature: Annotated[str | N
 
         # 3. Map to local user (JIT Provisioning)
         user_service = OIDCUserService(domain_app.uow.users)
-        user = user_service.get_or_create_user(user_info)
+        user = await domain_app.async_uow().run(user_service.get_or_create_user, user_info)
 
         # 4. Create local JWT session
         access_token = create_access_token(data={"sub": user.email})
@@ -29,7 +29,7 @@ async def get_publishers_endpoint():
     Mais retourne les données au format JSON au lieu de créer un fichier CSV.
     """
     use_case = GetPublishersStatsUseCase(uow=domain_app.uow)
-    output = use_case.handle()
+    output = await domain_app.async_uow().run(use_case.handle)
     publishers_data = output.stats
 
     # Transform raw data to Pydantic models
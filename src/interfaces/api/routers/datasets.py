@@ -1,3 +1,6 @@
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from typing import Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
@@ -12,6 +15,8 @@ from interfaces.api.schemas.datasets import (
     DatasetAPI,
     DatasetCreateResponse,
     DatasetDetailAPI,
+    DatasetMetricsDeltasResponse,
+    DatasetMetricsResponse,
     DatasetResponse,
     DatasetVersionsResponse,
 )
@@ -26,18 +31,19 @@ async def add_dataset(url: str):
     Ajoute un dataset à la base de données à partir de son URL source.
     Supporte ODS (explore/dataset/...) et DataGouv.
     """
-    platform = find_platform_from_url(app=domain_app, url=url)
+    uow = domain_app.async_uow()
+    platform = await uow.run(find_platform_from_url, app=domain_app, url=url)
     if not platform:
         raise PlatformNotFoundError(f"No platform found for URL: {url}")
 
-    dataset_id = find_dataset_id_from_url(app=domain_app, url=url)
+    dataset_id = await uow.run(find_dataset_id_from_url, app=domain_app, url=url)
     if not dataset_id:
         raise DatasetNotFoundError(f"Could not extract dataset ID from URL: {url}")
 
     # Pattern Strict Command: InputDTO -> Handle
     use_case = SyncDatasetUseCase(uow=domain_app.uow)
     command = SyncDatasetCommand(platform=platform, platform_dataset_id=dataset_id)
-    output = use_case.handle(command)
+    output = await uow.run(use_case.handle, command)
 
     if output.status == "failed":
         # For now we keep ValueError for business failures if no specific exception exists
@@ -66,7 +72,8 @@ async def get_tests():
     WHERE d.slug ILIKE '%test%' AND p.type = 'opendatasoft'
     ORDER BY timestamp DESC
     """
-    datasets_raw = domain_app.dataset.repository.client.fetchall(query)
+    uow = domain_app.async_uow()
+    datasets_raw = await uow.run(domain_app.uow.datasets.client.fetchall, query)
     datasets_list = [
         DatasetAPI(
             id=dataset["id"],
@@ -99,13 +106,15 @@ async def list_datasets(
     modified_from: str | None = None,
     modified_to: str | None = None,
     q: str | None = None,
-    sort_by: str = Query(  # noqa: B008
-        "modified",
-        pattern="^(created|modified|publisher|title|api_calls_count|downloads_count|versions_count|popularity_score|views_count|reuses_count|followers_count|health_score|size_bytes|records_count)$",
+    sort_by: str | None = Query(  # noqa: B008
+        None,
+        pattern="^(created|modified|publisher|title|api_calls_count|downloads_count|versions_count|popularity_score|views_count|reuses_count|followers_count|health_score|size_bytes|records_count|relevance)$",
     ),
     order: str = Query("desc", pattern="^(asc|desc)$"),  # noqa: B008
     page: int = 1,
     page_size: int = 25,
+    cursor: str | None = None,
+    with_total: bool | None = None,
     include_counts: bool = True,
     is_deleted: bool | None = None,
     min_health: float | None = None,
@@ -113,8 +122,11 @@ async def list_datasets(
 ):
     """
     Liste paginée de datasets.
+    Passer le `next_cursor` renvoyé pour obtenir la page suivante à coût constant (pagination par clé).
+    Le total n'est compté par défaut que pour la première page.
+    Avec `q`, le tri par défaut est la pertinence (recherche plein texte).
     """
-    items, total = domain_app.dataset.repository.search(
+    items, total, next_cursor = await domain_app.async_uow().datasets.search_page(
         platform_id=platform_id,
         publisher=publisher,
         q=q,
@@ -123,15 +135,17 @@ async def list_datasets(
         modified_from=modified_from,
         modified_to=modified_to,
         is_deleted=is_deleted,
-        sort_by=sort_by,
+        sort_by=sort_by or ("relevance" if q else "modified"),
         order=order,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        with_total=cursor is None if with_total is None else with_total,
         min_health=min_health,
         max_health=max_health,
     )
 
-    return DatasetResponse(datasets=items, total_datasets=total)
+    return DatasetResponse(datasets=items, total_datasets=total, next_cursor=next_cursor)
 
 
 @router.get("/{dataset_id}", response_model=DatasetDetailAPI)
@@ -140,29 +154,67 @@ async def get_dataset_detail(dataset_id: str, include_snapshots: bool = False):
     Détail d'un dataset avec snapshot courant.
     dataset_id peut être un UUID ou un slug.
     """
-    uid = None
-    try:
-        uid = UUID(dataset_id)
-    except ValueError:
-        # Fallback to slug lookup
-        uid = domain_app.dataset.repository.get_id_by_slug_globally(dataset_id)
-
-    if not uid:
-        raise DatasetNotFoundError(f"Dataset not found: {dataset_id}")
-
-    detail = domain_app.dataset.repository.get_detail(uid, include_snapshots)
+    async with domain_app.async_uow() as uow:
+        uid = None
+        try:
+            uid = UUID(dataset_id)
+        except ValueError:
+            # Fallback to slug lookup
+            uid = await uow.datasets.get_id_by_slug_globally(dataset_id)
+
+        if not uid:
+            raise DatasetNotFoundError(f"Dataset not found: {dataset_id}")
+
+        detail = await uow.datasets.get_detail(uid, include_snapshots)
     if not detail:
         raise DatasetNotFoundError(f"Dataset not found (repo): {uid}")
     return detail
 
 
 @router.get("/{dataset_id}/versions", response_model=DatasetVersionsResponse)
-async def get_dataset_versions(dataset_id: UUID, page: int = 1, page_size: int = 10, include_data: bool = False):
+async def get_dataset_versions(
+    dataset_id: UUID, page: int = 1, page_size: int = 10, include_data: bool = False, cursor: str | None = None
+):
     """
     Liste paginée des versions (snapshots) d'un dataset.
     """
-    items, total = domain_app.dataset.repository.get_versions(dataset_id, page, page_size, include_data)
-    return {"versions": items, "total_versions": total, "page": page, "page_size": page_size}
+    items, total, next_cursor = await domain_app.async_uow().datasets.get_versions_page(
+        dataset_id, page, page_size, include_data, cursor
+    )
+    return {
+        "versions": items,
+        "total_versions": total,
+        "page": page,
+        "page_size": page_size,
+        "next_cursor": next_cursor,
+    }
+
+
+@router.get("/{dataset_id}/metrics", response_model=DatasetMetricsResponse)
+async def get_dataset_metrics(
+    dataset_id: UUID, granularity: Literal["day", "week", "month"] = "day", since: datetime | None = None
+):
+    """
+    Série temporelle des compteurs d'un dataset (dernière valeur de chaque jour, semaine ou mois UTC).
+    """
+    points = await domain_app.async_uow().datasets.get_metrics_series(dataset_id, granularity, since)
+    return {"granularity": granularity, "points": points}
+
+
+@router.get("/{dataset_id}/metrics/deltas", response_model=DatasetMetricsDeltasResponse)
+async def get_dataset_metrics_deltas(dataset_id: UUID, days: list[int] = Query([7, 30])):  # noqa: B008
+    """
+    Évolution des compteurs d'un dataset sur les derniers jours (7 et 30 par défaut).
+    """
+    now = datetime.now(timezone.utc)
+    deltas = []
+    async with domain_app.async_uow() as uow:
+        for window in days:
+            for delta in await uow.datasets.get_metrics_deltas(now - timedelta(days=window), [dataset_id]):
+                deltas.append({"days": window, **asdict(delta)})
+    if not deltas:
+        raise DatasetNotFoundError(f"No metrics for dataset: {dataset_id}")
+    return {"deltas": deltas}
 
 
 @router.get("/publisher/{publisher_name}", response_model=DatasetResponse)
@@ -170,18 +222,31 @@ async def get_by_publisher(publisher_name: str):
     """
     Récupère la liste des datasets liés à un publisher précis.
     """
-    items, total = domain_app.dataset.repository.search(publisher=publisher_name, page_size=1000)
+    datasets = domain_app.async_uow().datasets
+    items, total, cursor = await datasets.search_page(publisher=publisher_name, page_size=100)
+    while cursor:
+        page_items, _, cursor = await datasets.search_page(
+            publisher=publisher_name, page_size=100, cursor=cursor, with_total=False
+        )
+        items.extend(page_items)
     return DatasetResponse(datasets=items, total_datasets=total)
 
 
 @router.post("/{dataset_id}/evaluate")
-async def evaluate_dataset(dataset_id: UUID):
+async def evaluate_dataset(dataset_id: UUID, refresh: bool = False):
     """
     Déclenche une évaluation de qualité par LLM pour un dataset.
+    Si ses métadonnées ont déjà été évaluées avec le même prompt et le même modèle, l'évaluation
+    en cache est renvoyée (`cached: true`) sans appel au LLM, sauf avec `refresh=true`.
     """
-    use_case = EvaluateDatasetUseCase(uow=domain_app.uow, evaluator=domain_app.evaluator, mappers=domain_app.mappers)
-    command = EvaluateDatasetCommand(dataset_id=dataset_id)
-    output = use_case.handle(command)
+    use_case = EvaluateDatasetUseCase(
+        uow=domain_app.uow,
+        evaluator=domain_app.evaluator,
+        mappers=domain_app.mappers,
+        db_executor=domain_app.db_executor,
+    )
+    command = EvaluateDatasetCommand(dataset_id=dataset_id, refresh=refresh)
+    output = await use_case.ahandle(command)
 
     if output.status == "failed":
         raise ValueError(output.error)
@@ -198,7 +263,7 @@ async def get_audit_report(dataset_id: UUID):
 
     from application.services.headless_report import PlaywrightReportGenerator
 
-    dataset = domain_app.dataset.repository.get(dataset_id)
+    dataset = await domain_app.async_uow().datasets.get(dataset_id)
     if not dataset:
         raise DatasetNotFoundError(f"Dataset not found: {dataset_id}")
 
@@ -24,7 +24,7 @@ async def get_platforms():
     Retrieve the list of all configured open data platforms.
     Useful for obtaining platform IDs and tracking synchronization health.
     """
-    platforms = domain_app.platform.get_all_platforms()
+    platforms = await domain_app.async_uow().run(domain_app.platform.get_all_platforms)
     return PlatformsResponse(
         platforms=[PlatformDTO.model_validate(p) for p in platforms], total_platforms=len(platforms)
     )
@@ -46,12 +46,13 @@ async def create_platform_endpoint(platform: PlatformCreateDTO):
         url=platform.url,
         key=platform.key,
     )
-    output = use_case.handle(command)
+    uow = domain_app.async_uow()
+    output = await uow.run(use_case.handle, command)
 
     if output.status == "failed":
         raise RuntimeError(f"Failed to create platform: {output.message}")
 
-    platform_raw = domain_app.platform.get(output.platform_id)
+    platform_raw = await uow.run(domain_app.platform.get, output.platform_id)
     if not platform_raw:
         raise PlatformNotFoundError(f"Platform created but not found: {output.platform_id}")
 
@@ -66,7 +67,7 @@ async def sync_platform_endpoint(id: UUID):
     """
     use_case = SyncPlatformUseCase(uow=domain_app.uow)
     command = SyncPlatformCommand(platform_id=id)
-    output = use_case.handle(command)
+    output = await domain_app.async_uow().run(use_case.handle, command)
 
     if output.status == "failed":
         raise PlatformNotFoundError(output.message)
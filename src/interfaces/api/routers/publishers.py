@@ -2,6 +2,8 @@ from uuid import UUID
 
 from fastapi import APIRouter
 
+from domain.common.ports import PUBLISHERS
+from interfaces.api.dependencies import read_through
 from settings import app as domain_app
 
 router = APIRouter(prefix="/publishers", tags=["publishers"])
@@ -14,5 +16,10 @@ async def get_publishers(platform_id: UUID | None = None, q: str | None = None,
     Retrieve the list of unique publishers (organizations) from indexed datasets.
     Supports filtering by platform and name search.
     """
-    items = domain_app.dataset.repository.list_publishers(platform_id=platform_id, q=q, limit=limit)
+    items = await read_through(
+        domain_app.uow.cache,
+        PUBLISHERS,
+        f"{platform_id}:{q}:{limit}",
+        lambda: domain_app.async_uow().datasets.list_publishers(platform_id=platform_id, q=q, limit=limit),
+    )
     return {"items": items}
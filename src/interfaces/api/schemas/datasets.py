@@ -4,7 +4,7 @@ Self-documenting schemas using type annotations and minimal descriptions.
 """
 
 import datetime
-from typing import Annotated
+from typing import Annotated, Literal
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -120,8 +120,8 @@ class SnapshotVersionAPI(BaseModel):
     followers_count: PositiveInt | None = None
     popularity_score: Score | None = None
 
-    # Backend-calculated diff from previous version
-    diff: dict | None = None
+    # Backend-calculated diff from previous version: JSON-Patch-style operations (legacy versions: nested dict)
+    diff: list[dict] | dict | None = None
 
     # Full snapshot data (only when include_data=true)
     data: dict | None = None
@@ -141,7 +141,8 @@ class DatasetResponse(BaseModel):
     """Paginated list of datasets."""
 
     datasets: list[DatasetAPI]
-    total_datasets: int
+    total_datasets: int | None = None  # Only counted when requested (first page by default)
+    next_cursor: str | None = None  # Opaque keyset cursor, None on the last page
 
 
 class DatasetDetailAPI(DatasetAPI):
@@ -160,3 +161,54 @@ class DatasetVersionsResponse(BaseModel):
     total_versions: int
     page: int  # 1-indexed
     page_size: int
+    next_cursor: str | None = None
+
+
+# ============================================================================
+# Metrics Time Series
+# ============================================================================
+
+
+class MetricsPointAPI(BaseModel):
+    """Counters at the end of a period, with their growth over the previous period."""
+
+    period: datetime.datetime  # Start of the UTC day, ISO week or month
+    last_ts: datetime.datetime  # Sample the counters come from
+    downloads_count: int | None = None
+    api_calls_count: int | None = None
+    views_count: int | None = None
+    reuses_count: int | None = None
+    followers_count: int | None = None
+    popularity_score: float | None = None
+    downloads_delta: int | None = None
+    api_calls_delta: int | None = None
+    views_delta: int | None = None
+    reuses_delta: int | None = None
+    followers_delta: int | None = None
+
+
+class DatasetMetricsResponse(BaseModel):
+    """Metrics time series of a dataset."""
+
+    granularity: Literal["day", "week", "month"]
+    points: list[MetricsPointAPI]
+
+
+class MetricsDeltaAPI(BaseModel):
+    """Growth of the counters over the last `days` days."""
+
+    days: int
+    since: datetime.datetime  # Reference sample (the first one for datasets followed more recently)
+    until: datetime.datetime
+    downloads_count: int | None = None
+    api_calls_count: int | None = None
+    views_count: int | None = None
+    reuses_count: int | None = None
+    followers_count: int | None = None
+    popularity_score: float | None = None
+
+
+class DatasetMetricsDeltasResponse(BaseModel):
+    """Growth of the counters of a dataset over several windows."""
+
+    deltas: list[MetricsDeltaAPI]
@@ -1,3 +1,4 @@
+import asyncio
 import csv
 import json
 import os
@@ -12,12 +13,24 @@ from application.handlers import (
     find_dataset_id_from_url,
     find_platform_from_url,
 )
+from application.use_cases.compact_dataset_versions import (
+    CompactDatasetVersionsCommand,
+    CompactDatasetVersionsUseCase,
+)
 from application.use_cases.create_platform import CreatePlatformCommand, CreatePlatformUseCase
 from application.use_cases.get_publishers_stats import GetPublishersStatsUseCase
+from application.use_cases.refresh_dataset_metrics import RefreshDatasetMetricsCommand, RefreshDatasetMetricsUseCase
 from application.use_cases.sync_dataset import SyncDatasetCommand, SyncDatasetUseCase
+from application.use_cases.sync_datasets_batch import SyncDatasetsBatchCommand, SyncDatasetsBatchUseCase
 from application.use_cases.sync_platform import SyncPlatformCommand, SyncPlatformUseCase
+from application.use_cases.sync_platform_incremental import (
+    IncrementalSyncPlatformCommand,
+    IncrementalSyncPlatformUseCase,
+)
 from domain.auth.aggregate import User
+from domain.common.ports import ANALYTICS
 from domain.datasets.exceptions import DatasetUnreachableError
+from infrastructure.factories.dataset import DatasetAdapterFactory
 from infrastructure.security import get_password_hash
 from interfaces.cli_impact import cli_impact
 from interfaces.cli_quality import cli_quality
@@ -84,6 +97,31 @@ def cli_sync_platform(id):
     pprint(result.__dict__)
 
 
+@cli_platform.command("sync-incremental")
+@click.argument("id")
+@click.option("--since", type=click.DateTime(), default=None, help="Override the stored high-water mark")
+def cli_sync_platform_incremental(id, since):
+    """Sync only datasets modified since the last incremental run"""
+    use_case = IncrementalSyncPlatformUseCase(uow=app.uow)
+    output = use_case.handle(IncrementalSyncPlatformCommand(platform_id=UUID(id), since=since))
+    if output.status == "failed":
+        click.echo(f"❌ Incremental sync failed: {output.message}")
+    else:
+        click.echo(f"✅ Incremental sync {output.status}: {output.datasets_count} synced ({output.message})")
+
+
+@cli_platform.command("refresh-metrics")
+@click.argument("id")
+def cli_refresh_platform_metrics(id):
+    """Refresh dataset counters only (no metadata fetch)"""
+    use_case = RefreshDatasetMetricsUseCase(uow=app.uow)
+    output = use_case.handle(RefreshDatasetMetricsCommand(platform_id=UUID(id)))
+    if output.status == "failed":
+        click.echo(f"❌ Metrics refresh failed: {output.message}")
+    else:
+        click.echo(f"✅ Metrics refreshed: {output.updated_count} datasets updated")
+
+
 @cli.group("dataset")
 def cli_dataset():
     """Dataset management"""
@@ -109,6 +147,51 @@ def cli_add_dataset(url, output):
         pass
 
 
+@cli_dataset.command("refresh")
+@click.argument("platform_id")
+@click.option("-b", "--batch-size", default=500, show_default=True, help="Datasets committed per batch")
+def cli_refresh_datasets(platform_id, batch_size):
+    """Refetch every known dataset of a platform concurrently and sync them"""
+    platform = app.platform.get(platform_id=UUID(platform_id))
+    with app.uow:
+        slugs = [str(d.slug) for d in app.uow.datasets.get_sync_states(platform_id=platform.id).values()]
+
+    adapter = DatasetAdapterFactory().create(platform_type=platform.type)
+    results = asyncio.run(adapter.afetch_many(platform.url, platform.key, slugs))
+    unreachable = [slug for slug, result in results.items() if isinstance(result, Exception)]
+    for slug in unreachable:
+        logger.warning(f"{platform.type.upper()} - {slug} - {results[slug]!r}")
+
+    raw_datasets = [result for result in results.values() if not isinstance(result, Exception)]
+    output = SyncDatasetsBatchUseCase(uow=app.uow).handle(
+        SyncDatasetsBatchCommand(platform=platform, datasets=raw_datasets, batch_size=batch_size)
+    )
+    click.echo(
+        f"✅ {output.success_count} synced, {output.failed_count} failed, "
+        f"{output.skipped_count + len(unreachable)} skipped ({len(unreachable)} unreachable)"
+    )
+
+
+@cli_dataset.command("compact-versions")
+@click.option("--daily-after", default=30, show_default=True, help="Days after which heartbeats are folded per day")
+@click.option("--weekly-after", default=180, show_default=True, help="Days after which heartbeats are folded per week")
+@click.option(
+    "--full", is_flag=True, default=False, help="Fold the whole history instead of resuming from the last run"
+)
+def cli_compact_versions(daily_after, weekly_after, full):
+    """Create the coming version partitions and fold old metrics-only versions into rollups"""
+    output = CompactDatasetVersionsUseCase(uow=app.uow).handle(
+        CompactDatasetVersionsCommand(
+            daily_after_days=daily_after, weekly_after_days=weekly_after, window_days=None if full else 7
+        )
+    )
+    click.echo(
+        f"✅ {output.daily_removed + output.weekly_removed} versions folded "
+        f"({output.daily_removed} daily, {output.weekly_removed} weekly), "
+        f"{output.partitions_created} partitions created"
+    )
+
+
 @cli_dataset.command("fetch")
 @click.argument("dataset_id")
 def cli_fetch_dataset(dataset_id):
@@ -146,6 +229,15 @@ def cli_get_publishers():
     click.echo(f"-> {filename}")
 
 
+@cli_common.command("rebuild-direction-health")
+def cli_rebuild_direction_health():
+    """Recompute the direction health aggregates from scratch (repair)"""
+    with app.uow:
+        app.uow.datasets.rebuild_direction_health()
+    app.uow.cache.invalidate(ANALYTICS)
+    click.echo("✅ Direction health aggregates rebuilt")
+
+
 @cli_platform.group("get")
 def cli_get_datasets():
     """retrieve datasets"""
@@ -1,5 +1,6 @@
 """CLI commands for dataset impact reporting."""
 
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 import click
@@ -37,21 +38,21 @@ def cli_generate_impact_report(dataset_id: str, output: str | None):
                 console.print(f"[red]Error: Dataset {dataset_id} not found.[/red]")
                 return
 
-            # Get dataset with versions
-            dataset = app.uow.datasets.get(uid)
+            # Trends come from the metrics series: the version history is not needed
+            dataset = app.uow.datasets.get(uid, include_versions=False)
             if not dataset:
                 console.print(f"[red]Error: Dataset {uid} not found in repository.[/red]")
                 return
 
-            # Note: The repository.get() should ideally include versions.
-            # If not, we might need a specific method.
-            # Let's check if versions are loaded.
-            if not dataset.versions:
-                # Try to load versions explicitly if repo doesn't do it by default
-                dataset.versions, _ = app.uow.datasets.get_versions(uid, page=1, page_size=100)
+            now = datetime.now(timezone.utc)
+            deltas = {
+                days: delta
+                for days in (7, 30)
+                for delta in app.uow.datasets.get_metrics_deltas(now - timedelta(days=days), [uid])
+            }
 
             generator = ReportGenerator()
-            pdf_buffer = generator.generate_impact_report(dataset)
+            pdf_buffer = generator.generate_impact_report(dataset, deltas)
 
             out_path = output or f"impact_report_{dataset.slug}.pdf"
             with open(out_path, "wb") as f:
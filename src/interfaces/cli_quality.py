@@ -1,10 +1,15 @@
 """CLI commands for metadata quality evaluation."""
 
+import asyncio
+
 import click
 from rich.console import Console
 from rich.table import Table
 
+from application.services.evaluation_worker import EvaluationWorker
 from application.services.quality_assessment import QualityAssessmentService
+from application.use_cases.enqueue_evaluations import EnqueueEvaluationsCommand, EnqueueEvaluationsUseCase
+from application.use_cases.plan_reevaluation import PlanReevaluationCommand, PlanReevaluationUseCase
 from infrastructure.llm.ollama_evaluator import OllamaEvaluator
 from infrastructure.llm.openai_evaluator import OpenAIEvaluator
 from logger import logger
@@ -47,6 +52,7 @@ def cli_quality():
     default="standard",
     help="Prompt template to use (default: standard)",
 )
+@click.option("--refresh", is_flag=True, help="Call the LLM even if the same metadata was already evaluated")
 def cli_evaluate_quality(
     dataset_id: str,
     dcat: str,
@@ -56,6 +62,7 @@ def cli_evaluate_quality(
     output: str,
     report: bool,
     prompt_type: str,
+    refresh: bool,
 ):
     """Evaluate metadata quality for a dataset."""
     console.print(f"\n[bold]Evaluating dataset {dataset_id}...[/bold]\n")
@@ -75,7 +82,16 @@ def cli_evaluate_quality(
             charter_path=charter,
             output=output,
             prompt_type=prompt_type,
+            refresh=refresh,
         )
+        if evaluation.cached:
+            console.print("[dim]Evaluation reused from cache (same metadata, prompt and model).[/dim]")
+        elif evaluation.usage:
+            usage = evaluation.usage
+            console.print(
+                f"[dim]{usage.model}: {usage.prompt_tokens} prompt tokens ({usage.cached_prompt_tokens} cached), "
+                f"{usage.completion_tokens} completion tokens in {usage.latency_ms or 0:.0f} ms.[/dim]"
+            )
 
         # Display results
         report = _display_evaluation(evaluation, output)
@@ -90,6 +106,136 @@ def cli_evaluate_quality(
         console.print(f"[red]Evaluation failed: {e}[/red]")
 
 
+@cli_quality.command("plan")
+@click.option("--threshold", default=10.0, help="Minimal metadata drift (0-100) since the last evaluation")
+@click.option("--budget", default=200, help="LLM evaluations allowed per day, today's included")
+@click.option("--platform", default=None, help="Platform slug")
+@click.option("--limit", default=20, help="Number of queued datasets to display")
+def cli_plan_reevaluation(threshold: float, budget: int, platform: str | None, limit: int):
+    """Show which datasets changed enough since their last evaluation to be evaluated again."""
+    output = PlanReevaluationUseCase(app.uow).handle(
+        PlanReevaluationCommand(drift_threshold=threshold, daily_budget=budget, platform_slug=platform)
+    )
+    plan = output.plan
+    console.print(
+        f"\n[bold]{len(plan.queued)}[/bold] queued, {len(plan.over_budget)} over budget "
+        f"({output.budget_used} evaluations queued or run today), {plan.below_threshold} below threshold, "
+        f"{plan.unchanged} unchanged\n"
+    )
+    table = Table(title="Re-evaluation queue")
+    table.add_column("Dataset", style="cyan")
+    table.add_column("Drift", justify="right")
+    table.add_column("Priority", justify="right")
+    table.add_column("Health", justify="right")
+    table.add_column("Reason")
+    for candidate in plan.queued[:limit]:
+        health = f"{candidate.health_score:.0f}" if candidate.health_score is not None else "-"
+        table.add_row(candidate.slug, f"{candidate.drift:.0f}", f"{candidate.priority:.0f}", health, candidate.reason)
+    console.print(table)
+
+
+@cli_quality.group("queue")
+def cli_queue():
+    """LLM evaluation job queue, shared by the audit workers"""
+    pass
+
+
+@cli_queue.command("enqueue")
+@click.option("--prompt-type", type=click.Choice(["standard", "light"]), default="standard", help="Prompt type")
+@click.option("--platform", default=None, help="Platform slug")
+@click.option("--publisher", default=None, help="Publisher name")
+@click.option("--skip-evaluated", is_flag=True, help="Leave out datasets that already have LLM results")
+@click.option("--limit", default=None, type=int, help="Max datasets to queue, most recently modified first")
+@click.option("--refresh", is_flag=True, help="Call the LLM even if the same metadata was already evaluated")
+@click.option("--requeue", is_flag=True, help="Queue again datasets whose job is done or failed")
+@click.option("--max-attempts", default=3, help="Attempts per job before it is marked failed")
+@click.option("--drift-threshold", default=None, type=float, help="Only the datasets of the re-evaluation plan")
+@click.option("--budget", default=200, help="With --drift-threshold, LLM evaluations allowed per day")
+def cli_queue_enqueue(
+    prompt_type: str,
+    platform: str | None,
+    publisher: str | None,
+    skip_evaluated: bool,
+    limit: int | None,
+    refresh: bool,
+    requeue: bool,
+    max_attempts: int,
+    drift_threshold: float | None,
+    budget: int,
+):
+    """Queue LLM evaluations of the published datasets matching the filters."""
+    output = EnqueueEvaluationsUseCase(app.uow).handle(
+        EnqueueEvaluationsCommand(
+            prompt_type=prompt_type,
+            platform_slug=platform,
+            publisher=publisher,
+            skip_evaluated=skip_evaluated,
+            limit=limit,
+            refresh=refresh,
+            requeue=requeue,
+            max_attempts=max_attempts,
+            drift_threshold=drift_threshold,
+            daily_budget=budget,
+        )
+    )
+    planned = f" (re-evaluation plan: {output.planned} datasets)" if output.planned is not None else ""
+    console.print(f"[green]{output.enqueued} evaluation jobs queued[/green]{planned}")
+
+
+@cli_queue.command("status")
+@click.option("--prompt-type", type=click.Choice(["standard", "light"]), default=None, help="Prompt type")
+@click.option("--failures", default=10, help="Number of last failures to display")
+def cli_queue_status(prompt_type: str | None, failures: int):
+    """Show the progress of the evaluation queue and its last failures."""
+    with app.uow:
+        progress = app.uow.datasets.get_evaluation_job_progress(prompt_type=prompt_type, failures=failures)
+    finished = progress.counts["done"] + progress.counts["failed"]
+    console.print(
+        f"\n[bold]{finished}/{progress.total}[/bold] jobs finished: "
+        + ", ".join(f"{count} {state}" for state, count in progress.counts.items())
+        + "\n"
+    )
+    if not progress.failures:
+        return
+    table = Table(title="Last failures")
+    table.add_column("Dataset", style="cyan")
+    table.add_column("State")
+    table.add_column("Attempts", justify="right")
+    table.add_column("Next attempt")
+    table.add_column("Error", style="red")
+    for failure in progress.failures:
+        retry = f"{failure['run_after']:%Y-%m-%d %H:%M}" if failure["state"] == "pending" else "-"
+        table.add_row(
+            failure["slug"],
+            failure["state"],
+            f"{failure['attempts']}/{failure['max_attempts']}",
+            retry,
+            (failure["last_error"] or "")[:120],
+        )
+    console.print(table)
+
+
+@cli_queue.command("work")
+@click.option("--dcat", default="docs/quality/dcat_reference.md", help="Path to DCAT reference markdown file")
+@click.option("--charter", default="docs/quality/charter_opendata.md", help="Path to Open Data charter markdown file")
+@click.option("--concurrency", default=16, help="Jobs in flight; the evaluator's RPM/TPM limiter paces the calls")
+def cli_queue_work(dcat: str, charter: str, concurrency: int):
+    """
+    Evaluate queued datasets until no job is left to claim. Run as many workers as needed.
+
+    OPENAI_RPM / OPENAI_TPM are paced per process: with several workers, set OPENAI_WORKERS to their number.
+    """
+    service = QualityAssessmentService(
+        evaluator=app.evaluator, uow=app.uow, mappers=app.mappers, db_executor=app.db_executor
+    )
+    worker = EvaluationWorker(service)
+    report = asyncio.run(worker.run(dcat, charter, concurrency=concurrency))
+    console.print(
+        f"[bold]{worker.worker_id}[/bold]: {report.done} done, {report.retried} to retry, {report.failed} failed, "
+        f"{report.lost} lost ({service.cache_stats.hits} from cache, {service.usage_stats.calls} LLM calls)"
+    )
+
+
 @cli_quality.command("report")
 @click.argument("dataset_id")
 def cli_quality_report(dataset_id: str):
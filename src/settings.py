@@ -1,15 +1,18 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from dotenv import load_dotenv
 
 from application.services.dataset import DatasetMonitoring
 from application.services.platform import PlatformMonitoring
-from domain.unit_of_work import UnitOfWork
+from domain.common.ports import ReadModelCache
+from domain.unit_of_work import AsyncUnitOfWork, UnitOfWork
 from infrastructure.adapters.quality.metadata_mappers import DatagouvMetadataMapper, OpendatasoftMetadataMapper
-from infrastructure.database.postgres import PostgresClient
+from infrastructure.cache import InMemoryReadModelCache, RedisReadModelCache
+from infrastructure.database.postgres import PooledPostgresClient, PostgresConnectionPool
 from infrastructure.llm.openai_evaluator import OpenAIEvaluator
-from infrastructure.unit_of_work import InMemoryUnitOfWork, PostgresUnitOfWork
+from infrastructure.unit_of_work import InMemoryUnitOfWork, PostgresUnitOfWork, ThreadedAsyncUnitOfWork
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 ENV_PATH = os.path.join(BASE_DIR, ".env")
@@ -35,16 +38,40 @@ PROCONNECT_FEATURE_LEVEL = os.environ.get("PROCONNECT_FEATURE_LEVEL", "off").low
 
 
 class App:
-    def __init__(self, uow: UnitOfWork):
+    def __init__(self, uow: UnitOfWork, db_workers: int = 10):
         self.uow = uow
+        # Threads running the API database work off the event loop, one per pooled connection
+        self.db_executor = ThreadPoolExecutor(max_workers=db_workers, thread_name_prefix="db")
         self.platform = PlatformMonitoring(repository=uow.platforms)
         self.dataset = DatasetMonitoring(repository=uow.datasets)
-        self.evaluator = OpenAIEvaluator(model_name="gpt-4o-mini")
+        # The limiter lives in this process: the key's limits are shared out between the OPENAI_WORKERS processes
+        # (audit workers, API) calling OpenAI at the same time
+        workers = max(int(os.environ.get("OPENAI_WORKERS", 1)), 1)
+        self.evaluator = OpenAIEvaluator(
+            model_name="gpt-4o-mini",
+            requests_per_minute=int(os.environ.get("OPENAI_RPM", 500)) // workers,
+            tokens_per_minute=int(os.environ.get("OPENAI_TPM", 200_000)) // workers,
+        )
         self.mappers = {
             "opendatasoft": OpendatasoftMetadataMapper(),
             "datagouvfr": DatagouvMetadataMapper(),
         }
 
+    def async_uow(self) -> AsyncUnitOfWork:
+        """New async unit of work for one API request"""
+        return ThreadedAsyncUnitOfWork(self.uow, self.db_executor)
+
+
+def build_read_model_cache() -> ReadModelCache:
+    """Redis-backed when REDIS_URL is set (shared with the sync workers), in-process otherwise."""
+    ttl = float(os.environ.get("CACHE_TTL", 300))
+    redis_url = os.environ.get("REDIS_URL")
+    if redis_url:  # pragma: no cover
+        import redis
+
+        return RedisReadModelCache(redis.Redis.from_url(redis_url), ttl=ttl)
+    return InMemoryReadModelCache(max_entries=int(os.environ.get("CACHE_MAX_ENTRIES", 256)), ttl=ttl)
+
 
 if ENV == "PROD":  # pragma: no cover
     raise NotImplementedError
@@ -53,11 +80,16 @@ elif ENV == "TEST":
     app = App(uow=InMemoryUnitOfWork())
 else:  # pragma: no cover
     print(f"App environment = {ENV}")
-    client = PostgresClient(
+    pool = PostgresConnectionPool(
         dbname=os.environ["DB_NAME"],
         user=os.environ["DB_USER"],
         password=os.environ["DB_PASSWORD"],
         host="localhost",
         port=int(os.environ["DB_PORT"]),
+        min_size=int(os.environ.get("DB_POOL_MIN_SIZE", 1)),
+        max_size=int(os.environ.get("DB_POOL_MAX_SIZE", 10)),
+        timeout=float(os.environ.get("DB_POOL_TIMEOUT", 30)),
+    )
+    app = App(
+        uow=PostgresUnitOfWork(PooledPostgresClient(pool), cache=build_read_model_cache()), db_workers=pool.max_size
     )
-    app = App(uow=PostgresUnitOfWork(client))
@@ -1 +1,30 @@
-WITH filtered_versions AS (SELECT dv.*, d.publisher, d.slug AS dataset_slug, d.created, d.modified, p.type AS platform FROM dataset_versions dv JOIN datasets d ON d.id = dv.dataset_id JOIN platforms p ON p.id = d.platform_id WHERE dv.timestamp >= CURRENT_DATE - INTERVAL '1 week' AND d.restricted IS FALSE AND d.published IS TRUE), ranked_versions AS (SELECT *, ROW_NUMBER() OVER (PARTITION BY dataset_id ORDER BY timestamp ASC) AS rn_earliest, ROW_NUMBER() OVER (PARTITION BY dataset_id ORDER BY timestamp DESC) AS rn_latest FROM filtered_versions), earliest AS (SELECT * FROM ranked_versions WHERE rn_earliest = 1), latest AS (SELECT * FROM ranked_versions WHERE rn_latest = 1)SELECT e.created, e.modified, e.publisher, e.platform, e.dataset_slug, e.timestamp AS first, l.timestamp AS last, l.downloads_count, l.api_calls_count, l.views_count, l.reuses_count, l.followers_count, l.popularity_score, l.downloads_count - e.downloads_count AS downloads_delta, l.api_calls_count - e.api_calls_count AS api_calls_delta, l.views_count - e.views_count AS views_delta, l.reuses_count - e.reuses_count AS reuses_delta, l.followers_count - e.followers_count AS followers_delta FROM earliest e JOIN latest l ON e.dataset_id = l.dataset_id ORDER BY e.created DESC NULLS LAST;
+-- ============================================================================
+-- Deltas des compteurs sur 7 jours, par jeu de données publié
+-- Valeurs courantes lues dans dataset_current, valeur de référence dans la série dataset_metrics :
+-- dernier point au plus tard il y a 7 jours, sinon le premier point (jeu de données plus récent).
+-- Deux lectures d'index par jeu de données, sans parcours de dataset_versions.
+-- ============================================================================
+SELECT d.created, d.modified, d.publisher, p.type AS platform, d.slug AS dataset_slug,
+       ref.ts AS first, dc.version_timestamp AS last,
+       dc.downloads_count, dc.api_calls_count, dc.views_count, dc.reuses_count, dc.followers_count, dc.popularity_score,
+       dc.downloads_count - ref.downloads_count AS downloads_delta,
+       dc.api_calls_count - ref.api_calls_count AS api_calls_delta,
+       dc.views_count - ref.views_count AS views_delta,
+       dc.reuses_count - ref.reuses_count AS reuses_delta,
+       dc.followers_count - ref.followers_count AS followers_delta
+FROM datasets d
+JOIN platforms p ON p.id = d.platform_id
+JOIN dataset_current dc ON dc.dataset_id = d.id
+CROSS JOIN LATERAL (
+    SELECT * FROM (
+        (SELECT * FROM dataset_metrics m
+         WHERE m.dataset_id = d.id AND m.ts <= CURRENT_DATE - INTERVAL '1 week' ORDER BY m.ts DESC LIMIT 1)
+        UNION ALL
+        (SELECT * FROM dataset_metrics m WHERE m.dataset_id = d.id ORDER BY m.ts LIMIT 1)
+    ) candidates
+    LIMIT 1
+) ref
+WHERE dc.version_timestamp >= CURRENT_DATE - INTERVAL '1 week'
+  AND d.restricted IS FALSE
+  AND d.published IS TRUE
+ORDER BY d.created DESC NULLS LAST;
@@ -3,14 +3,16 @@ import os
 os.environ["OPEN_DATA_MONITORING_ENV"] = "TEST"
 
 import json
+import threading
 import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import psycopg2
 import pytest
 
 from application.use_cases.create_platform import CreatePlatformCommand, CreatePlatformUseCase
 from domain.platform.aggregate import Platform
-from infrastructure.database.postgres import PostgresClient
+from infrastructure.database.postgres import PostgresClient, PostgresConnectionPool
 from infrastructure.unit_of_work import InMemoryUnitOfWork, PostgresUnitOfWork
 from settings import App
 from tests.fixtures.fixtures import platform_1
@@ -42,6 +44,34 @@ def datagouv_dataset():
         return json.load(f)
 
 
+@pytest.fixture
+def stub_server():
+    """Local HTTP server: `routes` maps a path to a list of (status, body) replayed in order, the last one sticking."""
+    routes = {}
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split("?")[0]
+            hits.append(self.path)
+            replies = routes.get(path, [(404, {})])
+            status, body = replies.pop(0) if len(replies) > 1 else replies[0]
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}", routes, hits
+    server.shutdown()
+
+
 @pytest.fixture
 def app():
     return App(uow=InMemoryUnitOfWork())
@@ -144,7 +174,9 @@ def db_transaction(setup_test_database):
         # bypassing the mock/yield client.rollback() test strategy.
         client.execute(
             "TRUNCATE TABLE platforms, platform_sync_histories, datasets, dataset_blobs, "
-            "dataset_versions, dataset_quality, users CASCADE;"
+            "dataset_versions, dataset_quality, dataset_current, direction_health_members, direction_health_totals, "
+            "dataset_metrics, dataset_metrics_rollups, dataset_version_compactions, llm_evaluation_cache, "
+            "llm_evaluation_jobs, users CASCADE;"
         )
         client.commit()
     except Exception as e:
@@ -157,6 +189,22 @@ def db_transaction(setup_test_database):
         client.close()
 
 
+@pytest.fixture
+def pg_pool(db_transaction, setup_test_database):
+    pool = PostgresConnectionPool(
+        dbname=setup_test_database,
+        user=TEST_USER,
+        password=TEST_PASSWORD,
+        host=HOST,
+        port=int(PORT),
+        min_size=1,
+        max_size=3,
+        timeout=0.5,
+    )
+    yield pool
+    pool.close()
+
+
 @pytest.fixture
 def pg_app(db_transaction):
     uow = PostgresUnitOfWork(client=db_transaction)
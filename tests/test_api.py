@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import BytesIO
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -6,6 +7,9 @@ from uuid import uuid4
 import pytest
 from fastapi.testclient import TestClient
 
+from domain.datasets.value_objects import DatasetMetricsDelta
+from infrastructure.cache import InMemoryReadModelCache
+from infrastructure.unit_of_work import ThreadedAsyncUnitOfWork
 from interfaces.api.dependencies import get_current_user
 from interfaces.api.main import api_app
 from tests.fixtures.fixtures import platform_1
@@ -24,6 +28,13 @@ def skip_auth_dependency():
 
 
 client = TestClient(api_app)
+executor = ThreadPoolExecutor(max_workers=2)
+
+
+def with_async_uow(mock_app):
+    """Serve the mocked app's blocking unit of work through the real async adapter."""
+    mock_app.async_uow.side_effect = lambda: ThreadedAsyncUnitOfWork(mock_app.uow, executor)
+    return mock_app
 
 
 @pytest.fixture
@@ -32,13 +43,13 @@ def mock_platforms_router():
         patch("interfaces.api.routers.platforms.domain_app") as mock_app,
         patch("interfaces.api.routers.platforms.CreatePlatformUseCase") as mock_uc,
     ):
-        yield mock_app, mock_uc
+        yield with_async_uow(mock_app), mock_uc
 
 
 @pytest.fixture
 def mock_datasets_router():
     with patch("interfaces.api.routers.datasets.domain_app") as mock_app:
-        yield mock_app
+        yield with_async_uow(mock_app)
 
 
 def test_health_check():
@@ -94,6 +105,7 @@ def test_api_list_platforms(mock_platforms_router):
 def test_get_publishers_stats_mock():
     with patch("interfaces.api.routers.common.domain_app") as mock_app:
         # Arrange
+        with_async_uow(mock_app)
         mock_app.uow.datasets.get_publishers_stats.return_value = [{"publisher": "P", "dataset_count": 5}]
         # Act
         res = client.get("/api/v1/common/publishers")
@@ -105,7 +117,7 @@ def test_get_publishers_stats_mock():
 def test_api_list_datasets_tests(mock_datasets_router):
     # Arrange
     mock_app, now = mock_datasets_router, datetime.now()
-    mock_app.dataset.repository.client.fetchall.return_value = [
+    mock_app.uow.datasets.client.fetchall.return_value = [
         {
             "id": uuid4(),
             "platform_id": uuid4(),
@@ -155,23 +167,24 @@ def test_api_list_datasets(mock_datasets_router):
         "deleted": False,
         "quality": {"has_description": True, "is_slug_valid": True, "evaluation_results": None},
     }
-    mock_app.dataset.repository.search.return_value = ([item], 1)
+    mock_app.uow.datasets.search_page.return_value = ([item], 1, "next")
     # Act
     res = client.get("/api/v1/datasets/?q=t")
     # Assert
     assert res.status_code == 200
     assert res.json()["total_datasets"] == 1
+    assert res.json()["next_cursor"] == "next"
 
 
 def test_api_list_datasets_sorting_health(mock_datasets_router):
     # Arrange
     mock_app = mock_datasets_router
-    mock_app.dataset.repository.search.return_value = ([], 0)
+    mock_app.uow.datasets.search_page.return_value = ([], 0, None)
     # Act
     res = client.get("/api/v1/datasets/?sort_by=health_score&order=asc")
     # Assert
     assert res.status_code == 200
-    mock_app.dataset.repository.search.assert_called_with(
+    mock_app.uow.datasets.search_page.assert_called_with(
         platform_id=None,
         publisher=None,
         q=None,
@@ -184,18 +197,34 @@ def test_api_list_datasets_sorting_health(mock_datasets_router):
         order="asc",
         page=1,
         page_size=25,
+        cursor=None,
+        with_total=True,
         min_health=None,
         max_health=None,
     )
 
 
+def test_api_list_datasets_with_cursor_skips_count(mock_datasets_router):
+    # Arrange
+    mock_app = mock_datasets_router
+    mock_app.uow.datasets.search_page.return_value = ([], None, None)
+    # Act
+    res = client.get("/api/v1/datasets/?cursor=abc")
+    # Assert
+    assert res.status_code == 200
+    assert res.json()["total_datasets"] is None
+    kwargs = mock_app.uow.datasets.search_page.call_args.kwargs
+    assert kwargs["cursor"] == "abc"
+    assert kwargs["with_total"] is False
+
+
 def test_get_audit_report(mock_datasets_router):
     # Arrange
     mock_app = mock_datasets_router
     d_id = uuid4()
     p = MagicMock()
     p.id, p.slug = d_id, "s"
-    mock_app.dataset.repository.get.return_value = p
+    mock_app.uow.datasets.get.return_value = p
     with patch("application.services.headless_report.PlaywrightReportGenerator") as mock_gen_cls:
         mock_gen_cls.return_value.generate_audit_report = AsyncMock(return_value=BytesIO(b"%PDF"))
         # Act
@@ -205,6 +234,22 @@ def test_get_audit_report(mock_datasets_router):
     assert res.content.startswith(b"%PDF")
 
 
+def test_get_dataset_metrics_deltas(mock_datasets_router):
+    # Arrange
+    mock_app = mock_datasets_router
+    d_id = uuid4()
+    mock_app.uow.datasets.get_metrics_deltas.return_value = [
+        DatasetMetricsDelta(dataset_id=d_id, since=datetime(2026, 10, 1), until=datetime(2026, 10, 17), views_count=42)
+    ]
+    # Act
+    res = client.get(f"/api/v1/datasets/{d_id}/metrics/deltas?days=7")
+    # Assert
+    assert res.status_code == 200
+    assert res.json()["deltas"][0]["days"] == 7
+    assert res.json()["deltas"][0]["views_count"] == 42
+    assert mock_app.uow.datasets.get_metrics_deltas.call_args.args[1] == [d_id]
+
+
 def test_api_add_dataset(mock_datasets_router):
     # Arrange
     mock_app = mock_datasets_router
@@ -224,3 +269,18 @@ def test_api_add_dataset(mock_datasets_router):
         assert res.status_code == 200
         # Check that use case was instantiated with ONLY uow (not repository)
         mock_uc.assert_called_once_with(uow=mock_app.uow)
+
+
+def test_api_analytics_summary_is_served_from_cache():
+    with patch("interfaces.api.routers.analytics.domain_app") as mock_app:
+        # Arrange
+        with_async_uow(mock_app)
+        mock_app.uow.cache = InMemoryReadModelCache()
+        mock_app.uow.datasets.client.fetchone.return_value = {"total_datasets": 2}
+        # Act
+        first = client.get("/api/v1/analytics/summary")
+        second = client.get("/api/v1/analytics/summary")
+        # Assert
+        assert first.json() == second.json() == {"total_datasets": 2}
+        mock_app.uow.datasets.client.fetchone.assert_called_once()
+        assert mock_app.uow.cache.stats()["hits"] == 1
@@ -0,0 +1,65 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from infrastructure.database.postgres import PooledPostgresClient
+from infrastructure.unit_of_work import PostgresUnitOfWork, ThreadedAsyncUnitOfWork
+
+
+@pytest.fixture
+def async_uow_factory(pg_pool):
+    uow = PostgresUnitOfWork(client=PooledPostgresClient(pg_pool))
+    executor = ThreadPoolExecutor(max_workers=pg_pool.max_size)
+    yield lambda: ThreadedAsyncUnitOfWork(uow, executor)
+    executor.shutdown()
+
+
+def test_async_unit_of_work_commits_block(async_uow_factory, platform):
+    # Arrange
+    async def scenario():
+        async with async_uow_factory() as uow:
+            await uow.platforms.save(platform)
+            seen_in_transaction = await uow.platforms.get(platform.id)
+        return seen_in_transaction, await async_uow_factory().platforms.get(platform.id)
+
+    # Act
+    seen_in_transaction, seen_after = asyncio.run(scenario())
+    # Assert
+    assert seen_in_transaction is not None
+    assert seen_after is not None
+
+
+def test_async_unit_of_work_rolls_back_on_exception(async_uow_factory, platform, pg_pool):
+    # Arrange
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            async with async_uow_factory() as uow:
+                await uow.platforms.save(platform)
+                raise RuntimeError("Test exception")
+        return await async_uow_factory().platforms.get(platform.id)
+
+    # Act
+    result = asyncio.run(scenario())
+    # Assert
+    assert result is None
+    assert pg_pool.stats()["in_use"] == 0
+
+
+def test_async_unit_of_work_runs_requests_concurrently(async_uow_factory, pg_pool):
+    # Arrange
+    async def slow_query():
+        uow = async_uow_factory()
+        return await uow.run(uow.uow.client.fetchone, "SELECT 1 AS n FROM pg_sleep(0.3)")
+
+    async def scenario():
+        return await asyncio.gather(*(slow_query() for _ in range(pg_pool.max_size)))
+
+    # Act
+    started = time.monotonic()
+    results = asyncio.run(scenario())
+    elapsed = time.monotonic() - started
+    # Assert
+    assert [result["n"] for result in results] == [1] * pg_pool.max_size
+    assert elapsed < 0.3 * pg_pool.max_size
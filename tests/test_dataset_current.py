@@ -0,0 +1,56 @@
+from application.use_cases.sync_dataset import SyncDatasetCommand, SyncDatasetUseCase
+
+
+def _sync(pg_app, platform, raw):
+    return SyncDatasetUseCase(uow=pg_app.uow).handle(
+        SyncDatasetCommand(platform=platform, platform_dataset_id=raw["uid"], raw_data=raw)
+    )
+
+
+def _changed(raw, title):
+    return {
+        **raw,
+        "metadata": {**raw["metadata"], "default": {**raw["metadata"]["default"], "title": title}},
+    }
+
+
+def _current_row(pg_app, dataset_id):
+    return pg_app.uow.client.fetchone(
+        "SELECT title, versions_count, version_id FROM dataset_current WHERE dataset_id = %s", (str(dataset_id),)
+    )
+
+
+def test_dataset_current_follows_each_new_version(pg_app, pg_ods_platform, ods_dataset):
+    # Arrange
+    dataset_id = _sync(pg_app, pg_ods_platform, ods_dataset).dataset_id
+    # Act
+    _sync(pg_app, pg_ods_platform, _changed(ods_dataset, "Projection Title"))
+    # Assert
+    row = _current_row(pg_app, dataset_id)
+    latest = pg_app.uow.client.fetchone(
+        "SELECT id FROM dataset_versions WHERE dataset_id = %s ORDER BY timestamp DESC LIMIT 1", (str(dataset_id),)
+    )
+    assert row["versions_count"] == 2
+    assert row["title"] == "Projection Title"
+    assert row["version_id"] == latest["id"]
+    result = pg_app.dataset.repository.search(page=1, page_size=10)
+    assert result[0][0]["versions_count"] == 2
+
+
+def test_dataset_current_rebuild_repairs_projection(pg_app, pg_ods_platform, ods_dataset):
+    # Arrange
+    dataset_id = _sync(pg_app, pg_ods_platform, ods_dataset).dataset_id
+    _sync(pg_app, pg_ods_platform, _changed(ods_dataset, "Projection Title"))
+    pg_app.uow.client.execute(
+        """DELETE FROM dataset_versions WHERE id = (
+            SELECT id FROM dataset_versions WHERE dataset_id = %s ORDER BY timestamp DESC LIMIT 1
+        )""",
+        (str(dataset_id),),
+    )
+    pg_app.uow.client.commit()
+    # Act
+    pg_app.uow.datasets.rebuild_current_state()
+    # Assert
+    row = _current_row(pg_app, dataset_id)
+    assert row["versions_count"] == 1
+    assert row["title"] != "Projection Title"
@@ -0,0 +1,127 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from application.use_cases.sync_dataset import SyncDatasetCommand, SyncDatasetUseCase
+from domain.datasets.value_objects import DatasetMetricsParams
+
+
+@pytest.fixture
+def dataset_id(pg_app, pg_ods_platform, ods_dataset):
+    return (
+        SyncDatasetUseCase(uow=pg_app.uow)
+        .handle(
+            SyncDatasetCommand(platform=pg_ods_platform, platform_dataset_id=ods_dataset["uid"], raw_data=ods_dataset)
+        )
+        .dataset_id
+    )
+
+
+def _add_metrics(pg_app, dataset_id, downloads_count):
+    with pg_app.uow:
+        pg_app.uow.datasets.add_metrics_versions(
+            [DatasetMetricsParams(dataset_id=dataset_id, downloads_count=downloads_count, views_count=1)]
+        )
+
+
+def test_versions_feed_the_metrics_series_and_its_rollups(pg_app, dataset_id):
+    # Act
+    _add_metrics(pg_app, dataset_id, 500)
+    # Assert
+    client = pg_app.uow.client
+    samples = client.fetchall(
+        "SELECT downloads_count FROM dataset_metrics WHERE dataset_id = %s ORDER BY ts", (str(dataset_id),)
+    )
+    assert len(samples) == 2 and samples[-1]["downloads_count"] == 500
+    rollups = client.fetchall(
+        "SELECT granularity, samples, downloads_count FROM dataset_metrics_rollups WHERE dataset_id = %s",
+        (str(dataset_id),),
+    )
+    assert {(r["granularity"], r["samples"], r["downloads_count"]) for r in rollups} == {
+        ("day", 2, 500),
+        ("week", 2, 500),
+        ("month", 2, 500),
+    }
+
+
+def test_a_sample_written_again_is_counted_once_in_the_rollups(pg_app, dataset_id):
+    # Act: one transaction, hence one NOW(): both versions share their (dataset_id, ts) metrics sample
+    with pg_app.uow:
+        for downloads_count in (500, 600):
+            pg_app.uow.datasets.add_metrics_versions(
+                [DatasetMetricsParams(dataset_id=dataset_id, downloads_count=downloads_count, views_count=1)]
+            )
+    # Assert
+    rollups = pg_app.uow.client.fetchall(
+        "SELECT granularity, samples, downloads_count FROM dataset_metrics_rollups WHERE dataset_id = %s",
+        (str(dataset_id),),
+    )
+    assert {(r["granularity"], r["samples"], r["downloads_count"]) for r in rollups} == {
+        ("day", 2, 600),
+        ("week", 2, 600),
+        ("month", 2, 600),
+    }
+
+
+def test_metrics_deltas_use_the_last_sample_before_the_window(pg_app, dataset_id):
+    # Arrange
+    now = datetime.now(timezone.utc)
+    client = pg_app.uow.client
+    client.execute_values(
+        "INSERT INTO dataset_metrics (dataset_id, ts, downloads_count) VALUES %s",
+        [(str(dataset_id), now - timedelta(days=days), 100 - days) for days in (40, 20, 10, 3)],
+    )
+    client.commit()
+    _add_metrics(pg_app, dataset_id, 150)
+    # Act
+    week = pg_app.uow.datasets.get_metrics_deltas(now - timedelta(days=7), [dataset_id])
+    quarter = pg_app.uow.datasets.get_metrics_deltas(now - timedelta(days=90))
+    # Assert
+    assert [d.downloads_count for d in week] == [150 - 90]
+    assert week[0].since == now - timedelta(days=10)
+    assert [d.downloads_count for d in quarter] == [150 - 60]  # Followed for 40 days: since the first sample
+
+
+def test_metrics_series_reports_growth_per_period(pg_app, dataset_id):
+    # Arrange
+    client = pg_app.uow.client
+    client.execute("DELETE FROM dataset_metrics_rollups")
+    client.execute_values(
+        """
+        INSERT INTO dataset_metrics_rollups (dataset_id, granularity, period, first_ts, last_ts, downloads_count)
+        VALUES %s
+        """,
+        [
+            (str(dataset_id), "month", month, month, month + timedelta(days=27), downloads)
+            for month, downloads in (
+                (datetime(2026, 7, 1, tzinfo=timezone.utc), 10),
+                (datetime(2026, 8, 1, tzinfo=timezone.utc), 25),
+                (datetime(2026, 9, 1, tzinfo=timezone.utc), 45),
+            )
+        ],
+    )
+    client.commit()
+    # Act
+    series = pg_app.uow.datasets.get_metrics_series(dataset_id, "month", datetime(2026, 8, 1, tzinfo=timezone.utc))
+    # Assert
+    assert [(p["period"].month, p["downloads_count"], p["downloads_delta"]) for p in series] == [
+        (8, 25, 15),
+        (9, 45, 20),
+    ]
+
+
+def test_metrics_series_rejects_unknown_granularity(pg_app, dataset_id):
+    with pytest.raises(ValueError):
+        pg_app.uow.datasets.get_metrics_series(dataset_id, "year")
+
+
+def test_metrics_are_deleted_with_their_dataset(pg_app, dataset_id):
+    # Arrange
+    _add_metrics(pg_app, dataset_id, 500)
+    client = pg_app.uow.client
+    # Act: as cleanup_today does, versions first (their blobs are not deleted in cascade)
+    client.execute("DELETE FROM dataset_versions WHERE dataset_id = %s", (str(dataset_id),))
+    client.execute("DELETE FROM datasets WHERE id = %s", (str(dataset_id),))
+    # Assert
+    for table in ("dataset_metrics", "dataset_metrics_rollups"):
+        assert client.fetchone(f"SELECT COUNT(*) AS n FROM {table} WHERE dataset_id = %s", (str(dataset_id),))["n"] == 0
@@ -0,0 +1,66 @@
+from application.use_cases.sync_dataset import SyncDatasetCommand, SyncDatasetUseCase
+
+# Definition of the former materialized view, used as the reference
+_FULL_RECOMPUTE_SQL = """
+    SELECT d.normalized_publisher AS direction,
+           ROUND(AVG(dq.health_quality_score)::numeric, 2) AS score_quality,
+           ROUND(AVG(dq.health_freshness_score)::numeric, 2) AS score_freshness,
+           ROUND(AVG(dq.health_engagement_score)::numeric, 2) AS score_engagement,
+           ROUND(AVG(dq.health_score)::numeric, 2) AS score_global,
+           COUNT(*) AS dataset_count,
+           COUNT(*) FILTER (WHERE dq.health_score < 50) AS unhealthy_count
+    FROM normalized_datasets d
+    JOIN dataset_quality dq ON d.id = dq.dataset_id
+    WHERE d.deleted IS FALSE AND d.published IS TRUE AND d.restricted IS FALSE AND dq.health_score IS NOT NULL
+    GROUP BY d.normalized_publisher
+    ORDER BY direction
+"""
+
+
+def _sync(pg_app, platform, raw):
+    return SyncDatasetUseCase(uow=pg_app.uow).handle(
+        SyncDatasetCommand(platform=platform, platform_dataset_id=raw["uid"], raw_data=raw)
+    )
+
+
+def _with_publisher(raw, publisher):
+    return {
+        **raw,
+        "metadata": {**raw["metadata"], "default": {**raw["metadata"]["default"], "publisher": {"value": publisher}}},
+    }
+
+
+def _direction_stats(pg_app):
+    return pg_app.uow.client.fetchall("SELECT * FROM direction_health_stats_view ORDER BY direction")
+
+
+def test_direction_health_follows_publisher_and_deletion(pg_app, pg_ods_platform, ods_dataset):
+    # Arrange
+    dataset_id = _sync(pg_app, pg_ods_platform, _with_publisher(ods_dataset, "Direction A")).dataset_id
+    assert [row["direction"] for row in _direction_stats(pg_app)] == ["Direction A"]
+    # Act
+    _sync(pg_app, pg_ods_platform, _with_publisher(ods_dataset, "Direction B"))
+    # Assert
+    assert _direction_stats(pg_app) == pg_app.uow.client.fetchall(_FULL_RECOMPUTE_SQL)
+    assert [row["direction"] for row in _direction_stats(pg_app)] == ["Direction B"]
+
+    dataset = pg_app.uow.datasets.get(dataset_id, include_versions=False)
+    dataset.mark_as_deleted()
+    with pg_app.uow:
+        pg_app.uow.datasets.update_dataset_state(dataset)
+    assert _direction_stats(pg_app) == []
+
+
+def test_direction_health_rebuild_repairs_bulk_updates(pg_app, pg_ods_platform, ods_dataset):
+    # Arrange
+    _sync(pg_app, pg_ods_platform, ods_dataset)
+    pg_app.uow.client.execute("UPDATE dataset_quality SET health_score = 10")
+    pg_app.uow.client.commit()
+    assert _direction_stats(pg_app) != pg_app.uow.client.fetchall(_FULL_RECOMPUTE_SQL)
+    # Act
+    with pg_app.uow:
+        pg_app.uow.datasets.rebuild_direction_health()
+    # Assert
+    stats = _direction_stats(pg_app)
+    assert stats == pg_app.uow.client.fetchall(_FULL_RECOMPUTE_SQL)
+    assert stats[0]["unhealthy_count"] == 1
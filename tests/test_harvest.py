@@ -0,0 +1,61 @@
+import pytest
+
+from infrastructure.adapters.harvest import iter_next_pages, iter_offset_pages, merge_by_key
+from infrastructure.adapters.http import HttpFetcher, RetryPolicy
+
+
+@pytest.fixture
+def http():
+    return HttpFetcher(timeout=5, retry=RetryPolicy(max_attempts=1))
+
+
+def test_merge_by_key_later_streams_take_precedence():
+    # Arrange
+    automation = iter([{"dataset_id": "a", "v": 1}, {"dataset_id": "b", "v": 1}])
+    catalog = iter([{"dataset_id": "a", "v": 2}])
+    # Act
+    result = list(merge_by_key(automation, catalog))
+    # Assert
+    assert result == [{"dataset_id": "a", "v": 2}, {"dataset_id": "b", "v": 1}]
+
+
+def test_merge_by_key_is_lazy():
+    # Arrange
+    stream = ({"dataset_id": str(i)} for i in range(10**9))
+    # Act
+    first = next(merge_by_key(stream))
+    # Assert
+    assert first == {"dataset_id": "0"}
+
+
+def test_iter_offset_pages_follows_pagination(stub_server, http):
+    # Arrange
+    url, routes, hits = stub_server
+    routes["/records"] = [(200, {"results": [{"id": 1}, {"id": 2}]}), (200, {"results": [{"id": 3}]})]
+    # Act
+    result = list(iter_offset_pages(f"{url}/records", page_size=2, http=http))
+    # Assert
+    assert [r["id"] for r in result] == [1, 2, 3]
+    assert "offset=2" in hits[1]
+
+
+def test_iter_next_pages_follows_next_page(stub_server, http):
+    # Arrange
+    url, routes, _ = stub_server
+    routes["/datasets"] = [(200, {"data": [{"id": 1}], "next_page": f"{url}/datasets-2"})]
+    routes["/datasets-2"] = [(200, {"data": [{"id": 2}], "next_page": None})]
+    # Act
+    result = list(iter_next_pages(f"{url}/datasets", http=http))
+    # Assert
+    assert [r["id"] for r in result] == [1, 2]
+
+
+def test_merge_by_key_warns_on_unsorted_stream(caplog):
+    # Arrange
+    automation = iter([{"dataset_id": "b", "v": 1}, {"dataset_id": "a", "v": 1}])
+    catalog = iter([{"dataset_id": "a", "v": 2}, {"dataset_id": "b", "v": 2}])
+    # Act
+    result = list(merge_by_key(automation, catalog))
+    # Assert
+    assert sorted(result, key=lambda r: r["dataset_id"]) == [{"dataset_id": "a", "v": 2}, {"dataset_id": "b", "v": 2}]
+    assert "Stream #0 is not sorted by dataset_id" in caplog.text
@@ -0,0 +1,59 @@
+import pytest
+
+from application.services.health_backfill import HealthBackfillService
+from application.use_cases.sync_dataset import SyncDatasetCommand, SyncDatasetUseCase
+from infrastructure.database.postgres import PostgresClient
+from infrastructure.repositories.datasets.postgres import PostgresDatasetRepository
+
+_SCORES_SQL = """
+    SELECT dataset_id, health_score, health_quality_score, health_freshness_score, health_engagement_score
+    FROM dataset_quality ORDER BY dataset_id
+"""
+
+
+@pytest.fixture
+def reader(db_transaction):
+    info = db_transaction.connection.info
+    client = PostgresClient(info.dbname, info.user, info.password, info.host, info.port)
+    yield PostgresDatasetRepository(client)
+    client.connection.close()
+
+
+@pytest.fixture
+def synced_scores(pg_app, pg_ods_platform, ods_dataset):
+    for uid in ("backfill-a", "backfill-b", "backfill-c"):
+        raw = {**ods_dataset, "uid": uid, "dataset_id": uid}
+        SyncDatasetUseCase(uow=pg_app.uow).handle(
+            SyncDatasetCommand(platform=pg_ods_platform, platform_dataset_id=uid, raw_data=raw)
+        )
+    scores = pg_app.uow.client.fetchall(_SCORES_SQL)
+    pg_app.uow.client.execute("UPDATE dataset_quality SET health_score = NULL, health_quality_score = NULL")
+    pg_app.uow.client.commit()
+    return scores
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_health_backfill_restores_domain_scores(pg_app, reader, synced_scores, workers):
+    # Arrange
+    service = HealthBackfillService(uow=pg_app.uow, reader=reader, workers=workers, batch_size=2)
+    seen = []
+    # Act
+    progress = service.run(on_batch=lambda p: seen.append(p.processed))
+    # Assert
+    assert progress.processed == 3
+    assert seen == [2, 3]
+    assert pg_app.uow.client.fetchall(_SCORES_SQL) == synced_scores
+    assert pg_app.uow.client.fetchone("SELECT dataset_count FROM direction_health_stats_view")["dataset_count"] == 3
+
+
+def test_health_backfill_resumes_after_last_committed_id(pg_app, reader, synced_scores):
+    # Arrange
+    service = HealthBackfillService(uow=pg_app.uow, reader=reader, workers=1, batch_size=2)
+    first_id = synced_scores[0]["dataset_id"]
+    # Act
+    progress = service.run(after_id=first_id)
+    # Assert
+    assert progress.processed == 2
+    rows = pg_app.uow.client.fetchall(_SCORES_SQL)
+    assert rows[0]["health_score"] is None
+    assert rows[1:] == synced_scores[1:]
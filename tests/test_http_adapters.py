@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from domain.datasets.exceptions import DatasetGoneError, DatasetUnreachableError
+from infrastructure.adapters.datasets.datagouvfr import DatagouvDatasetAdapter
+from infrastructure.adapters.datasets.ods import OpendatasoftDatasetAdapter
+from infrastructure.adapters.http import HttpFetcher, HttpRequest, RetryPolicy
+
+
+@pytest.fixture
+def http():
+    return HttpFetcher(timeout=5, retry=RetryPolicy(max_attempts=3, backoff_factor=0))
+
+
+def test_ods_fetch_merges_the_three_endpoints(stub_server, http, monkeypatch):
+    # Arrange
+    url, routes, hits = stub_server
+    monkeypatch.setenv("STUB_KEY", "secret")
+    routes["/api/automation/v1.0/datasets/"] = [(200, {"results": [{"uid": "u1", "is_published": True}]})]
+    routes["/api/explore/v2.1/catalog/datasets/ds/"] = [(200, {"dataset_id": "ds"})]
+    routes["/api/explore/v2.1/monitoring/datasets/ods-datasets-monitoring/exports/json/"] = [
+        (200, [{"api_call_count": 3}])
+    ]
+    # Act
+    result = OpendatasoftDatasetAdapter(http=http).fetch(url, "STUB_KEY", "ds")
+    # Assert
+    assert result == {"uid": "u1", "is_published": True, "dataset_id": "ds", "api_call_count": 3}
+    assert len(hits) == 3
+
+
+def test_fetch_retries_on_server_errors(stub_server, http):
+    # Arrange
+    url, routes, hits = stub_server
+    routes["/api/1/datasets/ds/"] = [(503, {}), (429, {}), (200, {"id": "ds"})]
+    # Act
+    result = DatagouvDatasetAdapter(http=http).fetch(url, None, "ds")
+    # Assert
+    assert result == {"id": "ds"}
+    assert len(hits) == 3
+
+
+def test_fetch_raises_unreachable_on_missing_dataset(stub_server, http):
+    # Arrange
+    url, _, _ = stub_server
+    # Act & Assert
+    with pytest.raises(DatasetUnreachableError):
+        DatagouvDatasetAdapter(http=http).fetch(url, None, "missing")
+
+
+def test_afetch_many_returns_failures_in_place(stub_server, http):
+    # Arrange
+    url, routes, _ = stub_server
+    routes["/api/1/datasets/a/"] = [(200, {"id": "a"})]
+    # Act
+    results = asyncio.run(DatagouvDatasetAdapter(http=http).afetch_many(url, None, ["a", "missing"]))
+    # Assert
+    assert results["a"] == {"id": "a"}
+    assert isinstance(results["missing"], DatasetUnreachableError)
+
+
+def test_afetch_many_closes_the_async_client(stub_server, http):
+    # Arrange
+    url, routes, _ = stub_server
+    routes["/api/1/datasets/a/"] = [(200, {"id": "a"}), (200, {"id": "a"})]
+    adapter = DatagouvDatasetAdapter(http=http)
+    # Act
+    for _ in range(2):
+        asyncio.run(adapter.afetch_many(url, None, ["a"]))
+    # Assert
+    assert http._async_client is None
+
+
+def test_get_many_shares_one_bounded_executor(stub_server):
+    # Arrange
+    url, routes, hits = stub_server
+    for i in range(6):
+        routes[f"/api/1/datasets/d{i}/"] = [(200, {"id": f"d{i}"})]
+    http = HttpFetcher(timeout=5, max_workers=2)
+    requests = [HttpRequest(f"{url}/api/1/datasets/d{i}/") for i in range(6)]
+    # Act
+    responses = http.get_many(requests)
+    # Assert
+    assert [r.json()["id"] for r in responses] == [f"d{i}" for i in range(6)]
+    assert len(http._executor._threads) == 2
+
+
+def test_fetch_raises_gone_when_the_source_answers_404(stub_server, http):
+    # Arrange
+    url, _, _ = stub_server
+    # Act & Assert
+    with pytest.raises(DatasetGoneError):
+        DatagouvDatasetAdapter(http=http).fetch(url, None, "deleted")
@@ -0,0 +1,80 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+from application.use_cases.sync_dataset import SyncDatasetCommand, SyncDatasetUseCase
+from application.use_cases.sync_platform_incremental import (
+    IncrementalSyncPlatformCommand,
+    IncrementalSyncPlatformUseCase,
+)
+from domain.datasets.value_objects import DatasetMetricsParams
+
+
+def test_high_water_mark_advances_on_partial_runs(pg_app, pg_ods_platform):
+    # Arrange
+    repository = pg_app.platform.repository
+    mark = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    last_mark = datetime.now(timezone.utc)
+    payload = {"timestamp": mark, "datasets_count": 0, "mode": "incremental"}
+    repository.save_incremental_sync(pg_ods_platform.id, {**payload, "status": "success", "high_water_mark": mark})
+    repository.save_incremental_sync(
+        pg_ods_platform.id,
+        {**payload, "status": "partial_success", "high_water_mark": last_mark, "retry_datasets": {"da_1": 1}},
+    )
+    # Act
+    result = repository.get_high_water_mark(pg_ods_platform.id)
+    # Assert
+    assert result == last_mark
+    assert repository.get_retry_datasets(pg_ods_platform.id) == {"da_1": 1}
+
+
+def test_failing_dataset_is_retried_without_holding_the_mark_back(pg_app, pg_ods_platform):
+    # Arrange
+    repository = pg_app.platform.repository
+    mark = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    repository.save_incremental_sync(
+        pg_ods_platform.id,
+        {"timestamp": mark, "status": "success", "datasets_count": 0, "mode": "incremental", "high_water_mark": mark},
+    )
+    with (
+        patch("application.use_cases.sync_platform_incremental.PlatformAdapterFactory") as platform_factory,
+        patch("application.use_cases.sync_platform_incremental.DatasetAdapterFactory") as dataset_factory,
+    ):
+        # Listed as modified by the first run only: the second one fetches it as a retry
+        platform_factory.return_value.create.return_value.fetch_modified_since.side_effect = [
+            iter(["broken"]),
+            iter([]),
+        ]
+        afetch_many = AsyncMock(return_value={"broken": TimeoutError("read timeout")})
+        dataset_factory.return_value.create.return_value.afetch_many = afetch_many
+        use_case = IncrementalSyncPlatformUseCase(pg_app.uow)
+        command = IncrementalSyncPlatformCommand(platform_id=pg_ods_platform.id)
+        # Act
+        first = use_case.handle(command)
+        first_mark = repository.get_high_water_mark(pg_ods_platform.id)
+        second = use_case.handle(command)
+    # Assert
+    assert (first.status, second.status) == ("partial_success", "partial_success")
+    assert mark < first_mark < repository.get_high_water_mark(pg_ods_platform.id)
+    assert afetch_many.call_args_list[1].args[2] == ["broken"]
+    assert repository.get_retry_datasets(pg_ods_platform.id) == {"broken": 2}
+
+
+def test_metrics_version_reuses_latest_blob(pg_app, pg_ods_platform, ods_dataset):
+    # Arrange
+    dataset_id = (
+        SyncDatasetUseCase(uow=pg_app.uow)
+        .handle(
+            SyncDatasetCommand(platform=pg_ods_platform, platform_dataset_id=ods_dataset["uid"], raw_data=ods_dataset)
+        )
+        .dataset_id
+    )
+    # Act
+    pg_app.dataset.repository.add_metrics_versions([DatasetMetricsParams(dataset_id=dataset_id, downloads_count=999)])
+    # Assert
+    rows = pg_app.uow.client.fetchall(
+        "SELECT blob_id, downloads_count FROM dataset_versions WHERE dataset_id = %s ORDER BY timestamp",
+        (str(dataset_id),),
+    )
+    assert len(rows) == 2
+    assert rows[1]["blob_id"] == rows[0]["blob_id"]
+    assert rows[1]["downloads_count"] == 999
@@ -0,0 +1,81 @@
+from datetime import datetime
+
+import pytest
+
+from application.services.quality_assessment import QualityAssessmentService
+from application.use_cases.sync_dataset import SyncDatasetCommand, SyncDatasetUseCase
+from domain.quality.evaluation import CriterionScore, MetadataEvaluation, Suggestion
+from domain.quality.ports import LLMEvaluator
+
+DCAT_PATH = "docs/quality/dcat_reference.md"
+CHARTER_PATH = "docs/quality/charter_opendata.md"
+
+
+class CountingEvaluator(LLMEvaluator):
+    model_name = "test-model"
+    prompt_version = "1"
+
+    def __init__(self):
+        self.calls = 0
+
+    def evaluate_metadata(self, dataset, dcat_reference, charter, output, prompt_type="standard"):
+        self.calls += 1
+        return MetadataEvaluation(
+            dataset_id=None,
+            dataset_slug=None,
+            evaluated_at=datetime.now(),
+            overall_score=72.5,
+            criteria_scores={
+                "title": CriterionScore(criterion="title", category="descriptive", score=80.0, weight=0.1)
+            },
+            suggestions=[
+                Suggestion(field="title", current_value="x", suggested_value="y", reason="short", priority="low")
+            ],
+        )
+
+
+@pytest.fixture
+def dataset_id(pg_app, pg_ods_platform, ods_dataset):
+    return (
+        SyncDatasetUseCase(uow=pg_app.uow)
+        .handle(
+            SyncDatasetCommand(platform=pg_ods_platform, platform_dataset_id=ods_dataset["uid"], raw_data=ods_dataset)
+        )
+        .dataset_id
+    )
+
+
+def test_unchanged_metadata_is_evaluated_once(pg_app, dataset_id):
+    # Arrange
+    evaluator = CountingEvaluator()
+    service = QualityAssessmentService(evaluator=evaluator, uow=pg_app.uow, mappers=pg_app.mappers)
+    # Act
+    first = service.evaluate_dataset(dataset_id, DCAT_PATH, CHARTER_PATH, "json")
+    second = service.evaluate_dataset(dataset_id, DCAT_PATH, CHARTER_PATH, "json")
+    # Assert
+    assert evaluator.calls == 1
+    assert not first.cached and second.cached
+    assert second.overall_score == first.overall_score
+    assert second.suggestions == first.suggestions
+    assert (service.cache_stats.hits, service.cache_stats.misses) == (1, 1)
+    entry = pg_app.uow.client.fetchone("SELECT model, prompt_version, hits FROM llm_evaluation_cache")
+    assert entry == {"model": "test-model", "prompt_version": "1", "hits": 1}
+    quality = pg_app.uow.client.fetchone(
+        "SELECT evaluation_results FROM dataset_quality WHERE dataset_id = %s", (str(dataset_id),)
+    )
+    assert quality["evaluation_results"]["overall_score"] == 72.5
+
+
+def test_prompt_or_model_change_misses_the_cache(pg_app, dataset_id):
+    # Arrange
+    evaluator = CountingEvaluator()
+    service = QualityAssessmentService(evaluator=evaluator, uow=pg_app.uow, mappers=pg_app.mappers)
+    service.evaluate_dataset(dataset_id, DCAT_PATH, CHARTER_PATH, "json")
+    # Act
+    service.evaluate_dataset(dataset_id, DCAT_PATH, CHARTER_PATH, "json", prompt_type="light")
+    evaluator.model_name = "other-model"
+    service.evaluate_dataset(dataset_id, DCAT_PATH, CHARTER_PATH, "json")
+    # Assert
+    assert evaluator.calls == 3
+    count = pg_app.uow.client.fetchone("SELECT count(*) AS count FROM llm_evaluation_cache")["count"]
+    assert count == 3
@@ -0,0 +1,200 @@
+import asyncio
+import copy
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from application.services.evaluation_worker import EvaluationWorker
+from application.services.quality_assessment import QualityAssessmentService
+from application.use_cases.enqueue_evaluations import EnqueueEvaluationsCommand, EnqueueEvaluationsUseCase
+from application.use_cases.sync_dataset import SyncDatasetCommand, SyncDatasetUseCase
+from domain.quality.evaluation import MetadataEvaluation
+from domain.quality.jobs import EvaluationJobSelection
+from domain.quality.ports import LLMEvaluator
+
+
+class FlakyEvaluator(LLMEvaluator):
+    model_name = "test-model"
+    prompt_version = "1"
+
+    def __init__(self, failures=0, delay=0.0):
+        self.failures = failures
+        self.delay = delay
+
+    def evaluate_metadata(self, dataset, dcat_reference, charter, output, prompt_type="standard"):
+        time.sleep(self.delay)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("LLM evaluation failed: rate limited")
+        return MetadataEvaluation(
+            dataset_id=None,
+            dataset_slug=None,
+            evaluated_at=datetime.now(),
+            overall_score=70.0,
+            criteria_scores={},
+            suggestions=[],
+        )
+
+
+@pytest.fixture
+def dataset_ids(pg_app, pg_ods_platform, ods_dataset):
+    ids = []
+    for suffix in ("a", "b"):
+        raw = copy.deepcopy(ods_dataset)
+        raw["uid"] = f"da_{suffix}"
+        raw["dataset_id"] = f"dataset-{suffix}"
+        command = SyncDatasetCommand(platform=pg_ods_platform, platform_dataset_id=raw["uid"], raw_data=raw)
+        ids.append(SyncDatasetUseCase(uow=pg_app.uow).handle(command).dataset_id)
+    return ids
+
+
+def _states(pg_app):
+    rows = pg_app.uow.client.fetchall("SELECT state FROM llm_evaluation_jobs ORDER BY id")
+    return [row["state"] for row in rows]
+
+
+def test_enqueue_is_idempotent_until_requeued(pg_app, dataset_ids):
+    # Arrange
+    use_case = EnqueueEvaluationsUseCase(pg_app.uow)
+    first = use_case.handle(EnqueueEvaluationsCommand())
+    again = use_case.handle(EnqueueEvaluationsCommand())
+    with pg_app.uow:
+        job = pg_app.uow.datasets.claim_evaluation_jobs("worker-1")[0]
+        pg_app.uow.datasets.complete_evaluation_job(job.id, "worker-1")
+    # Act
+    requeued = use_case.handle(EnqueueEvaluationsCommand(requeue=True))
+    # Assert
+    assert (first.enqueued, again.enqueued, requeued.enqueued) == (2, 0, 1)
+    assert _states(pg_app) == ["pending", "pending"]
+
+
+def test_leased_jobs_are_not_claimed_twice_until_the_lease_expires(pg_app, dataset_ids):
+    # Arrange
+    with pg_app.uow:
+        pg_app.uow.datasets.enqueue_evaluation_jobs(EvaluationJobSelection())
+        repository = pg_app.uow.datasets
+        # Act
+        first = repository.claim_evaluation_jobs("worker-1", limit=1, lease=timedelta(seconds=-1))
+        second = repository.claim_evaluation_jobs("worker-2", limit=5)
+        third = repository.claim_evaluation_jobs("worker-3", limit=5)
+    # Assert
+    assert len(first) == 1
+    assert len(second) == 2  # The other pending job, and the one whose lease expired
+    assert third == []
+    reclaimed = next(job for job in second if job.id == first[0].id)
+    assert reclaimed.attempts == 2
+
+
+def test_a_reclaimed_job_cannot_be_renewed_or_completed_by_its_former_worker(pg_app, dataset_ids):
+    # Arrange
+    repository = pg_app.uow.datasets
+    with pg_app.uow:
+        repository.enqueue_evaluation_jobs(EvaluationJobSelection(dataset_ids=(dataset_ids[0],)))
+        job = repository.claim_evaluation_jobs("worker-1", lease=timedelta(seconds=-1))[0]
+        # Act
+        renewed = repository.renew_evaluation_job_lease(job.id, "worker-1", timedelta(minutes=10))
+        not_reclaimed = repository.claim_evaluation_jobs("worker-2")
+        pg_app.uow.client.execute("UPDATE llm_evaluation_jobs SET leased_until = NOW() - interval '1 second'")
+        reclaimed = repository.claim_evaluation_jobs("worker-2")
+        late_renewal = repository.renew_evaluation_job_lease(job.id, "worker-1", timedelta(minutes=10))
+        late_completion = repository.complete_evaluation_job(job.id, "worker-1")
+    # Assert
+    assert renewed and not_reclaimed == []
+    assert [j.id for j in reclaimed] == [job.id]
+    assert (late_renewal, late_completion) == (False, False)
+    assert _states(pg_app) == ["running"]
+
+
+def test_failed_jobs_are_retried_later_then_given_up(pg_app, dataset_ids):
+    # Arrange
+    with pg_app.uow:
+        pg_app.uow.datasets.enqueue_evaluation_jobs(
+            EvaluationJobSelection(dataset_ids=(dataset_ids[0],), max_attempts=2)
+        )
+    repository = pg_app.uow.datasets
+    # Act
+    with pg_app.uow:
+        job = repository.claim_evaluation_jobs("worker-1")[0]
+        repository.fail_evaluation_job(job.id, "worker-1", "timeout", retry_after=timedelta(minutes=1))
+        waiting = repository.claim_evaluation_jobs("worker-1")
+        repository.fail_evaluation_job(job.id, "worker-1", "ignored: not leased", retry_after=timedelta(0))
+        pg_app.uow.client.execute("UPDATE llm_evaluation_jobs SET run_after = NOW()")
+        job = repository.claim_evaluation_jobs("worker-1")[0]
+        repository.fail_evaluation_job(job.id, "worker-1", "timeout again", retry_after=timedelta(0))
+        progress = repository.get_evaluation_job_progress()
+    # Assert
+    assert waiting == []
+    assert progress.counts == {"pending": 0, "running": 0, "done": 0, "failed": 1}
+    assert progress.failures[0]["slug"] == "dataset-a"
+    assert (progress.failures[0]["attempts"], progress.failures[0]["last_error"]) == (2, "timeout again")
+
+
+def test_worker_drains_the_queue_and_schedules_retries(pg_app, dataset_ids):
+    # Arrange
+    EnqueueEvaluationsUseCase(pg_app.uow).handle(EnqueueEvaluationsCommand())
+    service = QualityAssessmentService(evaluator=FlakyEvaluator(failures=1), uow=pg_app.uow, mappers=pg_app.mappers)
+    worker = EvaluationWorker(service, worker_id="worker-1")
+    # Act
+    report = asyncio.run(worker.run("docs/quality/dcat_reference.md", "docs/quality/charter_opendata.md", 1))
+    # Assert
+    assert (report.done, report.retried, report.failed) == (1, 1, 0)
+    assert sorted(_states(pg_app)) == ["done", "pending"]
+    evaluated = pg_app.uow.client.fetchone(
+        "SELECT count(*) AS count FROM dataset_quality WHERE evaluation_results IS NOT NULL"
+    )
+    assert evaluated["count"] == 1
+
+
+def test_worker_renews_the_lease_of_a_long_evaluation(pg_app, dataset_ids):
+    # Arrange
+    with pg_app.uow:
+        pg_app.uow.datasets.enqueue_evaluation_jobs(EvaluationJobSelection(dataset_ids=(dataset_ids[0],)))
+    service = QualityAssessmentService(evaluator=FlakyEvaluator(delay=1.2), uow=pg_app.uow, mappers=pg_app.mappers)
+    worker = EvaluationWorker(service, worker_id="worker-1", lease=timedelta(seconds=0.6))
+
+    def claim_as_another_worker():
+        with pg_app.uow:
+            return pg_app.uow.datasets.claim_evaluation_jobs("worker-2")
+
+    async def run():
+        stolen = asyncio.create_task(asyncio.sleep(0.9))
+        work = asyncio.create_task(worker.run("docs/quality/dcat_reference.md", "docs/quality/charter_opendata.md", 1))
+        await stolen
+        return await worker._in_db_thread(claim_as_another_worker), await work
+
+    # Act
+    stolen, report = asyncio.run(run())
+    # Assert
+    assert stolen == []  # Past the first lease, but renewed meanwhile
+    assert report.done == 1
+    assert _states(pg_app) == ["done"]
+
+
+def test_worker_cancels_the_evaluation_of_a_reclaimed_job(pg_app, dataset_ids):
+    # Arrange
+    with pg_app.uow:
+        pg_app.uow.datasets.enqueue_evaluation_jobs(EvaluationJobSelection(dataset_ids=(dataset_ids[0],)))
+    service = QualityAssessmentService(evaluator=FlakyEvaluator(delay=1.2), uow=pg_app.uow, mappers=pg_app.mappers)
+    worker = EvaluationWorker(service, worker_id="worker-1", lease=timedelta(seconds=0.6))
+
+    def reclaim_as_another_worker():
+        with pg_app.uow:
+            pg_app.uow.client.execute("UPDATE llm_evaluation_jobs SET leased_until = NOW() - interval '1 second'")
+            return pg_app.uow.datasets.claim_evaluation_jobs("worker-2")
+
+    async def run():
+        work = asyncio.create_task(worker.run("docs/quality/dcat_reference.md", "docs/quality/charter_opendata.md", 1))
+        await asyncio.sleep(0.1)
+        return await worker._in_db_thread(reclaim_as_another_worker), await work
+
+    # Act
+    reclaimed, report = asyncio.run(run())
+    # Assert
+    assert len(reclaimed) == 1
+    assert (report.done, report.lost) == (0, 1)
+    assert _states(pg_app) == ["running"]  # Still leased by worker-2
+    evaluated = pg_app.uow.client.fetchone(
+        "SELECT count(*) AS count FROM dataset_quality WHERE evaluation_results IS NOT NULL"
+    )
+    assert evaluated["count"] == 0
@@ -124,3 +124,16 @@ def test_retrieve_platform_with_syncs(app):
     # Assert
     assert result.last_sync == datetime(2025, 1, 1, 12, 0)
     assert len(result.syncs) == 1
+
+
+def test_ods_fetch_modified_since_reads_the_export_without_offset_cap(stub_server):
+    # Arrange
+    url, routes, hits = stub_server
+    routes["/api/explore/v2.1/catalog/exports/json"] = [(200, [{"dataset_id": f"d{i}"} for i in range(10_050)])]
+    adapter = OpendatasoftPlatformAdapter(url=url, key="TEST_API_KEY", slug="slug")
+    # Act
+    result = list(adapter.fetch_modified_since(datetime(2026, 1, 1)))
+    # Assert
+    assert len(result) == 10_050
+    assert len(hits) == 1
+    assert "offset" not in hits[0]
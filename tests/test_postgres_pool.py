@@ -0,0 +1,117 @@
+import threading
+
+import pytest
+
+from infrastructure.database.postgres import PooledPostgresClient, PoolTimeoutError
+from infrastructure.unit_of_work import PostgresUnitOfWork
+
+
+def test_pool_waits_then_times_out_when_exhausted(pg_pool):
+    # Arrange
+    connections = [pg_pool.acquire() for _ in range(pg_pool.max_size)]
+    # Act & Assert
+    with pytest.raises(PoolTimeoutError):
+        pg_pool.acquire()
+    for connection in connections:
+        pg_pool.release(connection)
+    stats = pg_pool.stats()
+    assert stats["timeouts"] == 1
+    assert stats["in_use"] == 0
+    assert stats["checkouts"] == pg_pool.max_size
+
+
+def test_pool_replaces_broken_connections(pg_pool):
+    # Arrange
+    connection = pg_pool.acquire()
+    connection.close()
+    pg_pool.release(connection)
+    # Act
+    connection = pg_pool.acquire()
+    with connection.cursor() as cur:
+        cur.execute("SELECT 1")
+        result = cur.fetchone()
+    pg_pool.release(connection)
+    # Assert
+    assert result == (1,)
+    assert pg_pool.stats()["discarded"] == 1
+
+
+def test_pool_rolls_back_pending_transaction_on_release(pg_pool):
+    # Arrange
+    connection = pg_pool.acquire()
+    with connection.cursor() as cur:
+        cur.execute("INSERT INTO users (email, hashed_password) VALUES ('pending@test.fr', 'x')")
+    # Act
+    pg_pool.release(connection)
+    client = PooledPostgresClient(pg_pool)
+    # Assert
+    assert client.fetchone("SELECT 1 FROM users WHERE email = 'pending@test.fr'") is None
+
+
+def test_pooled_client_reads_do_not_hold_a_connection(pg_pool):
+    # Arrange
+    client = PooledPostgresClient(pg_pool)
+    # Act
+    client.fetchall("SELECT 1")
+    rows = list(client.stream_fetchall("SELECT generate_series(1, 3) AS n"))
+    # Assert
+    assert [row["n"] for row in rows] == [1, 2, 3]
+    assert pg_pool.stats()["in_use"] == 0
+
+
+def test_pooled_unit_of_work_commits_and_releases(pg_pool, platform):
+    # Arrange
+    uow = PostgresUnitOfWork(client=PooledPostgresClient(pg_pool))
+    # Act
+    with uow:
+        uow.platforms.save(platform)
+        assert pg_pool.stats()["in_use"] == 1
+    # Assert
+    assert pg_pool.stats()["in_use"] == 0
+    with uow:
+        assert uow.platforms.get(platform.id) is not None
+
+
+def test_pooled_unit_of_work_rolls_back_on_exception(pg_pool, platform):
+    # Arrange
+    uow = PostgresUnitOfWork(client=PooledPostgresClient(pg_pool))
+    # Act
+    with pytest.raises(RuntimeError):
+        with uow:
+            uow.platforms.save(platform)
+            raise RuntimeError("Test exception")
+    # Assert
+    assert pg_pool.stats()["in_use"] == 0
+    with uow:
+        assert uow.platforms.get(platform.id) is None
+
+
+def test_pooled_unit_of_work_is_shared_across_threads(pg_pool):
+    # Arrange
+    uow = PostgresUnitOfWork(client=PooledPostgresClient(pg_pool))
+    barrier = threading.Barrier(pg_pool.max_size)
+    backend_pids = []
+    errors = []
+
+    def work(index):
+        try:
+            with uow:
+                uow.client.execute(
+                    "INSERT INTO users (email, hashed_password) VALUES (%s, 'x')", (f"user{index}@test.fr",)
+                )
+                backend_pids.append(uow.client.fetchone("SELECT pg_backend_pid() AS pid")["pid"])
+                barrier.wait(timeout=5)
+        except Exception as e:
+            errors.append(e)
+
+    # Act
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(pg_pool.max_size)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Assert
+    assert not errors
+    assert len(set(backend_pids)) == pg_pool.max_size
+    assert uow.client.fetchone("SELECT count(*) AS n FROM users WHERE email LIKE 'user%%@test.fr'")["n"] == 3
+    assert pg_pool.stats()["in_use"] == 0
@@ -11,6 +11,8 @@ from application.use_cases.check_deleted_datasets import (
 from application.use_cases.create_platform import CreatePlatformCommand, CreatePlatformUseCase
 from application.use_cases.sync_dataset import SyncDatasetCommand, SyncDatasetUseCase
 from application.use_cases.sync_platform import SyncPlatformCommand, SyncPlatformUseCase
+from domain.datasets.exceptions import InvalidCursorError
+from domain.datasets.value_objects import DatasetVersionParams
 from infrastructure.adapters.datasets.ods import OpendatasoftDatasetAdapter
 from tests.fixtures.fixtures import platform_1
 
@@ -81,6 +83,42 @@ def test_postgresql_get_dataset_checksum_by_buid(pg_app, pg_ods_platform, ods_da
     assert len(checksum) == 64
 
 
+def test_postgresql_add_version_diffs_against_loaded_version_state(pg_app, pg_ods_platform, ods_dataset, monkeypatch):
+    # Arrange
+    SyncDatasetUseCase(uow=pg_app.uow).handle(
+        SyncDatasetCommand(platform=pg_ods_platform, platform_dataset_id=ods_dataset["uid"], raw_data=ods_dataset)
+    )
+    repository = pg_app.dataset.repository
+    existing = repository.get_by_buid(dataset_buid=ods_dataset["uid"])
+    queries = []
+    fetchone = repository.client.fetchone
+    monkeypatch.setattr(
+        repository.client, "fetchone", lambda query, *args: queries.append(query) or fetchone(query, *args)
+    )
+    # Act
+    repository.add_version(
+        DatasetVersionParams(
+            dataset_id=existing.id,
+            snapshot=existing.raw,
+            checksum=existing.checksum,
+            title=existing.title,
+            downloads_count=(existing.downloads_count or 0) + 5,
+            api_calls_count=existing.api_calls_count,
+            previous=existing.current_version,
+        )
+    )
+    # Assert
+    assert len(existing.current_version.blob_hash) == 64
+    assert not any("blob_data" in query for query in queries)
+    diff = repository.get(existing.id).versions[-1].diff
+    assert {
+        "op": "replace",
+        "path": "/downloads_count",
+        "old": existing.downloads_count,
+        "value": (existing.downloads_count or 0) + 5,
+    } in diff
+
+
 def test_postgresql_dataset_has_changed(pg_app, pg_ods_platform, ods_dataset):
     # Arrange
     result = SyncDatasetUseCase(uow=pg_app.uow).handle(
@@ -235,6 +273,25 @@ def test_postgresql_check_deletions_isolation_between_platforms(pg_app, pg_ods_p
     assert result_b.is_deleted is False
 
 
+def test_postgresql_check_deletions_marks_missing_datasets_once(pg_app, pg_ods_platform, ods_dataset):
+    # Arrange
+    kept = {**ods_dataset, "uid": "kept", "dataset_id": "kept"}
+    for raw in (ods_dataset, kept, {**ods_dataset, "uid": "gone", "dataset_id": "gone"}):
+        SyncDatasetUseCase(uow=pg_app.uow).handle(
+            SyncDatasetCommand(platform=pg_ods_platform, platform_dataset_id=raw["uid"], raw_data=raw)
+        )
+    command = CheckDeletedDatasetsCommand(platform=pg_ods_platform, datasets=[kept])
+    # Act
+    first = CheckDeletedDatasetsUseCase(uow=pg_app.uow).handle(command)
+    second = CheckDeletedDatasetsUseCase(uow=pg_app.uow).handle(command)
+    # Assert
+    assert first.deleted_count == 2
+    assert second.deleted_count == 0
+    rows = pg_app.uow.client.fetchall("SELECT buid, deleted, deleted_at FROM datasets ORDER BY buid")
+    assert {row["buid"]: row["deleted"] for row in rows} == {"gone": True, "kept": False, ods_dataset["uid"]: True}
+    assert all(row["deleted_at"] for row in rows if row["deleted"])
+
+
 def test_postgresql_get_id_by_slug_globally_with_suffix(pg_app, pg_ods_platform, ods_dataset):
     # Arrange
     result = SyncDatasetUseCase(uow=pg_app.uow).handle(
@@ -339,3 +396,108 @@ def test_postgresql_search_sorting_health_nulls_last(pg_app, pg_ods_platform, od
     assert items_asc[0]["slug"] == "d2"
     assert items_asc[1]["slug"] == "d1"
     assert items_asc[2]["slug"] == "d3"
+
+
+def _walk_search(repository, **kwargs):
+    slugs, cursor = [], None
+    while True:
+        items, _, cursor = repository.search_page(page_size=1, cursor=cursor, with_total=False, **kwargs)
+        slugs.extend(item["slug"] for item in items)
+        if not cursor:
+            return slugs
+
+
+@pytest.mark.parametrize("sort_by", ["health_score", "title", "modified"])
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_postgresql_search_cursor_walks_same_rows_as_offset(pg_app, pg_ods_platform, ods_dataset, sort_by, order):
+    # Arrange: two datasets share a health score, one has none
+    for slug, health_score in (("d1", 80), ("d2", 80), ("d3", None), ("d4", 20)):
+        dataset_id = (
+            SyncDatasetUseCase(uow=pg_app.uow)
+            .handle(
+                SyncDatasetCommand(
+                    platform=pg_ods_platform,
+                    platform_dataset_id=slug,
+                    raw_data={**ods_dataset, "uid": slug, "dataset_id": slug},
+                )
+            )
+            .dataset_id
+        )
+        pg_app.dataset.repository.client.execute(
+            "UPDATE dataset_quality SET health_score = %s WHERE dataset_id = %s", (health_score, str(dataset_id))
+        )
+    # Act
+    walked = _walk_search(pg_app.dataset.repository, sort_by=sort_by, order=order)
+    # Assert
+    items, total = pg_app.dataset.repository.search(sort_by=sort_by, order=order)
+    assert total == 4
+    assert walked == [item["slug"] for item in items]
+
+
+def test_postgresql_search_rejects_cursor_from_another_sort(pg_app, pg_ods_platform, ods_dataset):
+    # Arrange
+    for slug in ("d1", "d2"):
+        SyncDatasetUseCase(uow=pg_app.uow).handle(
+            SyncDatasetCommand(
+                platform=pg_ods_platform,
+                platform_dataset_id=slug,
+                raw_data={**ods_dataset, "uid": slug, "dataset_id": slug},
+            )
+        )
+    _, _, cursor = pg_app.dataset.repository.search_page(sort_by="title", page_size=1)
+    # Act & Assert
+    with pytest.raises(InvalidCursorError):
+        pg_app.dataset.repository.search_page(sort_by="modified", cursor=cursor)
+
+
+def test_postgresql_get_versions_cursor(pg_app, pg_ods_platform, ods_dataset):
+    # Arrange
+    dataset_id = None
+    for title in ("First", "Second", "Third"):
+        raw = {
+            **ods_dataset,
+            "metadata": {**ods_dataset["metadata"], "default": {**ods_dataset["metadata"]["default"], "title": title}},
+        }
+        dataset_id = (
+            SyncDatasetUseCase(uow=pg_app.uow)
+            .handle(SyncDatasetCommand(platform=pg_ods_platform, platform_dataset_id=ods_dataset["uid"], raw_data=raw))
+            .dataset_id
+        )
+    # Act
+    first, total, cursor = pg_app.dataset.repository.get_versions_page(dataset_id, page_size=2)
+    second, _, last_cursor = pg_app.dataset.repository.get_versions_page(dataset_id, page_size=2, cursor=cursor)
+    # Assert
+    assert total == 3
+    assert [v["title"] for v in first + second] == ["Third", "Second", "First"]
+    assert last_cursor is None
+
+
+def test_postgresql_search_matches_title_words_and_ranks(pg_app, pg_ods_platform, ods_dataset):
+    # Arrange
+    for slug, title in (
+        ("d1", "Qualité de l'air en Île-de-France"),
+        ("d2", "Stations de mesure de la qualité de l'eau"),
+        ("d3", "Budget primitif"),
+    ):
+        raw = {
+            **ods_dataset,
+            "uid": slug,
+            "dataset_id": slug,
+            "metadata": {
+                **ods_dataset["metadata"],
+                "default": {**ods_dataset["metadata"]["default"], "title": title},
+            },
+        }
+        SyncDatasetUseCase(uow=pg_app.uow).handle(
+            SyncDatasetCommand(platform=pg_ods_platform, platform_dataset_id=slug, raw_data=raw)
+        )
+    # Act
+    items, total = pg_app.dataset.repository.search(q="qualités", sort_by="relevance")
+    by_substring, _ = pg_app.dataset.repository.search(q="primit")
+    # Assert: stemming matches the plural, the substring fallback keeps partial words working
+    assert total == 2
+    assert {item["slug"] for item in items} == {"d1", "d2"}
+    assert _walk_search(pg_app.dataset.repository, q="qualités", sort_by="relevance") == [
+        item["slug"] for item in items
+    ]
+    assert [item["slug"] for item in by_substring] == ["d3"]
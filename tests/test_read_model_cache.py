@@ -0,0 +1,66 @@
+from application.use_cases.sync_dataset import SyncDatasetCommand, SyncDatasetUseCase
+from domain.common.ports import ANALYTICS, PUBLISHERS
+from infrastructure.cache import InMemoryReadModelCache
+
+
+def test_in_memory_cache_counts_hits_and_misses():
+    # Arrange
+    cache = InMemoryReadModelCache()
+    # Act
+    missed = cache.get(ANALYTICS, "summary")
+    cache.set(ANALYTICS, "summary", {"total_datasets": 3})
+    hit = cache.get(ANALYTICS, "summary")
+    # Assert
+    assert missed is None
+    assert hit == {"total_datasets": 3}
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+
+
+def test_in_memory_cache_expires_entries():
+    # Arrange
+    cache = InMemoryReadModelCache(ttl=0)
+    cache.set(ANALYTICS, "summary", {"total_datasets": 3})
+    # Act & Assert
+    assert cache.get(ANALYTICS, "summary") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    # Arrange
+    cache = InMemoryReadModelCache(max_entries=2)
+    cache.set(PUBLISHERS, "a", ["A"])
+    cache.set(PUBLISHERS, "b", ["B"])
+    cache.get(PUBLISHERS, "a")
+    # Act
+    cache.set(PUBLISHERS, "c", ["C"])
+    # Assert
+    assert cache.get(PUBLISHERS, "b") is None
+    assert cache.get(PUBLISHERS, "a") == ["A"]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_in_memory_cache_invalidates_whole_namespaces():
+    # Arrange
+    cache = InMemoryReadModelCache()
+    cache.set(ANALYTICS, "summary", {})
+    cache.set(ANALYTICS, "direction-health", [])
+    cache.set(PUBLISHERS, "None:None:50", [])
+    # Act
+    cache.invalidate(ANALYTICS)
+    # Assert
+    assert cache.get(ANALYTICS, "summary") is None
+    assert cache.get(ANALYTICS, "direction-health") is None
+    assert cache.get(PUBLISHERS, "None:None:50") == []
+
+
+def test_sync_dataset_invalidates_cached_analytics(app, ods_platform, ods_dataset):
+    # Arrange
+    app.uow.cache = InMemoryReadModelCache()
+    app.uow.cache.set(ANALYTICS, "summary", {"total_datasets": 0})
+    # Act
+    SyncDatasetUseCase(uow=app.uow).handle(
+        SyncDatasetCommand(platform=ods_platform, platform_dataset_id=ods_dataset["uid"], raw_data=ods_dataset)
+    )
+    # Assert
+    assert app.uow.cache.get(ANALYTICS, "summary") is None
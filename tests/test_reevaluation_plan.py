@@ -0,0 +1,99 @@
+import copy
+from datetime import datetime
+
+import pytest
+
+from application.services.quality_assessment import QualityAssessmentService
+from application.use_cases.enqueue_evaluations import EnqueueEvaluationsCommand, EnqueueEvaluationsUseCase
+from application.use_cases.plan_reevaluation import PlanReevaluationCommand, PlanReevaluationUseCase
+from application.use_cases.sync_dataset import SyncDatasetCommand, SyncDatasetUseCase
+from domain.quality.evaluation import MetadataEvaluation
+from domain.quality.jobs import EvaluationJobSelection
+from domain.quality.ports import LLMEvaluator
+
+
+class FixedEvaluator(LLMEvaluator):
+    model_name = "test-model"
+    prompt_version = "1"
+
+    def evaluate_metadata(self, dataset, dcat_reference, charter, output, prompt_type="standard"):
+        return MetadataEvaluation(
+            dataset_id=None,
+            dataset_slug=None,
+            evaluated_at=datetime.now(),
+            overall_score=60.0,
+            criteria_scores={},
+            suggestions=[],
+        )
+
+
+def _sync(pg_app, platform, raw):
+    command = SyncDatasetCommand(platform=platform, platform_dataset_id=raw["uid"], raw_data=raw)
+    return SyncDatasetUseCase(uow=pg_app.uow).handle(command).dataset_id
+
+
+@pytest.fixture
+def evaluated_dataset(pg_app, pg_ods_platform, ods_dataset):
+    dataset_id = _sync(pg_app, pg_ods_platform, ods_dataset)
+    QualityAssessmentService(evaluator=FixedEvaluator(), uow=pg_app.uow, mappers=pg_app.mappers).evaluate_dataset(
+        dataset_id, "docs/quality/dcat_reference.md", "docs/quality/charter_opendata.md", "json"
+    )
+    return dataset_id
+
+
+def test_only_datasets_whose_metadata_drifted_are_queued(pg_app, pg_ods_platform, ods_dataset, evaluated_dataset):
+    # Arrange
+    use_case = PlanReevaluationUseCase(pg_app.uow)
+    command = PlanReevaluationCommand(drift_threshold=10.0, daily_budget=10)
+    before = use_case.handle(command)
+    changed = copy.deepcopy(ods_dataset)
+    description = "Effectifs des agents de la direction par service et par grade"
+    changed["metas"]["default"]["description"] = description
+    changed["metadata"]["default"]["description"] = {"value": description}
+    _sync(pg_app, pg_ods_platform, changed)
+    # Act
+    after = use_case.handle(command)
+    # Assert
+    assert (before.plan.unchanged, before.plan.queued) == (1, [])
+    assert [c.dataset_id for c in after.plan.queued] == [evaluated_dataset]
+    assert after.plan.queued[0].drift >= 10.0
+    assert after.plan.queued[0].platform_slug == str(pg_ods_platform.slug)
+
+
+def test_queued_and_claimed_jobs_count_against_the_budget(pg_app, pg_ods_platform, ods_dataset, evaluated_dataset):
+    # Arrange
+    other = copy.deepcopy(ods_dataset)
+    other["uid"] = "da_other"
+    other["dataset_id"] = "other-dataset"
+    _sync(pg_app, pg_ods_platform, other)
+    repository = pg_app.uow.datasets
+    repository.enqueue_evaluation_jobs(EvaluationJobSelection(dataset_ids=(evaluated_dataset,)))
+    use_case = PlanReevaluationUseCase(pg_app.uow)
+    command = PlanReevaluationCommand(daily_budget=1)
+    # Act
+    queued = use_case.handle(command)
+    job = repository.claim_evaluation_jobs(worker="w1")[0]
+    repository.complete_evaluation_job(job.id, "w1")
+    claimed = use_case.handle(command)
+    # Assert
+    assert (queued.budget_used, claimed.budget_used) == (1, 1)
+    assert claimed.plan.queued == []
+    assert [c.slug for c in claimed.plan.over_budget] == ["other-dataset"]
+
+
+def test_planning_twice_a_day_stays_within_the_budget(pg_app, pg_ods_platform, ods_dataset):
+    # Arrange
+    for index in range(3):
+        other = copy.deepcopy(ods_dataset)
+        other["uid"] = f"da_{index}"
+        other["dataset_id"] = f"dataset-{index}"
+        _sync(pg_app, pg_ods_platform, other)
+    use_case = EnqueueEvaluationsUseCase(pg_app.uow)
+    command = EnqueueEvaluationsCommand(drift_threshold=10.0, daily_budget=2)
+    # Act
+    first = use_case.handle(command)
+    for job in pg_app.uow.datasets.claim_evaluation_jobs(worker="w1", limit=10):
+        pg_app.uow.datasets.complete_evaluation_job(job.id, "w1")
+    second = use_case.handle(command)
+    # Assert
+    assert (first.enqueued, second.enqueued) == (2, 0)
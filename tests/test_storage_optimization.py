@@ -205,9 +205,10 @@ def test_version_diff_tracking(pg_app, pg_datagouv_platform, datagouv_dataset):
     # Version 2 should have a diff showing the title change
     v2 = dataset.versions[1]
     assert v2.diff is not None
-    assert v2.diff["title"]["_t"] == "changed"
-    assert v2.diff["title"]["new"] == "Updated Title"
-    assert v2.diff["title"]["old"] == datagouv_dataset["title"]
+    title_op = next(op for op in v2.diff if op["path"] == "/title")
+    assert title_op["op"] == "replace"
+    assert title_op["value"] == "Updated Title"
+    assert title_op["old"] == datagouv_dataset["title"]
 
     # Act 2: Third sync with only a metric change
     # Bypass cooldown
@@ -232,8 +233,8 @@ def test_version_diff_tracking(pg_app, pg_datagouv_platform, datagouv_dataset):
     v3 = dataset.versions[2]
     assert v3.diff is not None
     # The diff should show the view change
-    assert "views_count" in v3.diff
-    assert v3.diff["views_count"]["new"] == 20000
+    views_op = next(op for op in v3.diff if op["path"] == "/views_count")
+    assert views_op["value"] == 20000
 
 
 @pytest.mark.skip(reason="Cooldown is disabled (hours=0) for now")
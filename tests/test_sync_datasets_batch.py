@@ -0,0 +1,84 @@
+import copy
+
+from application.use_cases.sync_datasets_batch import SyncDatasetsBatchCommand, SyncDatasetsBatchUseCase
+from domain.datasets.value_objects import DatasetVersionParams
+
+
+def _variants(ods_dataset, count):
+    datasets = []
+    for i in range(count):
+        dataset = copy.deepcopy(ods_dataset)
+        dataset["uid"] = f"{ods_dataset['uid']}-{i}"
+        dataset["dataset_id"] = f"{ods_dataset['dataset_id']}-{i}"
+        datasets.append(dataset)
+    return datasets
+
+
+def test_batch_sync_creates_datasets_and_versions(pg_app, pg_ods_platform, ods_dataset):
+    # Arrange
+    datasets = _variants(ods_dataset, 3)
+    # Act
+    result = SyncDatasetsBatchUseCase(pg_app.uow).handle(SyncDatasetsBatchCommand(pg_ods_platform, datasets, 2))
+    # Assert
+    assert result.success_count == 3
+    assert pg_app.uow.client.fetchone("SELECT COUNT(*) AS n FROM dataset_versions")["n"] == 3
+
+
+def test_batch_sync_skips_unchanged_versions(pg_app, pg_ods_platform, ods_dataset):
+    # Arrange
+    datasets = _variants(ods_dataset, 2)
+    SyncDatasetsBatchUseCase(pg_app.uow).handle(SyncDatasetsBatchCommand(pg_ods_platform, datasets))
+    # Act
+    SyncDatasetsBatchUseCase(pg_app.uow).handle(SyncDatasetsBatchCommand(pg_ods_platform, datasets))
+    # Assert
+    assert pg_app.uow.client.fetchone("SELECT COUNT(*) AS n FROM dataset_versions")["n"] == 2
+
+
+def test_batch_sync_versions_metric_changes_with_diff(pg_app, pg_ods_platform, ods_dataset):
+    # Arrange
+    datasets = _variants(ods_dataset, 1)
+    SyncDatasetsBatchUseCase(pg_app.uow).handle(SyncDatasetsBatchCommand(pg_ods_platform, datasets))
+    datasets[0]["download_count"] = (datasets[0].get("download_count") or 0) + 10
+    # Act
+    SyncDatasetsBatchUseCase(pg_app.uow).handle(SyncDatasetsBatchCommand(pg_ods_platform, datasets))
+    # Assert
+    dataset = pg_app.dataset.repository.get_by_buid(datasets[0]["uid"])
+    versions = pg_app.dataset.repository.get(dataset.id).versions
+    assert len(versions) == 2
+    assert "/downloads_count" in [op["path"] for op in versions[-1].diff]
+
+
+def test_batch_sync_reuses_stored_blobs_without_rewriting_them(pg_app, pg_ods_platform, ods_dataset):
+    # Arrange
+    datasets = _variants(ods_dataset, 2)
+    SyncDatasetsBatchUseCase(pg_app.uow).handle(SyncDatasetsBatchCommand(pg_ods_platform, datasets))
+    blobs = pg_app.uow.client.fetchall("SELECT id, xmin::text AS xmin FROM dataset_blobs ORDER BY id")
+    for dataset in datasets:
+        dataset["download_count"] = (dataset.get("download_count") or 0) + 10
+    # Act
+    SyncDatasetsBatchUseCase(pg_app.uow).handle(SyncDatasetsBatchCommand(pg_ods_platform, datasets))
+    # Assert
+    assert pg_app.uow.client.fetchone("SELECT COUNT(*) AS n FROM dataset_versions")["n"] == 4
+    assert pg_app.uow.client.fetchall("SELECT id, xmin::text AS xmin FROM dataset_blobs ORDER BY id") == blobs
+
+
+def test_add_versions_finds_stored_blobs_missing_from_known_blobs(pg_app, pg_ods_platform, ods_dataset):
+    # Arrange
+    datasets = _variants(ods_dataset, 1)
+    SyncDatasetsBatchUseCase(pg_app.uow).handle(SyncDatasetsBatchCommand(pg_ods_platform, datasets))
+    repository = pg_app.dataset.repository
+    dataset = repository.get_by_buid(datasets[0]["uid"])
+    params = DatasetVersionParams(
+        dataset_id=dataset.id,
+        snapshot=dataset.current_version.blob_data,
+        checksum=dataset.checksum,
+        title=dataset.title,
+        diff=[],
+    )
+    known_blobs = {}
+    # Act
+    repository.add_versions([params], known_blobs=known_blobs)
+    # Assert
+    assert known_blobs == {(str(dataset.id), dataset.current_version.blob_hash): dataset.current_version.blob_id}
+    versions = pg_app.uow.client.fetchall("SELECT DISTINCT blob_id FROM dataset_versions")
+    assert len(versions) == 1
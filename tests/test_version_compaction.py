@@ -0,0 +1,192 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from psycopg2.extras import Json
+
+from application.use_cases.compact_dataset_versions import (
+    CompactDatasetVersionsCommand,
+    CompactDatasetVersionsUseCase,
+)
+from application.use_cases.sync_dataset import SyncDatasetCommand, SyncDatasetUseCase
+
+_HISTORY_SQL = """
+    SELECT timestamp, blob_id, views_count, diff FROM dataset_versions WHERE dataset_id = %s ORDER BY timestamp
+"""
+
+
+def _insert_history(pg_app, pg_ods_platform, ods_dataset, versions) -> tuple:
+    """Sync a dataset, then insert `versions` (hours after a Monday 200 days ago, blob 'current' or 'other', views,
+    diff) before its synced version."""
+    dataset_id = (
+        SyncDatasetUseCase(uow=pg_app.uow)
+        .handle(
+            SyncDatasetCommand(platform=pg_ods_platform, platform_dataset_id=ods_dataset["uid"], raw_data=ods_dataset)
+        )
+        .dataset_id
+    )
+    client = pg_app.uow.client
+    current = client.fetchone("SELECT blob_id, checksum FROM dataset_current WHERE dataset_id = %s", (str(dataset_id),))
+    other_blob = client.fetchone(
+        "INSERT INTO dataset_blobs (dataset_id, hash, data) VALUES (%s, 'old', '{}') RETURNING id", (str(dataset_id),)
+    )["id"]
+    blobs = {"current": (current["blob_id"], current["checksum"]), "other": (other_blob, "changed")}
+    day = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=200)
+    day -= timedelta(days=day.weekday())  # All hours in the same week
+    rows = [
+        (str(dataset_id), day + timedelta(hours=hours), *blobs[blob], views, Json(diff) if diff else None)
+        for hours, blob, views, diff in versions
+    ]
+    client.execute_values(
+        "INSERT INTO dataset_versions (dataset_id, timestamp, blob_id, checksum, views_count, diff) VALUES %s", rows
+    )
+    client.execute(
+        "UPDATE dataset_current SET versions_count = versions_count + %s WHERE dataset_id = %s",
+        (len(rows), str(dataset_id)),
+    )
+    client.commit()
+    return dataset_id
+
+
+@pytest.fixture
+def history(pg_app, pg_ods_platform, ods_dataset):
+    """A synced dataset with a Monday and a Tuesday of old history, a content change in between."""
+    return _insert_history(
+        pg_app,
+        pg_ods_platform,
+        ods_dataset,
+        [
+            (1, "current", 10, None),
+            (2, "current", 11, None),
+            (3, "current", 12, None),
+            (4, "current", 13, None),
+            (5, "other", 14, None),
+            (25, "other", 15, None),
+            (26, "other", 16, None),
+        ],
+    )
+
+
+def _views(old, new):
+    return {"op": "replace", "path": "/views_count", "old": old, "value": new}
+
+
+_TITLE_OP = {"op": "replace", "path": "/title", "old": "A", "value": "B"}
+
+
+def test_compaction_folds_heartbeats_per_day_and_keeps_content_changes(pg_app, history):
+    # Act
+    output = CompactDatasetVersionsUseCase(pg_app.uow).handle(
+        CompactDatasetVersionsCommand(daily_after_days=30, weekly_after_days=365, window_days=None)
+    )
+    # Assert
+    client = pg_app.uow.client
+    versions = client.fetchall(_HISTORY_SQL, (str(history),))
+    assert output.daily_removed == 3
+    assert [v["views_count"] for v in versions[:-1]] == [10, 13, 14, 16]
+    assert versions[1]["diff"] == [{"op": "replace", "path": "/views_count", "old": 10, "value": 13}]
+    assert versions[3]["diff"] == [{"op": "replace", "path": "/views_count", "old": 14, "value": 16}]
+    current = client.fetchone("SELECT versions_count FROM dataset_current WHERE dataset_id = %s", (str(history),))
+    assert current["versions_count"] == len(versions) == 5
+
+
+def test_compaction_folds_weekly_and_is_idempotent(pg_app, history):
+    # Arrange
+    use_case = CompactDatasetVersionsUseCase(pg_app.uow)
+    command = CompactDatasetVersionsCommand(daily_after_days=30, weekly_after_days=90, window_days=None)
+    # Act
+    first = use_case.handle(command)
+    second = use_case.handle(command)
+    # Assert
+    versions = pg_app.uow.client.fetchall(_HISTORY_SQL, (str(history),))
+    assert (first.daily_removed, first.weekly_removed) == (3, 1)
+    assert (second.daily_removed, second.weekly_removed) == (0, 0)
+    assert [v["views_count"] for v in versions[:-1]] == [10, 14, 16]
+    assert versions[2]["diff"] == [{"op": "replace", "path": "/views_count", "old": 14, "value": 16}]
+
+
+def test_compaction_resumes_from_the_last_compacted_point(pg_app, history):
+    # Arrange
+    client = pg_app.uow.client
+    first_version = client.fetchone(
+        "SELECT min(timestamp) AS ts FROM dataset_versions WHERE dataset_id = %s", (str(history),)
+    )["ts"]
+    # Last daily pass well before the history: a fixed 7 days window would not reach it anymore
+    client.execute(
+        "INSERT INTO dataset_version_compactions (bucket, compacted_until) VALUES ('day', %s)",
+        (first_version - timedelta(days=1),),
+    )
+    command = CompactDatasetVersionsCommand(daily_after_days=30, weekly_after_days=365, window_days=7)
+    # Act
+    output = CompactDatasetVersionsUseCase(pg_app.uow).handle(command)
+    # Assert
+    assert output.daily_removed == 3
+    mark = pg_app.uow.datasets.get_compacted_until("day")
+    assert mark > datetime.now(timezone.utc) - timedelta(days=31)
+    assert CompactDatasetVersionsUseCase(pg_app.uow).handle(command).daily_removed == 0
+
+
+def test_partitions_created_later_take_their_rows_from_the_default_partition(pg_app, history):
+    # Arrange
+    client = pg_app.uow.client
+    month = client.fetchone("SELECT min(timestamp)::date AS day FROM dataset_versions")["day"]
+    # Act
+    client.execute("SELECT ensure_dataset_versions_partitions(%s, %s)", (month, month))
+    # Assert
+    partitions = client.fetchall(
+        "SELECT DISTINCT tableoid::regclass::text AS partition FROM dataset_versions WHERE timestamp < now() - interval '100 days'"
+    )
+    assert partitions == [{"partition": f"dataset_versions_{month:%Y_%m}"}]
+    assert pg_app.dataset.repository.get(history).versions
+
+
+def test_compaction_rediffs_a_content_change_following_folded_heartbeats(pg_app, pg_ods_platform, ods_dataset):
+    # Arrange: [change, hb, hb, change, hb] on one day, the second change diffed against the last folded heartbeat
+    dataset_id = _insert_history(
+        pg_app,
+        pg_ods_platform,
+        ods_dataset,
+        [
+            (1, "current", 10, None),
+            (2, "current", 11, [_views(10, 11)]),
+            (3, "current", 12, [_views(11, 12)]),
+            (4, "other", 13, [_TITLE_OP, _views(12, 13)]),
+            (5, "other", 14, [_views(13, 14)]),
+        ],
+    )
+    command = CompactDatasetVersionsCommand(daily_after_days=30, weekly_after_days=365, window_days=None)
+    # Act
+    CompactDatasetVersionsUseCase(pg_app.uow).handle(command)
+    # Assert: replaying the counters ops from the first version gives back every stored counter
+    versions = pg_app.uow.client.fetchall(_HISTORY_SQL, (str(dataset_id),))[:-1]
+    assert [v["views_count"] for v in versions] == [10, 13, 14]
+    assert versions[1]["diff"] == [_TITLE_OP, _views(10, 13)]
+    views = versions[0]["views_count"]
+    for version in versions[1:]:
+        for op in version["diff"]:
+            if op["path"] == "/views_count":
+                assert op["old"] == views
+                views = op["value"]
+        assert views == version["views_count"]
+
+
+def test_compaction_rediffs_legacy_object_diffs_in_their_format(pg_app, pg_ods_platform, ods_dataset):
+    # Arrange
+    title = {"_t": "changed", "old": "A", "new": "B"}
+    dataset_id = _insert_history(
+        pg_app,
+        pg_ods_platform,
+        ods_dataset,
+        [
+            (1, "current", 10, None),
+            (2, "current", 11, None),
+            (3, "current", 12, None),
+            (4, "other", 13, {"title": title, "views_count": {"_t": "changed", "old": 12, "new": 13}}),
+            (5, "other", 14, None),
+        ],
+    )
+    command = CompactDatasetVersionsCommand(daily_after_days=30, weekly_after_days=365, window_days=None)
+    # Act
+    CompactDatasetVersionsUseCase(pg_app.uow).handle(command)
+    # Assert
+    versions = pg_app.uow.client.fetchall(_HISTORY_SQL, (str(dataset_id),))
+    assert versions[1]["diff"] == {"title": title, "views_count": {"_t": "changed", "old": 10, "new": 13}}
@@ -0,0 +1,61 @@
+from datetime import timedelta
+
+import pytest
+
+from application.use_cases.sync_dataset import SyncDatasetCommand, SyncDatasetUseCase
+from domain.datasets.entities import VersionHistory
+from domain.datasets.value_objects import DatasetMetricsParams
+
+
+@pytest.fixture
+def dataset_id(pg_app, pg_ods_platform, ods_dataset):
+    """A dataset with a content version followed by 4 metrics-only versions (downloads 1 to 4)."""
+    dataset_id = (
+        SyncDatasetUseCase(uow=pg_app.uow)
+        .handle(
+            SyncDatasetCommand(platform=pg_ods_platform, platform_dataset_id=ods_dataset["uid"], raw_data=ods_dataset)
+        )
+        .dataset_id
+    )
+    for downloads_count in range(1, 5):
+        with pg_app.uow:
+            pg_app.uow.datasets.add_metrics_versions(
+                [DatasetMetricsParams(dataset_id=dataset_id, downloads_count=downloads_count)]
+            )
+    return dataset_id
+
+
+def test_get_reads_versions_on_demand(pg_app, dataset_id):
+    # Act
+    versions = pg_app.uow.datasets.get(dataset_id).versions
+    # Assert
+    assert isinstance(versions, VersionHistory)
+    assert len(versions) == 5
+    assert versions[-1].downloads_count == 4
+    assert versions[-1].snapshot["dataset_id"] == versions[0].snapshot["dataset_id"]
+    assert [v.downloads_count for v in versions.last(2)] == [3, 4]
+
+
+def test_version_history_iterates_in_chunks_in_both_directions(pg_app, dataset_id):
+    # Arrange
+    versions = VersionHistory(pg_app.uow.datasets, dataset_id, chunk_size=2)
+    # Act / Assert
+    assert [v.downloads_count for v in versions][1:] == [1, 2, 3, 4]
+    assert [v.downloads_count for v in reversed(versions)][:-1] == [4, 3, 2, 1]
+    assert [v.downloads_count for v in versions[1:3]] == [1, 2]
+
+
+def test_version_history_projections(pg_app, dataset_id):
+    # Arrange
+    versions = pg_app.uow.datasets.get(dataset_id).versions
+    latest = versions[-1].timestamp
+    # Act
+    metrics = versions.metrics_only()
+    window = versions.between(start=versions[1].timestamp, end=latest)
+    empty = versions.between(start=latest + timedelta(seconds=1))
+    # Assert
+    assert all(v.snapshot is None for v in metrics) and len(metrics) == 5
+    assert [v.downloads_count for v in window] == [1, 2, 3] and len(window) == 3
+    assert len(empty) == 0 and not empty
+    with pytest.raises(IndexError):
+        empty[-1]
@@ -1,11 +1,13 @@
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
 from application.services.quality_assessment import QualityAssessmentService
+from domain.quality.evaluation import LLMUsage
 
 
 @dataclass
@@ -14,6 +16,8 @@ class MockEval:
     dataset_slug: str = ""
     overall_score: float = 80.0
     evaluated_at: datetime = datetime.now()
+    cached: bool = False
+    usage: LLMUsage | None = None
 
 
 @pytest.fixture
@@ -22,6 +26,7 @@ def qa_deps():
     dataset = MagicMock(id=uuid4(), slug=MagicMock(), versions=[], downloads_count=0, api_calls_count=0)
     dataset.slug.is_valid.return_value = True
     uow.datasets.get.return_value = dataset
+    uow.datasets.get_cached_evaluation.return_value = None
     return uow, evaluator, dataset
 
 
@@ -41,6 +46,77 @@ def test_evaluate_dataset_success(service, qa_deps):
     # Assert
     assert res.overall_score == 80.0
     uow.commit.assert_called_once()
+    uow.datasets.cache_evaluation.assert_called_once()
+    assert (service.cache_stats.hits, service.cache_stats.misses) == (0, 1)
+
+
+def test_evaluate_dataset_records_llm_usage(service, qa_deps):
+    # Arrange
+    _, evaluator, dataset = qa_deps
+    usage = LLMUsage(model="m", prompt_tokens=3000, completion_tokens=500, cached_prompt_tokens=2048, latency_ms=900)
+    evaluator.evaluate_metadata.return_value = MockEval(usage=usage)
+    with patch.object(service, "_load_markdown", return_value="# Doc"):
+        # Act
+        service.evaluate_dataset(dataset.id, "d", "c", "json")
+        service.evaluate_dataset(dataset.id, "d", "c", "json")
+    # Assert
+    stats = service.usage_stats
+    assert (stats.calls, stats.prompt_tokens, stats.completion_tokens) == (2, 6000, 1000)
+    assert stats.cached_prompt_rate == 2048 / 3000
+    assert stats.mean_latency_ms == 900
+
+
+def test_evaluate_dataset_cache_hit_skips_llm(service, qa_deps):
+    # Arrange
+    uow, evaluator, dataset = qa_deps
+    uow.datasets.get_cached_evaluation.return_value = {
+        "dataset_id": str(dataset.id),
+        "dataset_slug": "slug",
+        "evaluated_at": "2026-10-01T12:00:00",
+        "overall_score": 65.0,
+        "criteria_scores": {
+            "title": {"criterion": "title", "category": "descriptive", "score": 65.0, "weight": 1.0, "issues": []}
+        },
+        "suggestions": [],
+    }
+    with patch.object(service, "_load_markdown", return_value="# Doc"):
+        # Act
+        res = service.evaluate_dataset(dataset.id, "d", "c", "json")
+    # Assert
+    evaluator.evaluate_metadata.assert_not_called()
+    uow.datasets.cache_evaluation.assert_not_called()
+    assert res.cached and res.overall_score == 65.0
+    assert res.cached_from == datetime(2026, 10, 1, 12)
+    assert res.evaluated_at > res.cached_from
+    assert res.criteria_scores["title"].score == 65.0
+    assert (service.cache_stats.hits, service.cache_stats.misses) == (1, 0)
+
+
+def test_evaluate_dataset_refresh_bypasses_cache(service, qa_deps):
+    # Arrange
+    uow, evaluator, dataset = qa_deps
+    evaluator.evaluate_metadata.return_value = MockEval()
+    with patch.object(service, "_load_markdown", return_value="# Doc"):
+        # Act
+        service.evaluate_dataset(dataset.id, "d", "c", "json", refresh=True)
+    # Assert
+    uow.datasets.get_cached_evaluation.assert_not_called()
+    evaluator.evaluate_metadata.assert_called_once()
+
+
+def test_aevaluate_dataset_awaits_the_evaluator(service, qa_deps):
+    # Arrange
+    uow, evaluator, dataset = qa_deps
+    evaluator.aevaluate_metadata = AsyncMock(return_value=MockEval())
+    with patch.object(service, "_load_markdown", return_value="# Doc"):
+        # Act
+        res = asyncio.run(service.aevaluate_dataset(dataset.id, "d", "c", "json"))
+    # Assert
+    assert res.overall_score == 80.0
+    evaluator.aevaluate_metadata.assert_awaited_once()
+    evaluator.evaluate_metadata.assert_not_called()
+    uow.datasets.cache_evaluation.assert_called_once()
+    assert uow.commit.call_count == 1
 
 
 def test_evaluate_dataset_not_found(service, qa_deps):
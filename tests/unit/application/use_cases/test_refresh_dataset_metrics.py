@@ -0,0 +1,90 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from application.use_cases.refresh_dataset_metrics import RefreshDatasetMetricsCommand, RefreshDatasetMetricsUseCase
+from domain.datasets.aggregate import Dataset
+
+
+@pytest.fixture
+def metrics_deps():
+    with (
+        patch("application.use_cases.refresh_dataset_metrics.PlatformAdapterFactory") as pf,
+        patch("application.use_cases.refresh_dataset_metrics.DatasetAdapterFactory") as df,
+    ):
+        uow = MagicMock()
+        existing = Dataset.from_dict(
+            {
+                "id": uuid4(),
+                "platform_id": uuid4(),
+                "buid": "b",
+                "slug": "s",
+                "page": "https://data.gouv.fr/d",
+                "created": datetime.now(),
+                "modified": datetime.now(),
+                "downloads_count": 10,
+                "last_version_timestamp": datetime.now(timezone.utc),
+            }
+        )
+        uow.datasets.get_sync_states.return_value = {"b": existing}
+        pf.return_value.create.return_value.fetch_metrics.return_value = iter([{"slug": "s"}])
+        yield uow, df.return_value.create.return_value.map
+
+
+def test_refresh_metrics_versions_changed_counters(metrics_deps):
+    # Arrange
+    uow, mapper = metrics_deps
+    mapper.return_value = MagicMock(
+        slug="s",
+        downloads_count=12,
+        api_calls_count=None,
+        views_count=None,
+        reuses_count=None,
+        followers_count=None,
+        popularity_score=None,
+    )
+    # Act
+    result = RefreshDatasetMetricsUseCase(uow).handle(RefreshDatasetMetricsCommand(uuid4()))
+    # Assert
+    assert result.updated_count == 1
+    assert uow.datasets.add_metrics_versions.call_args.args[0][0].diff == [
+        {"op": "replace", "path": "/downloads_count", "old": 10, "value": 12}
+    ]
+
+
+def test_refresh_metrics_skips_unchanged_counters(metrics_deps):
+    # Arrange
+    uow, mapper = metrics_deps
+    mapper.return_value = MagicMock(
+        slug="s",
+        downloads_count=10,
+        api_calls_count=None,
+        views_count=None,
+        reuses_count=None,
+        followers_count=None,
+        popularity_score=None,
+    )
+    # Act
+    result = RefreshDatasetMetricsUseCase(uow).handle(RefreshDatasetMetricsCommand(uuid4()))
+    # Assert
+    assert result.updated_count == 0
+
+
+def test_refresh_metrics_keeps_the_last_record_of_a_duplicated_dataset(metrics_deps):
+    # Arrange
+    uow, mapper = metrics_deps
+    counters = {"api_calls_count": None, "views_count": None, "reuses_count": None, "followers_count": None}
+    mapper.side_effect = [
+        MagicMock(slug="s", downloads_count=12, popularity_score=None, **counters),
+        MagicMock(slug="s", downloads_count=15, popularity_score=None, **counters),
+    ]
+    use_case = RefreshDatasetMetricsUseCase(uow)
+    use_case.platform_factory.create.return_value.fetch_metrics.return_value = iter([{"slug": "s"}, {"slug": "s"}])
+    # Act
+    result = use_case.handle(RefreshDatasetMetricsCommand(uuid4()))
+    # Assert
+    assert result.updated_count == 1
+    (params,) = uow.datasets.add_metrics_versions.call_args.args[0]
+    assert params.downloads_count == 15
@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from application.use_cases.sync_datasets_batch import SyncDatasetsBatchCommand, SyncDatasetsBatchUseCase
+
+
+@pytest.fixture
+def batch_dependencies():
+    with (
+        patch("application.use_cases.sync_datasets_batch.DatasetAdapterFactory"),
+        patch("application.use_cases.sync_datasets_batch.DatasetFactory.create_from_adapter") as df,
+    ):
+        uow = MagicMock()
+        uow.datasets.get_sync_states.return_value = {}
+        uow.datasets.find_by_slugs.return_value = []
+        df.side_effect = lambda adapter, platform, raw_data: MagicMock(id=uuid4(), buid=raw_data["uid"], raw=raw_data)
+        yield uow
+
+
+def test_batch_sync_persists_by_chunks(batch_dependencies, ods_platform):
+    # Arrange
+    uow = batch_dependencies
+    datasets = [{"uid": f"d{i}"} for i in range(3)]
+    # Act
+    result = SyncDatasetsBatchUseCase(uow).handle(SyncDatasetsBatchCommand(ods_platform, datasets, batch_size=2))
+    # Assert
+    assert result.success_count == 3
+    assert uow.datasets.add_many.call_count == 2
+
+
+def test_batch_sync_counts_injected_failures(batch_dependencies, ods_platform):
+    # Arrange
+    uow = batch_dependencies
+    datasets = [{"uid": "d1"}, {"slug": "d2", "sync_status": "failed"}]
+    # Act
+    result = SyncDatasetsBatchUseCase(uow).handle(SyncDatasetsBatchCommand(ods_platform, datasets))
+    # Assert
+    assert (result.success_count, result.failed_count) == (1, 1)
+    assert result.status == "partial"
+
+
+def test_batch_sync_marks_known_failures_by_slug(batch_dependencies, ods_platform):
+    # Arrange
+    uow = batch_dependencies
+    known = MagicMock(id=uuid4(), slug="d2")
+    uow.datasets.get_sync_states.return_value = {"b1": MagicMock(id=uuid4(), slug="d1"), "b2": known}
+    datasets = [{"slug": "d2", "sync_status": "failed"}, {"slug": "d3", "sync_status": "failed"}]
+    # Act
+    SyncDatasetsBatchUseCase(uow).handle(SyncDatasetsBatchCommand(ods_platform, datasets))
+    # Assert
+    uow.datasets.update_datasets_sync_status.assert_any_call(ods_platform.id, [known.id], "failed")
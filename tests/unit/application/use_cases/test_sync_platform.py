@@ -4,6 +4,7 @@ from uuid import uuid4
 import pytest
 
 from application.use_cases.sync_platform import SyncPlatformCommand, SyncPlatformUseCase
+from domain.common.ports import ANALYTICS, PUBLISHERS
 
 
 @pytest.fixture
@@ -30,7 +31,8 @@ def test_sync_platform_success(use_case, sync_p_deps):
     # Assert
     assert result.status == "success"
     uow.platforms.save_sync.assert_called_once()
-    uow.datasets.refresh_materialized_views.assert_called_once()
+    uow.datasets.rebuild_direction_health.assert_not_called()
+    uow.cache.invalidate.assert_called_once_with(ANALYTICS, PUBLISHERS)
 
 
 def test_sync_platform_not_found(use_case, sync_p_deps):
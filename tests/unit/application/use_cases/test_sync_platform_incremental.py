@@ -0,0 +1,89 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from application.use_cases.sync_platform_incremental import (
+    IncrementalSyncPlatformCommand,
+    IncrementalSyncPlatformUseCase,
+)
+from domain.common.constants import INCREMENTAL_SYNC_MAX_ATTEMPTS
+from domain.datasets.exceptions import DatasetGoneError
+
+
+@pytest.fixture
+def incremental_deps():
+    with (
+        patch("application.use_cases.sync_platform_incremental.PlatformAdapterFactory") as pf,
+        patch("application.use_cases.sync_platform_incremental.DatasetAdapterFactory"),
+        patch("application.use_cases.sync_platform_incremental.SyncDatasetsBatchUseCase") as batch,
+    ):
+        uow = MagicMock()
+        uow.platforms.get.return_value = MagicMock(type="t", url="https://v.com", key="k", slug="s", last_sync=None)
+        uow.platforms.get_retry_datasets.return_value = {}
+        batch.return_value.handle.return_value = MagicMock(failed_count=0, success_count=0, failed_datasets=())
+        yield uow, pf.return_value.create.return_value
+
+
+def test_incremental_sync_uses_high_water_mark(incremental_deps):
+    # Arrange
+    uow, adapter = incremental_deps
+    uow.platforms.get_high_water_mark.return_value = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+    adapter.fetch_modified_since.return_value = iter([])
+    # Act
+    result = IncrementalSyncPlatformUseCase(uow).handle(IncrementalSyncPlatformCommand(uuid4()))
+    # Assert
+    assert result.status == "success"
+    assert adapter.fetch_modified_since.call_args.args[0] < datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+    assert uow.platforms.save_incremental_sync.call_args.kwargs["payload"]["mode"] == "incremental"
+
+
+def test_incremental_sync_requires_a_previous_sync(incremental_deps):
+    # Arrange
+    uow, adapter = incremental_deps
+    uow.platforms.get_high_water_mark.return_value = None
+    # Act
+    result = IncrementalSyncPlatformUseCase(uow).handle(IncrementalSyncPlatformCommand(uuid4()))
+    # Assert
+    assert result.status == "failed"
+    adapter.fetch_modified_since.assert_not_called()
+
+
+def test_incremental_sync_retries_the_datasets_left_by_the_last_run(incremental_deps):
+    # Arrange
+    uow, adapter = incremental_deps
+    uow.platforms.get_high_water_mark.return_value = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+    uow.platforms.get_retry_datasets.return_value = {"d2": 1}
+    adapter.fetch_modified_since.return_value = iter(["d1"])
+    use_case = IncrementalSyncPlatformUseCase(uow)
+    use_case.dataset_factory.create.return_value.afetch_many = AsyncMock(
+        return_value={"d1": {"uid": "d1"}, "d2": {"uid": "d2"}}
+    )
+    # Act
+    result = use_case.handle(IncrementalSyncPlatformCommand(uuid4()))
+    # Assert
+    assert result.status == "success"
+    assert use_case.dataset_factory.create.return_value.afetch_many.call_args.args[2] == ["d1", "d2"]
+    assert uow.platforms.save_incremental_sync.call_args.kwargs["payload"]["retry_datasets"] == {}
+
+
+def test_incremental_sync_drops_gone_datasets_and_gives_up_after_max_attempts(incremental_deps):
+    # Arrange
+    uow, adapter = incremental_deps
+    uow.platforms.get_high_water_mark.return_value = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+    uow.platforms.get_retry_datasets.return_value = {"gone": 1, "flaky": 1, "stuck": INCREMENTAL_SYNC_MAX_ATTEMPTS - 1}
+    adapter.fetch_modified_since.return_value = iter([])
+    use_case = IncrementalSyncPlatformUseCase(uow)
+    use_case.dataset_factory.create.return_value.afetch_many = AsyncMock(
+        return_value={
+            "gone": DatasetGoneError("404"),
+            "flaky": TimeoutError("read timeout"),
+            "stuck": TimeoutError("read timeout"),
+        }
+    )
+    # Act
+    result = use_case.handle(IncrementalSyncPlatformCommand(uuid4()))
+    # Assert
+    assert result.status == "partial_success"
+    assert uow.platforms.save_incremental_sync.call_args.kwargs["payload"]["retry_datasets"] == {"flaky": 2}
@@ -0,0 +1,110 @@
+import math
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import numpy as np
+from freezegun import freeze_time
+
+from domain.datasets.aggregate import Dataset
+from domain.datasets.services import health_scoring
+
+NOW = datetime(2026, 10, 17, tzinfo=timezone.utc)
+
+CATALOG = [
+    # has_description, is_slug_valid, llm_score, syntax, modified days ago, frequency, views, api_calls, reuses, slug
+    (True, True, None, 80.0, 1, "daily", 10, 5, 0, "budget-2026"),
+    (True, False, 90.0, None, 3, "daily", 0, 0, 2, "comptes-publics"),
+    (False, True, None, None, 120, None, None, 1000, 0, "effectifs"),
+    (True, True, 100.0, 50.0, 900, "Annual", 5000, 5000, 30, "admin-logs"),
+    (False, False, None, 0.0, 9, "weekly", 0, 0, 0, "dette"),
+]
+
+
+def _dataset(has_description, is_slug_valid, llm_score, syntax, days_ago, frequency, views, api_calls, reuses, slug):
+    dataset = Dataset(
+        id=uuid4(),
+        platform_id=uuid4(),
+        buid=slug,
+        slug=slug,
+        title=slug,
+        page="http://example.com/dataset",
+        created=NOW - timedelta(days=1000),
+        modified=NOW - timedelta(days=days_ago),
+        published=True,
+        restricted=False,
+        downloads_count=0,
+        api_calls_count=api_calls,
+        views_count=views,
+        reuses_count=reuses,
+        raw={"frequency": frequency} if frequency else {},
+    )
+    dataset.add_quality(
+        downloads_count=0,
+        api_calls_count=api_calls,
+        has_description=has_description,
+        is_slug_valid=is_slug_valid,
+        evaluation_results={"overall_score": llm_score} if llm_score is not None else None,
+        syntax_change_score=syntax,
+    )
+    return dataset
+
+
+def _columns():
+    columns = list(zip(*CATALOG, strict=True))
+    columns[4] = [NOW - timedelta(days=days) for days in columns[4]]
+    return columns
+
+
+@freeze_time(NOW)
+def test_health_scores_match_dataset_scores():
+    # Arrange
+    datasets = [_dataset(*row) for row in CATALOG]
+    # Act
+    scores = health_scoring.health_scores(*_columns(), now=NOW)
+    # Assert
+    expected = [
+        (
+            d.quality.health_score,
+            d.quality.health_quality_score,
+            d.quality.health_freshness_score,
+            d.quality.health_engagement_score,
+        )
+        for d in datasets
+    ]
+    assert scores.rows() == expected
+
+
+def test_health_scores_known_values():
+    # Act
+    scores = health_scoring.health_scores(*_columns(), now=NOW)
+    # Assert
+    assert scores.quality.tolist() == [92.0, 83.0, 20.0, 100.0, 0.0]
+    assert scores.freshness.tolist() == [100.0, 50.0, 50.0, 0.0, 100.0]
+    assert scores.engagement[3] == 100.0  # admin datasets
+    assert scores.engagement[2] == round(math.log1p(1000) * 3, 2)
+
+
+def test_health_scores_leave_unscored_datasets_empty():
+    # Act
+    scores = health_scoring.health_scores(*_columns(), scored=[True, False, True, True, False], now=NOW)
+    # Assert
+    rows = scores.rows()
+    assert rows[1] == (None, None, None, None)
+    assert rows[4] == (None, None, None, None)
+    assert None not in rows[0]
+
+
+def test_threshold_days_defaults_unknown_frequencies():
+    # Act
+    days = health_scoring.threshold_days(["monthly", "MONTHLY", None, "irregular"])
+    # Assert
+    assert days.tolist() == [37.0, 37.0, 90.0, 90.0]
+
+
+def test_freshness_scores_accept_datetime64_columns():
+    # Arrange
+    modified = np.array(["2026-10-16", "2026-09-01", "2026-01-01"], dtype="datetime64[D]")
+    # Act
+    scores = health_scoring.freshness_scores(modified, ["weekly"] * 3, now=NOW)
+    # Assert
+    assert scores.tolist() == [100.0, 0.0, 0.0]
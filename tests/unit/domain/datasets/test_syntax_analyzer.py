@@ -63,3 +63,14 @@ def test_empty_analyze_change():
     analysis = SyntaxAnalyzer.analyze_change({}, {"title": "New"})
     assert "syntax_score" in analysis
     assert analysis["structure_changed"] is True
+
+
+def test_analyze_change_reads_opendatasoft_metas():
+    old_raw = {"metas": {"default": {"title": "Budget 2023", "description": "Données budgétaires"}}}
+    new_raw = {"metas": {"default": {"title": "Effectifs", "description": "Effectifs par service"}}}
+    # Act
+    analysis = SyntaxAnalyzer.analyze_change(old_raw, new_raw)
+    # Assert
+    assert SyntaxAnalyzer.get_text_field({"metadata": {"default": {"title": {"value": "T"}}}}, "title") == "T"
+    assert analysis["title_similarity"] < 50.0
+    assert analysis["structure_changed"] is False
@@ -0,0 +1,79 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from domain.datasets.aggregate import Dataset
+from domain.datasets.entities import DatasetVersion, VersionHistory
+
+
+def test_latest_version_is_read_alone_and_kept():
+    # Arrange
+    repository = MagicMock()
+    dataset_id = uuid4()
+    repository.load_versions.return_value = [DatasetVersion(dataset_id=dataset_id, snapshot={"title": "t"})]
+    versions = VersionHistory(repository, dataset_id)
+    # Act
+    first, second = versions[-1], versions[-1]
+    # Assert
+    assert first is second
+    repository.load_versions.assert_called_once()
+    assert repository.load_versions.call_args.kwargs["limit"] == 1
+    assert repository.load_versions.call_args.kwargs["newest_first"] is True
+    repository.count_versions.assert_not_called()
+
+
+def test_between_stays_within_the_current_bounds():
+    # Arrange
+    versions = VersionHistory(MagicMock(), uuid4(), start=10, end=20)
+    # Act
+    window = versions.between(start=5, end=15).metrics_only()
+    # Assert
+    assert (window.start, window.end, window.with_snapshots) == (10, 15, False)
+
+
+def test_appended_versions_follow_the_stored_ones():
+    # Arrange
+    repository = MagicMock()
+    dataset_id = uuid4()
+    stored = DatasetVersion(dataset_id=dataset_id, snapshot={"title": "stored"})
+    repository.count_versions.return_value = 1
+    repository.load_versions.return_value = [stored]
+    versions = VersionHistory(repository, dataset_id)
+    added = DatasetVersion(dataset_id=dataset_id, snapshot={"title": "added"})
+    # Act
+    versions.append(added)
+    # Assert
+    assert len(versions) == 2
+    assert versions[-1] is added and versions[1] is added
+    assert versions[-2] is stored
+    assert list(versions) == [stored, added]
+    assert versions.last(1) == [added]
+
+
+def test_dataset_add_version_and_to_dict_do_not_read_a_lazy_history():
+    # Arrange
+    repository = MagicMock()
+    now = datetime.now(timezone.utc)
+    dataset = Dataset(
+        id=uuid4(),
+        platform_id=uuid4(),
+        buid="buid",
+        slug="slug",
+        title="Title",
+        page="http://example.com",
+        created=now,
+        modified=now,
+        published=True,
+        restricted=False,
+        downloads_count=0,
+        api_calls_count=0,
+        raw={},
+    )
+    dataset.versions = VersionHistory(repository, dataset.id)
+    # Act
+    dataset.add_version(dataset_id=dataset.id, snapshot={"title": "t"}, checksum="c")
+    result = dataset.to_dict()
+    # Assert
+    assert [v["checksum"] for v in result["versions"]] == ["c"]
+    repository.load_versions.assert_not_called()
+    repository.count_versions.assert_not_called()
@@ -0,0 +1,37 @@
+from domain.quality.context_budget import context_tokens, trim_context
+
+
+def test_context_within_budget_is_left_untouched():
+    # Arrange
+    context = {"id": "1", "slug": "budget", "title": "Budget", "description": "Budget primitif 2026"}
+    # Act
+    trimmed = trim_context(context, max_tokens=1000)
+    # Assert
+    assert trimmed is context
+
+
+def test_long_values_are_cut_with_their_original_size():
+    # Arrange
+    context = {"id": "1", "title": "Budget", "metas": {"description": "x" * 20_000, "keyword": list(range(100))}}
+    # Act
+    trimmed = trim_context(context, max_tokens=1500)
+    # Assert
+    assert context_tokens(trimmed) <= 1500
+    assert trimmed["metas"]["description"].endswith("[tronqué, 20000 caractères]")
+    assert trimmed["metas"]["keyword"][-1] == "… [50 éléments de plus]"
+    assert len(context["metas"]["description"]) == 20_000
+
+
+def test_largest_fields_are_dropped_last_keeping_the_dataset_identity():
+    # Arrange
+    context = {
+        "id": "1",
+        "slug": "budget",
+        "title": "Budget",
+        "extras": {f"field_{i}": "valeur" * 80 for i in range(60)},
+        "license": "Licence Ouverte v2.0",
+    }
+    # Act
+    trimmed = trim_context(context, max_tokens=100)
+    # Assert
+    assert list(trimmed) == ["id", "slug", "title", "license"]
@@ -0,0 +1,57 @@
+from uuid import uuid4
+
+from domain.quality.reevaluation import MIN_CHANGED_DRIFT, NEVER_EVALUATED, UNKNOWN_BASELINE, plan_reevaluations
+
+
+def _row(evaluated=True, same_blob=False, evaluated_title="Budget", current_title="Budget", engagement=0.0):
+    blob_id = uuid4()
+    return {
+        "id": uuid4(),
+        "slug": f"dataset-{current_title.lower().replace(' ', '-')}",
+        "health_score": 50.0,
+        "health_engagement_score": engagement,
+        "evaluated": evaluated,
+        "current_blob_id": blob_id,
+        "evaluated_blob_id": blob_id if same_blob else uuid4(),
+        "current_data": {"title": current_title, "description": "Données budgétaires"},
+        "evaluated_data": {"title": evaluated_title, "description": "Données budgétaires"},
+    }
+
+
+def test_plan_skips_unchanged_and_small_drifts():
+    rows = [
+        _row(same_blob=True),
+        _row(current_title="Budget"),  # New blob, same title and description
+        _row(evaluated_title="Budget 2023", current_title="Budget 2024"),
+        _row(evaluated_title="Budget", current_title="Effectifs des agents"),
+    ]
+    # Act
+    plan = plan_reevaluations(rows, threshold=10.0, budget=10)
+    # Assert
+    assert (plan.unchanged, plan.below_threshold) == (1, 2)
+    assert [c.slug for c in plan.queued] == ["dataset-effectifs-des-agents"]
+    assert 10.0 <= plan.queued[0].drift < 100.0
+
+
+def test_plan_never_counts_a_changed_blob_as_unchanged():
+    rows = [_row(same_blob=True), _row(current_title="Budget")]  # New blob, same title and description
+    # Act
+    plan = plan_reevaluations(rows, threshold=0.0, budget=10)
+    # Assert
+    assert plan.unchanged == 1
+    assert [c.drift for c in plan.queued] == [MIN_CHANGED_DRIFT]
+
+
+def test_plan_orders_by_priority_within_budget():
+    rows = [
+        _row(evaluated_title="Budget", current_title="Effectifs des agents"),
+        _row(evaluated_title="Budget", current_title="Effectifs des services", engagement=100.0),
+        _row(evaluated=False, current_title="Nouveau"),
+        {**_row(current_title="Ancien"), "evaluated_data": None},
+    ]
+    # Act
+    plan = plan_reevaluations(rows, threshold=10.0, budget=2)
+    # Assert
+    assert [c.reason for c in plan.queued] == [NEVER_EVALUATED, UNKNOWN_BASELINE]
+    assert [c.slug for c in plan.over_budget] == ["dataset-effectifs-des-services", "dataset-effectifs-des-agents"]
+    assert plan.over_budget[0].priority > plan.over_budget[1].priority
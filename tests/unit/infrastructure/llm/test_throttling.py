@@ -0,0 +1,55 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from domain.quality.context_budget import estimate_tokens
+from infrastructure.llm.throttling import RateLimiter, TokenBucket, retry_with_backoff
+
+
+def test_token_bucket_waits_for_refill_once_empty():
+    # Arrange
+    bucket = TokenBucket(per_minute=60)  # One token per second
+    bucket.available = 0.0
+
+    async def sleep(delay):  # Let the clock move by the delay waited
+        bucket.updated -= delay
+
+    # Act
+    with patch("infrastructure.llm.throttling.asyncio.sleep", new=AsyncMock(side_effect=sleep)) as mock_sleep:
+        asyncio.run(bucket.acquire(1))
+    # Assert
+    mock_sleep.assert_awaited_once()
+    assert mock_sleep.await_args.args[0] == pytest.approx(1.0, abs=0.05)
+
+
+def test_rate_limiter_does_not_wait_within_limits():
+    # Arrange
+    limiter = RateLimiter(requests_per_minute=10, tokens_per_minute=10_000)
+    # Act
+    with patch("infrastructure.llm.throttling.asyncio.sleep", new=AsyncMock()) as sleep:
+        asyncio.run(limiter.acquire(estimate_tokens("x" * 4000, completion_tokens=1000)))
+    # Assert
+    sleep.assert_not_awaited()
+    assert limiter.tokens.available == pytest.approx(8000, abs=1)
+
+
+def test_retry_with_backoff_retries_retryable_errors():
+    # Arrange
+    call = AsyncMock(side_effect=[TimeoutError(), TimeoutError(), "ok"])
+    # Act
+    with patch("infrastructure.llm.throttling.asyncio.sleep", new=AsyncMock()) as sleep:
+        result = asyncio.run(retry_with_backoff(call, lambda e: isinstance(e, TimeoutError), attempts=5))
+    # Assert
+    assert result == "ok"
+    assert call.await_count == 3
+    assert sleep.await_count == 2
+
+
+def test_retry_with_backoff_raises_other_errors_at_once():
+    # Arrange
+    call = AsyncMock(side_effect=ValueError("bad prompt"))
+    # Act & Assert
+    with pytest.raises(ValueError, match="bad prompt"):
+        asyncio.run(retry_with_backoff(call, lambda e: isinstance(e, TimeoutError)))
+    assert call.await_count == 1
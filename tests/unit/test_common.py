@@ -0,0 +1,81 @@
+from common import calculate_snapshot_patch, deep_merge
+
+
+def _resources(count):
+    return [{"id": f"r{i}", "url": f"http://example.com/{i}.csv", "title": f"Resource {i}"} for i in range(count)]
+
+
+def test_snapshot_patch_reports_nested_changes_as_pointers():
+    # Arrange
+    old = {"title": "Budget", "metas": {"default": {"keyword": ["a", "b"]}}, "license": "etalab"}
+    new = {"title": "Budget 2026", "metas": {"default": {"keyword": ["a", "b", "c"]}}, "theme/sub": "eco"}
+    # Act
+    patch = calculate_snapshot_patch(old, new)
+    # Assert
+    assert patch == [
+        {"op": "replace", "path": "/title", "old": "Budget", "value": "Budget 2026"},
+        {"op": "replace", "path": "/metas/default/keyword", "old": ["a", "b"], "value": ["a", "b", "c"]},
+        {"op": "remove", "path": "/license"},
+        {"op": "add", "path": "/theme~1sub", "value": "eco"},
+    ]
+
+
+def test_snapshot_patch_inserting_a_resource_is_one_operation():
+    # Arrange
+    old = {"resources": _resources(500)}
+    new = {"resources": [{"id": "new", "url": "http://example.com/new.csv"}, *_resources(500)]}
+    # Act
+    patch = calculate_snapshot_patch(old, new)
+    # Assert
+    assert patch == [{"op": "add", "path": "/resources/0", "value": new["resources"][0]}]
+
+
+def test_snapshot_patch_matches_resources_by_identity():
+    # Arrange
+    old = {"resources": _resources(4)}
+    resources = _resources(4)
+    resources[2]["title"] = "Renamed"
+    new = {"resources": [resources[3], resources[0], resources[2]]}
+    # Act
+    patch = calculate_snapshot_patch(old, new)
+    # Assert
+    assert patch == [
+        {"op": "remove", "path": "/resources/1"},
+        {"op": "move", "from": "/resources/3", "path": "/resources/0"},
+        {"op": "replace", "path": "/resources/2/title", "old": "Resource 2", "value": "Renamed"},
+    ]
+
+
+def test_snapshot_patch_falls_back_to_positions_without_identity():
+    # Arrange
+    old = {"fields": [{"type": "text"}, {"type": "int"}]}
+    new = {"fields": [{"type": "text"}, {"type": "date"}, {"type": "int"}]}
+    # Act
+    patch = calculate_snapshot_patch(old, new)
+    # Assert
+    assert patch == [
+        {"op": "replace", "path": "/fields/1/type", "old": "int", "value": "date"},
+        {"op": "add", "path": "/fields/2", "value": {"type": "int"}},
+    ]
+
+
+def test_snapshot_patch_of_equal_snapshots_is_empty():
+    # Arrange
+    snapshot = {"resources": _resources(3), "count": 1}
+    # Act / Assert
+    assert calculate_snapshot_patch(snapshot, {**snapshot, "resources": _resources(3)}) == []
+
+
+def test_deep_merge_restores_volatile_fields_of_each_resource():
+    # Arrange
+    base = {"resources": [{"id": "a"}, {"id": "b"}], "title": "t"}
+    volatile = {"resources": [{"last_modified": "2026-10-01"}, {}], "last_update": "2026-10-02"}
+    # Act
+    merged = deep_merge(base, volatile)
+    # Assert
+    assert merged == {
+        "resources": [{"id": "a", "last_modified": "2026-10-01"}, {"id": "b"}],
+        "title": "t",
+        "last_update": "2026-10-02",
+    }
+    assert base["resources"][0] == {"id": "a"}
@@ -1,46 +1,108 @@
-import asyncio
+"""
+Health Score Backfill — Parallel + Checkpoint
+=============================================
+Recalcule les scores de santé de tout le catalogue (par exemple après un
+changement de pondération) : les entrées sont lues en flux, notées dans un
+pool de processus et seules les colonnes de score de dataset_quality sont
+réécrites, par lots. Reprend après le dernier lot validé si le script est
+interrompu.
+
+Usage:
+    ./venv/bin/python utils/backfill_health.py [OPTIONS]
+
+Options:
+    --batch-size N     Datasets scored and written per batch (default: 1000)
+    --workers N        Scoring processes (default: CPU count)
+    --reset            Ignore existing checkpoint and restart from scratch
+"""
+
+import argparse
+import json
 import os
 import sys
-import uuid
+import time
 
 # Add src to python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
+from application.services.health_backfill import BackfillProgress, HealthBackfillService
+from infrastructure.database.postgres import PostgresClient
+from infrastructure.repositories.datasets.postgres import PostgresDatasetRepository
 from settings import app
 
+CHECKPOINT_FILE = os.path.join(os.path.dirname(__file__), ".backfill_health_checkpoint.json")
+
 
-async def backfill_health_scores():
-    print("Starting Domain-driven health score backfill...")
-    repo = app.dataset.repository
+def load_checkpoint() -> dict:
+    """Load the last committed dataset id from the checkpoint file."""
+    if os.path.exists(CHECKPOINT_FILE):
+        try:
+            with open(CHECKPOINT_FILE) as f:
+                return json.load(f)
+        except Exception:
+            pass
+    return {}
 
-    # Get all dataset IDs
-    rows = repo.client.fetchall("SELECT id FROM datasets")
-    total = len(rows)
-    print(f"Found {total} datasets to process")
 
-    count = 0
-    for i, r in enumerate(rows):
-        if i > 0 and i % 100 == 0:
-            print(f"Progress: {i}/{total}")
-            repo.client.commit()
+def save_checkpoint(progress: BackfillProgress, already_processed: int) -> None:
+    with open(CHECKPOINT_FILE, "w") as f:
+        json.dump({"last_id": str(progress.last_id), "processed": already_processed + progress.processed}, f)
 
-        try:
-            dataset_id = uuid.UUID(r["id"])
-            # Load dataset (Repo.get fetches quality and identifying metadata)
-            dataset = repo.get(dataset_id, include_versions=False)
 
-            if dataset:
-                # Triggers domain calculation and persistence to dataset_quality
-                repo.add(dataset)
-                count += 1
-        except Exception as e:
-            print(f"Error processing {r['id']}: {e}")
+def reset_checkpoint() -> None:
+    if os.path.exists(CHECKPOINT_FILE):
+        os.remove(CHECKPOINT_FILE)
+        print("🗑  Checkpoint supprimé.")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Recompute the health scores of every dataset.")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--reset", action="store_true")
+    return parser.parse_args()
+
+
+def _reader() -> PostgresDatasetRepository:
+    """Repository on a dedicated connection: the streaming cursor must survive the commits of each batch."""
+    return PostgresDatasetRepository(
+        PostgresClient(
+            dbname=os.environ["DB_NAME"],
+            user=os.environ["DB_USER"],
+            password=os.environ["DB_PASSWORD"],
+            host="localhost",
+            port=int(os.environ["DB_PORT"]),
+        )
+    )
+
+
+def main():
+    args = parse_args()
+    if args.reset:
+        reset_checkpoint()
+    checkpoint = load_checkpoint()
+    already_processed = checkpoint.get("processed", 0)
+    if checkpoint:
+        print(f"♻️  Checkpoint trouvé : {already_processed} datasets déjà traités, reprise...")
+
+    reader = _reader()
+    total = reader.client.fetchone("SELECT count(*) AS count FROM dataset_quality")["count"]
+    print(f"📊 {total} datasets à noter, lots de {args.batch_size}")
+
+    started = time.monotonic()
+
+    def report(progress: BackfillProgress) -> None:
+        save_checkpoint(progress, already_processed)
+        done = already_processed + progress.processed
+        rate = progress.processed / max(time.monotonic() - started, 1e-6)
+        print(f"Progress: {done}/{total} ({rate:.0f} datasets/s)")
+
+    service = HealthBackfillService(uow=app.uow, reader=reader, workers=args.workers, batch_size=args.batch_size)
+    progress = service.run(after_id=checkpoint.get("last_id"), on_batch=report)
 
-    repo.client.commit()
-    # Refresh the analytics view
-    repo.client.execute("REFRESH MATERIALIZED VIEW direction_health_stats_view")
-    print(f"Backfill complete! {count} datasets updated and view refreshed.")
+    reset_checkpoint()
+    print(f"Backfill complete! {already_processed + progress.processed} datasets scored.")
 
 
 if __name__ == "__main__":
-    asyncio.run(backfill_health_scores())
+    main()
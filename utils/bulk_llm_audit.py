@@ -1,9 +1,11 @@
 """
-Bulk LLM Semantic Audit Script — Async + Checkpoint
-=====================================================
+Bulk LLM Semantic Audit Script — Async + file d'attente Postgres
+==================================================================
 Lance un audit sémantique LLM en asynchrone sur tous les datasets
-publiés et non-restreints. Reprend depuis son point d'arrêt si le
-script est interrompu.
+publiés et non-restreints. Les datasets sélectionnés sont mis en file
+(table llm_evaluation_jobs) puis traités par ce worker : on peut en lancer
+autant que voulu, sur plusieurs machines (--work-only), et un script
+interrompu reprend là où la file en est.
 
 Usage:
     ./venv/bin/python utils/bulk_llm_audit.py [OPTIONS]
@@ -14,83 +16,56 @@ Options:
     --platform SLUG    Filter by platform slug
     --publisher NAME   Filter by publisher name
     --prompt-type TYPE "light" (default) or "standard"
-    --concurrency N    Max parallel LLM calls (default: 3)
+    --concurrency N    Max datasets in flight (default: 16); the evaluator's RPM/TPM limiter
+                       (OPENAI_RPM / OPENAI_TPM) paces the LLM calls themselves, per process:
+                       with several workers, set OPENAI_WORKERS to their number
     --dry-run          List eligible datasets without calling LLM
-    --reset            Ignore existing checkpoint and restart from scratch
+    --requeue          Queue again the datasets whose job is done or failed (new audit run)
+    --work-only        Do not queue anything, only work the jobs already queued
+    --max-attempts N   Attempts per job before it is marked failed (default: 3)
+    --refresh          Call the LLM even for datasets whose metadata is already evaluated in cache
+    --drift-threshold X  Only audit datasets whose metadata drifted by X (0-100) since their last
+                       evaluation, by priority (see PlanReevaluationUseCase)
+    --daily-budget N   With --drift-threshold, max LLM evaluations per day, today's included (default: 200)
+    --batch            Submit the evaluations as one OpenAI Batch API job (half price, results within 24h)
+    --collect ID       Record the results of a completed batch
+
+File d'attente : `app quality queue status` pour suivre l'avancement,
+`quality queue enqueue` pour alimenter la file sans lancer de worker.
+
+Les évaluations sont mises en cache par empreinte des métadonnées envoyées au LLM, type de prompt,
+version des prompts et modèle : relancer l'audit après une synchronisation n'appelle le LLM que pour
+les datasets dont les métadonnées ont changé.
 """
 
 import argparse
 import asyncio
-import json
 import os
 import sys
-import time
 
 # Add src to python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
+from application.services.evaluation_worker import EvaluationWorker
 from application.services.quality_assessment import QualityAssessmentService
-from infrastructure.adapters.quality.metadata_mappers import DatagouvMetadataMapper, OpendatasoftMetadataMapper
-from infrastructure.database.postgres import PostgresClient
-from infrastructure.llm.openai_evaluator import OpenAIEvaluator
-from infrastructure.unit_of_work import PostgresUnitOfWork
+from application.use_cases.enqueue_evaluations import EnqueueEvaluationsCommand, EnqueueEvaluationsUseCase
+from application.use_cases.plan_reevaluation import PlanReevaluationCommand, PlanReevaluationUseCase
+from infrastructure.llm.openai_batch import BatchEvaluationRequest, OpenAIBatchEvaluator
 from logger import logger
 from settings import app
 
 DCAT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "docs", "quality", "dcat_reference.md"))
 CHARTER_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "dev", "docs", "charte-opendatamef.md"))
-CHECKPOINT_FILE = os.path.join(os.path.dirname(__file__), ".bulk_audit_checkpoint.json")
 
 
 def _make_service() -> QualityAssessmentService:
-    """Create a fresh QualityAssessmentService with its own DB connection.
-    Required for thread-safe concurrent execution (psycopg2 is not thread-safe).
+    """Service shared by all audit workers.
+    The LLM calls are awaited; the database work runs on the app's DB threads, one pooled
+    connection each, checked out only for the duration of a unit of work.
     """
-    import os as _os
-
-    client = PostgresClient(
-        dbname=_os.environ["DB_NAME"],
-        user=_os.environ["DB_USER"],
-        password=_os.environ["DB_PASSWORD"],
-        host="localhost",
-        port=int(_os.environ["DB_PORT"]),
+    return QualityAssessmentService(
+        evaluator=app.evaluator, uow=app.uow, mappers=app.mappers, db_executor=app.db_executor
     )
-    uow = PostgresUnitOfWork(client)
-    evaluator = OpenAIEvaluator(model_name="gpt-4o-mini")
-    mappers = {
-        "opendatasoft": OpendatasoftMetadataMapper(),
-        "datagouvfr": DatagouvMetadataMapper(),
-    }
-    return QualityAssessmentService(evaluator=evaluator, uow=uow, mappers=mappers)
-
-
-# ---------------------------------------------------------------------------
-# Checkpoint helpers
-# ---------------------------------------------------------------------------
-
-
-def load_checkpoint() -> set[str]:
-    """Load already-processed dataset IDs from the checkpoint file."""
-    if os.path.exists(CHECKPOINT_FILE):
-        try:
-            with open(CHECKPOINT_FILE) as f:
-                data = json.load(f)
-            return set(data.get("done", []))
-        except Exception:
-            pass
-    return set()
-
-
-def save_checkpoint(done: set[str]) -> None:
-    """Persist the set of processed dataset IDs to disk."""
-    with open(CHECKPOINT_FILE, "w") as f:
-        json.dump({"done": list(done)}, f)
-
-
-def reset_checkpoint() -> None:
-    if os.path.exists(CHECKPOINT_FILE):
-        os.remove(CHECKPOINT_FILE)
-        print("🗑  Checkpoint supprimé.")
 
 
 # ---------------------------------------------------------------------------
@@ -107,9 +82,16 @@ def parse_args():
     parser.add_argument("--platform", type=str, default=None)
     parser.add_argument("--publisher", type=str, default=None)
     parser.add_argument("--prompt-type", type=str, default="standard", choices=["light", "standard"])
-    parser.add_argument("--concurrency", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=16)
     parser.add_argument("--dry-run", action="store_true")
-    parser.add_argument("--reset", action="store_true")
+    parser.add_argument("--requeue", action="store_true")
+    parser.add_argument("--work-only", action="store_true")
+    parser.add_argument("--max-attempts", type=int, default=3)
+    parser.add_argument("--refresh", action="store_true")
+    parser.add_argument("--drift-threshold", type=float, default=None)
+    parser.add_argument("--daily-budget", type=int, default=200)
+    parser.add_argument("--batch", action="store_true")
+    parser.add_argument("--collect", type=str, default=None, metavar="BATCH_ID")
     return parser.parse_args()
 
 
@@ -128,11 +110,7 @@ def fetch_datasets(args) -> list[dict]:
                (dq.evaluation_results IS NOT NULL) as already_evaluated
         FROM datasets d
         JOIN platforms p ON d.platform_id = p.id
-        LEFT JOIN (
-            SELECT DISTINCT ON (dataset_id) dataset_id, evaluation_results
-            FROM dataset_quality
-            ORDER BY dataset_id, timestamp DESC
-        ) dq ON d.id = dq.dataset_id
+        LEFT JOIN dataset_quality dq ON d.id = dq.dataset_id
         WHERE d.published IS TRUE
           AND d.restricted IS NOT TRUE
           AND d.deleted IS NOT TRUE
@@ -153,67 +131,140 @@ def fetch_datasets(args) -> list[dict]:
     return rows
 
 
+def fetch_planned_datasets(args) -> list[dict]:
+    """Datasets dont les métadonnées ont assez changé depuis leur dernière évaluation, par priorité et dans le budget."""
+    output = PlanReevaluationUseCase(app.uow).handle(
+        PlanReevaluationCommand(
+            drift_threshold=args.drift_threshold,
+            daily_budget=args.daily_budget,
+            platform_slug=args.platform,
+            publisher=args.publisher,
+        )
+    )
+    plan = output.plan
+    print(
+        f"🧭 Plan : {len(plan.queued)} à réévaluer, {len(plan.over_budget)} hors budget "
+        f"({output.budget_used} évaluations en file ou faites aujourd'hui), {plan.below_threshold} sous le seuil, "
+        f"{plan.unchanged} inchangés"
+    )
+    rows = [
+        {"id": c.dataset_id, "slug": c.slug, "platform_slug": c.platform_slug, "drift": c.drift} for c in plan.queued
+    ]
+    return rows[: args.limit] if args.limit else rows
+
+
 # ---------------------------------------------------------------------------
 # Core async logic
 # ---------------------------------------------------------------------------
 
 
-async def audit_one(
-    row: dict,
-    semaphore: asyncio.Semaphore,
-    prompt_type: str,
-    done: set[str],
-    lock: asyncio.Lock,
-    counters: dict,
-) -> None:
-    """Audit a single dataset, creating a dedicated DB connection per call."""
-    dataset_id = str(row["id"])
-    slug = row["slug"]
+def enqueue(args) -> None:
+    """Met en file les datasets sélectionnés (ou le plan de réévaluation avec --drift-threshold)."""
+    output = EnqueueEvaluationsUseCase(app.uow).handle(
+        EnqueueEvaluationsCommand(
+            prompt_type=args.prompt_type,
+            platform_slug=args.platform,
+            publisher=args.publisher,
+            skip_evaluated=args.skip_evaluated,
+            limit=args.limit,
+            refresh=args.refresh,
+            requeue=args.requeue,
+            max_attempts=args.max_attempts,
+            drift_threshold=args.drift_threshold,
+            daily_budget=args.daily_budget,
+        )
+    )
+    print(f"📥 {output.enqueued} datasets mis en file")
+
+
+def _print_result(job, evaluation, error) -> None:
+    if error:
+        retry = "nouvelle tentative plus tard" if job.attempts < job.max_attempts else "abandon"
+        print(f"  ❌ {job.dataset_id} — {error} (essai {job.attempts}/{job.max_attempts}, {retry})")
+        return
+    source = "cache" if evaluation.cached else "LLM"
+    if evaluation.usage and not evaluation.cached:
+        usage = evaluation.usage
+        source += f", {usage.latency_ms or 0:.0f} ms, {usage.prompt_tokens}+{usage.completion_tokens} tokens"
+    print(f"  ✅ {evaluation.dataset_slug} ({source})")
+
+
+async def run_worker(args) -> dict:
+    """Traite la file jusqu'à ce qu'il n'y ait plus de job disponible."""
+    service = _make_service()
+    report = await EvaluationWorker(service).run(
+        DCAT_PATH, CHARTER_PATH, concurrency=args.concurrency, on_result=_print_result
+    )
+    return {
+        "success": report.done,
+        "error": report.retried + report.failed,
+        "failed_slugs": report.errors,
+        "cache": service.cache_stats,
+        "usage": service.usage_stats,
+    }
+
+
+# ---------------------------------------------------------------------------
+# OpenAI Batch API
+# ---------------------------------------------------------------------------
+
 
-    async with semaphore:
+def submit_batch(rows: list[dict], args) -> None:
+    """Prépare les datasets, enregistre ceux trouvés en cache et soumet les autres en un seul batch OpenAI."""
+    service = _make_service()
+    requests, dcat_reference, charter = [], "", ""
+    for row in rows:
         try:
-            t0 = time.time()
-
-            # Run the synchronous (blocking) LLM call in a thread pool.
-            # Each call creates its own DB connection — psycopg2 is not thread-safe.
-            def _run():
-                service = _make_service()
-                return service.evaluate_dataset(
-                    dataset_id=dataset_id,
-                    dcat_path=DCAT_PATH,
-                    charter_path=CHARTER_PATH,
-                    output="json",
-                    prompt_type=prompt_type,
-                )
-
-            await asyncio.get_event_loop().run_in_executor(None, _run)
-            elapsed = time.time() - t0
-
-            async with lock:
-                done.add(dataset_id)
-                counters["success"] += 1
-                idx = counters["success"] + counters["error"]
-                print(f"  ✅ [{idx}/{counters['total']}] {slug} ({elapsed:.1f}s)")
-                # Save checkpoint after each success
-                save_checkpoint(done)
+            prepared = service.prepare_evaluation(
+                str(row["id"]), DCAT_PATH, CHARTER_PATH, "json", prompt_type=args.prompt_type, refresh=args.refresh
+            )
+        except Exception as e:
+            print(f"  ❌ {row['slug']} — {e}")
+            continue
+        if prepared.cached:
+            service.complete_evaluation(prepared)
+            continue
+        dcat_reference, charter = prepared.dcat_reference, prepared.charter
+        requests.append(
+            BatchEvaluationRequest(
+                dataset_id=str(prepared.dataset.id),
+                context_hash=prepared.cache_key.context_hash,
+                context=prepared.context,
+            )
+        )
+
+    print(f"💾 {service.cache_stats.hits} évaluations reprises du cache")
+    if not requests:
+        print("✅ Aucun dataset à soumettre.")
+        return
+    batch_id = OpenAIBatchEvaluator(app.evaluator).submit(
+        requests, dcat_reference, charter, output="json", prompt_type=args.prompt_type
+    )
+    print(f"📦 Batch {batch_id} soumis : {len(requests)} évaluations")
+    print(f"   Récupération une fois terminé : utils/bulk_llm_audit.py --collect {batch_id}")
 
+
+def collect_batch(batch_id: str) -> dict | None:
+    """Enregistre (et met en cache) les évaluations d'un batch terminé."""
+    batch = OpenAIBatchEvaluator(app.evaluator)
+    status = batch.status(batch_id)
+    if status != "completed":
+        print(f"⏳ Batch {batch_id} : {status}")
+        return None
+
+    service = _make_service()
+    counters = {"success": 0, "error": 0}
+    for result in batch.results(batch_id):
+        try:
+            if result.error:
+                raise RuntimeError(result.error)
+            service.record_evaluation(result.dataset_id, result.evaluation, result.cache_key)
+            counters["success"] += 1
         except Exception as e:
-            async with lock:
-                counters["error"] += 1
-                idx = counters["success"] + counters["error"]
-                print(f"  ❌ [{idx}/{counters['total']}] {slug} — {e}")
-                counters.setdefault("failed_slugs", []).append(slug)
-            logger.error(f"Audit failed for {slug}: {e}")
-
-
-async def run_audit(rows: list[dict], args, done: set[str]) -> dict:
-    """Launch all audits concurrently with a semaphore."""
-    semaphore = asyncio.Semaphore(args.concurrency)
-    lock = asyncio.Lock()
-    counters = {"success": 0, "error": 0, "total": len(rows)}
-
-    tasks = [audit_one(row, semaphore, args.prompt_type, done, lock, counters) for row in rows]
-    await asyncio.gather(*tasks)
+            counters["error"] += 1
+            counters.setdefault("failed_slugs", []).append(f"{result.dataset_id} — {e}")
+            logger.error(f"Batch result failed for {result.dataset_id}: {e}")
+    counters["usage"] = service.usage_stats
     return counters
 
 
@@ -222,31 +273,28 @@ async def run_audit(rows: list[dict], args, done: set[str]) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def _prepare_run(args) -> tuple[list[dict], set[str]]:
-    """Load checkpoint and fetch the list of datasets to process."""
-    if args.reset:
-        reset_checkpoint()
-    done = load_checkpoint()
-    if done:
-        print(f"♻️  Checkpoint trouvé : {len(done)} datasets déjà traités, reprise...\n")
-
-    all_rows = fetch_datasets(args)
+def select_datasets(args) -> list[dict]:
+    """Datasets sélectionnés par les options (aperçu --dry-run et soumission --batch)."""
+    rows = fetch_planned_datasets(args) if args.drift_threshold is not None else fetch_datasets(args)
     if args.skip_evaluated:
-        all_rows = [r for r in all_rows if not r.get("already_evaluated")]
-
-    rows = [r for r in all_rows if str(r["id"]) not in done]
-
-    skipped = len(all_rows) - len(rows)
-    print(f"📊 Total éligibles : {len(all_rows)}")
-    if skipped:
-        print(f"   ⏭  Ignorés (checkpoint) : {skipped}")
-    print(f"   🔄 À traiter : {len(rows)}\n")
-
-    return rows, done
+        rows = [r for r in rows if not r.get("already_evaluated")]
+    print(f"📊 Total éligibles : {len(rows)}\n")
+    return rows
 
 
 def _print_summary(counters: dict) -> None:
     print(f"\n🏁 Terminé : {counters['success']} succès, {counters['error']} erreurs")
+    cache = counters.get("cache")
+    if cache:
+        print(f"   💾 Cache : {cache.hits} évaluations réutilisées, {cache.misses} appels LLM ({cache.hit_rate:.0%})")
+    usage = counters.get("usage")
+    if usage and usage.calls:
+        print(
+            f"   🔢 Tokens : {usage.prompt_tokens} en entrée dont {usage.cached_prompt_tokens} "
+            f"en cache fournisseur ({usage.cached_prompt_rate:.0%}), {usage.completion_tokens} en sortie"
+        )
+        if usage.timed_calls:
+            print(f"   ⏱  Latence moyenne : {usage.mean_latency_ms:.0f} ms sur {usage.timed_calls} appels")
     if counters.get("failed_slugs"):
         print("Slugs en erreur :")
         for s in counters["failed_slugs"]:
@@ -265,23 +313,35 @@ def main():
             print(f"❌ Fichier manquant : {name} → {path}")
             sys.exit(1)
 
-    rows, done = _prepare_run(args)
-
-    if args.dry_run:
-        print("[DRY RUN] Datasets qui seraient audités :\n")
-        for i, r in enumerate(rows, 1):
-            print(f"  {i:4}. {r['slug']} ({r['platform_slug']})")
+    if args.collect:
+        counters = collect_batch(args.collect)
+        if counters is not None:
+            _print_summary(counters)
         return
 
-    if not rows:
-        print("✅ Aucun dataset à auditer.")
+    if args.dry_run or args.batch:
+        rows = select_datasets(args)
+        if args.dry_run:
+            print("[DRY RUN] Datasets qui seraient audités :\n")
+            for i, r in enumerate(rows, 1):
+                print(f"  {i:4}. {r['slug']} ({r['platform_slug']})")
+        elif rows:
+            submit_batch(rows, args)
+        else:
+            print("✅ Aucun dataset à auditer.")
         return
 
-    counters = asyncio.run(run_audit(rows, args, done))
+    if not args.work_only:
+        enqueue(args)
+    counters = asyncio.run(run_worker(args))
     _print_summary(counters)
+    progress = _queue_progress(args.prompt_type)
+    print(f"   📋 File : {', '.join(f'{count} {state}' for state, count in progress.counts.items())}")
+
 
-    if counters["error"] == 0:
-        reset_checkpoint()
+def _queue_progress(prompt_type: str):
+    with app.uow:
+        return app.uow.datasets.get_evaluation_job_progress(prompt_type=prompt_type, failures=0)
 
 
 if __name__ == "__main__":
@@ -83,6 +83,11 @@ def cleanup_today(target_date: date = None):
                 logger.info(f"🗑️ Removing {len(new_dataset_ids)} dataset records...")
                 app.uow.datasets.client.execute("DELETE FROM datasets WHERE id = ANY(%s::uuid[])", (new_dataset_ids,))
 
+            # Versions of the remaining datasets were removed: recompute their current state
+            logger.info("🔁 Rebuilding dataset current state...")
+            app.uow.datasets.rebuild_current_state()
+            app.uow.datasets.rebuild_direction_health()
+
             logger.info(f"✅ Cleanup completed successfully for {target_str}.")
         except Exception as e:
             logger.error(f"❌ Cleanup failed: {e}")